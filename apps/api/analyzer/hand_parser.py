@@ -8,6 +8,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from core.cards import parse_card_indexes
+
 
 class Street(Enum):
     PREFLOP = "preflop"
@@ -45,6 +47,7 @@ class Player:
     is_hero: bool = False
     hole_cards: str | None = None
     position: str | None = None  # BTN, SB, BB, UTG, etc.
+    cards: list[int] = field(default_factory=list)  # Parsed hole_cards (core.cards indexes)
 
 
 @dataclass
@@ -70,6 +73,7 @@ class HandHistory:
     flop: str | None = None
     turn: str | None = None
     river: str | None = None
+    board_cards: list[int] = field(default_factory=list)  # Parsed flop + turn + river
 
     # Results
     pot: float = 0
@@ -80,6 +84,14 @@ class HandHistory:
     raw_text: str = ""
 
 
+def _parse_cards(text: str) -> list[int]:
+    """Parse a card list like 'Ah Kd 7c' once at load time; [] if malformed."""
+    try:
+        return parse_card_indexes(text)
+    except ValueError:
+        return []
+
+
 class GGPokerParser:
     """Parser for GGPoker hand history format."""
 
@@ -193,18 +205,21 @@ class GGPokerParser:
                 flop_match = re.search(r"\[(.+?)\]", line)
                 if flop_match:
                     hand.flop = flop_match.group(1)
+                    hand.board_cards = _parse_cards(hand.flop)
                 continue
             elif line.startswith("*** TURN ***"):
                 current_street = Street.TURN
                 turn_match = re.search(r"\] \[(.+?)\]$", line)
                 if turn_match:
                     hand.turn = turn_match.group(1)
+                    hand.board_cards = hand.board_cards + _parse_cards(hand.turn)
                 continue
             elif line.startswith("*** RIVER ***"):
                 current_street = Street.RIVER
                 river_match = re.search(r"\] \[(.+?)\]$", line)
                 if river_match:
                     hand.river = river_match.group(1)
+                    hand.board_cards = hand.board_cards + _parse_cards(hand.river)
                 continue
             elif line.startswith("*** SHOWDOWN ***") or line.startswith("*** SUMMARY ***"):
                 current_street = Street.SHOWDOWN
@@ -215,6 +230,7 @@ class GGPokerParser:
                 cards_match = re.search(r"\[(.+?)\]", line)
                 if cards_match and hand.hero:
                     hand.hero.hole_cards = cards_match.group(1)
+                    hand.hero.cards = _parse_cards(hand.hero.hole_cards)
                 continue
 
             # Parse actions
@@ -4,10 +4,11 @@ Analyzes user's postflop play using heuristic rules and frequency tracking.
 Note: This is NOT full GTO analysis (would require solver), but provides useful insights.
 """
 
-from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
 
+from core.cards import mask_of, parse_card_indexes, rank_mask, suit_counts
+
 from .hand_parser import Action, HandHistory, Street
 from .hand_parser import ActionType as ParserActionType
 
@@ -330,47 +331,29 @@ class PostflopAnalyzer:
     def _classify_board_texture(self, flop: str) -> BoardTexture:
         """Classify board texture from flop string."""
         # Parse cards from flop string like "Ah Kd 7c"
-        cards = flop.replace("[", "").replace("]", "").split()
-
+        try:
+            cards = parse_card_indexes(flop)
+        except ValueError:
+            return BoardTexture.DRY
         if len(cards) < 3:
             return BoardTexture.DRY
 
         # Check for pair
-        ranks = [c[0] for c in cards]
-        if len(set(ranks)) < 3:
+        mask = mask_of(cards)
+        if rank_mask(mask).bit_count() < len(cards):
             return BoardTexture.PAIRED
 
         # Check for flush draw (two same suit)
-        suits = [c[1] if len(c) > 1 else "" for c in cards]
-        suit_counts = defaultdict(int)
-        for s in suits:
-            suit_counts[s] += 1
-
-        if max(suit_counts.values()) >= 3:
+        max_suited = max(suit_counts(mask))
+        if max_suited >= 3:
             return BoardTexture.WET  # Monotone
 
         # Check for connectivity
-        rank_values = {
-            "A": 14,
-            "K": 13,
-            "Q": 12,
-            "J": 11,
-            "T": 10,
-            "9": 9,
-            "8": 8,
-            "7": 7,
-            "6": 6,
-            "5": 5,
-            "4": 4,
-            "3": 3,
-            "2": 2,
-        }
-
-        values = sorted([rank_values.get(r, 0) for r in ranks])
+        values = sorted(c >> 2 for c in cards)
         gaps = [values[i + 1] - values[i] for i in range(len(values) - 1)]
 
         # Wet if connected (small gaps) or two-tone
-        if max(suit_counts.values()) == 2 or max(gaps) <= 2:
+        if max_suited == 2 or max(gaps) <= 2:
             return BoardTexture.SEMI_WET
 
         return BoardTexture.DRY
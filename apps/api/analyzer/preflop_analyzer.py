@@ -9,6 +9,8 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
 
+from core.cards import hand_notation, parse_card_indexes
+
 from .hand_parser import ActionType as ParserActionType
 from .hand_parser import HandHistory
 
@@ -123,7 +125,10 @@ class PreflopAnalyzer:
             return None
 
         hero_position = hand.hero.position
-        hero_hand = self._normalize_hole_cards(hand.hero.hole_cards)
+        if len(hand.hero.cards) == 2:
+            hero_hand = hand_notation(*hand.hero.cards)
+        else:
+            hero_hand = self._normalize_hole_cards(hand.hero.hole_cards)
 
         if not hero_hand:
             return None
@@ -162,44 +167,13 @@ class PreflopAnalyzer:
             "Th 9h" -> "T9s"
         """
         # Parse cards like "As Kh" or "As,Kh" or "[As Kh]"
-        cards_str = cards_str.replace("[", "").replace("]", "").replace(",", " ")
-        parts = cards_str.split()
-
-        if len(parts) != 2:
-            return None
-
         try:
-            r1, s1 = parts[0][0].upper(), parts[0][1].lower()
-            r2, s2 = parts[1][0].upper(), parts[1][1].lower()
-
-            # Handle T for 10
-            if r1 == "1" and len(parts[0]) > 2:
-                r1 = "T"
-                s1 = parts[0][2].lower()
-            if r2 == "1" and len(parts[1]) > 2:
-                r2 = "T"
-                s2 = parts[1][2].lower()
-
-            # Normalize rank order (higher first)
-            ranks = ["A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2"]
-
-            if r1 not in ranks or r2 not in ranks:
-                return None
-
-            if ranks.index(r1) > ranks.index(r2):
-                r1, r2 = r2, r1
-                s1, s2 = s2, s1
-
-            # Format notation
-            if r1 == r2:
-                return f"{r1}{r2}"  # Pair
-            elif s1 == s2:
-                return f"{r1}{r2}s"  # Suited
-            else:
-                return f"{r1}{r2}o"  # Offsuit
-
-        except (IndexError, ValueError):
+            cards = parse_card_indexes(cards_str)
+        except ValueError:
+            return None
+        if len(cards) != 2:
             return None
+        return hand_notation(*cards)
 
     def _classify_scenario(
         self, hand: HandHistory
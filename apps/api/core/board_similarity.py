@@ -0,0 +1,141 @@
+"""
+Flop similarity for solver queries with no exact match.
+
+Every one of the 1,755 canonical flops gets a small feature vector:
+- rank profile: high, middle and low card
+- structure: connectivity, pairing and suit pattern
+- strength signature: the share of live hole-card combos that make at least
+  a pair, two pair, trips, a straight and a flush on the flop, i.e. a coarse
+  equity-distribution fingerprint of how the board hits ranges
+
+Structure features are weighted double so that, e.g., a monotone board is
+never "closest" to a rainbow one because the ranks happen to agree.
+
+A NeighborTable maps every canonical flop to its nearest board among a set of
+solved flops, so a query is one array lookup by flop id.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .canonical import NUM_FLOPS, board_from_id, flop_id
+from .cards import card_masks
+from .combos import COMBO_CARDS, COMBO_MASKS
+from .hand_rank import NUM_STRENGTHS, encode_batch, hand_category, strength_from_keys
+
+FEATURE_NAMES = (
+    "high_card",
+    "middle_card",
+    "low_card",
+    "connectivity",
+    "pairing",
+    "suitedness",
+    "pair_plus",
+    "two_pair_plus",
+    "trips_plus",
+    "straight_plus",
+    "flush_plus",
+)
+FEATURE_WEIGHTS = np.array([1, 1, 1, 2, 2, 2, 1, 1, 1, 1, 1], dtype=np.float64)
+
+# Categories of the strength signature: ONE_PAIR, TWO_PAIR, ... FLUSH
+_SIGNATURE_CATEGORIES = (1, 2, 3, 4, 5)
+
+
+@dataclass
+class NeighborTable:
+    """Nearest candidate flop for every canonical flop."""
+
+    candidates: np.ndarray  # Flop ids of the candidate (solved) boards
+    nearest: np.ndarray  # Per flop id: position in candidates of the closest board
+    distance: np.ndarray  # Per flop id: weighted feature distance to it
+
+    def lookup(self, target: int) -> tuple[int, float]:
+        """(position in candidates, distance) of the board closest to flop `target`."""
+        return int(self.nearest[target]), float(self.distance[target])
+
+
+@lru_cache(maxsize=1)
+def flop_features() -> np.ndarray:
+    """(1755, len(FEATURE_NAMES)) feature matrix, row = flop id, values in [0, 1]."""
+    boards = np.array([board_from_id(i) for i in range(NUM_FLOPS)], dtype=np.intp)
+    ranks = np.sort(boards >> 2, axis=1)[:, ::-1]
+    features = np.zeros((NUM_FLOPS, len(FEATURE_NAMES)))
+    features[:, :3] = ranks / 12
+
+    # Most board ranks inside one five-rank straight window (the ace plays low too)
+    rank_bits = np.zeros(NUM_FLOPS, dtype=np.int64)
+    for column in range(3):
+        rank_bits |= 1 << ranks[:, column]
+    distinct = _popcount(rank_bits)
+    # Bit 0 = low ace, bits 1..13 = deuce..ace
+    rank_bits = rank_bits << 1 | rank_bits >> 12 & 1
+    windows = [(rank_bits >> start & 0b11111) for start in range(10)]
+    in_window = np.max([_popcount(w) for w in windows], axis=0)
+    features[:, 3] = (np.minimum(in_window, distinct) - 1) / 2
+    features[:, 4] = (3 - distinct) / 2
+    suits = np.array([len(set(b & 3)) for b in boards])
+    features[:, 5] = (3 - suits) / 2
+
+    features[:, 6:] = _strength_signature(boards)
+    return features
+
+
+def board_features(flop: Sequence[int]) -> np.ndarray:
+    """Feature vector of one flop (card indexes)."""
+    return flop_features()[flop_id(flop)]
+
+
+def build_neighbor_table(candidates: Sequence[int]) -> NeighborTable:
+    """
+    Nearest candidate for every canonical flop.
+
+    Args:
+        candidates: Flop ids to choose from, e.g. the solved boards of one spot
+
+    Returns:
+        NeighborTable; ties go to the earlier candidate
+    """
+    candidates = np.asarray(candidates, dtype=np.intp)
+    if len(candidates) == 0:
+        raise ValueError("Need at least one candidate flop")
+    weighted = flop_features() * FEATURE_WEIGHTS
+    diff = weighted[:, None, :] - weighted[candidates][None, :, :]
+    distances = np.sqrt((diff**2).sum(axis=2))
+    nearest = distances.argmin(axis=1)
+    return NeighborTable(
+        candidates=candidates,
+        nearest=nearest,
+        distance=distances[np.arange(NUM_FLOPS), nearest],
+    )
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    count = np.zeros_like(values)
+    for bit in range(14):
+        count += values >> bit & 1
+    return count
+
+
+def _strength_signature(boards: np.ndarray) -> np.ndarray:
+    """Share of live combos at or above each signature category, per board."""
+    # Strengths are ordered by category, so each category starts at one threshold
+    starts = np.array(
+        [
+            next(s for s in range(1, NUM_STRENGTHS + 1) if hand_category(s) >= category)
+            for category in _SIGNATURE_CATEGORIES
+        ]
+    )
+    combo_keys = encode_batch(COMBO_CARDS)
+    board_keys = encode_batch(boards)
+    board_masks = card_masks(boards)
+
+    signature = np.zeros((len(boards), len(starts)))
+    for i in range(len(boards)):
+        live = (COMBO_MASKS & board_masks[i]) == 0
+        strength = strength_from_keys(*(k[live] + b[i] for k, b in zip(combo_keys, board_keys)))
+        signature[i] = (strength[:, None] >= starts).mean(axis=0)
+    return signature
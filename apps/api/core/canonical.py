@@ -0,0 +1,198 @@
+"""
+Suit-isomorphic board canonicalization.
+
+Boards that differ only by a relabelling of suits (AhKh5d vs AsKs5c) play
+identically, so they share one canonical form and one dense integer id:
+0..1754 for flops, 0..16431 for turn boards and 0..134458 for river boards.
+Solver lookups, texture classification and caches can key on that int
+instead of card strings.
+
+A board is treated as a set of cards, ranked in colex order; its canonical
+form is the suit relabelling with the smallest colex rank. With hole cards the
+board is still compared first and the hole cards only break ties, so the
+canonical board never depends on the hand.
+
+Tables (built lazily with NumPy, like the hand ranking tables):
+- raw flop colex rank (all 22,100 flops) -> flop id
+- sorted canonical colex ranks per street, so an id is a binary search away
+  (the river table takes ~1.5 s to build, so it is only built when needed)
+"""
+
+from collections.abc import Sequence
+from itertools import combinations, permutations
+from math import comb
+
+import numpy as np
+
+NUM_FLOPS = 1755
+NUM_TURNS = 16432
+NUM_RIVERS = 134459
+_STREET_SIZES = {3: NUM_FLOPS, 4: NUM_TURNS, 5: NUM_RIVERS}
+_STREET_KEYS = {3: "flop_keys", 4: "turn_keys", 5: "river_keys"}
+
+SUIT_PERMUTATIONS = tuple(permutations(range(4)))
+
+_tables: dict[str, np.ndarray] = {}
+
+
+def colex_rank(cards: Sequence[int]) -> int:
+    """Colex rank of a set of distinct cards (0..C(52, k) - 1)."""
+    return sum(comb(c, i + 1) for i, c in enumerate(sorted(cards)))
+
+
+def colex_unrank(rank: int, k: int) -> tuple[int, ...]:
+    """Inverse of colex_rank: the k-card set with this rank, ascending."""
+    cards = []
+    c = 51
+    for i in range(k, 0, -1):
+        while comb(c, i) > rank:
+            c -= 1
+        cards.append(c)
+        rank -= comb(c, i)
+        c -= 1
+    return tuple(reversed(cards))
+
+
+def _relabel(card: int, perm: Sequence[int]) -> int:
+    return (card & ~3) | perm[card & 3]
+
+
+def canonical_form(
+    board: Sequence[int], hole: Sequence[int] = ()
+) -> tuple[tuple[int, ...], tuple[int, ...], tuple[int, ...]]:
+    """
+    Canonical representative of a board (3-5 cards) plus optional hole cards.
+
+    Args:
+        board: Board cards as indexes (street order does not matter)
+        hole: Optional hole cards, mapped with the same suit relabelling
+
+    Returns:
+        (canonical board, canonical hole cards, perm): board and hole cards
+        sorted high card first, and perm[suit] is the canonical suit of each
+        original suit
+    """
+    if len(board) not in _STREET_SIZES:
+        raise ValueError("Board must have 3 to 5 cards")
+
+    best_key = None
+    best_perm = SUIT_PERMUTATIONS[0]
+    for perm in SUIT_PERMUTATIONS:
+        key = (
+            colex_rank([_relabel(c, perm) for c in board]),
+            sorted((_relabel(c, perm) for c in hole), reverse=True),
+        )
+        if best_key is None or key < best_key:
+            best_key, best_perm = key, perm
+
+    canonical = tuple(reversed(colex_unrank(best_key[0], len(board))))
+    return canonical, tuple(best_key[1]), best_perm
+
+
+def canonical_board(board: Sequence[int]) -> tuple[int, ...]:
+    """Canonical representative of a board without hole cards."""
+    return canonical_form(board)[0]
+
+
+def flop_id(flop: Sequence[int]) -> int:
+    """Dense id (0..1754) of a flop, by table lookup."""
+    table = _tables.get("flop_ids")
+    if table is None:
+        table = _build_flop_tables()["flop_ids"]
+    return int(table[colex_rank(flop)])
+
+
+def board_id(board: Sequence[int]) -> int:
+    """
+    Dense id of a flop, turn or river board.
+
+    Ids are per street: 0..1754 for 3 cards, 0..16431 for 4 and
+    0..134458 for 5.
+    """
+    if len(board) == 3:
+        return flop_id(board)
+    canonical = canonical_board(board)
+    return int(np.searchsorted(_street_keys(len(board)), colex_rank(canonical)))
+
+
+def board_from_id(board_id: int, n_cards: int = 3) -> tuple[int, ...]:
+    """Canonical board (high card first) for a dense id; inverse of board_id."""
+    rank = int(_street_keys(n_cards)[board_id])
+    return tuple(reversed(colex_unrank(rank, n_cards)))
+
+
+def _street_keys(n_cards: int) -> np.ndarray:
+    """Sorted canonical colex ranks for boards of n_cards."""
+    if n_cards not in _STREET_SIZES:
+        raise ValueError("Board must have 3 to 5 cards")
+    if "flop_keys" not in _tables:
+        _build_flop_tables()
+    for k in range(4, n_cards + 1):
+        if _STREET_KEYS[k] not in _tables:
+            _build_next_street(k)
+    return _tables[_STREET_KEYS[n_cards]]
+
+
+def _perm_array() -> np.ndarray:
+    """(24, 52) array: relabelled card index for every suit permutation."""
+    cards = np.arange(52)
+    return np.array([(cards & ~3) | np.array(perm)[cards & 3] for perm in SUIT_PERMUTATIONS])
+
+
+def _colex_batch(boards: np.ndarray) -> np.ndarray:
+    """Colex ranks for an (n, k) array of card sets."""
+    s = np.sort(boards, axis=1)
+    binomial = _binomials()
+    rank = binomial[s[:, 0], 1]
+    for i in range(1, s.shape[1]):
+        rank = rank + binomial[s[:, i], i + 1]
+    return rank
+
+
+def _binomials() -> np.ndarray:
+    """(52, 6) table of comb(c, i)."""
+    if "binomial" not in _tables:
+        _tables["binomial"] = np.array(
+            [[comb(c, i) for i in range(6)] for c in range(52)], dtype=np.int64
+        )
+    return _tables["binomial"]
+
+
+def _canonical_batch(boards: np.ndarray) -> np.ndarray:
+    """Canonical colex rank of each row: the minimum over all relabellings."""
+    boards = boards.astype(np.int8)
+    best = np.full(len(boards), np.iinfo(np.int64).max)
+    for perm in _perm_array().astype(np.int8):
+        best = np.minimum(best, _colex_batch(perm[boards]))
+    return best
+
+
+def _build_flop_tables() -> dict[str, np.ndarray]:
+    """Canonicalize all 22,100 raw flops in one NumPy pass per permutation."""
+    flops = np.array(list(combinations(range(52), 3)), dtype=np.int64)
+    canonical = _canonical_batch(flops)
+    keys = np.unique(canonical)
+    assert len(keys) == NUM_FLOPS
+
+    flop_ids = np.empty(len(flops), dtype=np.uint16)
+    flop_ids[_colex_batch(flops)] = np.searchsorted(keys, canonical)
+    _tables["flop_ids"] = flop_ids
+    _tables["flop_keys"] = keys
+    return _tables
+
+
+def _build_next_street(n_cards: int) -> None:
+    """
+    Canonical ranks for boards of n_cards.
+
+    Every board is isomorphic to a canonical board one card shorter plus one
+    more card, so extending each canonical board by every live card and
+    re-canonicalizing reaches every class.
+    """
+    prev = _street_keys(n_cards - 1)
+    boards = np.array([colex_unrank(int(r), n_cards - 1) for r in prev], dtype=np.int64)
+    live = (boards[:, :, None] != np.arange(52)[None, None, :]).all(axis=1)
+    rows, cards = np.nonzero(live)
+    keys = np.unique(_canonical_batch(np.column_stack([boards[rows], cards])))
+    assert len(keys) == _STREET_SIZES[n_cards]
+    _tables[_STREET_KEYS[n_cards]] = keys
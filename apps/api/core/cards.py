@@ -0,0 +1,271 @@
+"""
+Compact card representation shared by core, analyzer and routers.
+
+A card is a plain int 0-51: rank * 4 + suit, ranks "2".."A" = 0..12 and suits
+in ``SUITS`` order. A set of cards is a 52-bit int mask (bit i = card i), so
+dead-card checks, unions and suit / rank counts are integer operations and
+popcounts instead of loops over card objects.
+
+Card strings are parsed once at the edge (request bodies, solver JSON, hand
+histories) and formatted back only for responses.
+"""
+
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+RANKS = "23456789TJQKA"
+SUITS = "shdc"  # spades, hearts, diamonds, clubs
+SUIT_SYMBOLS = {"s": "♠", "h": "♥", "d": "♦", "c": "♣"}
+
+DECK_MASK = (1 << 52) - 1
+
+# One bit per rank (every 4th bit) for each suit, and all 4 suits of each rank
+SUIT_MASKS = tuple(sum(1 << (r * 4 + s) for r in range(13)) for s in range(4))
+RANK_MASKS = tuple(0xF << (r * 4) for r in range(13))
+
+_RANK_LOOKUP = {r: i for i, r in enumerate(RANKS)}
+_SUIT_LOOKUP = {s: i for i, s in enumerate(SUITS)}
+
+# Spread 4-rank pattern (one bit every 4th position) -> compact 4-bit pattern
+_SPREAD_TO_RANKS = {
+    sum(1 << (4 * i) for i in range(4) if bits >> i & 1): bits for bits in range(16)
+}
+
+
+def card_index(card: str) -> int:
+    """Convert a card string like 'As', 'td' or '10h' to its int index (0-51)."""
+    if len(card) == 3 and card[:2] == "10":
+        card = "T" + card[2]
+    try:
+        return _RANK_LOOKUP[card[0].upper()] * 4 + _SUIT_LOOKUP[card[1].lower()]
+    except (KeyError, IndexError):
+        raise ValueError(f"Invalid card: {card}") from None
+
+
+def card_str(index: int) -> str:
+    """Convert a card index back to a string like 'As'."""
+    return RANKS[index >> 2] + SUITS[index & 3]
+
+
+def card_symbol(index: int) -> str:
+    """Convert a card index to a display string like 'A♠'."""
+    return RANKS[index >> 2] + SUIT_SYMBOLS[SUITS[index & 3]]
+
+
+def card_rank(index: int) -> int:
+    """Rank value of a card index (0 = '2', 12 = 'A')."""
+    return index >> 2
+
+
+def card_suit(index: int) -> int:
+    """Suit value of a card index (position in ``SUITS``)."""
+    return index & 3
+
+
+def parse_card_indexes(cards: str) -> list[int]:
+    """Parse 'AhKs5d', 'Ah Ks 5d', 'Ah,Ks' or '[Ah Ks]' into card indexes."""
+    cleaned = cards.replace("10", "T")
+    for ch in " ,[]":
+        cleaned = cleaned.replace(ch, "")
+    if len(cleaned) % 2:
+        raise ValueError(f"Invalid cards: {cards}")
+    try:
+        return [card_index(cleaned[i : i + 2]) for i in range(0, len(cleaned), 2)]
+    except ValueError:
+        raise ValueError(f"Invalid cards: {cards}") from None
+
+
+def parse_dead_cards(dead: str) -> list[int]:
+    """Parse a dead-card string; an empty string means no dead cards."""
+    cards = parse_card_indexes(dead)
+    if len(set(cards)) != len(cards):
+        raise ValueError(f"Duplicate dead cards: {dead}")
+    return cards
+
+
+def hand_notation(card1: int, card2: int) -> str:
+    """Hand class of two cards, e.g. 'AKs', 'T9o' or 'QQ'."""
+    high, low = max(card1, card2), min(card1, card2)
+    ranks = RANKS[high >> 2] + RANKS[low >> 2]
+    if high >> 2 == low >> 2:
+        return ranks
+    return ranks + ("s" if high & 3 == low & 3 else "o")
+
+
+def format_cards(indexes: Iterable[int], sep: str = "") -> str:
+    """Format card indexes as 'AhKs5d' (or joined with sep)."""
+    return sep.join(card_str(i) for i in indexes)
+
+
+def mask_of(indexes: Iterable[int]) -> int:
+    """Bitmask of a collection of card indexes."""
+    mask = 0
+    for i in indexes:
+        mask |= 1 << i
+    return mask
+
+
+def indexes_of(mask: int) -> list[int]:
+    """Card indexes set in a mask, ascending."""
+    out = []
+    while mask:
+        low = mask & -mask
+        out.append(low.bit_length() - 1)
+        mask ^= low
+    return out
+
+
+def suit_counts(mask: int) -> tuple[int, int, int, int]:
+    """Number of cards of each suit in a mask, in ``SUITS`` order."""
+    return tuple((mask & m).bit_count() for m in SUIT_MASKS)
+
+
+def rank_mask(mask: int) -> int:
+    """13-bit mask of the ranks present in a card mask."""
+    # Fold the 4 suit bits of every rank onto the lowest one, then compact
+    folded = (mask | mask >> 1 | mask >> 2 | mask >> 3) & SUIT_MASKS[0]
+    return (
+        _SPREAD_TO_RANKS[folded & 0xFFFF]
+        | _SPREAD_TO_RANKS[folded >> 16 & 0xFFFF] << 4
+        | _SPREAD_TO_RANKS[folded >> 32 & 0xFFFF] << 8
+        | _SPREAD_TO_RANKS[folded >> 48] << 12
+    )
+
+
+def card_masks(cards: np.ndarray) -> np.ndarray:
+    """uint64 card mask for each row of an int array of card indexes."""
+    return np.bitwise_or.reduce(np.uint64(1) << np.asarray(cards).astype(np.uint64), axis=-1)
+
+
+class Card:
+    """
+    A single card object for code that wants attributes instead of raw ints.
+
+    Only the int index is stored, so hashing and equality are integer ops and
+    a list of Cards converts to a CardSet without re-parsing strings.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, rank: str, suit: str):
+        self.index = card_index(rank + suit)
+
+    @classmethod
+    def from_index(cls, index: int) -> "Card":
+        card = object.__new__(cls)
+        card.index = index
+        return card
+
+    @classmethod
+    def from_string(cls, s: str) -> "Card":
+        """Parse card from string like 'As', 'Kh', 'Td'."""
+        return cls.from_index(card_index(s))
+
+    def __str__(self):
+        return card_symbol(self.index)
+
+    def __repr__(self):
+        return f"Card(rank={self.rank!r}, suit={self.suit!r})"
+
+    def __hash__(self):
+        return self.index
+
+    def __eq__(self, other):
+        return isinstance(other, Card) and self.index == other.index
+
+    @property
+    def rank(self) -> str:
+        return RANKS[self.index >> 2]
+
+    @property
+    def suit(self) -> str:
+        return SUITS[self.index & 3]
+
+    @property
+    def value(self) -> int:
+        return self.index >> 2
+
+
+class CardSet:
+    """
+    Immutable set of cards backed by a single 52-bit mask.
+
+    Supports the usual set algebra (|, &, -, in, len, iteration in index
+    order) plus suit / rank queries used by the outs and texture code.
+    """
+
+    __slots__ = ("mask",)
+
+    def __init__(self, mask: int = 0):
+        self.mask = mask & DECK_MASK
+
+    @classmethod
+    def of(cls, indexes: Iterable[int]) -> "CardSet":
+        return cls(mask_of(indexes))
+
+    @classmethod
+    def from_cards(cls, cards: Iterable[Card]) -> "CardSet":
+        return cls(mask_of(c.index for c in cards))
+
+    @classmethod
+    def parse(cls, cards: str) -> "CardSet":
+        """Parse a card string like 'AhKs5d' or 'Ah Ks 5d'."""
+        return cls(mask_of(parse_card_indexes(cards)))
+
+    @classmethod
+    def deck(cls) -> "CardSet":
+        return cls(DECK_MASK)
+
+    def __contains__(self, index: int) -> bool:
+        return bool(self.mask >> index & 1)
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(indexes_of(self.mask))
+
+    def __bool__(self) -> bool:
+        return self.mask != 0
+
+    def __or__(self, other: "CardSet") -> "CardSet":
+        return CardSet(self.mask | other.mask)
+
+    def __and__(self, other: "CardSet") -> "CardSet":
+        return CardSet(self.mask & other.mask)
+
+    def __sub__(self, other: "CardSet") -> "CardSet":
+        return CardSet(self.mask & ~other.mask)
+
+    def __invert__(self) -> "CardSet":
+        return CardSet(~self.mask)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CardSet) and self.mask == other.mask
+
+    def __hash__(self) -> int:
+        return hash(self.mask)
+
+    def __repr__(self) -> str:
+        return f"CardSet('{self}')"
+
+    def __str__(self) -> str:
+        return format_cards(self)
+
+    def isdisjoint(self, other: "CardSet") -> bool:
+        return not self.mask & other.mask
+
+    def suit_counts(self) -> tuple[int, int, int, int]:
+        return suit_counts(self.mask)
+
+    def suit(self, suit: int) -> "CardSet":
+        """Cards of one suit (index into ``SUITS``)."""
+        return CardSet(self.mask & SUIT_MASKS[suit])
+
+    def rank(self, rank: int) -> "CardSet":
+        """Cards of one rank (0 = '2', 12 = 'A')."""
+        return CardSet(self.mask & RANK_MASKS[rank])
+
+    def rank_mask(self) -> int:
+        return rank_mask(self.mask)
@@ -0,0 +1,173 @@
+"""
+1326-combo engine: ranges, dead cards and blockers as arrays.
+
+Every concrete two-card combo has a fixed index 0..1325, in the order of
+``itertools.combinations(range(52), 2)`` (low card first). A range is a bool
+(or float weight) array over those indexes, so removing the board and hero's
+hand is one vectorized AND with a live mask and counting combos is a sum,
+instead of assuming 6 / 4 / 12 combos per hand class.
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from itertools import combinations
+
+import numpy as np
+
+from .cards import card_masks, card_str, mask_of
+from .hand import ALL_HANDS, Hand, parse_range
+
+NUM_COMBOS = 1326
+
+# (1326, 2) card indexes, low card first
+COMBO_CARDS = np.array(list(combinations(range(52), 2)), dtype=np.intp)
+COMBO_CARDS.flags.writeable = False
+COMBO_MASKS = card_masks(COMBO_CARDS)
+COMBO_MASKS.flags.writeable = False
+
+# (52, 52) card pair -> combo index, -1 on the diagonal
+_COMBO_INDEX = np.full((52, 52), -1, dtype=np.intp)
+_COMBO_INDEX[COMBO_CARDS[:, 0], COMBO_CARDS[:, 1]] = np.arange(NUM_COMBOS)
+_COMBO_INDEX[COMBO_CARDS[:, 1], COMBO_CARDS[:, 0]] = np.arange(NUM_COMBOS)
+
+# Hand class (index into ALL_HANDS) of every combo, and the combos of each class
+_CLASS_INDEX = {hand: i for i, hand in enumerate(ALL_HANDS)}
+COMBO_CLASS = np.empty(NUM_COMBOS, dtype=np.intp)
+CLASS_COMBOS: dict[str, np.ndarray] = {}
+for _hand in ALL_HANDS:
+    _ids = np.sort(_COMBO_INDEX[tuple(np.array(Hand(_hand).combos()).T)])
+    COMBO_CLASS[_ids] = _CLASS_INDEX[_hand]
+    CLASS_COMBOS[_hand] = _ids
+del _hand, _ids
+
+
+def combo_index(card1: int, card2: int) -> int:
+    """Combo index (0-1325) of two distinct cards, in either order."""
+    index = int(_COMBO_INDEX[card1, card2])
+    if index < 0:
+        raise ValueError("A combo needs two distinct cards")
+    return index
+
+
+def combo_str(card1: int, card2: int) -> str:
+    """Combo string like 'AhKh' or 'AsAc': higher rank first, then suit order."""
+    high, low = sorted((card1, card2), key=lambda c: (-(c >> 2), c & 3))
+    return card_str(high) + card_str(low)
+
+
+def class_notation(hand: str | Hand) -> str:
+    """
+    Hand class key in ``ALL_HANDS`` form.
+
+    Like ``Hand.combos``, an unsuited non-pair such as 'AK' means offsuit.
+    """
+    notation = Hand(str(hand)).notation
+    if len(notation) == 2 and notation[0] != notation[1]:
+        notation += "o"
+    if notation not in _CLASS_INDEX:
+        raise ValueError(f"Invalid hand: {hand}")
+    return notation
+
+
+def hands_mask(hands: Iterable[str | Hand]) -> np.ndarray:
+    """Bool combo array of a collection of hand classes like 'AKs' or 'QQ'."""
+    mask = np.zeros(NUM_COMBOS, dtype=bool)
+    for hand in hands:
+        mask[CLASS_COMBOS[class_notation(hand)]] = True
+    return mask
+
+
+def range_mask(range_str: str) -> np.ndarray:
+    """Bool combo array of a range string like 'TT+, AQs+, KQo'."""
+    return hands_mask(parse_range(range_str))
+
+
+def weighted_mask(weights: Mapping[str, float]) -> np.ndarray:
+    """Float combo array from per-class weights (e.g. mixed frequencies 0-1)."""
+    class_weights = np.zeros(len(ALL_HANDS))
+    for hand, weight in weights.items():
+        class_weights[_CLASS_INDEX[class_notation(hand)]] = weight
+    return class_weights[COMBO_CLASS]
+
+
+def live_mask(dead: int | Iterable[int] = 0) -> np.ndarray:
+    """Bool combo array of combos that share no card with the dead cards."""
+    dead_mask = dead if isinstance(dead, int) else mask_of(dead)
+    return (COMBO_MASKS & np.uint64(dead_mask)) == 0
+
+
+def count_combos(combos: np.ndarray, dead: int | Iterable[int] = 0) -> float:
+    """Number (or total weight) of combos left after removing dead cards."""
+    return float(np.sum(combos, where=live_mask(dead)))
+
+
+def class_counts(combos: np.ndarray, dead: int | Iterable[int] = 0) -> dict[str, float]:
+    """Live combos per hand class, for classes with any left."""
+    live = np.where(live_mask(dead), combos, 0).astype(np.float64)
+    counts = np.bincount(COMBO_CLASS, weights=live, minlength=len(ALL_HANDS))
+    return {ALL_HANDS[i]: float(counts[i]) for i in np.flatnonzero(counts)}
+
+
+def combo_cards(combos: np.ndarray, dead: int | Iterable[int] = 0) -> np.ndarray:
+    """(n, 2) card indexes of the live combos set in a bool combo array."""
+    return COMBO_CARDS[np.asarray(combos, dtype=bool) & live_mask(dead)]
+
+
+@dataclass
+class BlockerEffect:
+    """How hero's cards change the combos in villain's value and bluff ranges."""
+
+    value_combos: float  # Before hero's cards are removed (board only)
+    value_combos_blocked: float  # After
+    bluff_combos: float
+    bluff_combos_blocked: float
+    value_share: float  # Value / (value + bluffs), 0-1, before
+    value_share_blocked: float  # After
+
+    @property
+    def value_removed(self) -> float:
+        """Fraction of value combos hero blocks."""
+        return 1 - self.value_combos_blocked / self.value_combos if self.value_combos else 0.0
+
+    @property
+    def bluff_removed(self) -> float:
+        """Fraction of bluff combos hero blocks."""
+        return 1 - self.bluff_combos_blocked / self.bluff_combos if self.bluff_combos else 0.0
+
+
+def blocker_effect(
+    hero: Iterable[int],
+    value: np.ndarray,
+    bluffs: np.ndarray,
+    board: Iterable[int] = (),
+) -> BlockerEffect:
+    """
+    Compare villain's value and bluff combos with and without hero's cards.
+
+    Args:
+        hero: Hero's hole cards
+        value: Bool or weight combo array of villain's value hands
+        bluffs: Bool or weight combo array of villain's bluffs
+        board: Board cards, removed in both cases
+
+    Returns:
+        BlockerEffect with combo counts and value share before / after
+    """
+    board_mask = mask_of(board)
+    dead_mask = board_mask | mask_of(hero)
+    counts = [
+        count_combos(combos, dead) for dead in (board_mask, dead_mask) for combos in (value, bluffs)
+    ]
+    value_before, bluff_before, value_after, bluff_after = counts
+
+    def share(v: float, b: float) -> float:
+        return v / (v + b) if v + b else 0.0
+
+    return BlockerEffect(
+        value_combos=value_before,
+        value_combos_blocked=value_after,
+        bluff_combos=bluff_before,
+        bluff_combos_blocked=bluff_after,
+        value_share=share(value_before, bluff_before),
+        value_share_blocked=share(value_after, bluff_after),
+    )
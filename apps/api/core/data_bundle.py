@@ -0,0 +1,151 @@
+"""
+Validated, checksummed bundle of the API's data files.
+
+scripts/compile_solver_data.py checks every file under SOURCE_DIRS (see
+core/data_validation.py), compiles the solver scenarios into
+solver/strategies.bin and writes one versioned artifact, data/bundle.json:
+
+- version: BUNDLE_VERSION
+- sources: path -> sha256 of every validated source file
+- artifacts: path -> sha256 of the compiled binaries
+- content: path -> parsed JSON of every file the routers read directly (the
+  scenario files themselves are served from strategies.bin)
+- checksum: sha256 of all of the above
+
+Paths are relative to the data directory. load_bundle() rejects a bundle
+whose checksum or artifact hashes do not match, so a truncated or hand-edited
+file stops the API at startup instead of quietly serving fewer drills, and
+load_data_file() serves the routers from the verified content. Checkouts
+without a bundle fall back to reading the JSON files.
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+BUNDLE_VERSION = 1
+DATA_ROOT = Path(__file__).parent.parent / "data"
+BUNDLE_PATH = DATA_ROOT / "bundle.json"
+SOURCE_DIRS = ("solver", "postflop", "flop-texture", "ranges")
+# Written by the compiler, so bundled but not hashed or validated as a source
+GENERATED = frozenset({"solver/manifest.json"})
+
+
+@dataclass
+class DataBundle:
+    """Contents of a bundle.json."""
+
+    version: int
+    sources: dict[str, str]
+    artifacts: dict[str, str]
+    content: dict[str, Any]
+    checksum: str = ""
+
+    def compute_checksum(self) -> str:
+        body = [self.version, self.sources, self.artifacts, self.content]
+        return _sha256(json.dumps(body, sort_keys=True, ensure_ascii=False).encode())
+
+
+def file_sha256(path: Path) -> str:
+    return _sha256(Path(path).read_bytes())
+
+
+def build_bundle(
+    content: dict[str, Any], sources: dict[str, str], artifacts: dict[str, str]
+) -> DataBundle:
+    """Bundle with its checksum filled in."""
+    bundle = DataBundle(BUNDLE_VERSION, dict(sources), dict(artifacts), dict(content))
+    bundle.checksum = bundle.compute_checksum()
+    return bundle
+
+
+def write_bundle(bundle: DataBundle, path: Path | None = None) -> None:
+    path = Path(path or BUNDLE_PATH)
+    path.write_text(json.dumps(asdict(bundle), indent=1, ensure_ascii=False) + "\n")
+
+
+def load_bundle(path: Path | None = None, data_dir: Path | None = None) -> DataBundle:
+    """
+    Read and verify a bundle.
+
+    Args:
+        path: Bundle file, BUNDLE_PATH by default
+        data_dir: Directory the artifact paths are relative to, DATA_ROOT by default
+
+    Raises:
+        FileNotFoundError: If there is no bundle
+        ValueError: If the version, checksum or an artifact hash does not match
+    """
+    path = Path(path or BUNDLE_PATH)
+    data_dir = Path(data_dir or DATA_ROOT)
+    try:
+        bundle = DataBundle(**json.loads(path.read_text(encoding="utf-8")))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Unreadable data bundle {path}: {e}") from e
+    if bundle.version != BUNDLE_VERSION:
+        raise ValueError(f"Data bundle {path} has version {bundle.version}, need {BUNDLE_VERSION}")
+    if bundle.checksum != bundle.compute_checksum():
+        raise ValueError(f"Data bundle {path} is corrupt: checksum mismatch")
+    for name, digest in bundle.artifacts.items():
+        artifact = data_dir / name
+        if not artifact.exists() or file_sha256(artifact) != digest:
+            raise ValueError(
+                f"{artifact} does not match the data bundle; run scripts/compile_solver_data.py"
+            )
+    return bundle
+
+
+def stale_sources(bundle: DataBundle, data_dir: Path | None = None) -> list[str]:
+    """Source files added, removed or changed since the bundle was built."""
+    data_dir = Path(data_dir or DATA_ROOT)
+    current = {
+        file.relative_to(data_dir).as_posix(): file
+        for directory in SOURCE_DIRS
+        for file in (data_dir / directory).rglob("*.json")
+    }
+    current = {name: file for name, file in current.items() if name not in GENERATED}
+    changed = [
+        name
+        for name, file in current.items()
+        if name not in bundle.sources or file_sha256(file) != bundle.sources[name]
+    ]
+    removed = [name for name in bundle.sources if name not in current]
+    return sorted(changed + removed)
+
+
+@lru_cache(maxsize=1)
+def get_bundle() -> DataBundle | None:
+    """
+    The verified bundle, or None if it has not been built.
+
+    Raises:
+        ValueError: If the bundle exists but fails verification
+    """
+    try:
+        return load_bundle()
+    except FileNotFoundError:
+        return None
+
+
+def load_data_file(path: str) -> Any:
+    """
+    Parsed JSON of a data file, from the bundle when there is one.
+
+    Args:
+        path: Relative to the data directory, e.g. "postflop/flop_cbet.json"
+
+    Raises:
+        FileNotFoundError: If the file is neither bundled nor on disk
+    """
+    bundle = get_bundle()
+    if bundle is not None and path in bundle.content:
+        return bundle.content[path]
+    with open(DATA_ROOT / path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
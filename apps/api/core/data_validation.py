@@ -0,0 +1,303 @@
+"""
+Checks for the data files the API serves.
+
+Each data family has its own checker; validate_file picks one by the file's
+path relative to the data directory:
+
+- solver/*.json scenario files and solver/level1_textures.json: boards are
+  three distinct cards, strategy keys name hands ("AKs", "AhJh", "KhKx"),
+  actions are known solver actions and frequencies sum to 100
+- ranges/6max/*_frequencies.json: hand classes, preflop actions and sums
+- ranges/cash and ranges/mtt: every listed hand is a hand class
+- postflop and flop-texture: boards are distinct, well-formed cards, hero
+  hands name hands and frequencies are percentages
+
+The solver data is rounded, so a few strategies sum to 95-105. A sum within
+SUM_TOLERANCE of 100 is reported once per file as a warning; anything further
+off, and every structural problem, is an error that fails the build.
+"""
+
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .cards import parse_card_indexes
+from .data_bundle import GENERATED
+from .hand import ALL_HANDS
+from .solver_aggregates import hand_combos
+
+SUM_TOLERANCE = 5
+
+SOLVER_ACTIONS = frozenset(
+    {
+        "check",
+        "bet_33",
+        "bet_50",
+        "bet_66",
+        "bet_75",
+        "bet_100",
+        "all_in",
+        "check_raise",
+        "donk_33",
+    }
+)
+PREFLOP_ACTIONS = frozenset({"raise", "call", "fold", "3bet", "4bet", "5bet"})
+POSTFLOP_ACTIONS = frozenset({"bet", "check", "call", "fold", "raise"})
+
+_HANDS = frozenset(ALL_HANDS)
+
+
+@dataclass
+class DataIssue:
+    """One problem found in a data file."""
+
+    path: str  # Relative to the data directory, e.g. "solver/btn_vs_bb_srp.json"
+    location: str  # Where in the file, e.g. "[3].strategies.AKs"
+    message: str
+    fatal: bool = True
+
+    def __str__(self) -> str:
+        level = "error" if self.fatal else "warning"
+        return f"{level}: {self.path}: {self.location}: {self.message}"
+
+
+def validate_file(path: str, data: Any) -> list[DataIssue]:
+    """
+    Check one parsed data file.
+
+    Args:
+        path: Path relative to the data directory, with forward slashes
+        data: The parsed JSON
+
+    Returns:
+        Issues found, errors and warnings
+    """
+    if path in GENERATED:
+        return []
+    directory, name = path.split("/", 1)
+    if directory == "solver":
+        if name == "level1_textures.json":
+            checks = _check_level1(data)
+        elif isinstance(data, list):
+            checks = _check_solver_scenarios(data, "")
+        elif isinstance(data, dict) and "scenarios" in data:
+            checks = _check_solver_scenarios(data["scenarios"], "scenarios")
+        else:
+            checks = _check_object(data)
+    elif directory == "ranges" and name.startswith("6max/"):
+        checks = _check_range_frequencies(data)
+    elif directory == "ranges":
+        checks = _check_hand_lists(data)
+    elif directory in ("postflop", "flop-texture"):
+        checks = _check_postflop(data)
+    else:
+        checks = _check_object(data)
+    return _collect(path, checks)
+
+
+def validate_dir(
+    data_dir: Path, directories: Iterable[str]
+) -> tuple[dict[str, Any], list[DataIssue]]:
+    """
+    Parse and check every JSON file under some data subdirectories.
+
+    Returns:
+        (relative path -> parsed JSON, issues); files that fail to parse are
+        reported and left out
+    """
+    files: dict[str, Any] = {}
+    issues: list[DataIssue] = []
+    for directory in directories:
+        for file in sorted((data_dir / directory).rglob("*.json")):
+            path = file.relative_to(data_dir).as_posix()
+            try:
+                data = json.loads(file.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                issues.append(DataIssue(path, "", f"cannot be read: {e}"))
+                continue
+            files[path] = data
+            issues.extend(validate_file(path, data))
+    return files, issues
+
+
+# Checkers yield (location, message) for errors and (location, message, False)
+# for warnings
+
+
+def _collect(path: str, checks: Iterator[tuple]) -> list[DataIssue]:
+    issues = [DataIssue(path, *check) for check in checks]
+    # One warning per file for rounding drift
+    drift = [i for i in issues if not i.fatal]
+    if len(drift) > 1:
+        first = drift[0]
+        message = (
+            f"{first.message}; {len(drift) - 1} more strategies are off by up to {SUM_TOLERANCE}"
+        )
+        issues = [i for i in issues if i.fatal] + [
+            DataIssue(path, first.location, message, fatal=False)
+        ]
+    return issues
+
+
+def _check_object(data: Any) -> Iterator[tuple]:
+    if not isinstance(data, dict):
+        yield "", "expected a JSON object"
+
+
+def _check_solver_scenarios(scenarios: Any, prefix: str) -> Iterator[tuple]:
+    if not isinstance(scenarios, list):
+        yield prefix, "expected a list of scenarios"
+        return
+    seen = set()
+    for i, scenario in enumerate(scenarios):
+        location = f"{prefix}[{i}]"
+        if not isinstance(scenario, dict):
+            yield location, "expected a scenario object"
+            continue
+        for key in ("scenario_id", "position", "villain", "pot_type", "board", "texture"):
+            if not isinstance(scenario.get(key), (str, list)) or not scenario.get(key):
+                yield location, f"missing {key}"
+        scenario_id = scenario.get("scenario_id")
+        if scenario_id in seen:
+            yield location, f"duplicate scenario_id {scenario_id}"
+        seen.add(scenario_id)
+        yield from _check_board(scenario.get("board"), 3, f"{location}.board")
+        yield from _check_strategies(scenario.get("strategies"), f"{location}.strategies")
+
+
+def _check_level1(data: Any) -> Iterator[tuple]:
+    textures = data.get("textures") if isinstance(data, dict) else None
+    if not isinstance(textures, list):
+        yield "textures", "expected a list of textures"
+        return
+    for i, texture in enumerate(textures):
+        location = f"textures[{i}]"
+        if not isinstance(texture, dict) or not texture.get("texture_id"):
+            yield location, "missing texture_id"
+            continue
+        board = texture.get("representative_board")
+        yield from _check_board(board, 3, f"{location}.representative_board")
+        yield from _check_strategies(texture.get("strategies"), f"{location}.strategies")
+
+
+def _check_strategies(strategies: Any, location: str) -> Iterator[tuple]:
+    if not isinstance(strategies, dict):
+        yield location, "expected hand -> strategy"
+        return
+    for hand, strategy in strategies.items():
+        where = f"{location}.{hand}"
+        if not hand_combos(hand).any():
+            yield where, f"unknown hand {hand!r}"
+        if not isinstance(strategy, dict):
+            yield where, "expected action -> frequency"
+            continue
+        yield from _check_frequencies(
+            {k: v for k, v in strategy.items() if k != "note"}, SOLVER_ACTIONS, where
+        )
+
+
+def _check_frequencies(strategy: dict, actions: frozenset, location: str) -> Iterator[tuple]:
+    if not strategy:
+        return
+    for action, value in strategy.items():
+        if action not in actions:
+            yield location, f"unknown action {action!r}"
+        if not _is_percentage(value):
+            yield location, f"{action} frequency {value!r} is not a percentage"
+            return
+    total = sum(strategy.values())
+    if abs(total - 100) > SUM_TOLERANCE:
+        yield location, f"frequencies sum to {total:g}"
+    elif total != 100:
+        yield location, f"frequencies sum to {total:g}", False
+
+
+def _check_range_frequencies(data: Any) -> Iterator[tuple]:
+    if not isinstance(data, dict):
+        yield "", "expected a JSON object"
+        return
+    for spot, entry in data.items():
+        if spot == "meta":
+            continue
+        frequencies = entry.get("frequencies") if isinstance(entry, dict) else None
+        if not isinstance(frequencies, dict):
+            yield spot, "missing frequencies"
+            continue
+        for hand, strategy in frequencies.items():
+            where = f"{spot}.frequencies.{hand}"
+            if hand not in _HANDS:
+                yield where, f"unknown hand class {hand!r}"
+            if not isinstance(strategy, dict):
+                yield where, "expected action -> frequency"
+                continue
+            yield from _check_frequencies(strategy, PREFLOP_ACTIONS, where)
+        yield from _check_hands(entry.get("drillable", []), f"{spot}.drillable")
+
+
+def _check_hand_lists(data: Any, location: str = "") -> Iterator[tuple]:
+    """Every list of strings below the top level (except "meta") must hold hand classes."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if not location and key == "meta":
+                continue
+            yield from _check_hand_lists(value, f"{location}.{key}" if location else key)
+    elif isinstance(data, list) and all(isinstance(h, str) for h in data):
+        yield from _check_hands(data, location)
+
+
+def _check_hands(hands: list, location: str) -> Iterator[tuple]:
+    for hand in hands:
+        if hand not in _HANDS:
+            yield location, f"unknown hand class {hand!r}"
+
+
+def _check_postflop(data: Any) -> Iterator[tuple]:
+    scenarios = data.get("scenarios") if isinstance(data, dict) else None
+    if not isinstance(scenarios, list):
+        yield "scenarios", "expected a list of scenarios"
+        return
+    for i, scenario in enumerate(scenarios):
+        location = f"scenarios[{i}]"
+        if not isinstance(scenario, dict) or not scenario.get("id"):
+            yield location, "missing id"
+            continue
+        # Ranks and suits are stored side by side: flop + flop_suits or suits
+        ranks = list(scenario.get("board") or scenario.get("flop") or [])
+        suits = list(
+            scenario.get("board_suits") or scenario.get("flop_suits") or scenario.get("suits") or []
+        )
+        if "turn" in scenario:
+            ranks.append(scenario["turn"])
+            suits.append(scenario.get("turn_suit"))
+        if len(ranks) != len(suits):
+            yield f"{location}.flop", "ranks and suits differ in length"
+        else:
+            cards = [f"{r}{s}" for r, s in zip(ranks, suits)]
+            yield from _check_board(cards, len(cards) if len(cards) in (3, 4, 5) else 3, location)
+        hand = scenario.get("hero_hand")
+        if hand is not None and not hand_combos(hand).any():
+            yield f"{location}.hero_hand", f"unknown hand {hand!r}"
+        action = scenario.get("correct_action")
+        if action is not None and action not in POSTFLOP_ACTIONS:
+            yield f"{location}.correct_action", f"unknown action {action!r}"
+        if "frequency" in scenario and not _is_percentage(scenario["frequency"]):
+            yield f"{location}.frequency", f"{scenario['frequency']!r} is not a percentage"
+
+
+def _check_board(board: Any, size: int, location: str) -> Iterator[tuple]:
+    if not isinstance(board, list) or len(board) != size:
+        yield location, f"expected {size} cards, got {board!r}"
+        return
+    try:
+        cards = parse_card_indexes("".join(board))
+    except (ValueError, TypeError):
+        yield location, f"invalid cards {board!r}"
+        return
+    if len(cards) != size or len(set(cards)) != size:
+        yield location, f"cards must be {size} distinct cards, got {board!r}"
+
+
+def _is_percentage(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and 0 <= value <= 100
@@ -1,13 +1,54 @@
 """
 Preflop equity quiz module.
 Generates multiple choice questions about hand vs hand equity.
+
+Questions are generated on the fly from the precomputed 169x169 equity
+matrix (core/preflop_equity.py): any two hand classes, or a hand against a
+preset range. Every matchup is classified into a quiz category (domination,
+coin flip, pair over pair ...) once, lazily, and equities sit behind an LRU
+cache, so generating a question is a couple of random picks and a cached
+lookup. data/equity.json is optional and only overrides category
+descriptions / difficulties, quiz settings and per-matchup notes.
 """
 
 import json
 import random
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+from .hand import ALL_HANDS, RANKS
+from .preflop_equity import hand_index, hand_vs_hand, range_indexes, range_vs_range
+
+# Built-in categories: key -> (description, difficulty)
+CATEGORIES = {
+    "overpair_vs_underpair": ("高對子 vs 低對子", "easy"),
+    "pair_vs_overcards": ("對子 vs 兩高張 (經典翻硬幣)", "medium"),
+    "pair_vs_one_overcard": ("對子 vs 一高張一低張", "medium"),
+    "pair_vs_undercards": ("對子 vs 兩低張", "easy"),
+    "domination": ("壓制牌型 (同高張不同踢腳)", "easy"),
+    "high_vs_low": ("高張 vs 低張 (無配對)", "medium"),
+    "suited_connectors_vs_pairs": ("連接花色牌 vs 對子", "hard"),
+    "premium_battles": ("頂級牌對決", "medium"),
+    "special_cases": ("特殊案例", "hard"),
+    "hand_vs_range": ("單手牌 vs 範圍", "hard"),
+}
+
+PREMIUM_HANDS = frozenset({"AA", "KK", "QQ", "JJ", "AKs", "AKo"})
+
+# Villain ranges for hand vs range questions
+RANGE_PRESETS = (
+    "QQ+, AKs, AKo",
+    "TT+, AQs+, AKo",
+    "77+, ATs+, KQs, AJo+",
+    "22+, A2s+, KTs+, QJs, ATo+, KQo",
+    "22+, A2s+, K9s+, Q9s+, J9s+, T9s, A7o+, KTo+, QJo",
+)
+
+_HAND_CLASSES = frozenset(ALL_HANDS)
+
+_DATA_PATH = Path(__file__).parent.parent / "data" / "equity.json"
+
 
 @dataclass
 class EquityQuestion:
@@ -43,6 +84,9 @@ class EquityChoice:
 
 def _add_suit_symbols(hand: str) -> str:
     """Add suit symbols to hand string for display."""
+    if hand not in _HAND_CLASSES:
+        # A range (hand vs range questions) is shown as is
+        return hand
     if hand.endswith("s"):
         # Suited - use same suit
         return f"{hand[0]}♠ {hand[1]}♠"
@@ -54,6 +98,74 @@ def _add_suit_symbols(hand: str) -> str:
         return f"{hand[0]}♠ {hand[0]}♥"
 
 
+def _rank(card: str) -> int:
+    """Rank strength, higher is better (A = 12)."""
+    return 12 - RANKS.index(card)
+
+
+def classify_matchup(hand1: str, hand2: str) -> str:
+    """Quiz category of two hand classes, e.g. ('QQ', 'AKs') -> 'pair_vs_overcards'."""
+    pair1, pair2 = len(hand1) == 2, len(hand2) == 2
+    if pair1 and pair2:
+        return "overpair_vs_underpair"
+    if pair1 or pair2:
+        pair, other = (hand1, hand2) if pair1 else (hand2, hand1)
+        overs = sum(_rank(card) > _rank(pair[0]) for card in other[:2])
+        if overs == 2:
+            return "pair_vs_overcards"
+        if pair in PREMIUM_HANDS and other in PREMIUM_HANDS:
+            return "premium_battles"  # AA / KK vs AK
+        if overs == 1:
+            return "pair_vs_one_overcard"
+        if other[2] == "s" and _rank(other[0]) - _rank(other[1]) == 1:
+            return "suited_connectors_vs_pairs"
+        return "pair_vs_undercards"
+
+    if hand1[:2] == hand2[:2]:
+        return "special_cases"  # Same ranks, suited vs offsuit
+    if set(hand1[:2]) & set(hand2[:2]):
+        return "domination"
+    return "high_vs_low"
+
+
+@lru_cache(maxsize=8192)
+def matchup_equity(hand1: str, hand2: str) -> tuple[int, int]:
+    """Rounded all-in equity % of (hand1, hand2), summing to 100."""
+    equity1 = round(hand_vs_hand(hand1, hand2) * 100)
+    return equity1, 100 - equity1
+
+
+@lru_cache(maxsize=4096)
+def hand_vs_range_equity(hand: str, villain_range: str) -> tuple[int, int]:
+    """Rounded all-in equity % of a hand class vs a range, summing to 100."""
+    equity, _ = range_vs_range([hand_index(hand)], range_indexes(villain_range))
+    equity1 = round(equity * 100)
+    return equity1, 100 - equity1
+
+
+@lru_cache(maxsize=1)
+def _matchup_index() -> dict[str, tuple[tuple[str, str], ...]]:
+    """
+    Every pair of distinct hand classes, grouped by category.
+
+    Pairs are ordered the way the quiz asks them: the pair first in the
+    pair_vs_* categories, the connector first vs pairs, otherwise the
+    favourite first.
+    """
+    index: dict[str, list[tuple[str, str]]] = {}
+    for i, hand1 in enumerate(ALL_HANDS):
+        for hand2 in ALL_HANDS[i + 1 :]:
+            category = classify_matchup(hand1, hand2)
+            if category.startswith("pair_vs_"):
+                keep_order = len(hand1) == 2
+            elif category == "suited_connectors_vs_pairs":
+                keep_order = len(hand1) != 2
+            else:
+                keep_order = hand_vs_hand(hand1, hand2) >= 0.5
+            index.setdefault(category, []).append((hand1, hand2) if keep_order else (hand2, hand1))
+    return {category: tuple(pairs) for category, pairs in index.items()}
+
+
 class EquityQuiz:
     """Quiz engine for preflop equity matchups."""
 
@@ -62,58 +174,66 @@ class EquityQuiz:
         self.settings = self.data.get("quiz_settings", {})
         self.tolerance = self.settings.get("tolerance", 5)
 
+        # Built-in categories, with descriptions / difficulties from the data file
+        self.categories = {
+            key: {"description": description, "difficulty": difficulty}
+            for key, (description, difficulty) in CATEGORIES.items()
+        }
+        self.notes = {}
+        for key, cat_data in self.data.get("matchups", {}).items():
+            category = self.categories.setdefault(key, {"description": key, "difficulty": "medium"})
+            category.update(
+                {k: v for k, v in cat_data.items() if k in ("description", "difficulty")}
+            )
+            for example in cat_data.get("examples", []):
+                if example.get("note"):
+                    self.notes[(example["hand1"], example["hand2"])] = example["note"]
+
     def _load_data(self) -> dict:
-        """Load equity data from JSON file."""
-        data_path = Path(__file__).parent.parent / "data" / "equity.json"
-        with open(data_path, encoding="utf-8") as f:
+        """Load optional quiz settings and notes from the JSON file."""
+        if not _DATA_PATH.exists():
+            return {}
+        with open(_DATA_PATH, encoding="utf-8") as f:
             return json.load(f)
 
     def generate_question(
         self, difficulty: str | None = None, category: str | None = None
     ) -> EquityQuestion:
         """Generate a random equity question."""
-        matchups = self.data.get("matchups", {})
+        index = _matchup_index()
+        askable = [key for key in self.categories if key in index or key == "hand_vs_range"]
 
         # Filter by category if specified
         if category:
-            categories = [category] if category in matchups else list(matchups.keys())
+            categories = [category] if category in askable else askable
         else:
-            categories = list(matchups.keys())
+            categories = askable
 
         # Filter by difficulty if specified
-        valid_categories = []
-        for cat in categories:
-            cat_data = matchups.get(cat, {})
-            if difficulty is None or cat_data.get("difficulty") == difficulty:
-                valid_categories.append(cat)
-
+        valid_categories = [
+            cat
+            for cat in categories
+            if difficulty is None or self.categories[cat]["difficulty"] == difficulty
+        ]
         if not valid_categories:
             valid_categories = categories
 
-        # Pick random category and example
         chosen_category = random.choice(valid_categories)
-        cat_data = matchups[chosen_category]
-        examples = cat_data.get("examples", [])
-
-        if not examples:
-            # Fallback to any category with examples
-            for cat, data in matchups.items():
-                if data.get("examples"):
-                    chosen_category = cat
-                    cat_data = data
-                    examples = data["examples"]
-                    break
-
-        example = random.choice(examples)
+        if chosen_category == "hand_vs_range":
+            hand1, hand2 = random.choice(ALL_HANDS), random.choice(RANGE_PRESETS)
+            equity1, equity2 = hand_vs_range_equity(hand1, hand2)
+        else:
+            hand1, hand2 = random.choice(index[chosen_category])
+            equity1, equity2 = matchup_equity(hand1, hand2)
 
         return EquityQuestion(
-            hand1=example["hand1"],
-            hand2=example["hand2"],
-            correct_equity1=example["equity1"],
-            correct_equity2=example["equity2"],
+            hand1=hand1,
+            hand2=hand2,
+            correct_equity1=equity1,
+            correct_equity2=equity2,
             category=chosen_category,
-            difficulty=cat_data.get("difficulty", "medium"),
-            note=example.get("note"),
+            difficulty=self.categories[chosen_category]["difficulty"],
+            note=self.notes.get((hand1, hand2)),
         )
 
     def generate_choices(
@@ -178,8 +298,7 @@ class EquityQuiz:
 
     def get_categories(self) -> list[tuple[str, str]]:
         """Get list of (category_key, description) tuples."""
-        matchups = self.data.get("matchups", {})
-        return [(key, data.get("description", key)) for key, data in matchups.items()]
+        return [(key, data["description"]) for key, data in self.categories.items()]
 
     def get_difficulties(self) -> list[str]:
         """Get list of available difficulty levels."""
@@ -187,5 +306,4 @@ class EquityQuiz:
 
     def get_category_description(self, category: str) -> str:
         """Get Chinese description for a category."""
-        matchups = self.data.get("matchups", {})
-        return matchups.get(category, {}).get("description", category)
+        return self.categories.get(category, {}).get("description", category)
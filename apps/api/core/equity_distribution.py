@@ -0,0 +1,284 @@
+"""
+Range vs range equity distributions on a fixed board.
+
+For every combo in each range this computes its exact equity against the
+whole opposing range over all remaining runouts, then buckets the results
+into a histogram (how much of a range is near-nuts, medium, air ...).
+
+Both ranges are scored together on every runout and sorted by strength once,
+so a combo's wins and ties are just the cumulative villain weight below and
+through its tie group; no villain combos are looped over. Card removal uses
+inclusion-exclusion: the same counts taken inside the (about 51-combo) lists
+of combos holding each of hero's cards are subtracted, and the identical
+combo, removed by both cards, is added back once. A full 1326 vs 1326 flop
+(1,176 runouts) takes about half a second.
+
+Results are cached on the canonical (suit-isomorphic) board and the sets of
+hand classes in each range: class-based ranges are suit-symmetric, so
+isomorphic boards give the same distribution up to relabelling suits.
+"""
+
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations
+
+import numpy as np
+
+from .canonical import canonical_form
+from .cards import card_masks, mask_of
+from .combos import class_notation, combo_cards, combo_str, hands_mask
+from .hand import parse_range
+from .hand_rank import encode_batch, strength_from_keys
+
+# Runouts scored per NumPy batch
+_RUNOUT_CHUNK = 64
+# Sorts after every real hand strength; fills the padding in per-card lists
+_PAD_STRENGTH = 8191
+
+
+@dataclass
+class SideDistribution:
+    """Equity distribution of one range."""
+
+    equity: float  # Range equity, 0-1
+    combos: int  # Combos left after board removal
+    histogram: list[float]  # Share of combos per equity bucket (sums to 1)
+    combo_equity: dict[str, float]  # "AhKh" -> equity, in the caller's suits
+
+
+@dataclass
+class EquityDistribution:
+    """Equity distributions for both ranges on one board."""
+
+    hero: SideDistribution
+    villain: SideDistribution
+    runouts: int
+    elapsed_ms: float
+
+
+def range_classes(range_str: str) -> tuple[str, ...]:
+    """Sorted hand classes of a range string; the range part of the cache key."""
+    return tuple(sorted({class_notation(hand) for hand in parse_range(range_str)}))
+
+
+def equity_distribution(
+    hero_range: str, villain_range: str, board: list[int], buckets: int = 10
+) -> EquityDistribution:
+    """
+    Per-combo equity histograms for two ranges on a 3-5 card board.
+
+    Args:
+        hero_range: Range string, e.g. "22+, A2s+, KTo+"
+        villain_range: Range string
+        board: Board card indexes
+        buckets: Number of equal-width equity buckets
+
+    Returns:
+        EquityDistribution with a histogram and per-combo equities per side
+
+    Raises:
+        ValueError: If the board is invalid or a range is empty after board
+            removal
+    """
+    start = time.perf_counter()
+    if len(set(board)) != len(board):
+        raise ValueError("Board cards must be distinct")
+    canonical, _, perm = canonical_form(board)
+    hero, villain, runouts = _distribution(
+        canonical, range_classes(hero_range), range_classes(villain_range)
+    )
+
+    # Map canonical suits back to the suits the caller used
+    inverse = [0] * 4
+    for suit, canonical_suit in enumerate(perm):
+        inverse[canonical_suit] = suit
+
+    def side(result: tuple[np.ndarray, np.ndarray, float]) -> SideDistribution:
+        combos, equity, range_equity = result
+        bucket = np.minimum((equity * buckets).astype(np.intp), buckets - 1)
+        histogram = np.bincount(bucket, minlength=buckets) / len(equity)
+        combo_equity = {}
+        for (a, b), eq in zip(combos.tolist(), equity.tolist()):
+            a, b = (a & ~3) | inverse[a & 3], (b & ~3) | inverse[b & 3]
+            combo_equity[combo_str(a, b)] = round(eq, 4)
+        return SideDistribution(
+            equity=range_equity,
+            combos=len(combos),
+            histogram=histogram.tolist(),
+            combo_equity=combo_equity,
+        )
+
+    return EquityDistribution(
+        hero=side(hero),
+        villain=side(villain),
+        runouts=runouts,
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+    )
+
+
+@lru_cache(maxsize=128)
+def _distribution(
+    board: tuple[int, ...], hero_classes: tuple[str, ...], villain_classes: tuple[str, ...]
+) -> tuple[tuple, tuple, int]:
+    """Cached core: per-combo equities for both sides on a canonical board."""
+    dead = mask_of(board)
+    hero = combo_cards(hands_mask(hero_classes), dead)
+    villain = combo_cards(hands_mask(villain_classes), dead)
+    if len(hero) == 0 or len(villain) == 0:
+        raise ValueError("Range is empty after removing board cards")
+
+    # Score the union of both ranges once per runout
+    union, inverse = np.unique(np.vstack([hero, villain]), axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    hero_idx, villain_idx = inverse[: len(hero)], inverse[len(hero) :]
+    union_keys = encode_batch(union)
+    union_masks = card_masks(union)
+
+    remaining = [c for c in range(52) if not dead >> c & 1]
+    to_come = 5 - len(board)
+    runouts = np.array(list(combinations(remaining, to_come)), dtype=np.intp)
+    runouts = runouts.reshape(len(runouts), to_come)
+    runout_masks = card_masks(runouts) if to_come else np.zeros(1, dtype=np.uint64)
+    board_keys = encode_batch(np.array(board, dtype=np.intp))
+    runout_keys = tuple(b + r for b, r in zip(board_keys, encode_batch(runouts)))
+
+    # Union combos holding each card, padded with a dummy column that is
+    # never valid; every combo sits in the lists of both of its cards
+    card_lists, slots = _card_lists(union)
+    hero_side = _Showdown(union, hero_idx, villain_idx, card_lists, slots)
+    villain_side = _Showdown(union, villain_idx, hero_idx, card_lists, slots)
+    for start in range(0, len(runouts), _RUNOUT_CHUNK):
+        chunk = slice(start, start + _RUNOUT_CHUNK)
+        # Combos that collide with the runout are scored on the board alone
+        # (their rank counts could overflow the key tables) and masked out
+        valid = (runout_masks[chunk, None] & union_masks[None, :]) == 0
+        strength = strength_from_keys(
+            *(
+                r[chunk, None] + np.where(valid, u[None, :], 0)
+                for r, u in zip(runout_keys, union_keys)
+            )
+        )
+        padded = np.hstack([strength, np.full((len(strength), 1), _PAD_STRENGTH)])
+        by_card = padded[:, card_lists].reshape(-1, card_lists.shape[1])
+        groups = _tie_groups(strength)
+        card_groups = tuple(g.reshape(len(strength), 52, -1) for g in _tie_groups(by_card))
+        hero_side.add(valid, groups, card_groups)
+        villain_side.add(valid, groups, card_groups)
+
+    return hero_side.result(), villain_side.result(), len(runouts)
+
+
+def _card_lists(union: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Union combo indexes per card and each combo's slot in its cards' lists.
+
+    Returns:
+        (lists int[52, width] padded with len(union), slots int[n, 2])
+    """
+    per_card = [[] for _ in range(52)]
+    slots = np.empty(union.shape, dtype=np.intp)
+    for i, (a, b) in enumerate(union.tolist()):
+        slots[i] = len(per_card[a]), len(per_card[b])
+        per_card[a].append(i)
+        per_card[b].append(i)
+    lists = np.full((52, max(map(len, per_card))), len(union), dtype=np.intp)
+    for card, ids in enumerate(per_card):
+        lists[card, : len(ids)] = ids
+    return lists, slots
+
+
+def _tie_groups(strength: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sort each row of combo strengths.
+
+    Returns:
+        (order, lo, hi): argsort per row, and for every combo the sorted
+        positions where its tie group starts and ends (exclusive), i.e. the
+        number of combos in the row strictly below / at or below it
+    """
+    n_rows, n = strength.shape
+    order = np.argsort(strength, axis=1, kind="stable")
+    ordered = np.take_along_axis(strength, order, axis=1)
+    positions = np.broadcast_to(np.arange(n), (n_rows, n))
+    new_group = np.ones((n_rows, n), dtype=bool)
+    new_group[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    group_lo = np.maximum.accumulate(np.where(new_group, positions, 0), axis=1)
+    group_end = np.ones((n_rows, n), dtype=bool)
+    group_end[:, :-1] = new_group[:, 1:]
+    group_hi = np.minimum.accumulate(np.where(group_end, positions + 1, n)[:, ::-1], axis=1)
+
+    rank = np.empty_like(order)
+    np.put_along_axis(rank, order, positions, axis=1)
+    lo = np.take_along_axis(group_lo, rank, axis=1)
+    hi = np.take_along_axis(group_hi[:, ::-1], rank, axis=1)
+    return order, lo, hi
+
+
+def _cumulative(weights: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """Running weight along the last axis in sorted order, with a leading 0."""
+    out = np.zeros(weights.shape[:-1] + (weights.shape[-1] + 1,), dtype=np.int32)
+    np.cumsum(np.take_along_axis(weights, order, axis=-1), axis=-1, out=out[..., 1:])
+    return out
+
+
+class _Showdown:
+    """Accumulates one side's per-combo showdown share over runout batches."""
+
+    def __init__(
+        self,
+        union: np.ndarray,
+        hero_idx: np.ndarray,
+        villain_idx: np.ndarray,
+        card_lists: np.ndarray,
+        slots: np.ndarray,
+    ):
+        self.union = union
+        self.hero_idx = hero_idx
+        self.in_villain = np.zeros(len(union) + 1, dtype=bool)
+        self.in_villain[villain_idx] = True
+        self.card_lists = card_lists
+        self.slots = slots[hero_idx]
+        self.points = np.zeros(len(hero_idx))
+        self.weight = np.zeros(len(hero_idx))
+
+    def add(
+        self,
+        valid: np.ndarray,
+        groups: tuple[np.ndarray, np.ndarray, np.ndarray],
+        card_groups: tuple[np.ndarray, np.ndarray, np.ndarray],
+    ) -> None:
+        """Score one batch of runouts (see _tie_groups for the group arrays)."""
+        n_runouts = len(valid)
+        rows = np.arange(n_runouts)[:, None]
+        hero = self.hero_idx
+        villain_w = np.zeros((n_runouts, len(self.in_villain)), dtype=np.int32)
+        villain_w[:, :-1] = valid
+        villain_w &= self.in_villain
+        same_w = villain_w[:, hero]
+
+        order, lo, hi = groups
+        total = _cumulative(villain_w[:, :-1], order)
+        wins = total[rows, lo[:, hero]]
+        at_most = total[rows, hi[:, hero]] + same_w
+        weight = total[:, -1:] + same_w
+
+        # Remove villain combos that share either of hero's cards. The
+        # identical combo was added back above, since both cards remove it.
+        card_order, card_lo, card_hi = card_groups
+        card_total = _cumulative(villain_w[:, self.card_lists], card_order)
+        for side in (0, 1):
+            card, slot = self.union[hero, side], self.slots[:, side]
+            wins -= card_total[rows, card, card_lo[:, card, slot]]
+            at_most -= card_total[rows, card, card_hi[:, card, slot]]
+            weight -= card_total[:, card, -1]
+
+        hero_valid = valid[:, hero]
+        self.points += ((wins + (at_most - wins) / 2) * hero_valid).sum(axis=0)
+        self.weight += (weight * hero_valid).sum(axis=0)
+
+    def result(self) -> tuple[np.ndarray, np.ndarray, float]:
+        """(combos, per-combo equity, range equity)."""
+        weight = np.where(self.weight > 0, self.weight, 1)
+        range_equity = float(self.points.sum() / max(self.weight.sum(), 1e-12))
+        return self.union[self.hero_idx], self.points / weight, range_equity
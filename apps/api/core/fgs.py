@@ -0,0 +1,246 @@
+"""
+Future Game Simulation (FGS) for ICM decisions.
+
+Plain ICM values a stack distribution as if the tournament stopped now, so
+it cannot see who is about to pay the blinds. FGS plays a few more push/fold
+hands with the button moving round the table and applies ICM to the stacks
+at the end of them instead.
+
+Model of each simulated hand:
+- The first player in shoves the heads-up chip-EV push range for their
+  effective stack against the players behind, and each player behind calls
+  with the heads-up call range for their effective stack against the shover.
+  The charts are solved by core/push_fold.py at whole big blinds and cached.
+- Endings and their probabilities come from push_fold.outcome_stacks and
+  ending_probabilities. Busted players take the lowest open places (shorter
+  starting stacks finish lower, equal ones split) and are paid there.
+
+Every distinct (stacks, button) state is expanded once, through an LRU cache
+shared across calls, and all leaves of a tree are valued in a single
+icm_equities_batch pass. The tree grows by about n^2 states per hand, so a
+6-max decision with a two hand horizon takes well under a second; deeper
+horizons can fan the first hand's subtrees out to a process pool.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from .icm import icm_equities_batch
+from .push_fold import ending_probabilities, outcome_stacks, solve_push_fold
+
+DEFAULT_FGS_HANDS = 2
+# Heads-up charts are solved at whole big blinds up to this depth
+FGS_MAX_DEPTH = 25
+FGS_CHART_ITERATIONS = 200
+# Expanded states kept across calls
+FGS_CACHE_SIZE = 65_536
+
+# (stacks per seat, button seat); seats are numbered clockwise
+State = tuple[tuple[float, ...], int]
+
+
+def fgs_equities_batch(
+    stacks,
+    payouts: list[float],
+    button: int,
+    small_blind: float = 0.5,
+    big_blind: float = 1.0,
+    ante: float = 0.0,
+    hands: int = DEFAULT_FGS_HANDS,
+    workers: int | None = None,
+) -> np.ndarray:
+    """
+    FGS equities for many stack distributions of the same seats.
+
+    Args:
+        stacks: (rows, n) chip stacks by seat, clockwise; 0 = busted
+        payouts: Payouts for the places still open (1st place, 2nd place, etc.)
+        button: Button seat for the first simulated hand (moves on to the
+            next live seat if that player is busted)
+        small_blind: Small blind in chips
+        big_blind: Big blind in chips
+        ante: Ante per player in chips
+        hands: Hands to simulate before applying ICM (0 = plain ICM)
+        workers: Processes for the first hand's subtrees (None = in process)
+
+    Returns:
+        (rows, n) array of $ equities
+    """
+    rows = np.asarray(stacks, dtype=np.float64)
+    roots = [_root(row, button) for row in rows]
+    params = (tuple(float(p) for p in payouts), small_blind, big_blind, ante)
+    if not workers or workers <= 1 or hands < 2:
+        return _evaluate(roots, params, hands)
+
+    # Each worker evaluates a slice of the states after the first hand
+    expanded = {s: _expand(s, *params) for s in dict.fromkeys(roots) if _live(s) > 1}
+    children = list(dict.fromkeys(c for _, cs, _ in expanded.values() for c in cs))
+    chunks = [children[i::workers] for i in range(workers)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(_evaluate, chunks, [params] * workers, [hands - 1] * workers)
+        values = {s: v for chunk, part in zip(chunks, parts) for s, v in zip(chunk, part)}
+
+    ended = [s for s in roots if s not in expanded]
+    if ended:
+        values.update(zip(ended, icm_equities_batch([s[0] for s in ended], list(payouts))))
+    result = np.zeros_like(rows)
+    for r, state in enumerate(roots):
+        if state in expanded:
+            probs, cs, prizes = expanded[state]
+            result[r] = probs @ (prizes + np.array([values[c] for c in cs]))
+        else:
+            result[r] = values[state]
+    return result
+
+
+def fgs_equities(
+    stacks: list[float],
+    payouts: list[float],
+    button: int,
+    small_blind: float = 0.5,
+    big_blind: float = 1.0,
+    ante: float = 0.0,
+    hands: int = DEFAULT_FGS_HANDS,
+    workers: int | None = None,
+) -> list[float]:
+    """FGS equity of each player for one table (see fgs_equities_batch)."""
+    return fgs_equities_batch(
+        [stacks], payouts, button, small_blind, big_blind, ante, hands, workers
+    )[0].tolist()
+
+
+def fgs_cache_info() -> dict[str, int]:
+    """Hit / miss counters and size of the expanded state cache."""
+    info = _expand.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
+
+
+def _root(row: np.ndarray, button: int) -> State:
+    stacks = tuple(round(float(s), 9) for s in row)
+    return stacks, _next_live(stacks, button)
+
+
+def _live(state: State) -> int:
+    return sum(1 for s in state[0] if s > 0)
+
+
+def _next_live(stacks: tuple[float, ...], seat: int) -> int:
+    """First live seat clockwise from `seat`, inclusive."""
+    n = len(stacks)
+    for k in range(n):
+        if stacks[(seat + k) % n] > 0:
+            return (seat + k) % n
+    return seat
+
+
+def _acting_order(stacks: tuple[float, ...], button: int) -> list[int]:
+    """Live seats in acting order, first to act ... BB (heads-up the button is the SB)."""
+    live = [i for i, s in enumerate(stacks) if s > 0]
+    k = live.index(button)
+    if len(live) == 2:
+        return [live[k], live[1 - k]]
+    return [live[(k + 3 + i) % len(live)] for i in range(len(live))]
+
+
+def _depth(chips: float, big_blind: float) -> int:
+    return int(min(max(round(chips / big_blind), 1), FGS_MAX_DEPTH))
+
+
+@lru_cache(maxsize=256)
+def _heads_up_chart(depth: int, ante: float) -> tuple[np.ndarray, np.ndarray]:
+    """(push, call) frequencies of the heads-up chip-EV equilibrium at `depth` bb."""
+    solution = solve_push_fold([depth, depth], ante=ante, iterations=FGS_CHART_ITERATIONS)
+    return solution.push["SB"], solution.call[("BB", "SB")]
+
+
+@lru_cache(maxsize=FGS_CACHE_SIZE)
+def _expand(
+    state: State, payouts: tuple[float, ...], small_blind: float, big_blind: float, ante: float
+) -> tuple[np.ndarray, tuple[State, ...], np.ndarray]:
+    """
+    Every way one simulated hand from `state` can end.
+
+    Returns:
+        (probabilities, next states, prizes): prizes[k] is what ending k
+        pays the players it busts, per seat
+    """
+    stacks, button = state
+    order = _acting_order(stacks, button)
+    n = len(order)
+    chips = [stacks[s] for s in order]
+    index, rows = outcome_stacks(chips, small_blind, big_blind, ante)
+
+    chart_ante = ante / big_blind
+    push = {
+        p: _heads_up_chart(_depth(min(chips[p], max(chips[p + 1 :])), big_blind), chart_ante)[0]
+        for p in range(n - 1)
+    }
+    call = {
+        (p, j): _heads_up_chart(_depth(min(chips[p], chips[j]), big_blind), chart_ante)[1]
+        for p in range(n - 1)
+        for j in range(p + 1, n)
+    }
+
+    probs, children, prizes = [], [], []
+    for key, prob in ending_probabilities(n, push, call).items():
+        if prob <= 0:
+            continue
+        after = list(stacks)
+        for seat, chips_after in zip(order, rows[index[key]]):
+            after[seat] = max(round(float(chips_after), 9), 0.0)
+        after = tuple(after)
+        busted = [s for s in order if after[s] <= 0]
+        probs.append(prob)
+        children.append((after, _next_live(after, (button + 1) % len(stacks))))
+        prizes.append(_bust_prizes(busted, stacks, n, payouts))
+    return np.array(probs), tuple(children), np.array(prizes)
+
+
+def _bust_prizes(
+    busted: list[int], stacks: tuple[float, ...], live: int, payouts: tuple[float, ...]
+) -> np.ndarray:
+    """Prizes of the players busted in one hand, who take the lowest of `live` places."""
+    prizes = np.zeros(len(stacks))
+    place = live
+    for start in sorted({stacks[s] for s in busted}):
+        group = [s for s in busted if stacks[s] == start]
+        paid = [payouts[k] if k < len(payouts) else 0.0 for k in range(place - len(group), place)]
+        prizes[group] = sum(paid) / len(group)
+        place -= len(group)
+    return prizes
+
+
+def _evaluate(roots: list[State], params: tuple, hands: int) -> np.ndarray:
+    """FGS equities of `roots`: expand level by level, ICM the leaves, back up."""
+    levels = [dict.fromkeys(roots)]
+    for _ in range(hands):
+        frontier = {}
+        for state in levels[-1]:
+            if _live(state) > 1:
+                frontier.update(dict.fromkeys(_expand(state, *params)[1]))
+        levels.append(frontier)
+
+    # Leaves and finished tournaments are valued by ICM in one batch
+    leaves = list(
+        dict.fromkeys([*levels[-1], *(s for level in levels[:-1] for s in level if _live(s) <= 1)])
+    )
+    icm = dict(zip(leaves, icm_equities_batch([s[0] for s in leaves], list(params[0]))))
+
+    values = {s: icm[s] for s in levels[-1]}
+    for level in reversed(levels[:-1]):
+        above = {}
+        for state in level:
+            if _live(state) <= 1:
+                above[state] = icm[state]
+                continue
+            probs, children, prizes = _expand(state, *params)
+            above[state] = probs @ (prizes + np.array([values[c] for c in children]))
+        values = above
+    return np.array([values[s] for s in roots])
@@ -6,6 +6,8 @@ Supports notation like: AA, AKs, AKo, T9s, 72o
 import random
 from dataclasses import dataclass
 
+from . import cards
+
 RANKS = ["A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2"]
 SUITS = ["s", "h", "d", "c"]  # spades, hearts, diamonds, clubs
 SUIT_SYMBOLS = {"s": "\u2660", "h": "\u2665", "d": "\u2666", "c": "\u2663"}
@@ -84,6 +86,16 @@ class Hand:
         col = RANKS.index(self.rank2)
         return (row, col)
 
+    def combos(self) -> list[tuple[int, int]]:
+        """Concrete card combos as (card, card) indexes (see core.cards)."""
+        r1 = cards.RANKS.index(self.rank1) * 4
+        r2 = cards.RANKS.index(self.rank2) * 4
+        if self.is_pair:
+            return [(r1 + s1, r1 + s2) for s1 in range(4) for s2 in range(s1 + 1, 4)]
+        if self.is_suited:
+            return [(r1 + s, r2 + s) for s in range(4)]
+        return [(r1 + s1, r2 + s2) for s1 in range(4) for s2 in range(4) if s1 != s2]
+
     def to_display(self, with_suits: bool = False) -> str:
         """Return display string, optionally with suit symbols."""
         if not with_suits:
@@ -0,0 +1,346 @@
+"""
+Fast 5-7 card hand ranking.
+
+Cards are small ints (see core/cards.py): ``rank * 4 + suit`` with rank
+0 = deuce ... 12 = ace. Evaluating a set of cards returns one int where higher
+is better (1 = 7-5-4-3-2 high, 7462 = royal flush), so a showdown is a plain
+integer comparison.
+
+Two lookup tables are built once, on first use:
+- flush table: 13-bit rank mask of one suit -> best flush / straight flush
+- rank table: base-5 rank-count key -> best non-flush hand
+
+`evaluate_batch` scores many hands at once with NumPy. It splits the rank
+key into a low (2-8) and high (9-A) half so the rank table becomes a dense
+array indexed through two small direct-mapped tables instead of a dict.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from .cards import card_index
+
+# Hand categories, weakest to strongest
+HIGH_CARD = 0
+ONE_PAIR = 1
+TWO_PAIR = 2
+THREE_OF_A_KIND = 3
+STRAIGHT = 4
+FLUSH = 5
+FULL_HOUSE = 6
+FOUR_OF_A_KIND = 7
+STRAIGHT_FLUSH = 8
+
+CATEGORY_NAMES = [
+    "High Card",
+    "One Pair",
+    "Two Pair",
+    "Three of a Kind",
+    "Straight",
+    "Flush",
+    "Full House",
+    "Four of a Kind",
+    "Straight Flush",
+]
+
+# Number of distinct 5-card hand strengths
+NUM_STRENGTHS = 7462
+
+# Each rank contributes 5**rank to the rank-count key (counts never exceed 4)
+RANK_KEYS = [5**r for r in range(13)]
+
+_WHEEL_MASK = 0b1000000001111  # A-2-3-4-5
+
+# Straight high card (rank index) for every 13-bit rank mask, -1 if none
+_STRAIGHT_HIGH: list[int] = []
+# Dense strength of the best flush for every 13-bit mask, 0 if < 5 bits
+_FLUSH_TABLE: list[int] = []
+# Dense strength of the best non-flush hand, keyed on the rank-count key
+_RANK_TABLE: dict[int, int] = {}
+# Dense strength -> (category, ranks) for describing results
+_STRENGTH_INFO: list[tuple[int, tuple[int, ...]]] = []
+# NumPy versions of the tables, built on first batch evaluation
+_np_tables: dict[str, np.ndarray] = {}
+
+# Ranks below _SPLIT_RANK go into the low half of a batch key
+_SPLIT_RANK = 7
+
+
+def straight_high(rank_mask: int) -> int:
+    """Return the high rank of the best straight in a 13-bit rank mask, or -1."""
+    if not _STRAIGHT_HIGH:
+        _build_tables()
+    return _STRAIGHT_HIGH[rank_mask]
+
+
+def _find_straight(mask: int) -> int:
+    for top in range(12, 3, -1):
+        window = 0b11111 << (top - 4)
+        if mask & window == window:
+            return top
+    if mask & _WHEEL_MASK == _WHEEL_MASK:
+        return 3  # Five-high
+    return -1
+
+
+def _raw_value(category: int, ranks: Iterable[int]) -> int:
+    """Pack a category and up to five tie-break ranks into a sortable int."""
+    value = category
+    count = 0
+    for r in ranks:
+        value = (value << 4) | r
+        count += 1
+    return value << (4 * (5 - count))
+
+
+def _unpack_raw(raw: int) -> tuple[int, tuple[int, ...]]:
+    ranks = tuple((raw >> (4 * i)) & 0xF for i in range(4, -1, -1))
+    return raw >> 20, ranks
+
+
+def _raw_from_counts(counts: list[int]) -> int:
+    """Best non-flush hand from per-rank counts (any 5-7 cards)."""
+    mask = 0
+    quads, trips, pairs, singles = [], [], [], []
+    for r in range(12, -1, -1):
+        c = counts[r]
+        if c:
+            mask |= 1 << r
+            if c == 4:
+                quads.append(r)
+            elif c == 3:
+                trips.append(r)
+            elif c == 2:
+                pairs.append(r)
+            else:
+                singles.append(r)
+
+    if quads:
+        kicker = max([r for r in range(13) if counts[r] and r != quads[0]], default=0)
+        return _raw_value(FOUR_OF_A_KIND, (quads[0], kicker))
+    if trips and (len(trips) > 1 or pairs):
+        pair = max(trips[1:] + pairs)
+        return _raw_value(FULL_HOUSE, (trips[0], pair))
+    top = _find_straight(mask)
+    if top >= 0:
+        return _raw_value(STRAIGHT, (top,))
+    if trips:
+        return _raw_value(THREE_OF_A_KIND, (trips[0], *singles[:2]))
+    if len(pairs) >= 2:
+        kicker = max(pairs[2:] + singles[:1])
+        return _raw_value(TWO_PAIR, (pairs[0], pairs[1], kicker))
+    if pairs:
+        return _raw_value(ONE_PAIR, (pairs[0], *singles[:3]))
+    return _raw_value(HIGH_CARD, singles[:5])
+
+
+def _raw_flush(mask: int) -> int:
+    """Best flush / straight flush from a 13-bit mask with 5+ bits."""
+    top = _find_straight(mask)
+    if top >= 0:
+        return _raw_value(STRAIGHT_FLUSH, (top,))
+    ranks = [r for r in range(12, -1, -1) if mask >> r & 1]
+    return _raw_value(FLUSH, ranks[:5])
+
+
+def _rank_multisets(size: int, rank: int = 12):
+    """Yield (counts, key) for every multiset of `size` ranks, max 4 per rank."""
+    if rank < 0:
+        if size == 0:
+            yield [0] * 13, 0
+        return
+    for c in range(min(4, size) + 1):
+        for counts, key in _rank_multisets(size - c, rank - 1):
+            counts[rank] = c
+            yield counts, key + c * RANK_KEYS[rank]
+
+
+def _build_tables() -> None:
+    """Build the straight, flush and rank-count lookup tables."""
+    straight = [_find_straight(m) for m in range(8192)]
+
+    raw_flush = [_raw_flush(m) if m.bit_count() >= 5 else 0 for m in range(8192)]
+    raw_ranks: dict[int, int] = {}
+    for size in (5, 6, 7):
+        for counts, key in _rank_multisets(size):
+            raw_ranks[key] = _raw_from_counts(counts)
+
+    # Every 6/7-card best hand is also some 5-card hand, so the distinct
+    # 5-card values define the dense strength scale.
+    five_card = {raw_flush[m] for m in range(8192) if m.bit_count() == 5}
+    five_card.update(raw_ranks[key] for _, key in _rank_multisets(5))
+    ordered = sorted(five_card)
+    assert len(ordered) == NUM_STRENGTHS
+    dense = {raw: i + 1 for i, raw in enumerate(ordered)}
+
+    _STRENGTH_INFO[:] = [(0, ())] + [_unpack_raw(raw) for raw in ordered]
+    _FLUSH_TABLE[:] = [dense[raw] if raw else 0 for raw in raw_flush]
+    _RANK_TABLE.clear()
+    _RANK_TABLE.update((key, dense[raw]) for key, raw in raw_ranks.items())
+    _STRAIGHT_HIGH[:] = straight
+
+
+def evaluate(cards: Iterable[int]) -> int:
+    """
+    Evaluate 5-7 cards given as int indexes.
+
+    Returns:
+        Strength from 1 (worst) to 7462 (royal flush); higher always wins.
+    """
+    if not _RANK_TABLE:
+        _build_tables()
+
+    key = 0
+    s0 = s1 = s2 = s3 = 0
+    for c in cards:
+        r = c >> 2
+        key += RANK_KEYS[r]
+        suit = c & 3
+        if suit == 0:
+            s0 |= 1 << r
+        elif suit == 1:
+            s1 |= 1 << r
+        elif suit == 2:
+            s2 |= 1 << r
+        else:
+            s3 |= 1 << r
+
+    best = _RANK_TABLE[key]
+    flush = _FLUSH_TABLE
+    return max(best, flush[s0], flush[s1], flush[s2], flush[s3])
+
+
+def evaluate_strings(cards: Iterable[str]) -> int:
+    """Evaluate cards given as strings like ['As', 'Kd', ...]."""
+    return evaluate([card_index(c) for c in cards])
+
+
+def hand_category(strength: int) -> int:
+    """Return the category (HIGH_CARD ... STRAIGHT_FLUSH) of a strength value."""
+    if not _STRENGTH_INFO:
+        _build_tables()
+    return _STRENGTH_INFO[strength][0]
+
+
+def hand_ranks(strength: int) -> tuple[int, ...]:
+    """
+    Return the defining ranks of a strength value, most significant first.
+
+    E.g. a full house gives (trips rank, pair rank, 0, 0, 0) and a straight
+    gives (high card rank, 0, 0, 0, 0).
+    """
+    if not _STRENGTH_INFO:
+        _build_tables()
+    return _STRENGTH_INFO[strength][1]
+
+
+# ============ Batch (NumPy) Evaluation ============
+
+
+def _count_patterns(n_ranks: int) -> list[tuple[int, int]]:
+    """All (key, size) rank-count patterns over n_ranks with at most 7 cards."""
+    patterns = [(0, 0)]
+    for r in range(n_ranks):
+        patterns = [
+            (key + c * 5**r, size + c) for key, size in patterns for c in range(5) if size + c <= 7
+        ]
+    return sorted(patterns, key=lambda p: (p[1], p[0]))
+
+
+def _build_np_tables() -> dict[str, np.ndarray]:
+    """
+    Build the perfect-hash tables used by `evaluate_batch`.
+
+    High-half patterns are ordered by card count, so for a given low half the
+    valid high halves (total of 5-7 cards) form one contiguous block. The
+    rank table stores those blocks back to back: index = lo_base + hi_index.
+    """
+    if not _RANK_TABLE:
+        _build_tables()
+
+    lo_patterns = _count_patterns(_SPLIT_RANK)
+    hi_patterns = _count_patterns(13 - _SPLIT_RANK)
+    hi_start = [0] * 9  # First hi_index with at least n cards
+    for n in range(9):
+        hi_start[n] = next((i for i, p in enumerate(hi_patterns) if p[1] >= n), len(hi_patterns))
+
+    hi_index = np.zeros(5 ** (13 - _SPLIT_RANK), dtype=np.int32)
+    for i, (key, _) in enumerate(hi_patterns):
+        hi_index[key] = i
+
+    lo_base = np.zeros(5**_SPLIT_RANK, dtype=np.int32)
+    ranks = []
+    lo_shift = 5**_SPLIT_RANK
+    for lo_key, lo_size in lo_patterns:
+        first = hi_start[max(0, 5 - lo_size)]
+        last = hi_start[8 - lo_size]
+        lo_base[lo_key] = len(ranks) - first
+        ranks.extend(
+            _RANK_TABLE[lo_key + hi_key * lo_shift] for hi_key, _ in hi_patterns[first:last]
+        )
+
+    # Card index -> contribution to each part of the key
+    card_lo = np.array(
+        [5 ** (c >> 2) if c >> 2 < _SPLIT_RANK else 0 for c in range(52)], dtype=np.int32
+    )
+    card_hi = np.array(
+        [5 ** ((c >> 2) - _SPLIT_RANK) if c >> 2 >= _SPLIT_RANK else 0 for c in range(52)],
+        dtype=np.int32,
+    )
+    # Suit-major bit (suit * 13 + rank) so each suit's ranks are one 13-bit field
+    card_suit_bit = np.array([1 << ((c & 3) * 13 + (c >> 2)) for c in range(52)], dtype=np.int64)
+
+    _np_tables.update(
+        lo_base=lo_base,
+        hi_index=hi_index,
+        ranks=np.array(ranks, dtype=np.uint16),
+        flush=np.array(_FLUSH_TABLE, dtype=np.uint16),
+        card_lo=card_lo,
+        card_hi=card_hi,
+        card_suit_bit=card_suit_bit,
+    )
+    return _np_tables
+
+
+def encode_batch(cards: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Encode card sets into additive batch keys.
+
+    Args:
+        cards: int array of card indexes, shape (..., n_cards)
+
+    Returns:
+        (lo, hi, suit_bits) arrays of shape (...). Keys of disjoint card sets
+        can be summed, which lets callers precompute a shared board once and
+        add each hand to it.
+    """
+    tables = _np_tables or _build_np_tables()
+    cards = np.asarray(cards, dtype=np.intp)
+    lo = tables["card_lo"][cards].sum(axis=-1, dtype=np.int32)
+    hi = tables["card_hi"][cards].sum(axis=-1, dtype=np.int32)
+    suit_bits = tables["card_suit_bit"][cards].sum(axis=-1, dtype=np.int64)
+    return lo, hi, suit_bits
+
+
+def strength_from_keys(lo: np.ndarray, hi: np.ndarray, suit_bits: np.ndarray) -> np.ndarray:
+    """Look up hand strengths for batch keys covering 5-7 cards each."""
+    tables = _np_tables or _build_np_tables()
+    strength = tables["ranks"][tables["lo_base"][lo] + tables["hi_index"][hi]]
+    flush = tables["flush"]
+    for suit in range(4):
+        strength = np.maximum(strength, flush[(suit_bits >> (13 * suit)) & 0x1FFF])
+    return strength
+
+
+def evaluate_batch(cards: np.ndarray) -> np.ndarray:
+    """
+    Evaluate many 5-7 card hands at once.
+
+    Args:
+        cards: int array of card indexes, shape (..., n_cards)
+
+    Returns:
+        uint16 strengths of shape (...), same scale as `evaluate`
+    """
+    return strength_from_keys(*encode_batch(cards))
@@ -5,10 +5,31 @@ ICM calculates the real-money equity of chip stacks based on:
 - Current chip distribution among players
 - Prize pool structure (payouts for each finishing position)
 
-Uses the Malmuth-Harville formula to calculate finish probabilities.
+Uses the Malmuth-Harville formula to calculate finish probabilities, with
+dynamic programming over subsets of players so a 9-10 player final table
+takes milliseconds. Past MAX_EXACT_PLAYERS live stacks the subset table is
+too large, so equities are estimated by sampling finishing orders instead.
+
+Exact equities are memoized on a canonical form of the table (live stacks
+sorted and divided by their common factor, payouts cut to the field size),
+since drills keep asking about the same distributions.
 """
 
+import math
+import os
 from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+# Largest live field solved exactly; the subset DP is O(n * 2^n)
+MAX_EXACT_PLAYERS = 12
+# Default finishing orders sampled per Monte Carlo ICM run
+DEFAULT_ICM_SAMPLES = 20_000
+# Sort keys held in memory per sampling batch (samples x players)
+_SAMPLE_BATCH_KEYS = 2_000_000
+# Canonical tables kept by the exact equity cache
+ICM_CACHE_SIZE = 4096
 
 
 @dataclass
@@ -19,6 +40,111 @@ class ICMResult:
     payouts: list[float]
     equities: list[float]  # $ equity for each player
     equity_pcts: list[float]  # Percentage of prize pool
+    std_errors: list[float] | None = None  # $ standard error per player, when sampled
+    samples: int = 0  # Finishing orders sampled, 0 when exact
+
+
+@dataclass
+class PressureCurve:
+    """ICM risk premium of one player across pot sizes."""
+
+    pot_sizes: list[int]
+    current_equity: float
+    win_equities: list[float]  # $ equity after winning each pot
+    lose_equities: list[float]
+    pressure_ratios: list[float]  # $ lost / $ gained per pot, inf when winning gains nothing
+    pressure_levels: list[str]  # "low" / "medium" / "high" / "extreme"
+
+
+@lru_cache(maxsize=32)
+def _subset_layers(n: int) -> tuple[np.ndarray, tuple]:
+    """
+    Subset bookkeeping shared by every DP over n players.
+
+    Returns:
+        (members, layers): members is the (2^n, n) 0/1 membership matrix.
+        layers[k] is (subsets with k players, per_player), where
+        per_player[j] holds the positions within the layer of the subsets
+        without player j and the subsets they grow into by adding j.
+    """
+    subsets = np.arange(1 << n)
+    members = (subsets[:, None] >> np.arange(n) & 1).astype(np.float64)
+    sizes = members.sum(axis=1)
+    layers = []
+    for k in range(n):
+        layer = subsets[sizes == k]
+        per_player = []
+        for j in range(n):
+            positions = np.flatnonzero((layer >> j & 1) == 0)
+            per_player.append((positions, layer[positions] | 1 << j))
+        layers.append((layer, tuple(per_player)))
+    return members, tuple(layers)
+
+
+def finish_probabilities_batch(stacks, places: int | None = None) -> np.ndarray:
+    """
+    Malmuth-Harville finish probabilities for many stack distributions at once.
+
+    Dynamic programming over bitmask subsets of the players: reach[S] is the
+    probability that the players in S took the top |S| places in some order.
+    Extending each subset by every player outside it fills in all players'
+    place probabilities in one O(n * 2^n) pass, instead of recursing over
+    every ordering of finishers. Rows (e.g. the win / lose variants of a
+    table) share the subset bookkeeping and go through the pass together.
+
+    Args:
+        stacks: (rows, n) chip stacks of the same n players; 0 = busted
+        places: Number of places to compute (default: all)
+
+    Returns:
+        (rows, n, places) array: probs[row, player, place]
+    """
+    stacks = np.asarray(stacks, dtype=np.float64)
+    n_rows, n = stacks.shape
+    places = n if places is None else min(places, n)
+    probs = np.zeros((n_rows, n, places))
+
+    # Players busted in every row never take a place
+    live = np.flatnonzero((stacks > 0).any(axis=0))
+    if len(live) == 0:
+        return probs
+    chips = np.maximum(stacks[:, live], 0)
+    members, layers = _subset_layers(len(live))
+    remaining = chips.sum(axis=1) - members @ chips.T  # Chips outside each subset, per row
+
+    reach = np.zeros((len(members), n_rows))
+    reach[0] = 1.0
+    for place in range(min(places, len(live))):
+        layer, per_player = layers[place]
+        left = remaining[layer]
+        p_per_chip = np.divide(reach[layer], left, out=np.zeros_like(left), where=left > 0)
+        for j, (positions, grown) in enumerate(per_player):
+            q = p_per_chip[positions] * chips[:, j]
+            probs[:, live[j], place] = q.sum(axis=0)
+            if place + 1 < places:
+                reach[grown] += q
+
+    return probs
+
+
+def finish_probabilities(
+    stacks: list[int], places: int | None = None, excluded: tuple[int, ...] = ()
+) -> list[list[float]]:
+    """
+    Malmuth-Harville finish probabilities for every player and place at once.
+
+    Args:
+        stacks: List of chip stacks
+        places: Number of places to compute (default: all)
+        excluded: Player indices already finished; places count from the
+            best place still open
+
+    Returns:
+        probs[player][place] for place 0 (1st) .. places - 1
+    """
+    # Busted and excluded players never take a place
+    row = [0 if i in excluded else s for i, s in enumerate(stacks)]
+    return finish_probabilities_batch(np.array([row]).reshape(1, len(row)), places)[0].tolist()
 
 
 def calculate_finish_probability(
@@ -38,46 +164,89 @@ def calculate_finish_probability(
     Returns:
         Probability of finishing in that position
     """
-    if player_idx in excluded:
+    if player_idx in excluded or position >= len(stacks):
         return 0.0
+    return finish_probabilities(stacks, position + 1, excluded)[player_idx][position]
 
-    # Base case: first place probability
-    if position == 0:
-        remaining_chips = sum(s for i, s in enumerate(stacks) if i not in excluded)
-        if remaining_chips == 0:
-            return 0.0
-        return stacks[player_idx] / remaining_chips
-
-    # Recursive case: calculate via Malmuth-Harville
-    prob = 0.0
-    remaining_chips = sum(s for i, s in enumerate(stacks) if i not in excluded)
 
-    if remaining_chips == 0:
-        return 0.0
-
-    for other_idx in range(len(stacks)):
-        if other_idx in excluded or other_idx == player_idx:
-            continue
-
-        # Probability that other_idx wins first among remaining
-        other_first_prob = stacks[other_idx] / remaining_chips
-
-        # Then calculate player's probability of position-1 among rest
-        new_excluded = excluded + (other_idx,)
-        prob += other_first_prob * calculate_finish_probability(
-            stacks, player_idx, position - 1, new_excluded
-        )
+def sample_icm_equities(
+    stacks: list[int],
+    payouts: list[float],
+    samples: int = DEFAULT_ICM_SAMPLES,
+    target_std_error: float | None = None,
+    seed: int | None = None,
+) -> tuple[list[float], list[float], int]:
+    """
+    Estimate Malmuth-Harville ICM equities by sampling finishing orders.
 
-    return prob
+    Each player draws an exponential key with rate equal to their stack and
+    players finish in key order. The smallest of independent exponentials
+    is player i's with probability stack_i / total chips, and by
+    memorylessness the same holds among whoever is left, so sorted keys are
+    exact draws from the Malmuth-Harville order.
 
+    Args:
+        stacks: List of chip stacks (0 = busted, never paid)
+        payouts: List of payouts (1st place, 2nd place, etc.)
+        samples: Upper bound on finishing orders drawn
+        target_std_error: Stop once every player's $ standard error is below this
+        seed: RNG seed for reproducible results
 
-def calculate_icm_equity(stacks: list[int], payouts: list[float]) -> ICMResult:
+    Returns:
+        (equities, standard errors, samples drawn), per player in stacks order
+    """
+    rng = np.random.default_rng(seed)
+    live = np.flatnonzero(np.asarray(stacks) > 0)
+    places = min(len(payouts), len(live))
+    paid = np.asarray(payouts[:places], dtype=np.float64)
+    rates = np.asarray(stacks, dtype=np.float64)[live]
+    batch_size = max(1, _SAMPLE_BATCH_KEYS // len(live))
+
+    total = np.zeros(len(live))
+    total_sq = np.zeros(len(live))
+    drawn = 0
+    while drawn < samples:
+        n = min(batch_size, samples - drawn)
+        keys = rng.standard_exponential((n, len(live))) / rates
+        # Only the paid places need ordering
+        top = np.argpartition(keys, places - 1, axis=1)[:, :places]
+        top = np.take_along_axis(top, np.argsort(np.take_along_axis(keys, top, 1), 1), 1)
+        total += np.bincount(top.ravel(), weights=np.tile(paid, n), minlength=len(live))
+        total_sq += np.bincount(top.ravel(), weights=np.tile(paid**2, n), minlength=len(live))
+        drawn += n
+
+        std_error = np.sqrt(np.maximum(total_sq / drawn - (total / drawn) ** 2, 0) / drawn)
+        if target_std_error is not None and std_error.max() <= target_std_error:
+            break
+
+    equities = [0.0] * len(stacks)
+    std_errors = [0.0] * len(stacks)
+    for i, equity, error in zip(live.tolist(), (total / drawn).tolist(), std_error.tolist()):
+        equities[i] = equity
+        std_errors[i] = error
+    return equities, std_errors, drawn
+
+
+def calculate_icm_equity(
+    stacks: list[int],
+    payouts: list[float],
+    samples: int = DEFAULT_ICM_SAMPLES,
+    target_std_error: float | None = None,
+    seed: int | None = None,
+) -> ICMResult:
     """
     Calculate ICM equity for each player.
 
+    Exact up to MAX_EXACT_PLAYERS live stacks, sampled beyond that (see
+    sample_icm_equities); sampled results carry per-player standard errors.
+    Exact results are cached on the canonical table (see icm_cache_info).
+
     Args:
         stacks: List of chip stacks for each player
         payouts: List of payouts (1st place, 2nd place, etc.)
+        samples: Finishing orders to sample for large fields
+        target_std_error: Stop sampling early at this $ standard error
+        seed: RNG seed for sampled results
 
     Returns:
         ICMResult with equity calculations
@@ -108,22 +277,177 @@ def calculate_icm_equity(stacks: list[int], payouts: list[float]) -> ICMResult:
         equity_pcts = [e / total_payout * 100 if total_payout > 0 else 0 for e in equities]
         return ICMResult(stacks=stacks, payouts=payouts, equities=equities, equity_pcts=equity_pcts)
 
-    # Calculate equity for each player
-    equities = [0.0] * n_players
-
-    for player_idx in range(n_players):
-        if stacks[player_idx] == 0:
-            continue
-
-        # Sum expected value across all finishing positions
-        for position in range(min(n_payouts, n_players)):
-            prob = calculate_finish_probability(stacks, player_idx, position)
-            equities[player_idx] += prob * payouts[position]
+    std_errors = None
+    n_samples = 0
+    if len(active_stacks) > MAX_EXACT_PLAYERS:
+        equities, std_errors, n_samples = sample_icm_equities(
+            stacks, payouts, samples, target_std_error, seed
+        )
+    else:
+        equities = _exact_equities(stacks, payouts)
 
     total_payout = sum(payouts[: min(n_payouts, n_players)])
     equity_pcts = [e / total_payout * 100 if total_payout > 0 else 0 for e in equities]
 
-    return ICMResult(stacks=stacks, payouts=payouts, equities=equities, equity_pcts=equity_pcts)
+    return ICMResult(
+        stacks=stacks,
+        payouts=payouts,
+        equities=equities,
+        equity_pcts=equity_pcts,
+        std_errors=std_errors,
+        samples=n_samples,
+    )
+
+
+def _exact_equities(stacks: list[int], payouts: list[float]) -> list[float]:
+    """Exact equities through the cache, mapped back to the caller's seat order."""
+    live = sorted((i for i, s in enumerate(stacks) if s > 0), key=lambda i: -stacks[i])
+    chips = [stacks[i] for i in live]
+    # ICM only depends on stack ratios, so integer stacks share one key per
+    # common factor (a 2000 / 1000 table is the same as 2 / 1)
+    if all(float(c).is_integer() for c in chips):
+        unit = math.gcd(*(int(c) for c in chips))
+        chips = [int(c) // unit for c in chips]
+
+    canonical = _canonical_equities(tuple(chips), tuple(float(p) for p in payouts[: len(live)]))
+    equities = [0.0] * len(stacks)
+    for i, equity in zip(live, canonical):
+        equities[i] = equity
+    return equities
+
+
+@lru_cache(maxsize=ICM_CACHE_SIZE)
+def _canonical_equities(stacks: tuple, payouts: tuple[float, ...]) -> tuple[float, ...]:
+    """Equities of a canonical table: live stacks, largest first, in lowest terms."""
+    # Sum expected value across all paid finishing positions, all players at once
+    probs = finish_probabilities(list(stacks), len(payouts))
+    return tuple(sum(p * payout for p, payout in zip(row, payouts)) for row in probs)
+
+
+def icm_cache_info() -> dict[str, int]:
+    """Hit / miss counters and size of the exact equity cache."""
+    info = _canonical_equities.cache_info()
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
+
+
+def clear_icm_cache() -> None:
+    """Empty the exact equity cache and reset its counters."""
+    _canonical_equities.cache_clear()
+
+
+# Worker processes forked from a warm parent start with their own empty cache
+# and counters instead of a copy of the parent's
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=clear_icm_cache)
+
+
+def icm_equities_batch(
+    stacks, payouts: list[float], samples: int = DEFAULT_ICM_SAMPLES, seed: int = 0
+) -> np.ndarray:
+    """
+    ICM equities for many stack distributions of the same players.
+
+    Exact rows share one subset DP pass. Past MAX_EXACT_PLAYERS live players
+    every row is sampled with the same seed, so the differences between rows
+    that pressure and bubble factors measure are not swamped by noise.
+
+    Args:
+        stacks: (rows, n) chip stacks
+        payouts: List of payouts (1st place, 2nd place, etc.)
+
+    Returns:
+        (rows, n) array of $ equities
+    """
+    stacks = np.asarray(stacks, dtype=np.float64)
+    places = min(len(payouts), stacks.shape[1])
+    if (stacks > 0).any(axis=0).sum() > MAX_EXACT_PLAYERS:
+        return np.array(
+            [sample_icm_equities(row.tolist(), payouts, samples, seed=seed)[0] for row in stacks]
+        )
+    probs = finish_probabilities_batch(stacks, places)
+    return probs @ np.asarray(payouts[:places], dtype=np.float64)
+
+
+def icm_pressure_curve(
+    stacks: list[int], payouts: list[float], player_idx: int, pot_sizes: list[int]
+) -> PressureCurve:
+    """
+    ICM pressure for one player across many pot sizes in one batch.
+
+    Each pot has a win variant (the player adds the pot) and a lose variant
+    (the player loses it, busting if it covers their stack), as in
+    calculate_icm_pressure; all of them are evaluated together.
+
+    Args:
+        stacks: Current chip stacks
+        payouts: Prize pool structure
+        player_idx: Player we're calculating for
+        pot_sizes: Pot sizes to evaluate
+
+    Returns:
+        PressureCurve with one entry per pot size
+    """
+    pots = np.asarray(pot_sizes, dtype=np.float64)
+    rows = np.repeat(np.asarray(stacks, dtype=np.float64)[None, :], 1 + 2 * len(pots), axis=0)
+    rows[1 : 1 + len(pots), player_idx] += pots
+    rows[1 + len(pots) :, player_idx] = np.maximum(rows[0, player_idx] - pots, 0)
+
+    equities = icm_equities_batch(rows, payouts)[:, player_idx]
+    current = equities[0]
+    win, lose = equities[1 : 1 + len(pots)], equities[1 + len(pots) :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = np.where(win - current > 0, (current - lose) / (win - current), np.inf)
+
+    return PressureCurve(
+        pot_sizes=list(pot_sizes),
+        current_equity=float(current),
+        win_equities=win.tolist(),
+        lose_equities=lose.tolist(),
+        pressure_ratios=ratios.tolist(),
+        pressure_levels=[_get_pressure_level(r) for r in ratios.tolist()],
+    )
+
+
+def bubble_factors(stacks: list[int], payouts: list[float]) -> np.ndarray:
+    """
+    Bubble factor of every player against every opponent.
+
+    bf[i, j] is what player i risks over what they stand to win, in ICM
+    dollars, when all-in against j for the effective stack min(s_i, s_j);
+    calling needs bf / (1 + bf) equity instead of 50% to break even. Both
+    outcomes of every pair's all-in are evaluated in one batch.
+
+    Args:
+        stacks: Current chip stacks
+        payouts: Prize pool structure
+
+    Returns:
+        (n, n) array; NaN on the diagonal and for busted players, inf when
+        winning gains player i nothing
+    """
+    n = len(stacks)
+    base = np.asarray(stacks, dtype=np.float64)
+    pairs = [(i, j) for i in range(n) for j in range(i + 1, n) if base[i] > 0 and base[j] > 0]
+    rows = np.repeat(base[None, :], 1 + 2 * len(pairs), axis=0)
+    for k, (i, j) in enumerate(pairs):
+        effective = min(base[i], base[j])
+        rows[1 + 2 * k, [i, j]] += (effective, -effective)  # i wins
+        rows[2 + 2 * k, [i, j]] += (-effective, effective)  # j wins
+
+    equities = icm_equities_batch(rows, payouts)
+    current = equities[0]
+    factors = np.full((n, n), np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for k, (i, j) in enumerate(pairs):
+            i_wins, j_wins = equities[1 + 2 * k], equities[2 + 2 * k]
+            factors[i, j] = (current[i] - j_wins[i]) / (i_wins[i] - current[i])
+            factors[j, i] = (current[j] - i_wins[j]) / (j_wins[j] - current[j])
+    return factors
 
 
 def calculate_icm_pressure(
@@ -144,35 +468,23 @@ def calculate_icm_pressure(
     Returns:
         Dictionary with ICM pressure metrics
     """
-    current_icm = calculate_icm_equity(stacks, payouts)
-    current_equity = current_icm.equities[player_idx]
-
-    # Calculate equity if we win the pot
-    win_stacks = stacks.copy()
-    win_stacks[player_idx] += pot_size
-    win_icm = calculate_icm_equity(win_stacks, payouts)
-    win_equity = win_icm.equities[player_idx]
-
-    # Calculate equity if we lose (assume bust out if pot >= our stack)
-    lose_stacks = stacks.copy()
-    lose_stacks[player_idx] = max(0, lose_stacks[player_idx] - pot_size)
-    lose_icm = calculate_icm_equity(lose_stacks, payouts)
-    lose_equity = lose_icm.equities[player_idx]
+    curve = icm_pressure_curve(stacks, payouts, player_idx, [pot_size])
+    current_equity = curve.current_equity
+    win_equity = curve.win_equities[0]
+    lose_equity = curve.lose_equities[0]
 
     gain = win_equity - current_equity
     loss = current_equity - lose_equity
 
-    # ICM pressure ratio: how much more you lose vs gain
-    pressure_ratio = loss / gain if gain > 0 else float("inf")
-
     return {
         "current_equity": current_equity,
         "win_equity": win_equity,
         "lose_equity": lose_equity,
         "potential_gain": gain,
         "potential_loss": loss,
-        "pressure_ratio": pressure_ratio,
-        "pressure_level": _get_pressure_level(pressure_ratio),
+        # ICM pressure ratio: how much more you lose vs gain
+        "pressure_ratio": curve.pressure_ratios[0],
+        "pressure_level": curve.pressure_levels[0],
     }
 
 
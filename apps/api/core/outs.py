@@ -6,41 +6,45 @@ Calculates outs, draw types, and equity based on hole cards + board.
 import random
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from itertools import combinations
+from math import comb
+
+import numpy as np
+
+from .cards import (
+    RANK_MASKS,
+    SUIT_MASKS,
+    SUIT_SYMBOLS,
+    Card,
+    CardSet,
+    card_masks,
+    mask_of,
+    parse_card_indexes,
+    rank_mask,
+    suit_counts,
+)
+from .cards import RANKS as _RANK_CHARS
+from .cards import SUITS as _SUIT_CHARS
+from .combos import COMBO_CARDS, NUM_COMBOS, range_mask, weighted_mask
+from .hand_rank import (
+    NUM_STRENGTHS,
+    encode_batch,
+    evaluate,
+    evaluate_batch,
+    hand_category,
+    hand_ranks,
+    straight_high,
+    strength_from_keys,
+)
 
 # Card ranks and suits
-RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A"]
-SUITS = ["s", "h", "d", "c"]  # spades, hearts, diamonds, clubs
-SUIT_SYMBOLS = {"s": "♠", "h": "♥", "d": "♦", "c": "♣"}
+RANKS = list(_RANK_CHARS)
+SUITS = list(_SUIT_CHARS)  # spades, hearts, diamonds, clubs
 
 RANK_VALUES = {r: i for i, r in enumerate(RANKS)}
 
 
-@dataclass
-class Card:
-    """A single playing card."""
-
-    rank: str  # '2'-'9', 'T', 'J', 'Q', 'K', 'A'
-    suit: str  # 's', 'h', 'd', 'c'
-
-    def __str__(self):
-        return f"{self.rank}{SUIT_SYMBOLS[self.suit]}"
-
-    def __hash__(self):
-        return hash((self.rank, self.suit))
-
-    def __eq__(self, other):
-        return self.rank == other.rank and self.suit == other.suit
-
-    @property
-    def value(self) -> int:
-        return RANK_VALUES[self.rank]
-
-    @classmethod
-    def from_string(cls, s: str) -> "Card":
-        """Parse card from string like 'As', 'Kh', 'Td'."""
-        return cls(rank=s[0].upper(), suit=s[1].lower())
-
-
 class DrawType(Enum):
     """Types of draws."""
 
@@ -70,6 +74,19 @@ class HandStrength(Enum):
     ROYAL_FLUSH = 9
 
 
+@dataclass
+class EquityResult:
+    """Result of exact turn/river enumeration against a hand or range."""
+
+    win: float  # % of runouts won (weighted over villain combos)
+    tie: float
+    lose: float
+    equity: float  # win + tie / 2
+    true_outs: list["Card"]  # Next cards that take hero from behind to ahead
+    runouts: int  # Runouts enumerated per villain combo
+    villain_combos: int  # Villain combos left after card removal
+
+
 @dataclass
 class OutsResult:
     """Result of outs calculation."""
@@ -83,38 +100,36 @@ class OutsResult:
     river_probability: float  # Probability of hitting on turn OR river
     out_cards: list[Card]  # Specific cards that are outs
     notes: list[str]
+    equity: EquityResult | None = None  # Exact equity, when a villain hand/range is given
 
 
 def create_deck() -> list[Card]:
     """Create a standard 52-card deck."""
-    return [Card(r, s) for r in RANKS for s in SUITS]
+    return [Card.from_index(i) for i in range(52)]
+
+
+# Shared deck in card-index order, so a CardSet maps straight back to Cards
+_DECK = tuple(create_deck())
 
 
 def parse_cards(cards_str: str) -> list[Card]:
     """Parse cards from string like 'AsKh' or 'As Kh Qd'."""
-    cards_str = cards_str.replace(" ", "")
-    cards = []
-    i = 0
-    while i < len(cards_str):
-        cards.append(Card.from_string(cards_str[i : i + 2]))
-        i += 2
-    return cards
+    return [_DECK[i] for i in parse_card_indexes(cards_str)]
+
+
+def _deck_cards(cards: CardSet) -> list[Card]:
+    return [_DECK[i] for i in cards]
 
 
 def count_suits(cards: list[Card]) -> dict:
     """Count cards by suit."""
-    counts = {"s": 0, "h": 0, "d": 0, "c": 0}
-    for card in cards:
-        counts[card.suit] += 1
-    return counts
+    return dict(zip(SUITS, suit_counts(CardSet.from_cards(cards).mask)))
 
 
 def count_ranks(cards: list[Card]) -> dict:
     """Count cards by rank."""
-    counts = {r: 0 for r in RANKS}
-    for card in cards:
-        counts[card.rank] += 1
-    return counts
+    mask = CardSet.from_cards(cards).mask
+    return {r: (mask & RANK_MASKS[i]).bit_count() for i, r in enumerate(RANKS)}
 
 
 def get_rank_values(cards: list[Card]) -> list[int]:
@@ -124,8 +139,7 @@ def get_rank_values(cards: list[Card]) -> list[int]:
 
 def has_flush(cards: list[Card]) -> str | None:
     """Check if 5+ cards of same suit. Returns suit or None."""
-    suit_counts = count_suits(cards)
-    for suit, count in suit_counts.items():
+    for suit, count in zip(SUITS, suit_counts(CardSet.from_cards(cards).mask)):
         if count >= 5:
             return suit
     return None
@@ -133,15 +147,7 @@ def has_flush(cards: list[Card]) -> str | None:
 
 def has_straight(cards: list[Card]) -> bool:
     """Check if there's a 5-card straight."""
-    values = set(c.value for c in cards)
-    # Check for A-2-3-4-5 (wheel)
-    if {12, 0, 1, 2, 3}.issubset(values):
-        return True
-    # Check for regular straights
-    for i in range(9):  # 0-4 through 8-12
-        if all(v in values for v in range(i, i + 5)):
-            return True
-    return False
+    return straight_high(rank_mask(CardSet.from_cards(cards).mask)) >= 0
 
 
 def evaluate_hand_strength(
@@ -152,88 +158,80 @@ def evaluate_hand_strength(
     Returns (strength, description_en, description_zh)
     """
     all_cards = hole_cards + board
-    rank_counts = count_ranks(all_cards)
-    count_suits(all_cards)
-
-    # Count pairs, trips, quads
-    pairs = [r for r, c in rank_counts.items() if c == 2]
-    trips = [r for r, c in rank_counts.items() if c == 3]
-    quads = [r for r, c in rank_counts.items() if c == 4]
-
-    # Check for flush
-    flush_suit = has_flush(all_cards)
-
-    # Check for straight
-    is_straight = has_straight(all_cards)
+    strength = evaluate([c.index for c in all_cards])
+    category = hand_category(strength)
+    ranks = [RANKS[r] for r in hand_ranks(strength)]
 
-    # Evaluate from strongest to weakest
-    if flush_suit and is_straight:
-        flush_cards = [c for c in all_cards if c.suit == flush_suit]
-        if has_straight(flush_cards):
-            values = set(c.value for c in flush_cards)
-            if {8, 9, 10, 11, 12}.issubset(values):
-                return HandStrength.ROYAL_FLUSH, "Royal Flush", "皇家同花順"
-            return HandStrength.STRAIGHT_FLUSH, "Straight Flush", "同花順"
+    if category == 8:
+        if ranks[0] == "A":
+            return HandStrength.ROYAL_FLUSH, "Royal Flush", "皇家同花順"
+        return HandStrength.STRAIGHT_FLUSH, "Straight Flush", "同花順"
 
-    if quads:
-        return HandStrength.FOUR_OF_A_KIND, f"Four of a Kind ({quads[0]}s)", f"四條 {quads[0]}"
+    if category == 7:
+        return HandStrength.FOUR_OF_A_KIND, f"Four of a Kind ({ranks[0]}s)", f"四條 {ranks[0]}"
 
-    if trips and pairs:
+    if category == 6:
         return (
             HandStrength.FULL_HOUSE,
-            f"Full House ({trips[0]}s full of {pairs[0]}s)",
-            f"葫蘆 {trips[0]} 帶 {pairs[0]}",
+            f"Full House ({ranks[0]}s full of {ranks[1]}s)",
+            f"葫蘆 {ranks[0]} 帶 {ranks[1]}",
         )
 
-    if flush_suit:
-        return HandStrength.FLUSH, f"Flush ({flush_suit})", "同花"
+    if category == 5:
+        return HandStrength.FLUSH, f"Flush ({has_flush(all_cards)})", "同花"
 
-    if is_straight:
+    if category == 4:
         return HandStrength.STRAIGHT, "Straight", "順子"
 
-    if trips:
-        return HandStrength.THREE_OF_A_KIND, f"Three of a Kind ({trips[0]}s)", f"三條 {trips[0]}"
+    if category == 3:
+        return HandStrength.THREE_OF_A_KIND, f"Three of a Kind ({ranks[0]}s)", f"三條 {ranks[0]}"
 
-    if len(pairs) >= 2:
-        sorted_pairs = sorted(pairs, key=lambda r: RANK_VALUES[r], reverse=True)
+    if category == 2:
         return (
             HandStrength.TWO_PAIR,
-            f"Two Pair ({sorted_pairs[0]}s and {sorted_pairs[1]}s)",
-            f"兩對 {sorted_pairs[0]} 和 {sorted_pairs[1]}",
+            f"Two Pair ({ranks[0]}s and {ranks[1]}s)",
+            f"兩對 {ranks[0]} 和 {ranks[1]}",
         )
 
-    if pairs:
+    if category == 1:
         # Check if pair uses hole cards
         hole_ranks = [c.rank for c in hole_cards]
-        if pairs[0] in hole_ranks:
-            return HandStrength.ONE_PAIR, f"Pair of {pairs[0]}s", f"一對 {pairs[0]}"
+        if ranks[0] in hole_ranks:
+            return HandStrength.ONE_PAIR, f"Pair of {ranks[0]}s", f"一對 {ranks[0]}"
         else:
-            return HandStrength.ONE_PAIR, f"Pair of {pairs[0]}s (board)", f"一對 {pairs[0]} (公牌)"
+            return HandStrength.ONE_PAIR, f"Pair of {ranks[0]}s (board)", f"一對 {ranks[0]} (公牌)"
 
     # High card - get highest hole card
     high_card = max(hole_cards, key=lambda c: c.value)
     return HandStrength.HIGH_CARD, f"High Card ({high_card.rank})", f"高牌 {high_card.rank}"
 
 
-def calculate_outs(hole_cards: list[Card], board: list[Card]) -> OutsResult:
+def calculate_outs(
+    hole_cards: list[Card],
+    board: list[Card],
+    villain: list[Card] | str | dict[str, float] | None = None,
+) -> OutsResult:
     """
     Calculate outs for improving the hand.
 
     Args:
         hole_cards: List of 2 hole cards
         board: List of 3-5 board cards (flop, turn, river)
+        villain: Optional villain hand or range; when given, the result also
+            carries exact enumerated equity (see calculate_equity)
 
     Returns:
         OutsResult with all outs information
     """
     all_cards = hole_cards + board
-    remaining_deck = [c for c in create_deck() if c not in all_cards]
+    dead = CardSet.from_cards(all_cards)
+    live = ~dead
 
     # Current hand strength
     strength, desc_en, desc_zh = evaluate_hand_strength(hole_cards, board)
 
     draws = []
-    out_cards = set()
+    out_cards = CardSet()
     notes = []
 
     # Helper to format rank (T -> 10)
@@ -241,17 +239,18 @@ def calculate_outs(hole_cards: list[Card], board: list[Card]) -> OutsResult:
         return "10" if r == "T" else r
 
     # Check for flush draw
-    suit_counts = count_suits(all_cards)
-    for suit, count in suit_counts.items():
+    for suit_value, count in enumerate(dead.suit_counts()):
         if count == 4:
             # Flush draw - 9 outs
-            flush_outs = [c for c in remaining_deck if c.suit == suit]
-            draws.append((DrawType.FLUSH_DRAW, len(flush_outs), flush_outs))
-            out_cards.update(flush_outs)
+            suit = SUITS[suit_value]
+            flush_outs = live.suit(suit_value)
+            draws.append((DrawType.FLUSH_DRAW, len(flush_outs), _deck_cards(flush_outs)))
+            out_cards |= flush_outs
             notes.append(f"同花聽牌 ({SUIT_SYMBOLS[suit]}): 9張{SUIT_SYMBOLS[suit]}")
 
     # Check for straight draws
-    values = sorted(set(c.value for c in all_cards))
+    ranks_held = dead.rank_mask()
+    values = [r for r in range(13) if ranks_held >> r & 1]
 
     # OESD check (open-ended straight draw)
     for i in range(len(values) - 3):
@@ -260,14 +259,14 @@ def calculate_outs(hole_cards: list[Card], board: list[Card]) -> OutsResult:
             # Check both ends
             low_out = seq[0] - 1
             high_out = seq[-1] + 1
-            oesd_outs = []
+            oesd_outs = CardSet()
             if low_out >= 0:
-                oesd_outs.extend([c for c in remaining_deck if c.value == low_out])
+                oesd_outs |= live.rank(low_out)
             if high_out <= 12:
-                oesd_outs.extend([c for c in remaining_deck if c.value == high_out])
+                oesd_outs |= live.rank(high_out)
             if len(oesd_outs) == 8:
-                draws.append((DrawType.OESD, 8, oesd_outs))
-                out_cards.update(oesd_outs)
+                draws.append((DrawType.OESD, 8, _deck_cards(oesd_outs)))
+                out_cards |= oesd_outs
                 low_rank = RANKS[low_out] if low_out >= 0 else None
                 high_rank = RANKS[high_out] if high_out <= 12 else None
                 notes.append(
@@ -276,16 +275,14 @@ def calculate_outs(hole_cards: list[Card], board: list[Card]) -> OutsResult:
 
     # Gutshot check
     for target_low in range(9):  # Check all possible straights
-        straight_ranks = set(range(target_low, target_low + 5))
-        held = straight_ranks.intersection(set(values))
-        missing = straight_ranks - set(values)
-        if len(held) == 4 and len(missing) == 1:
-            missing_val = list(missing)[0]
-            gutshot_outs = [c for c in remaining_deck if c.value == missing_val]
+        missing = 0x1F << target_low & ~ranks_held
+        if missing.bit_count() == 1:
+            missing_val = missing.bit_length() - 1
+            gutshot_outs = live.rank(missing_val)
             if gutshot_outs and DrawType.OESD not in [d[0] for d in draws]:
                 missing_rank = RANKS[missing_val]
-                draws.append((DrawType.GUTSHOT, len(gutshot_outs), gutshot_outs))
-                out_cards.update(gutshot_outs)
+                draws.append((DrawType.GUTSHOT, len(gutshot_outs), _deck_cards(gutshot_outs)))
+                out_cards |= gutshot_outs
                 notes.append(f"卡順聽牌 (Gutshot): 需要 {fmt_rank(missing_rank)}")
                 break
 
@@ -295,26 +292,26 @@ def calculate_outs(hole_cards: list[Card], board: list[Card]) -> OutsResult:
         hole_high_cards = [c for c in hole_cards if c.value > board_high]
         if len(hole_high_cards) == 2:
             # Two overcards = 6 outs (3 per card)
-            overcard_outs = [
-                c for c in remaining_deck if c.rank in [hc.rank for hc in hole_high_cards]
-            ]
-            draws.append((DrawType.OVERCARDS, len(overcard_outs), overcard_outs))
-            out_cards.update(overcard_outs)
+            overcard_outs = CardSet()
+            for hc in hole_high_cards:
+                overcard_outs |= live.rank(hc.value)
+            draws.append((DrawType.OVERCARDS, len(overcard_outs), _deck_cards(overcard_outs)))
+            out_cards |= overcard_outs
             ranks_str = " ".join([fmt_rank(hc.rank) for hc in hole_high_cards])
             notes.append(f"兩張高牌 (Overcards): {ranks_str}")
         elif len(hole_high_cards) == 1:
             # One overcard = 3 outs
-            overcard_outs = [c for c in remaining_deck if c.rank == hole_high_cards[0].rank]
-            draws.append((DrawType.ONE_OVERCARD, len(overcard_outs), overcard_outs))
-            out_cards.update(overcard_outs)
+            overcard_outs = live.rank(hole_high_cards[0].value)
+            draws.append((DrawType.ONE_OVERCARD, len(overcard_outs), _deck_cards(overcard_outs)))
+            out_cards |= overcard_outs
             notes.append(f"一張高牌: {fmt_rank(hole_high_cards[0].rank)}")
 
     # Check for set draw (pocket pair)
     hole_ranks = [c.rank for c in hole_cards]
     if hole_ranks[0] == hole_ranks[1] and strength.value < HandStrength.THREE_OF_A_KIND.value:
-        set_outs = [c for c in remaining_deck if c.rank == hole_ranks[0]]
-        draws.append((DrawType.SET_DRAW, len(set_outs), set_outs))
-        out_cards.update(set_outs)
+        set_outs = live.rank(hole_cards[0].value)
+        draws.append((DrawType.SET_DRAW, len(set_outs), _deck_cards(set_outs)))
+        out_cards |= set_outs
         notes.append(f"聽暗三: {fmt_rank(hole_ranks[0])}")
 
     # Calculate total outs (remove duplicates for combo draws)
@@ -342,8 +339,346 @@ def calculate_outs(hole_cards: list[Card], board: list[Card]) -> OutsResult:
         total_outs=total_outs,
         turn_probability=round(turn_prob, 1),
         river_probability=round(river_prob, 1),
-        out_cards=list(out_cards),
+        out_cards=_deck_cards(out_cards),
         notes=notes,
+        equity=calculate_equity(hole_cards, board, villain) if villain is not None else None,
+    )
+
+
+# ============ Exact Equity Enumeration ============
+
+# Villain combos scored per NumPy chunk (bounds peak memory at ~1M hands)
+_EQUITY_CHUNK = 512
+
+
+def _villain_combos(
+    villain: list[Card] | str | dict[str, float] | None,
+) -> tuple[tuple[int, int, float], ...]:
+    """Expand a villain hand, range string or {hand: weight} dict to weighted combos."""
+    if villain is None:
+        weights = np.ones(NUM_COMBOS)
+    elif isinstance(villain, str):
+        weights = range_mask(villain).astype(np.float64)
+    elif isinstance(villain, dict):
+        weights = weighted_mask({hand: float(w) for hand, w in villain.items()})
+    else:
+        a, b = sorted(c.index for c in villain)
+        return ((a, b, 1.0),)
+
+    ids = np.flatnonzero(weights > 0)
+    return tuple((a, b, w) for (a, b), w in zip(COMBO_CARDS[ids].tolist(), weights[ids].tolist()))
+
+
+def calculate_equity(
+    hole_cards: list[Card],
+    board: list[Card],
+    villain: list[Card] | str | dict[str, float] | None = None,
+) -> EquityResult:
+    """
+    Exact equity by enumerating every remaining turn/river runout.
+
+    Args:
+        hole_cards: Hero's 2 hole cards
+        board: 3-5 board cards
+        villain: A specific hand (list of 2 Cards), a range string such as
+            "TT+, AQs+", a {hand class: weight} dict, or None for any two cards
+
+    Returns:
+        EquityResult with win/tie/lose percentages and the true outs
+    """
+    hero = tuple(sorted(c.index for c in hole_cards))
+    board_key = tuple(sorted(c.index for c in board))
+    win, tie, lose, outs, runouts, n_combos = _enumerate_equity(
+        hero, board_key, _villain_combos(villain)
+    )
+    return EquityResult(
+        win=round(win * 100, 1),
+        tie=round(tie * 100, 1),
+        lose=round(lose * 100, 1),
+        equity=round((win + tie / 2) * 100, 1),
+        true_outs=[_DECK[i] for i in outs],
+        runouts=runouts,
+        villain_combos=n_combos,
+    )
+
+
+def _strengths(
+    hero_keys: tuple, board_keys: tuple, villain_keys: tuple, valid: np.ndarray | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Score hero and every villain combo on a set of boards.
+
+    Keys are additive batch keys from encode_batch: hero keys cover one hand,
+    board keys have one entry per board and villain keys one per combo.
+    Combos marked invalid (combo x board) share a card with the board; they
+    are scored on the board alone, since their rank counts could overflow the
+    key tables, and callers must mask them out.
+
+    Returns:
+        (hero strength per board, villain strength per combo x board)
+    """
+    hero = strength_from_keys(*(h + b for h, b in zip(hero_keys, board_keys)))
+    villain = strength_from_keys(
+        *(
+            b[None, :] + (v[:, None] if valid is None else np.where(valid, v[:, None], 0))
+            for v, b in zip(villain_keys, board_keys)
+        )
+    )
+    return hero, villain
+
+
+@lru_cache(maxsize=512)
+def _enumerate_equity(
+    hero: tuple[int, int],
+    board: tuple[int, ...],
+    villain: tuple[tuple[int, int, float], ...],
+) -> tuple[float, float, float, tuple[int, ...], int, int]:
+    """Cached core of calculate_equity, keyed on sorted card indexes."""
+    dead = mask_of(hero + board)
+    combos = [(a, b, w) for a, b, w in villain if not (dead >> a & 1 or dead >> b & 1)]
+    if not combos:
+        return 0.0, 0.0, 0.0, (), 0, 0
+
+    villain_cards = np.array([(a, b) for a, b, _ in combos], dtype=np.intp)
+    weights = np.array([w for _, _, w in combos])
+    weights /= weights.sum()
+    villain_masks = card_masks(villain_cards)
+    villain_keys = encode_batch(villain_cards)
+    hero_keys = encode_batch(np.array(hero))
+    board_keys = encode_batch(np.array(board))
+
+    remaining = [c for c in range(52) if not dead >> c & 1]
+    to_come = 5 - len(board)
+    runouts = np.array(list(combinations(remaining, to_come)), dtype=np.intp)
+    runouts = runouts.reshape(len(runouts), to_come)
+    runout_masks = card_masks(runouts)
+    runout_keys = tuple(b + r for b, r in zip(board_keys, encode_batch(runouts)))
+
+    # Every villain combo sees the same number of runouts once its own two
+    # cards are removed, so per-combo rates can be weighted directly.
+    win = tie = 0.0
+    for start in range(0, len(combos), _EQUITY_CHUNK):
+        chunk = slice(start, start + _EQUITY_CHUNK)
+        valid = (villain_masks[chunk, None] & runout_masks[None, :]) == 0
+        hero_s, villain_s = _strengths(
+            hero_keys, runout_keys, tuple(k[chunk] for k in villain_keys), valid
+        )
+        n_valid = valid.sum(axis=1)
+        w = weights[chunk] / n_valid
+        win += float(w @ (valid & (hero_s[None, :] > villain_s)).sum(axis=1))
+        tie += float(w @ (valid & (hero_s[None, :] == villain_s)).sum(axis=1))
+
+    # True outs: next cards that move hero from behind to ahead, comparing
+    # made hands on the current board vs the board plus that one card.
+    outs: tuple[int, ...] = ()
+    if to_come:
+        hero_now, villain_now = _strengths(
+            hero_keys, tuple(np.atleast_1d(k) for k in board_keys), villain_keys
+        )
+        share_now = weights @ (
+            (hero_now > villain_now[:, 0]) + 0.5 * (hero_now == villain_now[:, 0])
+        )
+        if share_now < 0.5:
+            next_cards = np.array(remaining, dtype=np.intp)[:, None]
+            next_keys = tuple(b + k for b, k in zip(board_keys, encode_batch(next_cards)))
+            valid = (villain_masks[:, None] & card_masks(next_cards)[None, :]) == 0
+            hero_next, villain_next = _strengths(hero_keys, next_keys, villain_keys, valid)
+            result = (hero_next[None, :] > villain_next) + 0.5 * (
+                hero_next[None, :] == villain_next
+            )
+            covered = weights @ valid
+            share_next = (weights @ (valid * result)) / np.where(covered > 0, covered, 1)
+            outs = tuple(c for c, share in zip(remaining, share_next) if share > 0.5)
+
+    runouts_per_combo = comb(len(remaining) - 2, to_come)
+    return win, tie, 1.0 - win - tie, outs, runouts_per_combo, len(combos)
+
+
+# ============ Batch Outs ============
+
+# Draw types reported per spot by calculate_outs_batch, in detection order
+BATCH_DRAW_TYPES = (
+    DrawType.FLUSH_DRAW,
+    DrawType.OESD,
+    DrawType.GUTSHOT,
+    DrawType.OVERCARDS,
+    DrawType.ONE_OVERCARD,
+    DrawType.SET_DRAW,
+)
+
+# Lookup tables shared by every batch, built on first use
+_batch_tables: dict[str, np.ndarray] = {}
+
+
+@dataclass
+class OutsBatch:
+    """Column-oriented outs results; every array has one entry per spot."""
+
+    hand_strength: np.ndarray  # HandStrength values
+    draw_outs: dict[DrawType, np.ndarray]  # Outs per draw type, 0 when absent
+    total_outs: np.ndarray
+    turn_probability: np.ndarray  # %, rounded like calculate_outs
+    river_probability: np.ndarray
+    out_masks: np.ndarray  # uint64 card masks of the out cards
+
+    def __len__(self) -> int:
+        return len(self.total_outs)
+
+    def out_cards(self, i: int) -> list[Card]:
+        """Out cards of spot i."""
+        return _deck_cards(CardSet(int(self.out_masks[i])))
+
+
+def _build_batch_tables() -> dict[str, np.ndarray]:
+    """
+    Build the tables behind calculate_outs_batch.
+
+    Straight draws only depend on the set of ranks held: an OESD counts only
+    when both end ranks are fully live (not held at all), and a gutshot's
+    missing rank is never held, so both are 13-bit rank mask -> out ranks.
+    """
+    held = np.arange(1 << 13)
+    oesd = np.zeros(1 << 13, dtype=np.intp)
+    for low in range(1, 9):
+        ends = 0x21 << (low - 1)  # Ranks low - 1 and low + 4
+        oesd |= np.where((held >> low & 0xF == 0xF) & (held & ends == 0), ends, 0)
+
+    # First window missing exactly one rank, for hands without an OESD
+    gutshot = np.zeros(1 << 13, dtype=np.intp)
+    for low in reversed(range(9)):
+        missing = 0x1F << low & ~held
+        single = (missing != 0) & (missing & (missing - 1) == 0)
+        gutshot = np.where(single, missing, gutshot)
+    gutshot[oesd != 0] = 0
+
+    rank_bits = held[:, None] >> np.arange(13) & 1
+    rank_cards = np.bitwise_or.reduce(
+        np.where(rank_bits == 1, np.array(RANK_MASKS, dtype=np.uint64), np.uint64(0)), axis=1
+    )
+    hand_strength = np.array([hand_category(s) for s in range(NUM_STRENGTHS + 1)], dtype=np.int8)
+    hand_strength[NUM_STRENGTHS] = HandStrength.ROYAL_FLUSH.value
+
+    _batch_tables.update(
+        oesd=oesd,
+        gutshot=gutshot,
+        rank_cards=rank_cards,
+        suit_cards=np.array(SUIT_MASKS, dtype=np.uint64),
+        hand_strength=hand_strength,
+        popcount=np.array([i.bit_count() for i in range(256)], dtype=np.int8),
+    )
+    return _batch_tables
+
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    """Number of set bits in each uint64 mask."""
+    popcount = _batch_tables["popcount"]
+    return popcount[masks.view(np.uint8).reshape(len(masks), 8)].sum(axis=1, dtype=np.intp)
+
+
+def calculate_outs_batch(holes, boards) -> OutsBatch:
+    """
+    Calculate outs for many (hole cards, board) spots at once.
+
+    Follows the same draw rules and numbers as calculate_outs, without the
+    notes, descriptions or equity. Every spot goes through the same few NumPy
+    passes over shared deck masks and draw tables, so thousands of spots
+    (quiz banks, hand history review) cost milliseconds instead of one
+    Python call each.
+
+    Args:
+        holes: (n, 2) hole card indexes
+        boards: n boards of 3-5 card indexes each; lengths may differ
+
+    Returns:
+        OutsBatch with one entry per spot, in input order
+
+    Raises:
+        ValueError: On a wrong card count, an invalid card or a spot that
+            repeats a card
+    """
+    tables = _batch_tables or _build_batch_tables()
+    holes = np.asarray(holes, dtype=np.intp)
+    if holes.ndim != 2 or holes.shape[1] != 2:
+        raise ValueError("Hole cards must be 2 cards per spot")
+    n = len(holes)
+    if len(boards) != n:
+        raise ValueError("Need one board per spot")
+
+    board_len = np.array([len(b) for b in boards], dtype=np.intp).reshape(n)
+    if ((board_len < 3) | (board_len > 5)).any():
+        raise ValueError("Board must have 3 to 5 cards")
+    padded = np.full((n, 5), -1, dtype=np.intp)
+    for length in np.unique(board_len).tolist():
+        rows = np.flatnonzero(board_len == length)
+        padded[rows, :length] = np.array([boards[i] for i in rows.tolist()], dtype=np.intp)
+
+    cards = np.hstack([holes, padded])  # -1 pads short boards
+    present = cards >= 0
+    if (cards > 51).any() or (holes < 0).any():
+        raise ValueError("Card index must be 0-51")
+    bits = np.where(present, np.uint64(1) << np.maximum(cards, 0).astype(np.uint64), np.uint64(0))
+    dead = np.bitwise_or.reduce(bits, axis=1)
+    n_cards = 2 + board_len
+    if (_popcount(dead) != n_cards).any():
+        raise ValueError("Duplicate cards in a spot")
+    live = ~dead
+
+    strength = np.empty(n, dtype=np.intp)
+    for length in np.unique(board_len).tolist():
+        rows = np.flatnonzero(board_len == length)
+        strength[rows] = evaluate_batch(cards[rows, : 2 + length])
+    hand_strength = tables["hand_strength"][strength]
+
+    rank_cards = tables["rank_cards"]
+    ranks = cards >> 2
+    held = np.bitwise_or.reduce(np.where(present, 1 << np.maximum(ranks, 0), 0), axis=1)
+    suits = (cards[:, :, None] & 3) == np.arange(4)
+    flush_suits = (suits & present[:, :, None]).sum(axis=1) == 4
+    flush = np.bitwise_or.reduce(np.where(flush_suits, tables["suit_cards"], np.uint64(0)), axis=1)
+
+    # Overcards only count with a high card hand, a set draw below trips
+    hole_ranks = ranks[:, :2]
+    over = (hole_ranks > ranks[:, 2:].max(axis=1)[:, None]) & (
+        hand_strength == HandStrength.HIGH_CARD.value
+    )[:, None]
+    over_cards = rank_cards[np.bitwise_or.reduce(np.where(over, 1 << hole_ranks, 0), axis=1)]
+    n_over = over.sum(axis=1)
+    set_draw = (hole_ranks[:, 0] == hole_ranks[:, 1]) & (
+        hand_strength < HandStrength.THREE_OF_A_KIND.value
+    )
+
+    zero = np.uint64(0)
+    draw_masks = {
+        DrawType.FLUSH_DRAW: flush,
+        DrawType.OESD: rank_cards[tables["oesd"][held]],
+        DrawType.GUTSHOT: rank_cards[tables["gutshot"][held]],
+        DrawType.OVERCARDS: np.where(n_over == 2, over_cards, zero),
+        DrawType.ONE_OVERCARD: np.where(n_over == 1, over_cards, zero),
+        DrawType.SET_DRAW: np.where(set_draw, rank_cards[1 << hole_ranks[:, 0]], zero),
+    }
+    out_masks = np.zeros(n, dtype=np.uint64)
+    draw_outs = {}
+    for draw_type, mask in draw_masks.items():
+        mask = mask & live
+        out_masks |= mask
+        draw_outs[draw_type] = _popcount(mask)
+
+    total = _popcount(out_masks)
+    remaining = 52 - n_cards
+    turn_prob = total / remaining * 100
+    river_prob = np.where(
+        board_len == 3,
+        (1 - (remaining - total) / remaining * ((remaining - 1 - total) / (remaining - 1))) * 100,
+        turn_prob,
+    )
+
+    return OutsBatch(
+        hand_strength=hand_strength,
+        draw_outs=draw_outs,
+        total_outs=total,
+        turn_probability=np.round(turn_prob, 1),
+        river_probability=np.round(river_prob, 1),
+        out_masks=out_masks,
     )
 
 
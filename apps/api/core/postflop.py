@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
+from core.cards import Card, CardSet
 from core.hand import Hand
 
 
@@ -42,26 +43,9 @@ TEXTURE_NAMES = {
 }
 
 
-@dataclass
-class FlopCard:
-    rank: str
-    suit: str
-
-    def __str__(self):
-        suit_symbols = {"s": "♠", "h": "♥", "d": "♦", "c": "♣"}
-        return f"{self.rank}{suit_symbols.get(self.suit, self.suit)}"
-
-
-@dataclass
-class HeroCard:
-    """A specific hero card with rank and suit."""
-
-    rank: str
-    suit: str
-
-    def __str__(self):
-        suit_symbols = {"s": "♠", "h": "♥", "d": "♦", "c": "♣"}
-        return f"{self.rank}{suit_symbols.get(self.suit, self.suit)}"
+# Flop and hero cards share the compact card type; old names kept as aliases
+FlopCard = Card
+HeroCard = Card
 
 
 @dataclass
@@ -73,7 +57,7 @@ class PostflopScenario:
     hero_position: str
     villain_position: str
     pot_type: str  # "srp" or "3bp"
-    flop: list[FlopCard]
+    flop: list[Card]
     texture: FlopTexture
     texture_zh: str
     hero_hand: Hand
@@ -82,22 +66,17 @@ class PostflopScenario:
     frequency: int  # GTO frequency %
     explanation_zh: str
     explanation_en: str
-    hero_cards: list[HeroCard] | None = None  # Specific cards when suits matter
+    hero_cards: list[Card] | None = None  # Specific cards when suits matter
 
     @classmethod
     def from_dict(cls, data: dict) -> "PostflopScenario":
         """Create a PostflopScenario from a dictionary."""
-        flop = [FlopCard(rank=r, suit=s) for r, s in zip(data["flop"], data["flop_suits"])]
+        flop = [Card(rank=r, suit=s) for r, s in zip(data["flop"], data["flop_suits"])]
 
         # Parse specific hero cards if provided (e.g., ["As", "Qd"])
         hero_cards = None
         if "hero_cards" in data and data["hero_cards"]:
-            hero_cards = []
-            for card_str in data["hero_cards"]:
-                # Parse "As" -> rank="A", suit="s"
-                rank = card_str[:-1]  # Everything except last char
-                suit = card_str[-1].lower()  # Last char is suit
-                hero_cards.append(HeroCard(rank=rank, suit=suit))
+            hero_cards = [Card.from_string(c) for c in data["hero_cards"]]
 
         return cls(
             id=data["id"],
@@ -117,6 +96,11 @@ class PostflopScenario:
             hero_cards=hero_cards,
         )
 
+    @property
+    def dead_cards(self) -> CardSet:
+        """Flop plus any known hero cards, for card-removal checks."""
+        return CardSet.from_cards(self.flop + (self.hero_cards or []))
+
 
 @dataclass
 class PostflopSpot:
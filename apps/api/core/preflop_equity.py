@@ -0,0 +1,132 @@
+"""
+Precomputed preflop all-in equity between the 169 starting hand classes.
+
+The matrix is generated offline by scripts/generate_preflop_equity.py and
+shipped as a small binary file that is memory-mapped read-only, so every
+uvicorn worker shares the same pages and a lookup is a single array read.
+
+File layout (little-endian):
+- 16-byte header: magic b"PFEQ", version (uint16), size (uint16),
+  samples per matchup (uint32), 4 reserved bytes
+- equity: uint16[169, 169], equity of row class vs column class * 65535
+- combos: uint8[169, 169], card-disjoint (row combo, column combo) pairs
+"""
+
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from .hand import ALL_HANDS, Hand, parse_range
+
+MAGIC = b"PFEQ"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI4x")
+N_CLASSES = len(ALL_HANDS)
+EQUITY_SCALE = 65535
+
+DATA_PATH = Path(__file__).parent.parent / "data" / "equity" / "preflop_169.bin"
+
+# Hand class notation -> row/column in the matrix
+HAND_INDEX = {hand: i for i, hand in enumerate(ALL_HANDS)}
+
+_matrix_cache: dict[str, np.ndarray] = {}
+
+
+def write_matrix(path: Path, equity: np.ndarray, combos: np.ndarray, samples: int) -> None:
+    """Write an equity matrix (floats 0-1) and combo counts in the binary format."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    scaled = np.rint(np.clip(equity, 0, 1) * EQUITY_SCALE).astype("<u2")
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, N_CLASSES, samples))
+        f.write(scaled.tobytes())
+        f.write(combos.astype(np.uint8).tobytes())
+
+
+def load_matrix(path: Path | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Memory-map the equity and combo-count matrices.
+
+    Returns:
+        (equity uint16[169, 169], combos uint8[169, 169]) read-only views
+
+    Raises:
+        FileNotFoundError: If the binary has not been generated
+        ValueError: If the file header does not match this format
+    """
+    path = Path(path or DATA_PATH)
+    key = str(path)
+    if key in _matrix_cache:
+        return _matrix_cache[key], _matrix_cache[key + ":combos"]
+
+    with open(path, "rb") as f:
+        magic, version, size, _ = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or version != VERSION or size != N_CLASSES:
+        raise ValueError(f"Unsupported preflop equity file: {path}")
+
+    shape = (N_CLASSES, N_CLASSES)
+    equity = np.memmap(path, dtype="<u2", mode="r", offset=HEADER.size, shape=shape)
+    combos = np.memmap(
+        path, dtype=np.uint8, mode="r", offset=HEADER.size + equity.nbytes, shape=shape
+    )
+    _matrix_cache[key] = equity
+    _matrix_cache[key + ":combos"] = combos
+    return equity, combos
+
+
+def hand_index(hand: str) -> int:
+    """Matrix index of a hand class like 'AKs', 'qq' or 'T9o'."""
+    notation = Hand(hand).notation
+    if notation not in HAND_INDEX:
+        raise ValueError(f"Invalid hand: {hand}")
+    return HAND_INDEX[notation]
+
+
+def hand_vs_hand(hand1: str, hand2: str) -> float:
+    """All-in equity (0-1) of hand1 vs hand2, averaged over their combos."""
+    equity, _ = load_matrix()
+    return float(equity[hand_index(hand1), hand_index(hand2)]) / EQUITY_SCALE
+
+
+def range_indexes(range_str: str) -> np.ndarray:
+    """Matrix indexes of every class in a range string."""
+    return np.array(sorted({hand_index(h.notation) for h in parse_range(range_str)}), dtype=np.intp)
+
+
+def range_vs_range(
+    hero: np.ndarray | list[int],
+    villain: np.ndarray | list[int],
+    hero_weights: np.ndarray | None = None,
+    villain_weights: np.ndarray | None = None,
+) -> tuple[float, int]:
+    """
+    Aggregate equity of one set of classes vs another.
+
+    Every (hero class, villain class) cell is weighted by its number of
+    card-disjoint combo pairs times the optional class weights, which is the
+    same as dealing both ranges combo by combo.
+
+    Args:
+        hero: Hero class indexes (a single hand is a 1-element range)
+        villain: Villain class indexes
+        hero_weights: Optional per-class weights (e.g. mixed frequencies)
+        villain_weights: Optional per-class weights
+
+    Returns:
+        (hero equity 0-1, number of combo pairs covered)
+    """
+    equity, combos = load_matrix()
+    hero = np.asarray(hero, dtype=np.intp)
+    villain = np.asarray(villain, dtype=np.intp)
+    weights = combos[np.ix_(hero, villain)].astype(np.float64)
+    if hero_weights is not None:
+        weights *= np.asarray(hero_weights, dtype=np.float64)[:, None]
+    if villain_weights is not None:
+        weights *= np.asarray(villain_weights, dtype=np.float64)[None, :]
+
+    total = weights.sum()
+    if total == 0:
+        return 0.0, 0
+    cells = equity[np.ix_(hero, villain)].astype(np.float64) / EQUITY_SCALE
+    pairs = int(combos[np.ix_(hero, villain)].sum())
+    return float((cells * weights).sum() / total), pairs
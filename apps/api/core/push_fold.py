@@ -0,0 +1,435 @@
+"""
+Push/fold Nash solver for short-stacked MTT spots.
+
+Every player either moves all-in or folds preflop. Strategies are push / call
+frequencies per hand class (169, in ``ALL_HANDS`` order) and showdowns use
+the precomputed preflop equity matrix, so no boards are dealt. Payoffs are
+chips (chip EV) or ICM dollars: every way the hand can end is one final
+stack vector, and all of them are valued once, up front, in one ICM batch
+(or, with ``fgs_hands``, by future game simulation in core/fgs.py).
+
+The equilibrium is found by fictitious play: each iteration every decision
+plays a best response to the others' average strategies, and the averages
+converge to a Nash equilibrium (exactly so heads-up in chip EV, and in
+practice for multiway and ICM games).
+
+Model, as in the usual push/fold charts:
+- Everyone folds to the opener, who shoves or folds; players behind call or
+  fold in turn and the first caller ends the action (no overcalls).
+- Card removal is applied between shover and caller, through the matrix's
+  card-disjoint combo counts, but not for the players in between.
+
+``solve_resteal`` covers the resteal spot: an opener raises a fixed range,
+one player reshoves or folds and the opener calls or folds (chip EV).
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .hand import ALL_HANDS
+from .icm import icm_equities_batch
+from .preflop_equity import EQUITY_SCALE, load_matrix
+
+# Position names by table size, first to act first
+TABLE_POSITIONS = {
+    2: ["SB", "BB"],
+    3: ["BTN", "SB", "BB"],
+    4: ["CO", "BTN", "SB", "BB"],
+    5: ["HJ", "CO", "BTN", "SB", "BB"],
+    6: ["UTG", "HJ", "CO", "BTN", "SB", "BB"],
+}
+
+DEFAULT_ITERATIONS = 1000
+
+# Combos per hand class: 6 pairs, 4 suited, 12 offsuit
+CLASS_COMBOS = np.array(
+    [6 if len(h) == 2 else 4 if h.endswith("s") else 12 for h in ALL_HANDS], dtype=np.float64
+)
+HAND_WEIGHTS = CLASS_COMBOS / CLASS_COMBOS.sum()
+
+
+@dataclass
+class PushFoldSolution:
+    """Equilibrium push / call frequencies for one table."""
+
+    positions: list[str]
+    push: dict[str, np.ndarray]  # Opener -> push frequency per hand class
+    call: dict[tuple[str, str], np.ndarray]  # (caller, shover) -> call frequency
+    iterations: int
+    max_regret: float  # Largest per-hand gain of a best response, in payoff units
+
+    def push_range(self, position: str, threshold: float = 0.5) -> list[str]:
+        """Hand classes that push at least `threshold` of the time."""
+        return _hands(self.push[position], threshold)
+
+    def call_range(self, caller: str, shover: str, threshold: float = 0.5) -> list[str]:
+        """Hand classes that call a shove at least `threshold` of the time."""
+        return _hands(self.call[(caller, shover)], threshold)
+
+
+@dataclass
+class RestealSolution:
+    """Equilibrium reshove and call-off frequencies against one opener."""
+
+    shove: np.ndarray  # Reshove frequency per hand class
+    call: np.ndarray  # Opener's call frequency, per hand class it opened
+    iterations: int
+    max_regret: float
+
+    def shove_range(self, threshold: float = 0.5) -> list[str]:
+        """Hand classes that reshove at least `threshold` of the time."""
+        return _hands(self.shove, threshold)
+
+    def call_range(self, threshold: float = 0.5) -> list[str]:
+        """Opened hand classes that call the reshove at least `threshold` of the time."""
+        return _hands(self.call, threshold)
+
+
+def _hands(freqs: np.ndarray, threshold: float) -> list[str]:
+    return [ALL_HANDS[i] for i in np.flatnonzero(freqs >= threshold)]
+
+
+def outcome_stacks(
+    stacks: list[float], small_blind: float, big_blind: float, ante: float
+) -> tuple[dict[tuple, int], np.ndarray]:
+    """
+    Final stacks for every way a push/fold hand can end.
+
+    Keys are ("win", p) when everyone folds to p's shove (or p is the big
+    blind and gets a walk) and ("showdown", shover, caller, winner).
+
+    Returns:
+        (key -> row, rows float[n_outcomes, n_players])
+    """
+    n = len(stacks)
+    start = np.asarray(stacks, dtype=np.float64)
+    antes = np.minimum(ante, start)
+    blinds = np.zeros(n)
+    blinds[-2] = min(small_blind, start[-2] - antes[-2])
+    blinds[-1] = min(big_blind, start[-1] - antes[-1])
+    posted = antes + blinds
+    pot = posted.sum()
+    live = start - antes  # What each player can put in behind their ante
+
+    index = {}
+    rows = []
+    for p in range(n):
+        row = start - posted
+        row[p] += pot
+        index[("win", p)] = len(rows)
+        rows.append(row)
+    for shover in range(n - 1):
+        for caller in range(shover + 1, n):
+            matched = min(live[shover], live[caller])
+            dead = pot - blinds[shover] - blinds[caller]
+            for winner in (shover, caller):
+                row = start - posted
+                row[[shover, caller]] = live[[shover, caller]] - matched
+                row[winner] += dead + 2 * matched
+                index[("showdown", shover, caller, winner)] = len(rows)
+                rows.append(row)
+    return index, np.array(rows)
+
+
+def ending_probabilities(
+    n: int, push: dict[int, np.ndarray], call: dict[tuple[int, int], np.ndarray]
+) -> dict[tuple, float]:
+    """
+    Probability of every way a push/fold hand ends under fixed strategies.
+
+    Args:
+        n: Players, in acting order (first to act ... BB)
+        push: Push frequency per hand class, by acting index (all but the BB)
+        call: Call frequency per hand class, by (shover, caller)
+
+    Returns:
+        outcome_stacks key -> probability; the values sum to 1
+    """
+    m = _matrices()
+    probs = {}
+    reached = 1.0
+    for p in range(n - 1):
+        shoved = HAND_WEIGHTS * push[p]
+        alive = np.ones(len(ALL_HANDS))
+        for j in range(p + 1, n):
+            calls = m.cond @ call[(p, j)]
+            wins = m.cond_equity @ call[(p, j)]
+            probs[("showdown", p, j, p)] = reached * float(shoved @ (alive * wins))
+            probs[("showdown", p, j, j)] = reached * float(shoved @ (alive * (calls - wins)))
+            alive = alive * (1 - calls)
+        probs[("win", p)] = reached * float(shoved @ alive)
+        reached *= 1 - float(shoved.sum())
+    probs[("win", n - 1)] = reached
+    return probs
+
+
+def solve_push_fold(
+    stacks: list[float],
+    payouts: list[float] | None = None,
+    ante: float = 0.0,
+    small_blind: float = 0.5,
+    big_blind: float = 1.0,
+    iterations: int = DEFAULT_ITERATIONS,
+    fgs_hands: int = 0,
+) -> PushFoldSolution:
+    """
+    Solve push/fold for a table of 2-6 players.
+
+    Args:
+        stacks: Stacks in big blinds, in acting order (first to act ... BB)
+        payouts: Prize structure for ICM payoffs; None for chip EV
+        ante: Ante per player, in big blinds
+        small_blind: Small blind in big blinds
+        big_blind: Big blind in big blinds
+        iterations: Fictitious play iterations
+        fgs_hands: With payouts, hands of future game simulation before ICM
+            is applied (0 = plain ICM)
+
+    Returns:
+        PushFoldSolution with average (equilibrium) strategies
+
+    Raises:
+        ValueError: On an unsupported table size or a non-positive stack
+    """
+    n = len(stacks)
+    if n not in TABLE_POSITIONS:
+        raise ValueError(f"Push/fold tables need 2-{max(TABLE_POSITIONS)} players")
+    if min(stacks) <= 0:
+        raise ValueError("Every player needs chips")
+
+    index, rows = outcome_stacks(stacks, small_blind, big_blind, ante)
+    if payouts is None:
+        utility = rows
+    elif fgs_hands:
+        # fgs plays its future hands with this module's charts
+        from .fgs import fgs_equities_batch
+
+        # The button passes to the small blind (heads-up, to the big blind)
+        utility = fgs_equities_batch(
+            rows, payouts, n - 2 if n > 2 else 1, small_blind, big_blind, ante, fgs_hands
+        )
+    else:
+        utility = icm_equities_batch(rows, payouts)
+    game = _Game(n, index, utility)
+
+    push = {p: np.full(len(ALL_HANDS), 0.5) for p in range(n - 1)}
+    call = {(p, j): np.full(len(ALL_HANDS), 0.5) for p in range(n - 1) for j in range(p + 1, n)}
+    for t in range(1, iterations + 1):
+        best_push, best_call, _ = game.best_responses(push, call)
+        for key, br in best_push.items():
+            push[key] += (br - push[key]) / (t + 1)
+        for key, br in best_call.items():
+            call[key] += (br - call[key]) / (t + 1)
+
+    _, _, max_regret = game.best_responses(push, call)
+    positions = TABLE_POSITIONS[n]
+    return PushFoldSolution(
+        positions=positions,
+        push={positions[p]: freqs for p, freqs in push.items()},
+        call={(positions[j], positions[p]): freqs for (p, j), freqs in call.items()},
+        iterations=iterations,
+        max_regret=max_regret,
+    )
+
+
+def solve_resteal(
+    stack: float,
+    open_range: np.ndarray,
+    open_size: float = 2.3,
+    blind: float = 1.0,
+    dead: float = 0.5,
+    ante: float = 0.0,
+    players: int = 6,
+    iterations: int = DEFAULT_ITERATIONS,
+) -> RestealSolution:
+    """
+    Solve reshove / call-off after an open, with equal effective stacks.
+
+    Args:
+        stack: Effective stack in big blinds
+        open_range: Opener's frequency per hand class (0-1, ALL_HANDS order)
+        open_size: Open raise size in big blinds
+        blind: Blind the reshoving player has posted (1 in the BB, 0.5 in the SB)
+        dead: Blinds posted by players who fold
+        ante: Ante per player, in big blinds
+        players: Players dealt in, for the antes
+        iterations: Fictitious play iterations
+
+    Returns:
+        RestealSolution with average (equilibrium) strategies
+
+    Raises:
+        ValueError: If the stack does not cover the open or the range is empty
+    """
+    if stack <= open_size + ante:
+        raise ValueError("Stack must be larger than the open")
+    open_range = np.asarray(open_range, dtype=np.float64)
+    if not open_range.any():
+        raise ValueError("Open range is empty")
+
+    m = _matrices()
+    # Chips won or lost from here, by the reshover (all-in pots split evenly)
+    pot = open_size + blind + dead + ante * players
+    fold_loss = -(blind + ante)
+    steal_win = pot - blind - ante
+    allin_pot = 2 * stack + dead + ante * (players - 2)
+    # Opener: folding to the shove forfeits the open
+    opener_fold = -(open_size + ante)
+
+    shove = np.full(len(ALL_HANDS), 0.5)
+    call = np.full(len(ALL_HANDS), 0.5)
+    regret = 0.0
+    for t in range(1, iterations + 2):
+        # Reshover's hand b against the opened range, then the call-off
+        total = m.combos @ open_range
+        called = (m.combos @ (open_range * call)) / total
+        won = (m.combos_equity @ (open_range * call)) / total
+        ev_shove = (1 - called) * steal_win + won * allin_pot - called * stack
+        best_shove = (ev_shove > fold_loss).astype(np.float64)
+
+        # Opener's hand a against the reshoving range
+        shoved = m.combos @ shove
+        seen = shoved > 0
+        equity = (m.combos_equity @ shove) / np.where(seen, shoved, 1.0)
+        ev_call = equity * allin_pot - stack
+        best_call = ((ev_call > opener_fold) & seen).astype(np.float64)
+
+        if t > iterations:
+            regret = max(
+                _regret(ev_shove, fold_loss, shove),
+                _regret(np.where(seen & (open_range > 0), ev_call, opener_fold), opener_fold, call),
+            )
+            break
+        shove += (best_shove - shove) / (t + 1)
+        call += (best_call - call) / (t + 1)
+
+    return RestealSolution(
+        shove=shove, call=call * (open_range > 0), iterations=iterations, max_regret=regret
+    )
+
+
+@dataclass(frozen=True)
+class _Matrices:
+    """Float views of the preflop equity matrix (row hand vs column hand)."""
+
+    combos: np.ndarray  # Card-disjoint combo pairs
+    combos_equity: np.ndarray  # combos * equity
+    cond: np.ndarray  # Column class given the row class
+    cond_equity: np.ndarray  # cond * equity
+
+
+@lru_cache(maxsize=1)
+def _matrices() -> _Matrices:
+    equity, combos = load_matrix()
+    equity = np.asarray(equity, dtype=np.float64) / EQUITY_SCALE
+    combos = np.asarray(combos, dtype=np.float64)
+    cond = combos / combos.sum(axis=1, keepdims=True)
+    return _Matrices(combos, combos * equity, cond, cond * equity)
+
+
+def _regret(ev_act: np.ndarray, ev_fold, freqs: np.ndarray) -> float:
+    """Combo-weighted average gain of best responding instead of playing `freqs`."""
+    played = freqs * ev_act + (1 - freqs) * ev_fold
+    return float(HAND_WEIGHTS @ (np.maximum(ev_act, ev_fold) - played))
+
+
+class _Game:
+    """Best responses of every push/fold decision against fixed strategies."""
+
+    def __init__(self, n: int, index: dict[tuple, int], utility: np.ndarray):
+        self.n = n
+        self.index = index
+        self.utility = utility
+        self.m = _matrices()
+
+    def best_responses(
+        self, push: dict[int, np.ndarray], call: dict[tuple[int, int], np.ndarray]
+    ) -> tuple[dict[int, np.ndarray], dict[tuple[int, int], np.ndarray], float]:
+        """
+        Pure best responses to the given strategies.
+
+        Returns:
+            (push, call, max regret): best response per decision and the
+            largest average gain any decision gets from deviating
+        """
+        n, u, index = self.n, self.utility, self.index
+        best_push, best_call = {}, {}
+        regret = 0.0
+
+        # Expected utility of every player once the action reaches p, from
+        # the big blind's walk backwards
+        reached = u[index[("win", n - 1)]]
+        for p in range(n - 2, -1, -1):
+            callers = range(p + 1, n)
+            calls = {j: self.m.cond @ call[(p, j)] for j in callers}  # P(j calls | p's hand)
+            wins = {j: self.m.cond_equity @ call[(p, j)] for j in callers}  # ... and p wins
+
+            # Probability of each ending per shover hand, and its utilities
+            probs, ends = [], []
+            alive = np.ones(len(ALL_HANDS))
+            for j in callers:
+                probs += [alive * wins[j], alive * (calls[j] - wins[j])]
+                ends += [index[("showdown", p, j, p)], index[("showdown", p, j, j)]]
+                alive = alive * (1 - calls[j])
+            probs.append(alive)
+            ends.append(index[("win", p)])
+            probs = np.array(probs)  # (endings, hands)
+            ev_push = probs.T @ u[ends]  # (hands, players)
+
+            fold_value = reached[p]
+            best_push[p] = (ev_push[:, p] > fold_value).astype(np.float64)
+            regret = max(regret, _regret(ev_push[:, p], fold_value, push[p]))
+
+            for j in callers:
+                best_call[(p, j)], call_regret = self._caller(
+                    p, j, push[p], call[(p, j)], calls, wins
+                )
+                regret = max(regret, call_regret)
+
+            shove_rate = HAND_WEIGHTS @ push[p]
+            shove_value = (HAND_WEIGHTS * push[p]) @ ev_push / max(shove_rate, 1e-12)
+            reached = shove_rate * shove_value + (1 - shove_rate) * reached
+
+        return best_push, best_call, regret
+
+    def _caller(
+        self,
+        p: int,
+        j: int,
+        push: np.ndarray,
+        call: np.ndarray,
+        calls: dict[int, np.ndarray],
+        wins: dict[int, np.ndarray],
+    ) -> tuple[np.ndarray, float]:
+        """Best response and regret of player j facing p's shove."""
+        u, index = self.utility, self.index
+        # Shover's hand given that everyone between p and j folded; the
+        # posterior for each of j's hands is combos[b] * reach / total[b]
+        reach = push.copy()
+        for k in range(p + 1, j):
+            reach *= 1 - calls[k]
+        total = self.m.combos @ reach
+        seen = total > 0
+        total = np.where(seen, total, 1.0)
+
+        win = u[index[("showdown", p, j, j)], j]
+        lose = u[index[("showdown", p, j, p)], j]
+        ev_call = lose + (self.m.combos_equity @ reach) / total * (win - lose)
+
+        # If j folds, the players behind still get to call, per shover hand
+        fold = np.zeros(len(ALL_HANDS))
+        alive = np.ones(len(ALL_HANDS))
+        for m in range(j + 1, self.n):
+            fold += alive * (
+                wins[m] * u[index[("showdown", p, m, p)], j]
+                + (calls[m] - wins[m]) * u[index[("showdown", p, m, m)], j]
+            )
+            alive = alive * (1 - calls[m])
+        fold += alive * u[index[("win", p)], j]
+        ev_fold = (self.m.combos @ (reach * fold)) / total
+
+        # Hands that never see a shove keep folding
+        best = ((ev_call > ev_fold) & seen).astype(np.float64)
+        return best, _regret(ev_call, np.where(seen, ev_fold, ev_call), call)
@@ -0,0 +1,206 @@
+"""
+Range vs range equity.
+
+Monte Carlo engine that works in NumPy batches: each batch draws a hero
+combo, a villain combo and the rest of the board for thousands of samples at
+once, drops samples where the two hands share a card, and scores every
+showdown with the batch hand evaluator. Sampling stops at a sample cap, a
+time budget or a target standard error, whichever comes first.
+"""
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from .cards import card_masks
+from .combos import combo_cards, range_mask
+from .hand_rank import encode_batch, strength_from_keys
+
+# z-score for the reported 95% confidence interval
+Z_95 = 1.96
+
+# First batch size under a time budget; later batches are sized from the
+# measured per-sample cost so the last one still fits in the budget
+_PROBE_BATCH = 2_000
+
+
+@dataclass
+class RangeEquityResult:
+    """Result of a range vs range Monte Carlo run."""
+
+    equity: float  # Hero equity, 0-1 (ties count half)
+    std_error: float
+    ci_low: float  # 95% confidence interval
+    ci_high: float
+    win: float
+    tie: float
+    samples: int  # Showdowns actually scored
+    elapsed_ms: float
+    hero_combos: int  # Combos left after board / dead card removal
+    villain_combos: int
+
+
+def range_to_combos(range_str: str, dead_mask: int = 0) -> np.ndarray:
+    """
+    Expand a range string into concrete combos.
+
+    Args:
+        range_str: Range like "TT+, AQs+, KQo"
+        dead_mask: Bitmask of card indexes to remove (board, dead cards)
+
+    Returns:
+        int array of shape (n_combos, 2)
+    """
+    return combo_cards(range_mask(range_str), dead_mask)
+
+
+def _deal_boards(rng: np.random.Generator, dead: np.ndarray, n_cards: int) -> np.ndarray:
+    """
+    Deal n_cards distinct live cards per row.
+
+    Args:
+        dead: bool array (batch, 52), True for cards that may not be dealt
+
+    Returns:
+        int array (batch, n_cards)
+    """
+    keys = rng.random(dead.shape)
+    keys[dead] = 2.0  # Dead cards sort last
+    if n_cards == 0:
+        return np.empty((len(dead), 0), dtype=np.intp)
+    return np.argpartition(keys, n_cards - 1, axis=1)[:, :n_cards]
+
+
+def monte_carlo_equity(
+    hero_range: str,
+    villain_range: str,
+    board: list[int] | None = None,
+    dead: list[int] | None = None,
+    max_samples: int = 100_000,
+    time_budget_ms: float | None = None,
+    target_std_error: float | None = None,
+    batch_size: int = 20_000,
+    seed: int | None = None,
+) -> RangeEquityResult:
+    """
+    Estimate hero range equity vs villain range by sampling showdowns.
+
+    Args:
+        hero_range: Hero range string, e.g. "AA, KK, AKs"
+        villain_range: Villain range string
+        board: 0-5 known board cards as indexes
+        dead: Other dead card indexes
+        max_samples: Upper bound on scored showdowns
+        time_budget_ms: Wall-time budget; batches are sized to finish inside it
+        target_std_error: Stop once the standard error drops below this
+        batch_size: Samples drawn per NumPy batch
+        seed: RNG seed for reproducible results
+
+    Returns:
+        RangeEquityResult with equity and a 95% confidence interval
+
+    Raises:
+        ValueError: If the board is invalid or either range is empty after
+            card removal
+    """
+    start = time.perf_counter()
+    board = list(board or [])
+    dead_cards = board + list(dead or [])
+    if len(board) > 5 or len(set(dead_cards)) != len(dead_cards):
+        raise ValueError("Board must have at most 5 distinct cards")
+
+    dead_mask = 0
+    for c in dead_cards:
+        dead_mask |= 1 << c
+
+    hero = range_to_combos(hero_range, dead_mask)
+    villain = range_to_combos(villain_range, dead_mask)
+    if len(hero) == 0 or len(villain) == 0:
+        raise ValueError("Range is empty after removing board and dead cards")
+    if not _any_compatible(hero, villain):
+        raise ValueError("Every hero combo shares a card with every villain combo")
+
+    rng = np.random.default_rng(seed)
+    to_come = 5 - len(board)
+    board_keys = encode_batch(np.array(board, dtype=np.intp))
+    hero_keys = encode_batch(hero)
+    villain_keys = encode_batch(villain)
+    base_dead = np.zeros(52, dtype=bool)
+    base_dead[dead_cards] = True
+
+    total = 0
+    drawn = 0
+    wins = 0.0
+    ties = 0.0
+    sampling_start = time.perf_counter()
+    while total < max_samples:
+        n = min(batch_size, max_samples - total)
+        if time_budget_ms is not None:
+            now = time.perf_counter()
+            remaining_ms = time_budget_ms - (now - start) * 1000
+            if drawn == 0:
+                n = min(n, _PROBE_BATCH)
+            else:
+                ms_per_sample = (now - sampling_start) * 1000 / drawn
+                n = min(n, int(remaining_ms / ms_per_sample))
+            if total > 0 and n <= 0:
+                break
+            n = max(n, 1)  # Always score at least one batch
+        drawn += n
+        h = rng.integers(len(hero), size=n)
+        v = rng.integers(len(villain), size=n)
+
+        # Drop samples where the hands collide
+        hc, vc = hero[h], villain[v]
+        ok = (hc[:, :1] != vc).all(axis=1) & (hc[:, 1:] != vc).all(axis=1)
+        h, v, hc, vc = h[ok], v[ok], hc[ok], vc[ok]
+        if len(h) == 0:
+            continue
+
+        rows = np.arange(len(h))[:, None]
+        dead_rows = np.repeat(base_dead[None, :], len(h), axis=0)
+        dead_rows[rows, hc] = True
+        dead_rows[rows, vc] = True
+        runout_keys = encode_batch(_deal_boards(rng, dead_rows, to_come))
+        shared = [b + r for b, r in zip(board_keys, runout_keys)]
+
+        hero_s = strength_from_keys(*(k[h] + s for k, s in zip(hero_keys, shared)))
+        villain_s = strength_from_keys(*(k[v] + s for k, s in zip(villain_keys, shared)))
+        wins += float((hero_s > villain_s).sum())
+        ties += float((hero_s == villain_s).sum())
+        total += len(h)
+
+        if target_std_error is not None and _std_error(wins, ties, total) <= target_std_error:
+            break
+
+    equity = (wins + ties / 2) / total
+    std_error = _std_error(wins, ties, total)
+    return RangeEquityResult(
+        equity=equity,
+        std_error=std_error,
+        ci_low=max(0.0, equity - Z_95 * std_error),
+        ci_high=min(1.0, equity + Z_95 * std_error),
+        win=wins / total,
+        tie=ties / total,
+        samples=total,
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+        hero_combos=len(hero),
+        villain_combos=len(villain),
+    )
+
+
+def _any_compatible(hero: np.ndarray, villain: np.ndarray) -> bool:
+    """True if at least one hero/villain combo pair is card-disjoint."""
+    villain_masks = card_masks(villain)
+    return any(((m & villain_masks) == 0).any() for m in card_masks(hero))
+
+
+def _std_error(wins: float, ties: float, total: int) -> float:
+    """Standard error of the mean showdown result (1 win, 0.5 tie, 0 loss)."""
+    if total < 2:
+        return 0.5
+    mean = (wins + ties / 2) / total
+    second_moment = (wins + ties / 4) / total
+    variance = max(0.0, second_moment - mean * mean) * total / (total - 1)
+    return float(np.sqrt(variance / total))
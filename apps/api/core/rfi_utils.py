@@ -5,9 +5,9 @@ All RFI-related logic should derive from rfi_frequencies.json through this modul
 This eliminates the need to maintain multiple hardcoded constants across files.
 """
 
-import json
 from functools import lru_cache
-from pathlib import Path
+
+from .data_bundle import load_data_file
 
 # All 169 hands
 RANKS = ["A", "K", "Q", "J", "T", "9", "8", "7", "6", "5", "4", "3", "2"]
@@ -46,9 +46,7 @@ TRASH_HANDS = {
 @lru_cache(maxsize=1)
 def _load_rfi_data() -> dict:
     """Load RFI frequency data from JSON (cached)."""
-    data_path = Path(__file__).parent.parent / "data" / "ranges" / "6max" / "rfi_frequencies.json"
-    with open(data_path) as f:
-        return json.load(f)
+    return load_data_file("ranges/6max/rfi_frequencies.json")
 
 
 def get_rfi_data() -> dict:
@@ -0,0 +1,650 @@
+"""
+River subgame solver for spots the precomputed solver data does not cover.
+
+One street, two players (OOP acts first) and a small bet tree:
+
+- OOP: check or bet 33% / 75% pot / all-in
+- IP after a check: check back or bet the same sizes
+- facing a bet: fold, call or raise once (RAISE_SIZE of the pot after
+  calling, all-in if that is most of the stack); facing a raise: fold or call
+
+Sizes at or above the remaining stack collapse into one all-in. Ranges are
+weights over the 1326 concrete combos (see core/combos.py), so card removal
+between the two ranges is exact.
+
+The game is solved with discounted CFR (Brown & Sandholm, alpha 1.5, beta 0,
+gamma 2). Every node holds one regret row per combo, so an iteration is a
+forward pass of reach vectors, two matrix products per player against the
+showdown matrix (win / tie / loss from the batch hand evaluator) and the
+card-compatibility matrix for every terminal at once, and a backward pass of
+counterfactual values. Values are in units of the starting pot, so a solve
+only depends on the stack-to-pot ratio. Iterations stop once exploitability
+drops below target_exploitability of the pot.
+
+Solutions are cached on disk (CACHE_DIR, one .npz per spot) under a key of the
+canonical board, both ranges relabelled onto its suits, the stack-to-pot
+ratio and the tree, so isomorphic spots solve once. The cache keeps at most
+CACHE_MAX_FILES solutions; reads refresh a file's mtime and writes evict the
+least recently used files beyond that.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+import zipfile
+from dataclasses import dataclass, field
+from itertools import permutations
+from pathlib import Path
+
+import numpy as np
+
+from .canonical import canonical_board
+from .cards import card_index, card_masks, mask_of
+from .combos import COMBO_CARDS, COMBO_MASKS, NUM_COMBOS, combo_index, range_mask
+from .hand_rank import evaluate_batch
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+CACHE_DIR = Path(
+    os.getenv("RIVER_SOLVER_CACHE_DIR", Path(__file__).parent.parent / "data" / "river_cache")
+)
+CACHE_MAX_FILES = int(os.getenv("RIVER_SOLVER_CACHE_FILES", "2000"))
+
+BET_SIZES = (0.33, 0.75)  # Fractions of the pot
+RAISE_SIZE = 0.75  # Fraction of the pot after calling
+# Sizes of at least this share of the remaining stack go all-in instead
+ALL_IN_THRESHOLD = 0.67
+
+ALPHA = 1.5
+BETA = 0.0
+GAMMA = 2.0
+
+# Exploitability is measured every this many iterations
+_CHECK_EVERY = 25
+
+_COMBO_PATTERN = re.compile(r"[2-9TJQKA][shdc][2-9TJQKA][shdc]", re.IGNORECASE)
+
+OOP = 0
+IP = 1
+PLAYERS = ("oop", "ip")
+_SHOWDOWN = -1
+_FOLD = -2
+
+
+@dataclass
+class RiverNode:
+    """One decision of the average strategy."""
+
+    path: str  # Actions leading here, e.g. "check/bet_75"; "" at the root
+    player: int  # OOP or IP
+    actions: list[str]
+    strategy: np.ndarray  # (actions, combos of the acting player), rows sum to 1
+    reach: np.ndarray  # Range weight of each of the player's combos reaching here
+
+
+@dataclass
+class RiverSolution:
+    """Average strategy and values of a solved river spot."""
+
+    board: tuple[int, ...]
+    pot: float
+    stack: float
+    combos: tuple[np.ndarray, np.ndarray]  # (n, 2) card indexes per player
+    weights: tuple[np.ndarray, np.ndarray]  # Range weight of each combo
+    # Expected share of the pot minus river bets, per combo vs the opponent's
+    # range: 0 to pot for check-downs, and the two ranges' values sum to pot
+    ev: tuple[np.ndarray, np.ndarray]
+    value: tuple[float, float]  # The same over each whole range
+    nodes: list[RiverNode]
+    exploitability: float  # % of the pot
+    iterations: int
+    elapsed_ms: float
+    cached: bool = False
+
+    def node(self, path: str) -> RiverNode:
+        for node in self.nodes:
+            if node.path == path:
+                return node
+        raise KeyError(path)
+
+
+def range_weights(range_str: str) -> np.ndarray:
+    """
+    Float combo array of a range with optional weights.
+
+    Parts are separated by commas; each is a range like "TT+" or "AQs-ATs",
+    or a concrete combo like "AhKh", optionally followed by ":weight" (0-1).
+    Later parts override earlier ones.
+
+    Examples:
+        "AA, KK:0.5, AhKh, AsKs:0.25"
+    """
+    weights = np.zeros(NUM_COMBOS)
+    for part in range_str.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        hand, _, weight = part.partition(":")
+        hand = hand.strip()
+        value = float(weight) if weight else 1.0
+        if not 0 <= value <= 1:
+            raise ValueError(f"Weight must be between 0 and 1: {part}")
+        if _COMBO_PATTERN.fullmatch(hand):
+            cards = [card_index(hand[:2]), card_index(hand[2:])]
+            weights[combo_index(*cards)] = value
+        else:
+            weights[range_mask(hand)] = value
+    return weights
+
+
+def solve_river(
+    board: list[int],
+    oop_range: np.ndarray,
+    ip_range: np.ndarray,
+    pot: float,
+    stack: float,
+    max_iterations: int = 1000,
+    target_exploitability: float = 0.3,
+    use_cache: bool = True,
+    cache_dir: Path | None = None,
+) -> RiverSolution:
+    """
+    Solve a river spot.
+
+    Args:
+        board: Five board card indexes
+        oop_range: Float combo array (1326) of the out-of-position range
+        ip_range: Float combo array of the in-position range
+        pot: Pot at the start of the river
+        stack: Effective stack behind
+        max_iterations: DCFR iteration cap
+        target_exploitability: Stop early below this % of the pot
+        use_cache: Read and write the disk cache
+        cache_dir: Cache directory, CACHE_DIR by default
+
+    Returns:
+        RiverSolution in the caller's suits
+
+    Raises:
+        ValueError: If the board, pot or stack is invalid or a range is empty
+            after board removal
+    """
+    start = time.perf_counter()
+    if len(board) != 5 or len(set(board)) != 5:
+        raise ValueError("A river board needs 5 distinct cards")
+    if pot <= 0 or stack < 0:
+        raise ValueError("Pot must be positive and stack non-negative")
+
+    # Relabel everything onto the canonical board's suits
+    perm, canonical, ranges = _canonical_spot(board, oop_range, ip_range)
+    spr = round(stack / pot, 4)
+    key = _cache_key(canonical, ranges, spr, max_iterations, target_exploitability)
+    path = Path(cache_dir or CACHE_DIR) / f"{key}.npz"
+
+    result = _read_cache(path) if use_cache else None
+    cached = result is not None
+    if result is None:
+        result = _Solver(canonical, ranges, spr).solve(max_iterations, target_exploitability)
+        if use_cache:
+            try:
+                _write_cache(path, result)
+            except OSError:
+                logger.warning("Could not cache river solution %s", path, exc_info=True)
+
+    inverse = np.argsort(perm)
+    combos = tuple(np.sort(_relabel(c, inverse), axis=1) for c in result["combos"])
+    return RiverSolution(
+        board=tuple(board),
+        pot=pot,
+        stack=stack,
+        combos=combos,
+        weights=result["weights"],
+        # The solver measures values from an even split of the pot
+        ev=tuple((ev + 0.5) * pot for ev in result["ev"]),
+        value=((0.5 + result["value"]) * pot, (0.5 - result["value"]) * pot),
+        nodes=[
+            RiverNode(path, player, actions, strategy, reach)
+            for (path, player, actions), strategy, reach in zip(
+                result["tree"], result["strategies"], result["reaches"]
+            )
+        ],
+        exploitability=result["exploitability"] * 100,
+        iterations=result["iterations"],
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+        cached=cached,
+    )
+
+
+# ============================================
+# Game tree
+# ============================================
+
+
+@dataclass
+class _Node:
+    path: str
+    player: int  # Acting player, -1 at terminals
+    contrib: tuple[float, float]  # Chips each player put in on the river, pot = 1
+    actions: list[str] = field(default_factory=list)
+    children: list[int] = field(default_factory=list)
+    folder: int = -1  # Player who folded at a fold terminal
+
+
+def build_tree(spr: float) -> list["_Node"]:
+    """Nodes in pre-order (parents before children) for a pot of 1 and stack spr."""
+    nodes: list[_Node] = []
+
+    def add(path: str, player: int, contrib: tuple[float, float], raised: bool) -> int:
+        index = len(nodes)
+        node = _Node(path, player, contrib)
+        nodes.append(node)
+        to_call = abs(contrib[0] - contrib[1])
+        # (action, next player or _SHOWDOWN / _FOLD, contributions, raised)
+        options: list[tuple[str, int, tuple[float, float], bool]] = []
+        if to_call == 0:
+            options.append(("check", _SHOWDOWN if player == IP else IP, contrib, raised))
+            for name, amount in _bets(1 + sum(contrib), spr - contrib[player], BET_SIZES, "bet"):
+                options.append((name, 1 - player, _put(contrib, player, amount), raised))
+        else:
+            options.append(("fold", _FOLD, contrib, raised))
+            called = _put(contrib, player, to_call)
+            options.append(("call", _SHOWDOWN, called, raised))
+            behind = spr - called[player]
+            if not raised and behind > 0:
+                pot = 1 + sum(called)
+                for name, amount in _bets(pot, behind, (RAISE_SIZE,), "raise"):
+                    options.append((name, 1 - player, _put(called, player, amount), True))
+
+        for name, next_player, next_contrib, next_raised in options:
+            child_path = f"{path}/{name}" if path else name
+            if next_player >= 0:
+                child = add(child_path, next_player, next_contrib, next_raised)
+            else:
+                child = len(nodes)
+                nodes.append(_Node(child_path, -1, next_contrib))
+                if next_player == _FOLD:
+                    nodes[child].folder = player
+            node.actions.append(name)
+            node.children.append(child)
+        return index
+
+    add("", OOP, (0.0, 0.0), False)
+    return nodes
+
+
+def _bets(pot: float, behind: float, sizes: tuple[float, ...], label: str):
+    """(name, amount) of each size, merging sizes near or above the stack into all-in."""
+    if behind <= 0:
+        return []
+    bets = []
+    for size in sizes:
+        amount = size * pot
+        if amount >= behind * ALL_IN_THRESHOLD:
+            break
+        bets.append((f"{label}_{round(size * 100)}" if label == "bet" else label, amount))
+    bets.append(("all_in", behind))
+    return bets
+
+
+def _put(contrib: tuple[float, float], player: int, amount: float) -> tuple[float, float]:
+    updated = list(contrib)
+    updated[player] += amount
+    return tuple(updated)
+
+
+# ============================================
+# DCFR
+# ============================================
+
+
+class _Solver:
+    """Vectorized discounted CFR on a canonical board (pot = 1)."""
+
+    def __init__(self, board: tuple[int, ...], ranges: tuple[np.ndarray, np.ndarray], spr: float):
+        self.tree = build_tree(spr)
+        dead = mask_of(board)
+        live = (COMBO_MASKS & np.uint64(dead)) == 0
+        self.ids = tuple(np.flatnonzero((r > 0) & live) for r in ranges)
+        if any(len(ids) == 0 for ids in self.ids):
+            raise ValueError("Range is empty after removing board cards")
+        self.weights = tuple(r[ids] for r, ids in zip(ranges, self.ids))
+        combos = tuple(COMBO_CARDS[ids] for ids in self.ids)
+
+        # Showdown sign of every OOP combo against every IP combo, 0 where
+        # they share a card
+        strength = tuple(
+            evaluate_batch(np.hstack([c, np.tile(board, (len(c), 1))])).astype(np.int32)
+            for c in combos
+        )
+        masks = tuple(card_masks(c) for c in combos)
+        compatible = (masks[0][:, None] & masks[1][None, :]) == 0
+        self.showdown = (np.sign(strength[0][:, None] - strength[1][None, :]) * compatible).astype(
+            np.float32
+        )
+
+        # Opponent weight a combo can face, by inclusion-exclusion: all of it,
+        # minus the combos holding either of its cards, plus the identical
+        # combo removed twice. Cheaper than a product with the 0/1 matrix.
+        self.cards = combos
+        self.incidence = []
+        for c in combos:
+            incidence = np.zeros((52, len(c)), dtype=np.float32)
+            incidence[c[:, 0], np.arange(len(c))] = 1
+            incidence[c[:, 1], np.arange(len(c))] = 1
+            self.incidence.append(incidence)
+        self.same = []
+        for player in (OOP, IP):
+            ids, other = self.ids[player], self.ids[1 - player]
+            found = np.minimum(np.searchsorted(other, ids), len(other) - 1)
+            self.same.append(np.where(other[found] == ids, found, len(other)))
+
+        self.decisions = [i for i, n in enumerate(self.tree) if n.player >= 0]
+        terminals = [i for i, n in enumerate(self.tree) if n.player < 0]
+        self.showdowns = [i for i in terminals if self.tree[i].folder < 0]
+        self.folds = [i for i in terminals if self.tree[i].folder >= 0]
+        # OOP's payoff per unit of the matrix at each terminal: half the pot
+        # plus what the loser (or folder) put in
+        self.showdown_payoff = np.array([0.5 + self.tree[i].contrib[0] for i in self.showdowns])
+        folders = [self.tree[i].folder for i in self.folds]
+        self.fold_payoff = np.array(
+            [
+                (0.5 + self.tree[i].contrib[folder]) * (1 if folder == IP else -1)
+                for i, folder in zip(self.folds, folders)
+            ]
+        )
+        self.regrets = {
+            i: np.zeros((len(self.tree[i].actions), len(self.ids[self.tree[i].player])))
+            for i in self.decisions
+        }
+        self.strategy_sums = {i: np.zeros_like(r) for i, r in self.regrets.items()}
+
+    def solve(self, max_iterations: int, target_exploitability: float) -> dict:
+        exploitability = float("inf")
+        iterations = 0
+        target = target_exploitability / 100
+        while iterations < max_iterations:
+            iterations += 1
+            self._iterate(iterations)
+            if iterations % _CHECK_EVERY == 0 or iterations == max_iterations:
+                exploitability = self.exploitability()
+                if exploitability <= target:
+                    break
+
+        strategies = {i: self.average_strategy(i) for i in self.decisions}
+        reach = self._reach(strategies)
+        values = self._values(reach, strategies)
+        return {
+            "combos": tuple(COMBO_CARDS[ids] for ids in self.ids),
+            "weights": self.weights,
+            "ev": tuple(self._per_combo(values[0][p], p) for p in (OOP, IP)),
+            "value": float(self.weights[OOP] @ values[0][OOP]) / self._pairs(),
+            "tree": [
+                (self.tree[i].path, self.tree[i].player, self.tree[i].actions)
+                for i in self.decisions
+            ],
+            "strategies": [strategies[i].astype(np.float32) for i in self.decisions],
+            "reaches": [reach[i][self.tree[i].player].astype(np.float32) for i in self.decisions],
+            "exploitability": exploitability,
+            "iterations": iterations,
+        }
+
+    def current_strategy(self, node: int) -> np.ndarray:
+        positive = np.maximum(self.regrets[node], 0)
+        total = positive.sum(axis=0)
+        uniform = 1 / len(positive)
+        return np.divide(positive, total, out=np.full_like(positive, uniform), where=total > 0)
+
+    def average_strategy(self, node: int) -> np.ndarray:
+        sums = self.strategy_sums[node]
+        total = sums.sum(axis=0)
+        uniform = 1 / len(sums)
+        return np.divide(sums, total, out=np.full_like(sums, uniform), where=total > 0)
+
+    def exploitability(self) -> float:
+        """Mean gain of the two best responses to the average strategy, in pots."""
+        strategies = {i: self.average_strategy(i) for i in self.decisions}
+        reach = self._reach(strategies)
+        gains = []
+        for player in (OOP, IP):
+            values = self._values(reach, strategies, best_response=player)
+            gains.append(float(self.weights[player] @ values[0][player]))
+        return max(sum(gains) / 2 / self._pairs(), 0.0)
+
+    def _iterate(self, t: int) -> None:
+        strategies = {i: self.current_strategy(i) for i in self.decisions}
+        reach = self._reach(strategies)
+        self._values(reach, strategies, regrets=True)
+
+        # Discount: positive regrets by t^a / (t^a + 1), negative by t^b / (t^b + 1),
+        # and the average strategy by (t / (t + 1))^g before adding this iteration
+        positive = t**ALPHA / (t**ALPHA + 1)
+        negative = t**BETA / (t**BETA + 1)
+        weight = (t / (t + 1)) ** GAMMA
+        for i in self.decisions:
+            regrets = self.regrets[i]
+            regrets *= np.where(regrets > 0, positive, negative)
+            player = self.tree[i].player
+            self.strategy_sums[i] *= weight
+            self.strategy_sums[i] += strategies[i] * reach[i][player]
+
+    def _reach(self, strategies: dict[int, np.ndarray]) -> list:
+        """Range weight of each player's combos at every node."""
+        reach: list = [None] * len(self.tree)
+        reach[0] = self.weights
+        for i in self.decisions:
+            node = self.tree[i]
+            for action, child in enumerate(node.children):
+                updated = list(reach[i])
+                updated[node.player] = reach[i][node.player] * strategies[i][action]
+                reach[child] = tuple(updated)
+        return reach
+
+    def _values(
+        self,
+        reach: list,
+        strategies: dict[int, np.ndarray],
+        regrets: bool = False,
+        best_response: int = -1,
+    ) -> list:
+        """
+        Counterfactual values of every combo at every node, backwards.
+
+        With regrets, accumulates instantaneous regrets at each decision; with
+        best_response, that player maximizes instead of following strategies.
+        """
+        values: list = [None] * len(self.tree)
+        for terminals, payoffs in (
+            (self.showdowns, self.showdown_payoff),
+            (self.folds, self.fold_payoff),
+        ):
+            if not terminals:
+                continue
+            ip_reach = np.stack([reach[i][IP] for i in terminals], axis=1).astype(np.float32)
+            oop_reach = np.stack([reach[i][OOP] for i in terminals], axis=1).astype(np.float32)
+            if terminals is self.showdowns:
+                oop_values = (self.showdown @ ip_reach) * payoffs
+                ip_values = -(self.showdown.T @ oop_reach) * payoffs
+            else:
+                oop_values = self._facing(OOP, ip_reach) * payoffs
+                ip_values = -self._facing(IP, oop_reach) * payoffs
+            for k, i in enumerate(terminals):
+                values[i] = (oop_values[:, k], ip_values[:, k])
+
+        for i in reversed(self.decisions):
+            node = self.tree[i]
+            player = node.player
+            own = np.stack([values[c][player] for c in node.children])
+            other = sum(values[c][1 - player] for c in node.children)
+            if player == best_response:
+                value = own.max(axis=0)
+            else:
+                value = (strategies[i] * own).sum(axis=0)
+            if regrets:
+                self.regrets[i] += own - value
+            values[i] = (value, other) if player == OOP else (other, value)
+        return values
+
+    def _facing(self, player: int, reach: np.ndarray) -> np.ndarray:
+        """Opponent reach (combos, ...) summed over what each of player's combos can face."""
+        per_card = self.incidence[1 - player] @ reach
+        padded = np.concatenate([reach, np.zeros_like(reach[:1])])
+        cards = self.cards[player]
+        return (
+            reach.sum(axis=0)
+            - per_card[cards[:, 0]]
+            - per_card[cards[:, 1]]
+            + padded[self.same[player]]
+        )
+
+    def _pairs(self) -> float:
+        """Total weight of card-compatible (OOP combo, IP combo) pairs."""
+        return float(self.weights[OOP] @ self._facing(OOP, self.weights[IP]))
+
+    def _per_combo(self, values: np.ndarray, player: int) -> np.ndarray:
+        """Counterfactual values divided by the opponent weight each combo can face."""
+        facing = self._facing(player, self.weights[1 - player])
+        return np.divide(values, facing, out=np.zeros_like(values), where=facing > 0)
+
+
+# ============================================
+# Canonical keys and the disk cache
+# ============================================
+
+
+_PERMUTATIONS = np.array(list(permutations(range(4))))
+
+# (52, 52) card pair -> combo index, in either order
+_PAIR_INDEX = np.zeros((52, 52), dtype=np.intp)
+_PAIR_INDEX[COMBO_CARDS[:, 0], COMBO_CARDS[:, 1]] = np.arange(NUM_COMBOS)
+_PAIR_INDEX[COMBO_CARDS[:, 1], COMBO_CARDS[:, 0]] = np.arange(NUM_COMBOS)
+
+
+def _relabel(cards: np.ndarray, perm: np.ndarray) -> np.ndarray:
+    return (cards & ~3) | np.asarray(perm)[cards & 3]
+
+
+def _canonical_spot(
+    board: list[int], oop_range: np.ndarray, ip_range: np.ndarray
+) -> tuple[np.ndarray, tuple[int, ...], tuple[np.ndarray, np.ndarray]]:
+    """
+    Suit permutation onto the canonical board, that board, and both ranges
+    relabelled by the permutation.
+
+    Boards with suit symmetries reach their canonical form by several
+    permutations; the one giving the smallest relabelled ranges (by bytes)
+    is used, so every isomorphic spot gets the same key.
+    """
+    canonical = canonical_board(board)
+    best = None
+    for perm in _PERMUTATIONS:
+        if sorted(_relabel(np.array(board), perm).tolist()) != sorted(canonical):
+            continue
+        relabelled = _relabel(COMBO_CARDS, perm)
+        target = _PAIR_INDEX[relabelled[:, 0], relabelled[:, 1]]
+        ranges = []
+        for weights in (oop_range, ip_range):
+            moved = np.zeros(NUM_COMBOS)
+            moved[target] = weights
+            ranges.append(moved)
+        key = (ranges[0].tobytes(), ranges[1].tobytes())
+        if best is None or key < best[0]:
+            best = (key, perm, tuple(ranges))
+    return best[1], canonical, best[2]
+
+
+def _cache_key(
+    board: tuple[int, ...],
+    ranges: tuple[np.ndarray, np.ndarray],
+    spr: float,
+    max_iterations: int,
+    target_exploitability: float,
+) -> str:
+    payload = {
+        "version": CACHE_VERSION,
+        "board": list(board),
+        "ranges": [{int(i): round(float(w[i]), 4) for i in np.flatnonzero(w)} for w in ranges],
+        "spr": spr,
+        "tree": [BET_SIZES, RAISE_SIZE, ALL_IN_THRESHOLD],
+        "dcfr": [ALPHA, BETA, GAMMA, max_iterations, target_exploitability],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()[:32]
+
+
+def _write_cache(path: Path, result: dict) -> None:
+    """Write atomically, so concurrent workers never read half a file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    arrays = {
+        "oop_combos": result["combos"][OOP],
+        "ip_combos": result["combos"][IP],
+        "oop_weights": result["weights"][OOP],
+        "ip_weights": result["weights"][IP],
+        "oop_ev": result["ev"][OOP],
+        "ip_ev": result["ev"][IP],
+    }
+    for k, (strategy, reach) in enumerate(zip(result["strategies"], result["reaches"])):
+        arrays[f"strategy_{k}"] = strategy.astype(np.float32)
+        arrays[f"reach_{k}"] = reach.astype(np.float32)
+    meta = {
+        "version": CACHE_VERSION,
+        "tree": result["tree"],
+        "value": result["value"],
+        "exploitability": result["exploitability"],
+        "iterations": result["iterations"],
+    }
+    arrays["meta"] = np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8)
+    # A unique temp name, as threads in one worker can write the same spot at once
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as f:
+        temp = Path(f.name)
+    try:
+        with open(temp, "wb") as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(temp, path)
+    finally:
+        temp.unlink(missing_ok=True)
+    _evict(path.parent, CACHE_MAX_FILES)
+
+
+def _evict(directory: Path, keep: int) -> None:
+    """Delete the least recently used solutions beyond `keep`."""
+    entries = []
+    for file in directory.glob("*.npz"):
+        try:
+            entries.append((file.stat().st_mtime, file))
+        except OSError:
+            continue  # Removed by another worker
+    entries.sort(reverse=True)
+    for _, file in entries[keep:]:
+        file.unlink(missing_ok=True)
+
+
+def _read_cache(path: Path) -> dict | None:
+    """Cached result, or None if it is missing or unreadable."""
+    try:
+        with np.load(path) as data:
+            meta = json.loads(data["meta"].tobytes())
+            if meta["version"] != CACHE_VERSION:
+                return None
+            tree = [tuple(entry) for entry in meta["tree"]]
+            result = {
+                "combos": (data["oop_combos"], data["ip_combos"]),
+                "weights": (data["oop_weights"], data["ip_weights"]),
+                "ev": (data["oop_ev"], data["ip_ev"]),
+                "tree": tree,
+                "strategies": [data[f"strategy_{k}"] for k in range(len(tree))],
+                "reaches": [data[f"reach_{k}"] for k in range(len(tree))],
+                "value": meta["value"],
+                "exploitability": meta["exploitability"],
+                "iterations": meta["iterations"],
+            }
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+        return None
+    try:
+        os.utime(path)  # Mark as recently used for eviction
+    except OSError:
+        pass
+    return result
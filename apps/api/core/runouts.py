@@ -0,0 +1,159 @@
+"""
+Turn and river card classification tables for runout grids.
+
+The solver router classifies one turn or river card at a time (see
+classify_turn_card / classify_river_card in routers/solver.py). A runout grid
+needs every card at once, so the same rules are evaluated here with NumPy
+over whole boards and stored per canonical flop:
+
+- turn table: uint8[1755, 52], the type of every turn card on every
+  canonical flop (built once, ~90 KB)
+- river table: uint8[52, 52] per canonical flop, the type of every river
+  after every turn (built on first use and LRU-cached)
+
+Cards of the real board are mapped onto the canonical flop with the suit
+permutation from core/canonical.py, so a lookup is an array read. Cards
+already on the board are marked ON_BOARD.
+"""
+
+from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+
+from .canonical import NUM_FLOPS, board_from_id, canonical_form, flop_id
+from .cards import card_index
+from .hand_rank import straight_high
+
+TURN_TYPES = ("brick", "overcard", "pair_board", "flush_card", "straight_card")
+RIVER_TYPES = (
+    "brick",
+    "overcard",
+    "pair_board",
+    "flush_complete",
+    "straight_complete",
+    "counterfeit",
+)
+ON_BOARD = 255
+
+# Rank values at or above T count as overcards
+_BROADWAY = card_index("Ts") >> 2
+# Rank values up to 7 can counterfeit a low two pair
+_LOW_MAX = card_index("7s") >> 2
+
+_CARDS = np.arange(52)
+
+
+def turn_types(flop: Sequence[int]) -> list[str | None]:
+    """
+    Type of every turn card on a flop.
+
+    Returns:
+        52 entries indexed by card, None for cards on the flop
+    """
+    fid, perm = _canonical(flop)
+    row = turn_table()[fid][_relabel(_CARDS, perm)]
+    return [None if t == ON_BOARD else TURN_TYPES[t] for t in row.tolist()]
+
+
+def river_types(flop: Sequence[int], turn: int) -> list[str | None]:
+    """
+    Type of every river card after a flop and turn.
+
+    Returns:
+        52 entries indexed by card, None for cards on the board
+    """
+    fid, perm = _canonical(flop)
+    relabelled = _relabel(_CARDS, perm)
+    row = river_table(fid)[relabelled[turn]][relabelled]
+    return [None if t == ON_BOARD else RIVER_TYPES[t] for t in row.tolist()]
+
+
+@lru_cache(maxsize=1)
+def turn_table() -> np.ndarray:
+    """uint8[1755, 52]: turn type code of each card on each canonical flop."""
+    flops = np.array([board_from_id(i) for i in range(NUM_FLOPS)], dtype=np.intp)
+    return _classify_turns(flops)
+
+
+@lru_cache(maxsize=NUM_FLOPS)
+def river_table(fid: int) -> np.ndarray:
+    """uint8[52, 52]: river type code by (turn card, river card) on a canonical flop."""
+    flop = np.array(board_from_id(fid), dtype=np.intp)
+    boards = np.column_stack([np.tile(flop, (52, 1)), _CARDS])
+    table = _classify_rivers(boards)
+    table[np.isin(_CARDS, flop)] = ON_BOARD
+    return table
+
+
+def _canonical(flop: Sequence[int]) -> tuple[int, tuple[int, ...]]:
+    """Canonical flop id and the suit permutation onto it."""
+    return flop_id(flop), canonical_form(flop)[2]
+
+
+def _relabel(cards: np.ndarray, perm: Sequence[int]) -> np.ndarray:
+    return (cards & ~3) | np.asarray(perm)[cards & 3]
+
+
+@lru_cache(maxsize=1)
+def _straight_highs() -> np.ndarray:
+    return np.array([straight_high(m) for m in range(1 << 13)], dtype=np.int8)
+
+
+def _classify_turns(flops: np.ndarray) -> np.ndarray:
+    """Turn type codes, (boards, 52), for (boards, 3) flops."""
+    ranks = flops >> 2
+    suits = flops & 3
+    turn_rank = (_CARDS >> 2)[None, :]
+    turn_suit = (_CARDS & 3)[None, :]
+
+    paired = (ranks[:, :, None] == turn_rank[:, None, :]).any(axis=1)
+    flush = (suits[:, :, None] == turn_suit[:, None, :]).sum(axis=1) >= 2
+    # Connected: no gap above 2 between the sorted flop and turn ranks
+    n = len(flops)
+    values = np.concatenate(
+        [np.broadcast_to(ranks[:, :, None], (n, 3, 52)), np.broadcast_to(turn_rank, (n, 1, 52))],
+        axis=1,
+    )
+    values = np.sort(values, axis=1)
+    straight = np.diff(values, axis=1).max(axis=1) <= 2
+
+    codes = np.select(
+        [paired, flush, straight, turn_rank >= _BROADWAY],
+        [TURN_TYPES.index(t) for t in ("pair_board", "flush_card", "straight_card", "overcard")],
+        default=TURN_TYPES.index("brick"),
+    ).astype(np.uint8)
+    codes[(flops[:, :, None] == _CARDS[None, None, :]).any(axis=1)] = ON_BOARD
+    return codes
+
+
+def _classify_rivers(boards: np.ndarray) -> np.ndarray:
+    """River type codes, (boards, 52), for (boards, 4) turn boards."""
+    ranks = boards >> 2
+    suits = boards & 3
+    river_rank = (_CARDS >> 2)[None, :]
+    river_suit = (_CARDS & 3)[None, :]
+
+    flush = (suits[:, :, None] == river_suit[:, None, :]).sum(axis=1) >= 3
+    paired = (ranks[:, :, None] == river_rank[:, None, :]).any(axis=1)
+    rank_bits = np.bitwise_or.reduce(1 << ranks, axis=1)
+    straight = _straight_highs()[rank_bits[:, None] | (1 << river_rank)] >= 0
+    board_paired = (np.diff(np.sort(ranks, axis=1), axis=1) == 0).any(axis=1)
+    counterfeit = (river_rank <= _LOW_MAX) & board_paired[:, None]
+
+    codes = np.select(
+        [flush, paired, straight, river_rank >= _BROADWAY, counterfeit],
+        [
+            RIVER_TYPES.index(t)
+            for t in (
+                "flush_complete",
+                "pair_board",
+                "straight_complete",
+                "overcard",
+                "counterfeit",
+            )
+        ],
+        default=RIVER_TYPES.index("brick"),
+    ).astype(np.uint8)
+    codes[(boards[:, :, None] == _CARDS[None, None, :]).any(axis=1)] = ON_BOARD
+    return codes
@@ -0,0 +1,89 @@
+"""
+O(1) weighted sampling for drills.
+
+AliasSampler implements Vose's alias method: building the table is O(n) and
+every draw costs one uniform index and one coin flip, however skewed the
+weights are. Drill endpoints build one sampler per pool of (scenario, hand)
+pairs and reuse it for every request.
+
+drill_weights turns strategies into sampling weights:
+- "uniform": every (scenario, hand) pair is equally likely
+- "mixed": pairs lean toward mixed strategies, weight MIXED_FLOOR plus one
+  minus the most frequent action's share, so a pure hand still shows up but
+  a 50/50 hand is six times as likely
+"""
+
+import random
+from collections.abc import Sequence
+
+import numpy as np
+
+WEIGHTINGS = ("uniform", "mixed")
+MIXED_FLOOR = 0.1
+
+
+class AliasSampler:
+    """Draw indexes 0..n-1 with probability proportional to `weights`."""
+
+    def __init__(self, weights: Sequence[float]):
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.ndim != 1 or len(weights) == 0:
+            raise ValueError("Need a non-empty 1-d weight vector")
+        if (weights < 0).any() or not np.isfinite(weights).all() or weights.sum() <= 0:
+            raise ValueError("Weights must be finite, non-negative and not all zero")
+
+        n = len(weights)
+        scaled = weights * (n / weights.sum())
+        self.prob = np.ones(n)
+        self.alias = np.arange(n)
+        small = [i for i in range(n) if scaled[i] < 1]
+        large = [i for i in range(n) if scaled[i] >= 1]
+        # Pair each short column with a tall one; whatever is left over is 1
+        # up to rounding and keeps probability 1
+        while small and large:
+            s, g = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = g
+            scaled[g] -= 1 - scaled[s]
+            (small if scaled[g] < 1 else large).append(g)
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def sample(self, rng: random.Random | None = None) -> int:
+        """One index; uses the `random` module's generator unless `rng` is given."""
+        rng = rng or random
+        i = rng.randrange(len(self.prob))
+        return i if rng.random() < self.prob[i] else int(self.alias[i])
+
+
+def drill_weights(frequencies: np.ndarray, weighting: str = "uniform") -> np.ndarray:
+    """
+    Sampling weight of each strategy.
+
+    Args:
+        frequencies: (..., actions) action frequencies in percent, NaN for
+            actions the strategy does not list
+        weighting: One of WEIGHTINGS
+
+    Returns:
+        Weights with the leading shape of `frequencies`
+    """
+    if weighting not in WEIGHTINGS:
+        raise ValueError(f"Unknown weighting '{weighting}'")
+    if weighting == "uniform":
+        return np.ones(frequencies.shape[:-1])
+    top = np.nanmax(frequencies, axis=-1, initial=0)
+    return MIXED_FLOOR + np.clip(1 - top / 100, 0, 1)
+
+
+def strategy_weights(strategies: Sequence[dict], weighting: str = "uniform") -> np.ndarray:
+    """drill_weights for strategy dicts like {"bet_33": 70, "check": 30, "note": ...}."""
+    actions = sorted({a for s in strategies for a, v in s.items() if isinstance(v, (int, float))})
+    frequencies = np.full((len(strategies), max(len(actions), 1)), np.nan)
+    for i, strategy in enumerate(strategies):
+        for j, action in enumerate(actions):
+            value = strategy.get(action)
+            if isinstance(value, (int, float)):
+                frequencies[i, j] = value
+    return drill_weights(frequencies, weighting)
@@ -0,0 +1,186 @@
+"""
+Range-level aggregates of the compiled solver scenarios.
+
+A scenario lists a strategy per hand class ("AKs"), exact combo ("AhJh") or
+partly suited combo ("KhKx"). Each hand is weighted by its live combos on the
+scenario's board, so a range-wide frequency reads like a solver's summary
+line: the share of combos that take each action. Sums of weighted
+frequencies and combos are then pooled per texture and per position pair.
+
+aggregate_store computes every table once per data load from the strategy
+matrices, together with the scenario listings and counts the solver list
+endpoints serve, and a version tag that changes whenever any of them does.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+
+import numpy as np
+
+from .cards import RANKS, SUITS, mask_of, parse_card_indexes
+from .combos import CLASS_COMBOS, COMBO_CARDS, COMBO_MASKS, NUM_COMBOS, class_notation
+from .solver_store import ABSENT, NO_NOTE, SolverStore
+
+
+@dataclass
+class SolverAggregates:
+    """Precomputed listings and action frequencies of the solver data."""
+
+    actions: list[str]
+    # Per scenario, in store order: id, spot, board, texture and hand count
+    scenarios: list[dict]
+    # (position, villain, pot_type) -> indexes into scenarios
+    spots: dict[tuple, list[int]]
+    # Scenario id / texture / "BTN_vs_BB" -> {"combos", "frequencies"} and counts
+    by_scenario: dict[str, dict]
+    by_texture: dict[str, dict]
+    by_position: dict[str, dict]
+    pot_types: dict[str, int]
+    # Changes whenever any table does, e.g. for ETags
+    version: str
+
+
+def hand_combos(hand: str) -> np.ndarray:
+    """
+    Bool combo array of one strategy key.
+
+    Returns:
+        All False for keys that name no combo
+    """
+    if len(hand) == 4:
+        first, second = hand[:2], hand[2:]
+        mask = np.zeros(NUM_COMBOS, dtype=bool)
+        for pattern in (first + second, second + first):
+            mask |= _match(COMBO_CARDS[:, 0], pattern[:2]) & _match(COMBO_CARDS[:, 1], pattern[2:])
+        return mask
+    mask = np.zeros(NUM_COMBOS, dtype=bool)
+    try:
+        mask[CLASS_COMBOS[class_notation(hand)]] = True
+    except ValueError:
+        pass
+    return mask
+
+
+def aggregate_store(store: SolverStore) -> SolverAggregates:
+    """Scenario listings, counts and combo-weighted action frequencies of a store."""
+    scenarios = [scenario for name in store.files for scenario in store.file_scenarios(name)]
+    listed = (store.frequencies != ABSENT).any(axis=2)
+    hand_counts = (listed | (store.note_ids != NO_NOTE)).sum(axis=1)
+
+    # An action a listed hand does not take has frequency 0; the solver
+    # output is rounded, so each hand is scaled to sum to exactly 100
+    frequencies = np.where(store.frequencies == ABSENT, 0, store.frequencies).astype(np.float64)
+    totals = frequencies.sum(axis=2)
+    frequencies = np.divide(
+        frequencies * 100,
+        totals[..., None],
+        out=np.zeros_like(frequencies),
+        where=totals[..., None] > 0,
+    )
+
+    # Live combos of each hand on each board
+    hands = np.array([hand_combos(hand) for hand in store.hands], dtype=np.float64)
+    board_masks = np.array([_board_mask(s.get("board", [])) for s in scenarios], dtype=np.uint64)
+    live = ((COMBO_MASKS[None, :] & board_masks[:, None]) == 0).astype(np.float64)
+    combos = (live @ hands.T) * (totals > 0)
+    weighted = np.einsum("rh,rha->ra", combos, frequencies)
+    taken = (store.frequencies != ABSENT).any(axis=1)
+
+    listings = []
+    spots: dict[tuple, list[int]] = {}
+    by_scenario: dict[str, dict] = {}
+    texture_rows: dict[str, list[int]] = {}
+    position_rows: dict[str, list[int]] = {}
+    pot_types: dict[str, int] = {}
+    for row, s in enumerate(scenarios):
+        listings.append(
+            {
+                "scenario_id": s.get("scenario_id"),
+                "position": s.get("position"),
+                "villain": s.get("villain"),
+                "pot_type": s.get("pot_type"),
+                "board": s.get("board"),
+                "texture": s.get("texture"),
+                "texture_zh": s.get("texture_zh"),
+                "hand_count": int(hand_counts[row]),
+            }
+        )
+        spots.setdefault((s.get("position"), s.get("villain"), s.get("pot_type")), []).append(row)
+        by_scenario[s.get("scenario_id")] = _summary(store.actions, combos, weighted, taken, [row])
+        if s.get("texture"):
+            texture_rows.setdefault(s["texture"], []).append(row)
+        position_rows.setdefault(f"{s.get('position')}_vs_{s.get('villain')}", []).append(row)
+        pot_types[s.get("pot_type")] = pot_types.get(s.get("pot_type"), 0) + 1
+
+    by_texture = {
+        texture: {
+            "texture_zh": scenarios[rows[0]].get("texture_zh", ""),
+            "count": len(rows),
+            **_summary(store.actions, combos, weighted, taken, rows),
+        }
+        for texture, rows in texture_rows.items()
+    }
+    by_position = {
+        key: {
+            "position": scenarios[rows[0]].get("position"),
+            "villain": scenarios[rows[0]].get("villain"),
+            "count": len(rows),
+            **_summary(store.actions, combos, weighted, taken, rows),
+        }
+        for key, rows in position_rows.items()
+    }
+
+    tables = [listings, by_scenario, by_texture, by_position, pot_types]
+    digest = hashlib.sha256(json.dumps(tables, sort_keys=True, ensure_ascii=False).encode())
+    return SolverAggregates(
+        actions=list(store.actions),
+        scenarios=listings,
+        spots=spots,
+        by_scenario=by_scenario,
+        by_texture=by_texture,
+        by_position=by_position,
+        pot_types=pot_types,
+        version=digest.hexdigest()[:16],
+    )
+
+
+def _summary(
+    actions: list[str],
+    combos: np.ndarray,
+    weighted: np.ndarray,
+    taken: np.ndarray,
+    rows: list[int],
+) -> dict:
+    """Pooled combos and frequencies (percent, 1 decimal) of some scenario rows."""
+    total = float(combos[rows].sum())
+    sums = weighted[rows].sum(axis=0)
+    used = taken[rows].any(axis=0)
+    return {
+        "combos": round(total, 1),
+        "frequencies": {
+            action: round(float(sums[i]) / total, 1) if total else 0.0
+            for i, action in enumerate(actions)
+            if used[i]
+        },
+    }
+
+
+def _match(cards: np.ndarray, card: str) -> np.ndarray:
+    """Which cards match a card pattern like "Kh" or "Kx" (any suit)."""
+    rank = RANKS.find(card[0].upper())
+    if rank < 0:
+        return np.zeros(len(cards), dtype=bool)
+    matches = cards >> 2 == rank
+    if card[1].lower() in SUITS:
+        matches &= (cards & 3) == SUITS.index(card[1].lower())
+    elif card[1].lower() != "x":
+        matches[:] = False
+    return matches
+
+
+def _board_mask(board: list[str]) -> int:
+    try:
+        return mask_of(parse_card_indexes("".join(board)))
+    except ValueError:
+        return 0
@@ -0,0 +1,403 @@
+"""
+Compiled, memory-mapped storage for the precomputed solver scenarios.
+
+The JSON files in data/solver repeat every action name and note string for
+every hand of every scenario and parse into about a million small Python
+objects per worker. scripts/compile_solver_data.py packs them into one
+binary file instead: frequencies are whole percentages, so they fit a uint8
+matrix, and the few hundred distinct notes go into a string table. The file
+is memory-mapped read-only, so every uvicorn worker shares the same pages and
+a hand's strategy is decoded only when it is looked up.
+
+Scenario fields other than strategies are stored per source file and parsed
+only when that file is loaded, and the compiler also writes manifest.json:
+the position, villain, pot type, boards and board textures of every file.
+Together they let routers/solver.py load one spot at a time.
+
+File layout (little-endian):
+- 24-byte header: magic b"SLVR", version (uint16), hand classes (uint16),
+  actions (uint16), 2 reserved bytes, scenarios (uint32), index bytes (uint32),
+  scenario metadata bytes (uint32)
+- index: UTF-8 JSON with the hand and action vocabularies, the note string
+  table and, per source file, its scenario rows and metadata byte range
+- scenario metadata: one UTF-8 JSON array per source file
+- frequencies: uint8[scenarios, hands, actions] in percent, ABSENT = no entry
+- notes: uint16[scenarios, hands], index into the string table, NO_NOTE = none
+Each array starts on an 8-byte boundary.
+"""
+
+import json
+import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+MAGIC = b"SLVR"
+VERSION = 2
+HEADER = struct.Struct("<4sHHH2xIII")
+ABSENT = 255
+NO_NOTE = 0xFFFF
+
+DATA_DIR = Path(__file__).parent.parent / "data" / "solver"
+DATA_PATH = DATA_DIR / "strategies.bin"
+MANIFEST_PATH = DATA_DIR / "manifest.json"
+
+_store_cache: dict[str, "SolverStore"] = {}
+
+
+@dataclass
+class SolverStore:
+    """Scenarios of a compiled solver file, backed by read-only memory maps."""
+
+    hands: list[str]
+    actions: list[str]
+    notes: list[str]
+    # Source file name -> {"rows": [start, stop], "metadata": [offset, length]}
+    files: dict[str, dict]
+    metadata: np.ndarray  # uint8[scenario metadata bytes]
+    frequencies: np.ndarray  # uint8[scenarios, hands, actions]
+    note_ids: np.ndarray  # uint16[scenarios, hands]
+
+    def __post_init__(self):
+        self.hand_index = {hand: i for i, hand in enumerate(self.hands)}
+
+    def file_scenarios(self, name: str) -> list[dict]:
+        """
+        Scenarios compiled from one source file, as in the JSON.
+
+        "strategies" is a lazy Strategies view of the matrices.
+
+        Raises:
+            KeyError: If no file of that name was compiled
+        """
+        entry = self.files[name]
+        offset, length = entry["metadata"]
+        scenarios = json.loads(self.metadata[offset : offset + length].tobytes())
+        for row, scenario in enumerate(scenarios, start=entry["rows"][0]):
+            scenario["strategies"] = Strategies(self, row)
+        return scenarios
+
+    def hand_strategy(self, row: int, hand: str) -> dict | None:
+        """Strategy of one hand in scenario `row`, as in the JSON files."""
+        column = self.hand_index.get(hand)
+        if column is None:
+            return None
+        freqs = self.frequencies[row, column]
+        note = int(self.note_ids[row, column])
+        strategy = {a: int(f) for a, f in zip(self.actions, freqs.tolist()) if f != ABSENT}
+        if note != NO_NOTE:
+            strategy["note"] = self.notes[note]
+        return strategy or None
+
+    def present(self, row: int) -> list[str]:
+        """Hands with a strategy in scenario `row`."""
+        mask = (self.frequencies[row] != ABSENT).any(axis=1) | (self.note_ids[row] != NO_NOTE)
+        return [self.hands[i] for i in np.flatnonzero(mask)]
+
+
+class Strategies(Mapping):
+    """Read-only hand -> strategy mapping of one compiled scenario."""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: SolverStore, row: int):
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, hand: str) -> dict:
+        strategy = self._store.hand_strategy(self._row, hand)
+        if strategy is None:
+            raise KeyError(hand)
+        return strategy
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.present(self._row))
+
+    def __len__(self) -> int:
+        return len(self._store.present(self._row))
+
+
+_MISSING = object()
+
+
+class SpotCache:
+    """
+    Bounded LRU cache of loaded spots.
+
+    Values come from `loader(spot)` on a miss; once more than `max_size`
+    spots are held, the least recently used one is dropped. Safe to share
+    between the threads FastAPI runs sync endpoints on: the loader runs
+    outside the lock, and a spot loaded by two threads at once is kept once.
+    """
+
+    def __init__(self, loader: Callable[[Hashable], Any], max_size: int):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._loader = loader
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_size = max_size
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, spot: Hashable) -> Any:
+        with self._lock:
+            value = self._entries.get(spot, _MISSING)
+            if value is not _MISSING:
+                self.hits += 1
+                self._entries.move_to_end(spot)
+                return value
+            self.misses += 1
+
+        value = self._loader(spot)
+        with self._lock:
+            if spot in self._entries:
+                # Another thread loaded it meanwhile; keep the cached copy
+                self._entries.move_to_end(spot)
+                return self._entries[spot]
+            self._entries[spot] = value
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def __contains__(self, spot: Hashable) -> bool:
+        return spot in self._entries
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> dict[str, Any]:
+        """Hit / miss / eviction counters and the spots currently held."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "spots": list(self._entries),
+            }
+
+
+def read_json_file(path: Path) -> list[dict] | None:
+    """Scenarios of one JSON file, or None if it holds something else or fails to parse."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and "scenarios" in data:
+        return data["scenarios"]
+    return None
+
+
+def read_json_files(data_dir: Path | None = None) -> dict[str, list[dict]]:
+    """
+    Parse every scenario file in the solver data directory.
+
+    Returns:
+        File name -> scenarios, in file name order. Files that hold something
+        else (texture and adjustment tables) or fail to parse are skipped.
+    """
+    data_dir = Path(data_dir or DATA_DIR)
+    if not data_dir.exists():
+        return {}
+    files = {}
+    for json_file in sorted(data_dir.glob("*.json")):
+        if json_file.name == MANIFEST_PATH.name:
+            continue
+        scenarios = read_json_file(json_file)
+        if scenarios is not None:
+            files[json_file.name] = scenarios
+    return files
+
+
+def build_manifest(files: dict[str, list[dict]]) -> dict:
+    """
+    Manifest of the spot in each scenario file.
+
+    Returns:
+        {"spots": [{"file", "position", "villain", "pot_type", "boards", "textures"}]},
+        one entry per file with boards as strings like "AhKs5d" and the
+        texture of each board, in scenario order
+
+    Raises:
+        ValueError: If a file mixes scenarios of several spots
+    """
+    spots = []
+    for name, scenarios in files.items():
+        if not scenarios:
+            continue
+        keys = {(s.get("position"), s.get("villain"), s.get("pot_type")) for s in scenarios}
+        if len(keys) > 1:
+            raise ValueError(f"{name} mixes several spots: {sorted(keys, key=str)}")
+        position, villain, pot_type = keys.pop()
+        spots.append(
+            {
+                "file": name,
+                "position": position,
+                "villain": villain,
+                "pot_type": pot_type,
+                "boards": ["".join(s.get("board", [])) for s in scenarios],
+                "textures": [s.get("texture") for s in scenarios],
+            }
+        )
+    return {"spots": spots}
+
+
+def load_manifest(path: Path | None = None) -> dict:
+    """
+    Read a manifest written by the compiler.
+
+    Raises:
+        FileNotFoundError: If the manifest has not been generated
+    """
+    with open(path or MANIFEST_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_store(files: dict[str, list[dict]]) -> SolverStore:
+    """
+    Pack scenarios (file name -> scenarios as loaded from JSON) into an in-memory store.
+
+    Raises:
+        ValueError: If a frequency is not a whole percentage
+    """
+    index, metadata, frequencies, note_ids = _pack(files)
+    return SolverStore(
+        hands=index["hands"],
+        actions=index["actions"],
+        notes=index["notes"],
+        files=index["files"],
+        metadata=np.frombuffer(metadata, dtype=np.uint8),
+        frequencies=frequencies,
+        note_ids=note_ids,
+    )
+
+
+def write_store(path: Path, files: dict[str, list[dict]]) -> None:
+    """
+    Compile scenarios (file name -> scenarios as loaded from JSON) into the binary format.
+
+    Raises:
+        ValueError: If a frequency is not a whole percentage
+    """
+    index, metadata, frequencies, note_ids = _pack(files)
+    index_bytes = _dumps(index)
+    n_scenarios, n_hands, n_actions = frequencies.shape
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(
+            HEADER.pack(
+                MAGIC, VERSION, n_hands, n_actions, n_scenarios, len(index_bytes), len(metadata)
+            )
+        )
+        f.write(index_bytes)
+        f.write(metadata)
+        for array in (frequencies, note_ids):
+            f.write(b"\0" * (-f.tell() % 8))
+            f.write(array.tobytes())
+
+
+def load_store(path: Path | None = None) -> SolverStore:
+    """
+    Memory-map a compiled solver file.
+
+    Raises:
+        FileNotFoundError: If the file has not been compiled
+        ValueError: If the file header does not match this format
+    """
+    path = Path(path or DATA_PATH)
+    key = str(path)
+    if key in _store_cache:
+        return _store_cache[key]
+
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+        if len(header) < HEADER.size or header[:4] != MAGIC:
+            raise ValueError(f"Unsupported solver data file: {path}")
+        _, version, n_hands, n_actions, n_scenarios, index_size, metadata_size = HEADER.unpack(
+            header
+        )
+        if version != VERSION:
+            raise ValueError(f"Unsupported solver data file: {path}")
+        index = json.loads(f.read(index_size))
+
+    offset = HEADER.size + index_size
+    metadata = np.memmap(path, dtype=np.uint8, mode="r", offset=offset, shape=(metadata_size,))
+    offset = _align(offset + metadata_size)
+    frequencies = np.memmap(
+        path, dtype=np.uint8, mode="r", offset=offset, shape=(n_scenarios, n_hands, n_actions)
+    )
+    offset = _align(offset + frequencies.nbytes)
+    note_ids = np.memmap(path, dtype="<u2", mode="r", offset=offset, shape=(n_scenarios, n_hands))
+
+    # Plain ndarray views: indexing a memmap subclass is several times slower
+    store = SolverStore(
+        hands=index["hands"],
+        actions=index["actions"],
+        notes=index["notes"],
+        files=index["files"],
+        metadata=metadata.view(np.ndarray),
+        frequencies=frequencies.view(np.ndarray),
+        note_ids=note_ids.view(np.ndarray),
+    )
+    _store_cache[key] = store
+    return store
+
+
+def _pack(files: dict[str, list[dict]]) -> tuple[dict, bytes, np.ndarray, np.ndarray]:
+    """Index, scenario metadata, frequencies and note ids of the binary format."""
+    scenarios = [s for file_scenarios in files.values() for s in file_scenarios]
+    hands, actions, notes = {}, {}, {}
+    for scenario in scenarios:
+        for hand, strategy in scenario.get("strategies", {}).items():
+            hands.setdefault(hand, len(hands))
+            for action, value in strategy.items():
+                if action == "note":
+                    notes.setdefault(value, len(notes))
+                else:
+                    actions.setdefault(action, len(actions))
+
+    frequencies = np.full((len(scenarios), len(hands), len(actions)), ABSENT, dtype=np.uint8)
+    note_ids = np.full((len(scenarios), len(hands)), NO_NOTE, dtype="<u2")
+    for row, scenario in enumerate(scenarios):
+        for hand, strategy in scenario.get("strategies", {}).items():
+            column = hands[hand]
+            for action, value in strategy.items():
+                if action == "note":
+                    note_ids[row, column] = notes[value]
+                elif value != int(value) or not 0 <= value < ABSENT:
+                    raise ValueError(
+                        f"{scenario.get('scenario_id')} {hand} {action}: {value} is not a percentage"
+                    )
+                else:
+                    frequencies[row, column, actions[action]] = int(value)
+
+    blobs, entries = [], {}
+    row = offset = 0
+    for name, file_scenarios in files.items():
+        blob = _dumps([{k: v for k, v in s.items() if k != "strategies"} for s in file_scenarios])
+        entries[name] = {"rows": [row, row + len(file_scenarios)], "metadata": [offset, len(blob)]}
+        blobs.append(blob)
+        row += len(file_scenarios)
+        offset += len(blob)
+    index = {"hands": list(hands), "actions": list(actions), "notes": list(notes), "files": entries}
+    return index, b"".join(blobs), frequencies, note_ids
+
+
+def _dumps(data) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _align(offset: int) -> int:
+    return offset + (-offset % 8)
@@ -2,8 +2,10 @@
 GTO Poker Trainer - FastAPI Backend
 """
 
+import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 # Add api directory to path for imports
@@ -18,7 +20,9 @@ from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
-from routers import analyze, drill, evaluate, mtt, postflop, ranges, solver
+from core.data_bundle import get_bundle
+from core.runouts import turn_table
+from routers import analyze, drill, equity, evaluate, mtt, postflop, ranges, solver
 
 # Initialize rate limiter
 limiter = Limiter(key_func=get_remote_address, default_limits=["100/minute"])
@@ -40,10 +44,28 @@ if sentry_dsn:
         send_default_pii=False,
     )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Verify the compiled data bundle first: a corrupt or mismatched bundle
+    # raises here rather than serving partial data
+    if get_bundle() is None:
+        logging.getLogger(__name__).warning(
+            "No data bundle; serving unvalidated JSON (run scripts/compile_solver_data.py)"
+        )
+    # Load the solver spots listed in SOLVER_WARM_SPOTS, the solver list
+    # aggregates and the runout classification tables before serving
+    solver.warm_solver_cache()
+    solver.get_aggregates()
+    turn_table()
+    yield
+
+
 app = FastAPI(
     title="GTO Poker Trainer API",
     description="Backend API for GTO poker training application",
     version="2.1.0",  # Also update root() below when changing
+    lifespan=lifespan,
 )
 
 # Add rate limiter to app state
@@ -72,6 +94,7 @@ app.include_router(mtt.router, prefix="/api/mtt", tags=["mtt"])
 app.include_router(postflop.router, prefix="/api/postflop", tags=["postflop"])
 app.include_router(analyze.router, prefix="/api/analyze", tags=["analyze"])
 app.include_router(solver.router, prefix="/api/solver", tags=["solver"])
+app.include_router(equity.router, prefix="/api/equity", tags=["equity"])
 
 
 @app.get("/")
@@ -0,0 +1,192 @@
+"""
+Equity calculation endpoints.
+"""
+
+import logging
+import time
+
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel, Field
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from core.cards import format_cards, indexes_of, parse_card_indexes
+from core.outs import BATCH_DRAW_TYPES, HandStrength, calculate_outs_batch
+from core.preflop_equity import hand_index, hand_vs_hand, range_indexes, range_vs_range
+from core.range_equity import monte_carlo_equity
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+limiter = Limiter(key_func=get_remote_address)
+
+# Hard caps so one request cannot monopolize a worker
+MAX_SAMPLES = 500_000
+MAX_TIME_BUDGET_MS = 2_000
+MAX_OUTS_SPOTS = 10_000
+
+
+class RangeEquityRequest(BaseModel):
+    hero_range: str  # e.g. "TT+, AQs+"
+    villain_range: str  # e.g. "22+, A2s+, KTo+"
+    board: str = ""  # 0-5 cards, e.g. "Ah7s2d"
+    dead: str = ""  # Extra dead cards
+    samples: int = Field(default=100_000, ge=1_000, le=MAX_SAMPLES)
+    time_budget_ms: int = Field(default=250, ge=10, le=MAX_TIME_BUDGET_MS)
+    target_std_error: float | None = Field(default=None, gt=0, lt=50)  # In equity %
+    seed: int | None = None
+
+
+class RangeEquityResponse(BaseModel):
+    equity: float  # Hero equity %
+    ci_low: float  # 95% confidence interval, %
+    ci_high: float
+    std_error: float
+    win: float
+    tie: float
+    samples: int
+    elapsed_ms: float
+    hero_combos: int
+    villain_combos: int
+
+
+@router.post("/range", response_model=RangeEquityResponse)
+@limiter.limit("60/minute")
+def calculate_range_equity(request: Request, body: RangeEquityRequest):
+    """Monte Carlo range vs range equity with a bounded sample / time budget."""
+    try:
+        board = parse_card_indexes(body.board)
+        dead = parse_card_indexes(body.dead)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        result = monte_carlo_equity(
+            body.hero_range,
+            body.villain_range,
+            board=board,
+            dead=dead,
+            max_samples=body.samples,
+            time_budget_ms=body.time_budget_ms,
+            target_std_error=body.target_std_error / 100 if body.target_std_error else None,
+            seed=body.seed,
+        )
+    except (ValueError, IndexError) as e:
+        # parse_range raises ValueError / IndexError on bad notation
+        raise HTTPException(status_code=400, detail=f"Invalid range or board: {e}")
+    except Exception:
+        logger.exception("Unexpected error")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return RangeEquityResponse(
+        equity=round(result.equity * 100, 2),
+        ci_low=round(result.ci_low * 100, 2),
+        ci_high=round(result.ci_high * 100, 2),
+        std_error=round(result.std_error * 100, 3),
+        win=round(result.win * 100, 2),
+        tie=round(result.tie * 100, 2),
+        samples=result.samples,
+        elapsed_ms=round(result.elapsed_ms, 1),
+        hero_combos=result.hero_combos,
+        villain_combos=result.villain_combos,
+    )
+
+
+class PreflopEquityResponse(BaseModel):
+    hero: str
+    villain: str
+    equity: float  # Hero equity %
+    combo_pairs: int  # Card-disjoint combo pairs behind the number
+
+
+@router.get("/preflop", response_model=PreflopEquityResponse)
+def get_preflop_equity(hero: str, villain: str):
+    """Hand class vs hand class all-in equity, e.g. ?hero=AKs&villain=QQ."""
+    try:
+        i, j = hand_index(hero), hand_index(villain)
+        _, pairs = range_vs_range([i], [j])
+        equity = hand_vs_hand(hero, villain)
+    except (ValueError, IndexError):
+        raise HTTPException(status_code=400, detail="Invalid hand")
+    except Exception:
+        logger.exception("Unexpected error")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return PreflopEquityResponse(
+        hero=hero, villain=villain, equity=round(equity * 100, 2), combo_pairs=pairs
+    )
+
+
+@router.get("/preflop/range", response_model=PreflopEquityResponse)
+def get_preflop_range_equity(hero: str, villain: str):
+    """Range vs range all-in equity, weighted by combo pairs, e.g. ?hero=TT%2B&villain=22%2B."""
+    try:
+        equity, pairs = range_vs_range(range_indexes(hero), range_indexes(villain))
+    except (ValueError, IndexError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid range: {e}")
+    except Exception:
+        logger.exception("Unexpected error")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    if pairs == 0:
+        raise HTTPException(status_code=400, detail="Ranges have no card-disjoint combos")
+    return PreflopEquityResponse(
+        hero=hero, villain=villain, equity=round(equity * 100, 2), combo_pairs=pairs
+    )
+
+
+class OutsSpot(BaseModel):
+    hole: str  # e.g. "AhKh"
+    board: str  # 3-5 cards, e.g. "Qh7h2c"
+
+
+class OutsBatchRequest(BaseModel):
+    spots: list[OutsSpot] = Field(min_length=1, max_length=MAX_OUTS_SPOTS)
+
+
+class OutsBatchResponse(BaseModel):
+    """Column-oriented: every list has one entry per spot, in request order."""
+
+    hand_strength: list[str]  # e.g. "one_pair"
+    total_outs: list[int]
+    turn_probability: list[float]  # %
+    river_probability: list[float]
+    out_cards: list[str]  # e.g. "Ah2h3h..."
+    draws: dict[str, list[int]]  # Draw type -> outs per spot, 0 when absent
+    elapsed_ms: float
+
+
+@router.post("/outs/batch", response_model=OutsBatchResponse)
+@limiter.limit("30/minute")
+def calculate_outs_batch_endpoint(request: Request, body: OutsBatchRequest):
+    """Outs and draws for many (hole cards, board) spots in one call."""
+    start = time.perf_counter()
+    holes, boards = [], []
+    for i, spot in enumerate(body.spots):
+        try:
+            hole = parse_card_indexes(spot.hole)
+            board = parse_card_indexes(spot.board)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Spot {i}: {e}")
+        if len(hole) != 2:
+            raise HTTPException(status_code=400, detail=f"Spot {i}: need exactly 2 hole cards")
+        holes.append(hole)
+        boards.append(board)
+
+    try:
+        result = calculate_outs_batch(holes, boards)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        logger.exception("Unexpected error")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    strength_names = {s.value: s.name.lower() for s in HandStrength}
+    return OutsBatchResponse(
+        hand_strength=[strength_names[s] for s in result.hand_strength.tolist()],
+        total_outs=result.total_outs.tolist(),
+        turn_probability=result.turn_probability.tolist(),
+        river_probability=result.river_probability.tolist(),
+        out_cards=[format_cards(indexes_of(m)) for m in result.out_masks.tolist()],
+        draws={d.value: result.draw_outs[d].tolist() for d in BATCH_DRAW_TYPES},
+        elapsed_ms=round((time.perf_counter() - start) * 1000, 1),
+    )
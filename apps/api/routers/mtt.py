@@ -1,17 +1,25 @@
 """
-MTT Push/Fold range endpoints and drill mode.
+MTT Push/Fold range endpoints, drill mode and ICM pressure / FGS tools.
 """
 
-import json
 import logging
+import math
 import random
-from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Query, Request
+from pydantic import BaseModel, Field
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from core.cards import parse_dead_cards
+from core.combos import count_combos, hands_mask
+from core.data_bundle import load_data_file
+from core.fgs import DEFAULT_FGS_HANDS, fgs_equities_batch
+from core.icm import MAX_EXACT_PLAYERS, bubble_factors, icm_equities_batch, icm_pressure_curve
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
+limiter = Limiter(key_func=get_remote_address)
 
 # Cache for MTT data
 _mtt_cache: dict[str, dict] = {}
@@ -32,7 +40,7 @@ class PushFoldResponse(BaseModel):
     position: str
     stack_depth: str
     hands: list[str]  # List of hands that should push
-    total_combos: int
+    total_combos: int  # Concrete combos after removing dead cards
 
 
 class DefenseResponse(BaseModel):
@@ -52,8 +60,6 @@ def get_mtt_data(data_type: str) -> dict:
     if data_type in _mtt_cache:
         return _mtt_cache[data_type]
 
-    data_dir = Path(__file__).parent.parent / "data" / "ranges" / "mtt"
-
     file_map = {
         "push_fold": "push_fold.json",
         "defense": "defense_vs_shove.json",
@@ -64,12 +70,10 @@ def get_mtt_data(data_type: str) -> dict:
     if data_type not in file_map:
         raise HTTPException(status_code=404, detail=f"Data type {data_type} not found")
 
-    file_path = data_dir / file_map[data_type]
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail=f"Data file not found: {file_path}")
-
-    with open(file_path) as f:
-        data = json.load(f)
+    try:
+        data = load_data_file(f"ranges/mtt/{file_map[data_type]}")
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Data file not found: {file_map[data_type]}")
 
     _mtt_cache[data_type] = data
     return data
@@ -80,8 +84,14 @@ def get_push_fold_range(
     position: str,
     stack_depth: str,
     format: str = Query(default="6max", description="Game format"),
+    dead: str = Query(default="", description="Known cards to remove, e.g. hero hand"),
 ):
     """Get push/fold range for a specific position and stack depth."""
+    try:
+        dead_cards = parse_dead_cards(dead)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         data = get_mtt_data("push_fold")
 
@@ -102,7 +112,7 @@ def get_push_fold_range(
             position=position,
             stack_depth=stack_depth,
             hands=hands,
-            total_combos=len(hands),
+            total_combos=int(count_combos(hands_mask(hands), dead_cards)),
         )
     except HTTPException:
         raise
@@ -116,8 +126,14 @@ def get_defense_range(
     scenario: str,
     stack_depth: str,
     format: str = Query(default="6max", description="Game format"),
+    dead: str = Query(default="", description="Known cards to remove, e.g. hero hand"),
 ):
     """Get defense range for a specific scenario and stack depth."""
+    try:
+        dead_cards = parse_dead_cards(dead)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         data = get_mtt_data("defense")
 
@@ -138,7 +154,7 @@ def get_defense_range(
             scenario=scenario,
             stack_depth=stack_depth,
             hands=hands,
-            total_combos=len(hands),
+            total_combos=int(count_combos(hands_mask(hands), dead_cards)),
         )
     except HTTPException:
         raise
@@ -152,8 +168,14 @@ def get_resteal_range(
     scenario: str,
     stack_depth: str,
     format: str = Query(default="6max", description="Game format"),
+    dead: str = Query(default="", description="Known cards to remove, e.g. hero hand"),
 ):
     """Get resteal (3bet shove) range for a specific scenario."""
+    try:
+        dead_cards = parse_dead_cards(dead)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         data = get_mtt_data("resteal")
 
@@ -174,7 +196,7 @@ def get_resteal_range(
             scenario=scenario,
             stack_depth=stack_depth,
             hands=hands,
-            total_combos=len(hands),
+            total_combos=int(count_combos(hands_mask(hands), dead_cards)),
         )
     except HTTPException:
         raise
@@ -188,8 +210,14 @@ def get_hu_range(
     scenario: str,
     stack_depth: str,
     format: str = Query(default="6max", description="Game format"),
+    dead: str = Query(default="", description="Known cards to remove, e.g. hero hand"),
 ):
     """Get heads-up push/defense range."""
+    try:
+        dead_cards = parse_dead_cards(dead)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         data = get_mtt_data("hu")
 
@@ -210,7 +238,7 @@ def get_hu_range(
             scenario=scenario,
             stack_depth=stack_depth,
             hands=hands,
-            total_combos=len(hands),
+            total_combos=int(count_combos(hands_mask(hands), dead_cards)),
         )
     except HTTPException:
         raise
@@ -642,3 +670,146 @@ def evaluate_drill_answer(request: DrillEvaluateRequest):
     except Exception:
         logger.exception("Unexpected error")
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+# ============ ICM Pressure ============
+
+# Final-table sizes, solved exactly (larger fields would be sampled per variant)
+MAX_ICM_PAYOUTS = 100
+MAX_PRESSURE_POTS = 100
+
+
+class PressureCurveRequest(BaseModel):
+    stacks: list[int] = Field(min_length=2, max_length=MAX_EXACT_PLAYERS)
+    payouts: list[float] = Field(min_length=1, max_length=MAX_ICM_PAYOUTS)
+    player: int  # Index into stacks
+    pot_sizes: list[int] = Field(min_length=1, max_length=MAX_PRESSURE_POTS)
+
+
+class PressureCurveResponse(BaseModel):
+    pot_sizes: list[int]
+    current_equity: float  # $ ICM equity now
+    win_equities: list[float]  # After winning each pot
+    lose_equities: list[float]
+    pressure_ratios: list[float | None]  # $ lost / $ gained; None if winning gains nothing
+    pressure_levels: list[str]
+
+
+class BubbleFactorRequest(BaseModel):
+    stacks: list[int] = Field(min_length=2, max_length=MAX_EXACT_PLAYERS)
+    payouts: list[float] = Field(min_length=1, max_length=MAX_ICM_PAYOUTS)
+
+
+class BubbleFactorResponse(BaseModel):
+    equities: list[float]  # $ ICM equity per player
+    bubble_factors: list[list[float | None]]  # [player][opponent]; None on the diagonal / busted
+
+
+def _finite(value: float, digits: int) -> float | None:
+    """Round a ratio for JSON, None when it is inf / NaN."""
+    return round(value, digits) if math.isfinite(value) else None
+
+
+def validate_icm_input(stacks: list[int], payouts: list[float]) -> None:
+    """400 on negative stacks / payouts or a table with no chips."""
+    if any(s < 0 for s in stacks) or any(p < 0 for p in payouts):
+        raise HTTPException(status_code=400, detail="Stacks and payouts must not be negative")
+    if sum(1 for s in stacks if s > 0) < 2:
+        raise HTTPException(status_code=400, detail="Need at least 2 players with chips")
+
+
+@router.post("/icm/pressure-curve", response_model=PressureCurveResponse)
+def get_pressure_curve(request: PressureCurveRequest):
+    """ICM risk premium for one player across many pot sizes."""
+    validate_icm_input(request.stacks, request.payouts)
+    if not 0 <= request.player < len(request.stacks):
+        raise HTTPException(status_code=400, detail="Player index out of range")
+    if any(p <= 0 for p in request.pot_sizes):
+        raise HTTPException(status_code=400, detail="Pot sizes must be positive")
+
+    try:
+        curve = icm_pressure_curve(
+            request.stacks, request.payouts, request.player, request.pot_sizes
+        )
+    except Exception:
+        logger.exception("Unexpected error")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return PressureCurveResponse(
+        pot_sizes=curve.pot_sizes,
+        current_equity=round(curve.current_equity, 2),
+        win_equities=[round(e, 2) for e in curve.win_equities],
+        lose_equities=[round(e, 2) for e in curve.lose_equities],
+        pressure_ratios=[_finite(r, 3) for r in curve.pressure_ratios],
+        pressure_levels=curve.pressure_levels,
+    )
+
+
+@router.post("/icm/bubble-factors", response_model=BubbleFactorResponse)
+def get_bubble_factors(request: BubbleFactorRequest):
+    """Bubble factor matrix for every pair of players at a final table."""
+    validate_icm_input(request.stacks, request.payouts)
+
+    try:
+        equities = icm_equities_batch([request.stacks], request.payouts)[0]
+        factors = bubble_factors(request.stacks, request.payouts)
+    except Exception:
+        logger.exception("Unexpected error")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return BubbleFactorResponse(
+        equities=[round(e, 2) for e in equities.tolist()],
+        bubble_factors=[[_finite(f, 3) for f in row] for row in factors.tolist()],
+    )
+
+
+# Final-table sizes and future hands an API request may simulate; the tree
+# grows by about n^2 states per hand
+MAX_FGS_PLAYERS = 9
+MAX_FGS_HANDS = 2
+
+
+class FGSRequest(BaseModel):
+    stacks: list[int] = Field(min_length=2, max_length=MAX_FGS_PLAYERS)
+    payouts: list[float] = Field(min_length=1, max_length=MAX_ICM_PAYOUTS)
+    button: int = 0  # Seat with the button in the first simulated hand
+    small_blind: float = Field(gt=0)
+    big_blind: float = Field(gt=0)
+    ante: float = Field(default=0, ge=0)
+    hands: int = Field(default=DEFAULT_FGS_HANDS, ge=1, le=MAX_FGS_HANDS)
+
+
+class FGSResponse(BaseModel):
+    icm_equities: list[float]  # $ equity under plain ICM
+    fgs_equities: list[float]  # $ equity after simulating the next hands
+    differences: list[float]  # fgs - icm per player
+
+
+@router.post("/icm/fgs", response_model=FGSResponse)
+@limiter.limit("10/minute")
+def get_fgs_equities(request: Request, body: FGSRequest):
+    """ICM equities with future game simulation of the next few hands."""
+    validate_icm_input(body.stacks, body.payouts)
+    if not 0 <= body.button < len(body.stacks):
+        raise HTTPException(status_code=400, detail="Button seat out of range")
+
+    try:
+        icm = icm_equities_batch([body.stacks], body.payouts)[0]
+        fgs = fgs_equities_batch(
+            [body.stacks],
+            body.payouts,
+            body.button,
+            body.small_blind,
+            body.big_blind,
+            body.ante,
+            body.hands,
+        )[0]
+    except Exception:
+        logger.exception("Unexpected error")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    return FGSResponse(
+        icm_equities=[round(e, 2) for e in icm.tolist()],
+        fgs_equities=[round(e, 2) for e in fgs.tolist()],
+        differences=[round(f - i, 2) for f, i in zip(fgs.tolist(), icm.tolist())],
+    )
@@ -2,14 +2,14 @@
 Postflop C-bet practice endpoints.
 """
 
-import json
 import logging
 import random
-from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+from core.data_bundle import load_data_file
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
@@ -124,13 +124,11 @@ def get_cbet_data() -> dict:
     if "cbet" in _postflop_cache:
         return _postflop_cache["cbet"]
 
-    data_path = Path(__file__).parent.parent / "data" / "postflop" / "flop_cbet.json"
-    if not data_path.exists():
+    try:
+        data = load_data_file("postflop/flop_cbet.json")
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="C-bet data not found")
 
-    with open(data_path) as f:
-        data = json.load(f)
-
     _postflop_cache["cbet"] = data
     return data
 
@@ -263,13 +261,11 @@ def get_turn_data() -> dict:
     if "turn" in _postflop_cache:
         return _postflop_cache["turn"]
 
-    data_path = Path(__file__).parent.parent / "data" / "postflop" / "turn_barrel.json"
-    if not data_path.exists():
+    try:
+        data = load_data_file("postflop/turn_barrel.json")
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Turn data not found")
 
-    with open(data_path) as f:
-        data = json.load(f)
-
     _postflop_cache["turn"] = data
     return data
 
@@ -378,13 +374,11 @@ def get_river_data() -> dict:
     if "river" in _postflop_cache:
         return _postflop_cache["river"]
 
-    data_path = Path(__file__).parent.parent / "data" / "postflop" / "river_decision.json"
-    if not data_path.exists():
+    try:
+        data = load_data_file("postflop/river_decision.json")
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="River data not found")
 
-    with open(data_path) as f:
-        data = json.load(f)
-
     _postflop_cache["river"] = data
     return data
 
@@ -2,13 +2,15 @@
 Range data endpoints.
 """
 
-import json
 import logging
-from pathlib import Path
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+from core.cards import parse_dead_cards
+from core.combos import count_combos, weighted_mask
+from core.data_bundle import load_data_file
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,7 @@ class RangeResponse(BaseModel):
     hands: dict[str, dict[str, int]]  # {hand: {action: frequency}}
     drillable: list[str]
     total_hands: int
+    total_combos: float  # Combos weighted by non-fold frequency, after dead cards
 
 
 # Cache for range data
@@ -30,43 +33,38 @@ def get_range_data(format: str = "6max") -> dict:
     if format in _range_cache:
         return _range_cache[format]
 
-    data_dir = Path(__file__).parent.parent / "data" / "ranges" / format
     range_data = {}
-
-    # Load RFI frequencies
-    rfi_path = data_dir / "rfi_frequencies.json"
-    if rfi_path.exists():
-        with open(rfi_path) as f:
-            range_data["rfi"] = json.load(f)
-
-    # Load VS RFI frequencies
-    vs_rfi_path = data_dir / "vs_rfi_frequencies.json"
-    if vs_rfi_path.exists():
-        with open(vs_rfi_path) as f:
-            range_data["vs_rfi"] = json.load(f)
-
-    # Load VS 3bet frequencies
-    vs_3bet_path = data_dir / "vs_3bet_frequencies.json"
-    if vs_3bet_path.exists():
-        with open(vs_3bet_path) as f:
-            range_data["vs_3bet"] = json.load(f)
-
-    # Load VS 4bet frequencies
-    vs_4bet_path = data_dir / "vs_4bet_frequencies.json"
-    if vs_4bet_path.exists():
-        with open(vs_4bet_path) as f:
-            range_data["vs_4bet"] = json.load(f)
+    for key in ("rfi", "vs_rfi", "vs_3bet", "vs_4bet"):
+        try:
+            range_data[key] = load_data_file(f"ranges/{format}/{key}_frequencies.json")
+        except FileNotFoundError:
+            pass
 
     _range_cache[format] = range_data
     return range_data
 
 
+def range_combos(frequencies: dict[str, dict[str, int]], dead: list[int]) -> float:
+    """Live combos in a frequency range, each hand weighted by how often it is played."""
+    weights = {
+        hand: min(sum(f for action, f in actions.items() if action != "fold"), 100) / 100
+        for hand, actions in frequencies.items()
+    }
+    return round(count_combos(weighted_mask(weights), dead), 2)
+
+
 @router.get("/rfi/{position}", response_model=RangeResponse)
 def get_rfi_range(
     position: str,
     format: str = Query(default="6max", description="Game format"),
+    dead: str = Query(default="", description="Known cards to remove, e.g. board or hero hand"),
 ):
     """Get RFI range for a specific position."""
+    try:
+        dead_cards = parse_dead_cards(dead)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         data = get_range_data(format)
         if "rfi" not in data:
@@ -86,6 +84,7 @@ def get_rfi_range(
             hands=frequencies,
             drillable=drillable,
             total_hands=len(frequencies),
+            total_combos=range_combos(frequencies, dead_cards),
         )
     except HTTPException:
         raise
@@ -99,8 +98,14 @@ def get_vs_rfi_range(
     hero_position: str,
     villain_position: str,
     format: str = Query(default="6max", description="Game format"),
+    dead: str = Query(default="", description="Known cards to remove, e.g. board or hero hand"),
 ):
     """Get VS RFI range for a specific matchup."""
+    try:
+        dead_cards = parse_dead_cards(dead)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         data = get_range_data(format)
         if "vs_rfi" not in data:
@@ -122,6 +127,7 @@ def get_vs_rfi_range(
             hands=frequencies,
             drillable=drillable,
             total_hands=len(frequencies),
+            total_combos=range_combos(frequencies, dead_cards),
         )
     except HTTPException:
         raise
@@ -135,8 +141,14 @@ def get_vs_3bet_range(
     hero_position: str,
     villain_position: str,
     format: str = Query(default="6max", description="Game format"),
+    dead: str = Query(default="", description="Known cards to remove, e.g. board or hero hand"),
 ):
     """Get VS 3-bet range for a specific matchup (original raiser facing 3-bet)."""
+    try:
+        dead_cards = parse_dead_cards(dead)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         data = get_range_data(format)
         if "vs_3bet" not in data:
@@ -158,6 +170,7 @@ def get_vs_3bet_range(
             hands=frequencies,
             drillable=drillable,
             total_hands=len(frequencies),
+            total_combos=range_combos(frequencies, dead_cards),
         )
     except HTTPException:
         raise
@@ -171,8 +184,14 @@ def get_vs_4bet_range(
     hero_position: str,
     villain_position: str,
     format: str = Query(default="6max", description="Game format"),
+    dead: str = Query(default="", description="Known cards to remove, e.g. board or hero hand"),
 ):
     """Get VS 4-bet range for a specific matchup (3-bettor facing 4-bet)."""
+    try:
+        dead_cards = parse_dead_cards(dead)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
         data = get_range_data(format)
         if "vs_4bet" not in data:
@@ -194,6 +213,7 @@ def get_vs_4bet_range(
             hands=frequencies,
             drillable=drillable,
             total_hands=len(frequencies),
+            total_combos=range_combos(frequencies, dead_cards),
         )
     except HTTPException:
         raise
@@ -2,21 +2,60 @@
 GTO Solver API - Precomputed postflop strategies from Desktop Postflop.
 """
 
-import json
 import logging
 import os
-import random
-from pathlib import Path
-
-from fastapi import APIRouter, Header, HTTPException, Query
-from pydantic import BaseModel
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response
+from pydantic import BaseModel, Field
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from core.board_similarity import NeighborTable, build_neighbor_table
+from core.canonical import flop_id
+from core.cards import (
+    RANK_MASKS,
+    SUIT_MASKS,
+    card_index,
+    card_str,
+    format_cards,
+    mask_of,
+    parse_card_indexes,
+    rank_mask,
+    suit_counts,
+)
+from core.combos import blocker_effect, combo_str, range_mask
+from core.data_bundle import load_data_file
+from core.equity_distribution import equity_distribution
+from core.hand_rank import straight_high
+from core.river_solver import IP, OOP, PLAYERS, range_weights, solve_river
+from core.runouts import river_types, turn_types
+from core.sampling import WEIGHTINGS, AliasSampler, drill_weights, strategy_weights
+from core.solver_aggregates import SolverAggregates, aggregate_store
+from core.solver_store import (
+    ABSENT,
+    DATA_DIR,
+    SolverStore,
+    SpotCache,
+    build_manifest,
+    build_store,
+    load_store,
+    read_json_file,
+    read_json_files,
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
+limiter = Limiter(key_func=get_remote_address)
 
 # Cache for solver data
 _solver_cache: dict[str, dict] = {}
 
+# Spots kept loaded per worker
+SPOT_CACHE_SIZE = int(os.getenv("SOLVER_SPOT_CACHE_SIZE", "12"))
+
 
 class SolverStrategy(BaseModel):
     bet_33: float | None = None
@@ -48,6 +87,10 @@ class SolverQueryResponse(BaseModel):
     texture_zh: str | None = None
     hand: str | None = None
     strategy: dict[str, float] | None = None
+    # exact, pattern (same ranks and suit count), nearest or level1
+    match: str | None = None
+    # Feature distance to the queried board when match is nearest
+    distance: float | None = None
     message: str | None = None
 
 
@@ -57,29 +100,73 @@ class BoardTextureInfo(BaseModel):
     count: int
 
 
-def get_solver_data() -> list[dict]:
-    """Load all solver scenario data."""
-    if "all" in _solver_cache:
-        return _solver_cache["all"]
-
-    data_dir = Path(__file__).parent.parent / "data" / "solver"
-    if not data_dir.exists():
-        return []
-
-    all_scenarios = []
-    for json_file in data_dir.glob("*.json"):
-        try:
-            with open(json_file) as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    all_scenarios.extend(data)
-                elif isinstance(data, dict) and "scenarios" in data:
-                    all_scenarios.extend(data["scenarios"])
-        except Exception:
-            continue
+def get_manifest() -> dict[tuple, list[dict]]:
+    """
+    (position, villain, pot_type) -> manifest entries (source file and boards).
+
+    Reads manifest.json and falls back to scanning the JSON files when it has
+    not been generated (see scripts/compile_solver_data.py).
+    """
+    if "manifest" in _solver_cache:
+        return _solver_cache["manifest"]
+
+    try:
+        entries = load_data_file("solver/manifest.json")["spots"]
+    except (FileNotFoundError, ValueError):
+        entries = build_manifest(read_json_files())["spots"]
+
+    manifest: dict[tuple, list[dict]] = {}
+    for entry in entries:
+        spot = (entry["position"], entry["villain"], entry["pot_type"])
+        manifest.setdefault(spot, []).append(entry)
+    _solver_cache["manifest"] = manifest
+    return manifest
+
+
+def _read_solver_file(name: str) -> list[dict]:
+    """Scenarios of one source file, from the compiled store when there is one."""
+    try:
+        return load_store().file_scenarios(name)
+    except (FileNotFoundError, ValueError, KeyError):
+        return read_json_file(DATA_DIR / name) or []
+
+
+def get_solver_store() -> SolverStore:
+    """The compiled strategy store, packed in memory when strategies.bin is missing."""
+    if "store" in _solver_cache:
+        return _solver_cache["store"]
+    try:
+        store = load_store()
+    except (FileNotFoundError, ValueError):
+        store = build_store(read_json_files())
+    _solver_cache["store"] = store
+    return store
 
-    _solver_cache["all"] = all_scenarios
-    return all_scenarios
+
+def get_aggregates() -> SolverAggregates:
+    """Listings, counts and range-level frequencies, computed once per data load."""
+    if "aggregates" not in _solver_cache:
+        _solver_cache["aggregates"] = aggregate_store(get_solver_store())
+    return _solver_cache["aggregates"]
+
+
+def _not_modified(request: Request, response: Response, version: str) -> Response | None:
+    """
+    Tag a response computed from data `version` with an ETag.
+
+    Returns:
+        A 304 response if the client already holds that version, else None
+    """
+    etag = f'"{version}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    response.headers.update(headers)
+    sent = [
+        tag.strip().removeprefix("W/")
+        for tag in request.headers.get("if-none-match", "").split(",")
+    ]
+    if etag in sent or "*" in sent:
+        return Response(status_code=304, headers=headers)
+    return None
 
 
 def normalize_board(board: str) -> list[str]:
@@ -120,10 +207,37 @@ def normalize_hand(hand: str) -> str:
     return hand.upper()[:2]  # Truncate invalid input
 
 
+@lru_cache(maxsize=4096)
+def _board_signature(board: tuple[str, ...]) -> tuple[tuple[int, ...], int] | None:
+    """(sorted rank values, number of distinct suits), or None for malformed cards.
+
+    Cached on the card strings, so scenario boards from the solver JSON are
+    parsed once rather than on every lookup.
+    """
+    try:
+        cards = [card_index(c) for c in board]
+    except ValueError:
+        return None
+    suits = sum(1 for n in suit_counts(mask_of(cards)) if n)
+    return tuple(sorted(c >> 2 for c in cards)), suits
+
+
+@lru_cache(maxsize=4096)
+def _flop_id(board: tuple[str, ...]) -> int | None:
+    """Suit-isomorphic flop id (0..1754), or None if not a valid 3-card flop."""
+    if len(board) != 3:
+        return None
+    try:
+        cards = [card_index(c) for c in board]
+    except ValueError:
+        return None
+    return flop_id(cards) if len(set(cards)) == 3 else None
+
+
 def get_suit_pattern(board: list[str]) -> str:
     """Get suit pattern: monotone, two_tone, or rainbow."""
-    suits = [c[1].lower() for c in board if len(c) >= 2]
-    unique_suits = len(set(suits))
+    signature = _board_signature(tuple(board))
+    unique_suits = signature[1] if signature else 0
     if unique_suits == 1:
         return "monotone"
     elif unique_suits == 2:
@@ -136,34 +250,130 @@ def boards_match(board1: list[str], board2: list[str]) -> bool:
     if len(board1) != len(board2):
         return False
 
-    # Match ranks
-    ranks1 = sorted([c[0].upper() for c in board1])
-    ranks2 = sorted([c[0].upper() for c in board2])
-    if ranks1 != ranks2:
+    signature1 = _board_signature(tuple(board1))
+    signature2 = _board_signature(tuple(board2))
+    if signature1 is None or signature2 is None:
         return False
 
-    # Match suit pattern (monotone, two_tone, rainbow)
-    pattern1 = get_suit_pattern(board1)
-    pattern2 = get_suit_pattern(board2)
-    return pattern1 == pattern2
+    # Same ranks and same suit pattern (monotone, two_tone, rainbow)
+    return signature1 == signature2
+
+
+@dataclass
+class SpotIndex:
+    """Scenarios of one spot, indexed for O(1) board lookups."""
+
+    scenarios: list[dict]
+    # Flop id -> first scenario on that flop
+    by_flop: dict[int, dict]
+    # (sorted ranks, suit count) -> first scenario with that board signature
+    by_signature: dict[tuple, dict]
+    # Nearest solved flop for every flop, built on demand
+    neighbors: NeighborTable | None = None
+
+    def nearest(self, target: int) -> tuple[dict, float] | None:
+        """Scenario on the solved flop closest to flop `target`."""
+        if not self.by_flop:
+            return None
+        if self.neighbors is None:
+            self.neighbors = build_neighbor_table(list(self.by_flop))
+        position, distance = self.neighbors.lookup(target)
+        return self.by_flop[int(self.neighbors.candidates[position])], distance
+
+
+def _load_spot(spot: tuple) -> SpotIndex:
+    """Read and index the scenarios of one (position, villain, pot_type) spot."""
+    scenarios = [
+        scenario
+        for entry in get_manifest().get(spot, [])
+        for scenario in _read_solver_file(entry["file"])
+        if (scenario.get("position"), scenario.get("villain"), scenario.get("pot_type")) == spot
+    ]
+    by_flop: dict[int, dict] = {}
+    by_signature: dict[tuple, dict] = {}
+    for scenario in scenarios:
+        board = tuple(scenario.get("board", []))
+        target = _flop_id(board)
+        if target is not None:
+            by_flop.setdefault(target, scenario)
+        signature = _board_signature(board)
+        if signature is not None:
+            by_signature.setdefault(signature, scenario)
+    return SpotIndex(scenarios=scenarios, by_flop=by_flop, by_signature=by_signature)
+
+
+# Spots loaded in this worker, least recently used evicted first
+_spot_cache = SpotCache(_load_spot, max_size=SPOT_CACHE_SIZE)
+
+
+def get_spot(position: str, villain: str, pot_type: str) -> SpotIndex:
+    """Indexed scenarios of one spot, loaded on first use (empty if there is no data)."""
+    spot = (position, villain, pot_type)
+    if spot not in get_manifest():
+        return SpotIndex(scenarios=[], by_flop={}, by_signature={})
+    return _spot_cache.get(spot)
+
+
+def warm_solver_cache(spots: list[tuple] | None = None) -> list[tuple]:
+    """
+    Load spots before the first request needs them.
+
+    Args:
+        spots: (position, villain, pot_type) tuples; defaults to the
+            SOLVER_WARM_SPOTS environment variable, e.g. "BTN:BB:srp,CO:BB:3bet"
+
+    Returns:
+        The spots that have data and were loaded
+    """
+    if spots is None:
+        spots = [
+            tuple(item.split(":"))
+            for item in os.getenv("SOLVER_WARM_SPOTS", "").split(",")
+            if item.count(":") == 2
+        ]
+    loaded = [spot for spot in spots if get_spot(*spot).scenarios]
+    if len(loaded) > _spot_cache.max_size:
+        logger.warning("Warming %d solver spots with a cache of %d", len(loaded), SPOT_CACHE_SIZE)
+    return loaded
+
+
+def get_level1_index() -> dict[tuple, dict]:
+    """(sorted ranks, suit count) -> first Level 1 texture with that board."""
+    if "level1_index" in _solver_cache:
+        return _solver_cache["level1_index"]
+
+    level1: dict[tuple, dict] = {}
+    for texture in get_level1_data().get("textures", []):
+        signature = _board_signature(tuple(texture.get("representative_board", [])))
+        if signature is not None:
+            level1.setdefault(signature, texture)
+    _solver_cache["level1_index"] = level1
+    return level1
 
 
 def find_matching_scenario(
     board: list[str], position: str, villain: str, pot_type: str = "srp"
 ) -> dict | None:
-    """Find a scenario matching the given parameters."""
-    # First try exact scenario data
-    scenarios = get_solver_data()
+    """
+    Find a scenario matching the given parameters.
+
+    Preference: a suit-isomorphic flop, then the first board with the same
+    ranks and suit pattern, then Level 1 texture data for that pattern, then
+    the nearest solved flop of the same spot (see core/board_similarity.py),
+    so boards that used to find nothing still get a strategy. Anything but
+    an isomorphic flop is returned as a copy tagged with "match" (and
+    "distance" for nearest boards).
+    """
+    spot = get_spot(position, villain, pot_type)
+    target = _flop_id(tuple(board))
+    if target is not None and target in spot.by_flop:
+        return spot.by_flop[target]
 
-    for scenario in scenarios:
-        if scenario.get("position") != position:
-            continue
-        if scenario.get("villain") != villain:
-            continue
-        if scenario.get("pot_type") != pot_type:
-            continue
-        if boards_match(board, scenario.get("board", [])):
-            return scenario
+    signature = _board_signature(tuple(board))
+    if signature is None:
+        return None
+    if signature in spot.by_signature:
+        return {**spot.by_signature[signature], "match": "pattern"}
 
     # Fall back to Level 1 texture data
     # Support: IP vs BB (SRP/3bet) and OOP 3bet scenarios (SB/BB as 3bettor vs BTN)
@@ -172,23 +382,25 @@ def find_matching_scenario(
         and villain == "BB"
         and pot_type in ["srp", "3bet"]
     ) or (position in ["SB", "BB"] and villain == "BTN" and pot_type == "3bet")
-    if valid_combo:
-        level1_data = get_level1_data()
-        textures = level1_data.get("textures", [])
-
-        for texture in textures:
-            if boards_match(board, texture.get("representative_board", [])):
-                return {
-                    "scenario_id": f"level1_{texture.get('texture_id')}",
-                    "position": position,
-                    "villain": villain,
-                    "pot_type": pot_type,
-                    "board": texture.get("representative_board"),
-                    "texture": texture.get("texture_id"),
-                    "texture_zh": texture.get("texture_zh"),
-                    "strategies": texture.get("strategies", {}),
-                }
+    level1 = get_level1_index()
+    if valid_combo and signature in level1:
+        texture = level1[signature]
+        return {
+            "scenario_id": f"level1_{texture.get('texture_id')}",
+            "position": position,
+            "villain": villain,
+            "pot_type": pot_type,
+            "board": texture.get("representative_board"),
+            "texture": texture.get("texture_id"),
+            "texture_zh": texture.get("texture_zh"),
+            "strategies": texture.get("strategies", {}),
+            "match": "level1",
+        }
 
+    nearest = spot.nearest(target) if target is not None else None
+    if nearest is not None:
+        scenario, distance = nearest
+        return {**scenario, "match": "nearest", "distance": round(distance, 3)}
     return None
 
 
@@ -239,6 +451,8 @@ def get_postflop_strategy(
                 texture_zh=scenario.get("texture_zh"),
                 hand=normalized_hand,
                 strategy=None,
+                match=scenario.get("match", "exact"),
+                distance=scenario.get("distance"),
                 message=f"Hand {normalized_hand} not found in this scenario",
             )
 
@@ -252,6 +466,8 @@ def get_postflop_strategy(
             texture_zh=scenario.get("texture_zh"),
             hand=normalized_hand,
             strategy=hand_strategy,
+            match=scenario.get("match", "exact"),
+            distance=scenario.get("distance"),
         )
     except HTTPException:
         raise
@@ -261,30 +477,27 @@ def get_postflop_strategy(
 
 
 @router.get("/textures")
-def list_solver_textures():
+def list_solver_textures(request: Request, response: Response):
     """List all available board textures in solver data."""
-    scenarios = get_solver_data()
-
-    textures: dict[str, BoardTextureInfo] = {}
-    for s in scenarios:
-        texture = s.get("texture")
-        texture_zh = s.get("texture_zh", "")
-        if texture:
-            if texture in textures:
-                textures[texture].count += 1
-            else:
-                textures[texture] = BoardTextureInfo(
-                    texture=texture, texture_zh=texture_zh, count=1
-                )
+    aggregates = get_aggregates()
+    if not_modified := _not_modified(request, response, aggregates.version):
+        return not_modified
 
     return {
-        "textures": [t.model_dump() for t in textures.values()],
-        "total_scenarios": len(scenarios),
+        "textures": [
+            BoardTextureInfo(
+                texture=texture, texture_zh=t["texture_zh"], count=t["count"]
+            ).model_dump()
+            for texture, t in aggregates.by_texture.items()
+        ],
+        "total_scenarios": len(aggregates.scenarios),
     }
 
 
 @router.get("/scenarios")
 def list_solver_scenarios(
+    request: Request,
+    response: Response,
     position: str | None = Query(default=None, description="Filter by hero position"),
     villain: str | None = Query(default=None, description="Filter by villain position"),
     pot_type: str | None = Query(default=None, description="Filter by pot type"),
@@ -292,59 +505,50 @@ def list_solver_scenarios(
     limit: int = Query(default=20, le=100),
 ):
     """List available solver scenarios with optional filtering."""
-    scenarios = get_solver_data()
-
-    filtered = scenarios
-    if position:
-        filtered = [s for s in filtered if s.get("position") == position.upper()]
-    if villain:
-        filtered = [s for s in filtered if s.get("villain") == villain.upper()]
-    if pot_type:
-        filtered = [s for s in filtered if s.get("pot_type") == pot_type.lower()]
+    aggregates = get_aggregates()
+    if not_modified := _not_modified(request, response, aggregates.version):
+        return not_modified
+
+    # Listings are precomputed; no spot is loaded
+    wanted = (
+        position.upper() if position else None,
+        villain.upper() if villain else None,
+        pot_type.lower() if pot_type else None,
+    )
+    filtered = [
+        aggregates.scenarios[row]
+        for spot, rows in aggregates.spots.items()
+        if all(w is None or w == value for w, value in zip(wanted, spot))
+        for row in rows
+    ]
     if texture:
         filtered = [s for s in filtered if s.get("texture") == texture]
 
-    return {
-        "total": len(filtered),
-        "scenarios": [
-            {
-                "scenario_id": s.get("scenario_id"),
-                "position": s.get("position"),
-                "villain": s.get("villain"),
-                "pot_type": s.get("pot_type"),
-                "board": s.get("board"),
-                "texture": s.get("texture"),
-                "texture_zh": s.get("texture_zh"),
-                "hand_count": len(s.get("strategies", {})),
-            }
-            for s in filtered[:limit]
-        ],
-    }
+    return {"total": len(filtered), "scenarios": filtered[:limit]}
 
 
 @router.get("/boards")
 def list_available_boards(
+    request: Request,
+    response: Response,
     position: str = Query(..., description="Hero position, e.g., 'BTN'"),
     villain: str = Query(..., description="Villain position, e.g., 'BB'"),
     pot_type: str = Query(default="srp", description="Pot type: srp, 3bet"),
 ):
     """List all precomputed boards for a specific position matchup."""
-    scenarios = get_solver_data()
-
-    boards = []
-    for s in scenarios:
-        if (
-            s.get("position") == position.upper()
-            and s.get("villain") == villain.upper()
-            and s.get("pot_type") == pot_type.lower()
-        ):
-            boards.append(
-                {
-                    "board": s.get("board"),
-                    "texture": s.get("texture"),
-                    "texture_zh": s.get("texture_zh"),
-                }
-            )
+    aggregates = get_aggregates()
+    if not_modified := _not_modified(request, response, aggregates.version):
+        return not_modified
+
+    rows = aggregates.spots.get((position.upper(), villain.upper(), pot_type.lower()), [])
+    boards = [
+        {
+            "board": aggregates.scenarios[row]["board"],
+            "texture": aggregates.scenarios[row]["texture"],
+            "texture_zh": aggregates.scenarios[row]["texture_zh"],
+        }
+        for row in rows
+    ]
 
     return {
         "position": position.upper(),
@@ -355,6 +559,33 @@ def list_available_boards(
     }
 
 
+@router.get("/aggregates")
+def get_strategy_aggregates(
+    request: Request,
+    response: Response,
+    group: str = Query(default="texture", description="texture, position or scenario"),
+):
+    """
+    Range-wide action frequencies, pooled per texture, position pair or scenario.
+
+    Each hand counts with its live combos on the board, so "check": 58.3
+    means 58.3% of the listed combos check.
+    """
+    tables = {"texture": "by_texture", "position": "by_position", "scenario": "by_scenario"}
+    if group not in tables:
+        raise HTTPException(status_code=400, detail=f"Unknown group '{group}'")
+
+    aggregates = get_aggregates()
+    if not_modified := _not_modified(request, response, aggregates.version):
+        return not_modified
+
+    return {
+        "group": group,
+        "actions": aggregates.actions,
+        "aggregates": getattr(aggregates, tables[group]),
+    }
+
+
 @router.delete("/cache")
 def clear_solver_cache(x_api_key: str = Header(...)):
     """Clear solver data cache (for development/testing). Requires X-API-Key header."""
@@ -362,6 +593,7 @@ def clear_solver_cache(x_api_key: str = Header(...)):
     if not expected or x_api_key != expected:
         raise HTTPException(status_code=403, detail="Forbidden")
     _solver_cache.clear()
+    _spot_cache.clear()
     return {"message": "Solver cache cleared"}
 
 
@@ -373,13 +605,11 @@ def get_level1_data() -> dict:
     if "level1" in _solver_cache:
         return _solver_cache["level1"]
 
-    data_path = Path(__file__).parent.parent / "data" / "solver" / "level1_textures.json"
-    if not data_path.exists():
+    try:
+        data = load_data_file("solver/level1_textures.json")
+    except FileNotFoundError:
         return {"textures": []}
 
-    with open(data_path, encoding="utf-8") as f:
-        data = json.load(f)
-
     _solver_cache["level1"] = data
     return data
 
@@ -473,35 +703,47 @@ def get_texture_detail(texture_id: str):
     )
 
 
+def _level1_sampler(
+    texture_id: str | None, difficulty: int | None, weighting: str
+) -> tuple[AliasSampler, list[tuple[dict, str]]] | None:
+    """Sampler over the (texture, hand) pairs that pass the filters, built once per filter."""
+    samplers = _solver_cache.setdefault("level1_drill", {})
+    key = (texture_id, difficulty, weighting)
+    if key not in samplers:
+        pairs = [
+            (texture, hand)
+            for texture in get_level1_data().get("textures", [])
+            if (not texture_id or texture.get("texture_id") == texture_id)
+            and (not difficulty or texture.get("difficulty") == difficulty)
+            for hand in texture.get("strategies", {})
+        ]
+        weights = strategy_weights(
+            [texture["strategies"][hand] for texture, hand in pairs], weighting
+        )
+        samplers[key] = (AliasSampler(weights), pairs) if pairs else None
+    return samplers[key]
+
+
 @router.get("/level1/drill")
 def get_texture_drill(
     texture_id: str | None = Query(default=None, description="Specific texture to drill"),
     difficulty: int | None = Query(default=None, ge=1, le=3, description="Filter by difficulty"),
+    weighting: str = Query(
+        default="uniform", description="uniform, or mixed to favour mixed-strategy hands"
+    ),
 ):
     """Get a random drill question for texture training."""
-    data = get_level1_data()
-    textures = data.get("textures", [])
-
-    # Filter textures
-    filtered = textures
-    if texture_id:
-        filtered = [t for t in filtered if t.get("texture_id") == texture_id]
-    if difficulty:
-        filtered = [t for t in filtered if t.get("difficulty") == difficulty]
+    if weighting not in WEIGHTINGS:
+        raise HTTPException(status_code=400, detail=f"Unknown weighting '{weighting}'")
 
-    if not filtered:
+    # Every (texture, hand) pair is drawn with its weight, however many
+    # hands each texture lists
+    drill = _level1_sampler(texture_id, difficulty, weighting)
+    if drill is None:
         raise HTTPException(status_code=404, detail="No textures match the criteria")
-
-    # Pick random texture
-    texture = random.choice(filtered)
-    strategies = texture.get("strategies", {})
-
-    if not strategies:
-        raise HTTPException(status_code=404, detail="No strategies in this texture")
-
-    # Pick random hand
-    hand = random.choice(list(strategies.keys()))
-    hand_data = strategies[hand]
+    sampler, pairs = drill
+    texture, hand = pairs[sampler.sample()]
+    hand_data = texture["strategies"][hand]
 
     # Build options based on what actions are available
     options = []
@@ -541,15 +783,12 @@ def evaluate_texture_drill(
     data = get_level1_data()
     textures = data.get("textures", [])
 
-    # Find texture
-    texture = None
-    for t in textures:
-        if t.get("texture_id") == texture_id:
-            texture = t
-            break
-
-    if not texture:
+    # Find texture; a few ids are shared by several boards, so prefer the
+    # one the drilled hand comes from
+    matches = [t for t in textures if t.get("texture_id") == texture_id]
+    if not matches:
         raise HTTPException(status_code=404, detail=f"Texture '{texture_id}' not found")
+    texture = next((t for t in matches if hand in t.get("strategies", {})), matches[0])
 
     strategies = texture.get("strategies", {})
     hand_data = strategies.get(hand)
@@ -650,64 +889,46 @@ def get_turn_adjustments() -> dict:
     if "turn_adjustments" in _solver_cache:
         return _solver_cache["turn_adjustments"]
 
-    data_path = Path(__file__).parent.parent / "data" / "solver" / "turn_adjustments.json"
-    if not data_path.exists():
+    try:
+        data = load_data_file("solver/turn_adjustments.json")
+    except FileNotFoundError:
         return {}
 
-    with open(data_path, encoding="utf-8") as f:
-        data = json.load(f)
-
     _solver_cache["turn_adjustments"] = data
     return data
 
 
-def classify_turn_card(flop: list[str], turn: str) -> str:
-    """Classify the turn card type based on flop texture."""
-    turn_rank = turn[0].upper()
-    turn_suit = turn[1].lower() if len(turn) > 1 else ""
+# Rank values at or above T count as overcards
+_BROADWAY = card_index("Ts") >> 2
+# Rank values up to 7 can counterfeit a low two pair
+_LOW_MAX = card_index("7s") >> 2
+
 
-    flop_ranks = [c[0].upper() for c in flop]
-    flop_suits = [c[1].lower() for c in flop if len(c) > 1]
+def classify_turn_card(flop: list[int], turn: int) -> str:
+    """Classify the turn card type based on flop texture."""
+    flop_mask = mask_of(flop)
+    turn_rank = turn >> 2
 
     # Check for pair board
-    if turn_rank in flop_ranks:
+    if flop_mask & RANK_MASKS[turn_rank]:
         return "pair_board"
 
     # Check for flush card
-    suit_count = sum(1 for s in flop_suits if s == turn_suit)
-    if suit_count >= 2:
+    if (flop_mask & SUIT_MASKS[turn & 3]).bit_count() >= 2:
         return "flush_card"
 
     # Check for straight card (simplified: within 2 ranks of any flop card)
-    rank_values = {
-        "A": 14,
-        "K": 13,
-        "Q": 12,
-        "J": 11,
-        "T": 10,
-        "9": 9,
-        "8": 8,
-        "7": 7,
-        "6": 6,
-        "5": 5,
-        "4": 4,
-        "3": 3,
-        "2": 2,
-    }
-    turn_value = rank_values.get(turn_rank, 0)
-    flop_values = [rank_values.get(r, 0) for r in flop_ranks]
-
+    flop_values = [c >> 2 for c in flop]
     for fv in flop_values:
-        if abs(turn_value - fv) <= 2 and turn_value != fv:
+        if abs(turn_rank - fv) <= 2 and turn_rank != fv:
             # Check if it creates more connectivity
-            all_values = sorted(flop_values + [turn_value])
+            all_values = sorted(flop_values + [turn_rank])
             gaps = [all_values[i + 1] - all_values[i] for i in range(len(all_values) - 1)]
             if max(gaps) <= 2:
                 return "straight_card"
 
     # Check for overcard
-    high_cards = {"A", "K", "Q", "J", "T"}
-    if turn_rank in high_cards and turn_rank not in flop_ranks:
+    if turn_rank >= _BROADWAY:
         return "overcard"
 
     return "brick"
@@ -795,23 +1016,23 @@ def classify_turn(
     turn: str = Query(..., description="Turn card (e.g., 'Kc')"),
 ):
     """Classify a turn card based on the flop."""
-    # Parse flop
-    flop_cards = []
-    i = 0
-    while i < len(flop):
-        if i + 1 < len(flop):
-            flop_cards.append(flop[i : i + 2])
-            i += 2
-        else:
-            i += 1
-
+    try:
+        flop_cards = parse_card_indexes(flop)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid flop format")
     if len(flop_cards) < 3:
         raise HTTPException(status_code=400, detail="Invalid flop format")
+    try:
+        turn_card = card_index(turn)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid turn card")
+    if turn_card in flop_cards:
+        raise HTTPException(status_code=400, detail="Turn card is already on the flop")
 
-    turn_type = classify_turn_card(flop_cards, turn)
+    turn_type = classify_turn_card(flop_cards, turn_card)
 
     return {
-        "flop": flop_cards,
+        "flop": [card_str(c) for c in flop_cards],
         "turn": turn,
         "turn_type": turn_type,
         "turn_type_zh": {
@@ -843,85 +1064,41 @@ def get_river_adjustments() -> dict:
     if "river_adjustments" in _solver_cache:
         return _solver_cache["river_adjustments"]
 
-    data_path = Path(__file__).parent.parent / "data" / "solver" / "river_adjustments.json"
-    if not data_path.exists():
+    try:
+        data = load_data_file("solver/river_adjustments.json")
+    except FileNotFoundError:
         return {}
 
-    with open(data_path, encoding="utf-8") as f:
-        data = json.load(f)
-
     _solver_cache["river_adjustments"] = data
     return data
 
 
-def classify_river_card(board: list[str], river: str) -> str:
+def classify_river_card(board: list[int], river: int) -> str:
     """Classify the river card type based on the 4-card board."""
-    river_rank = river[0].upper()
-    river_suit = river[1].lower() if len(river) > 1 else ""
-
-    board_ranks = [c[0].upper() for c in board]
-    board_suits = [c[1].lower() for c in board if len(c) > 1]
-
-    # Count suits on board
-    suit_counts: dict[str, int] = {}
-    for s in board_suits:
-        suit_counts[s] = suit_counts.get(s, 0) + 1
+    board_mask = mask_of(board)
+    river_rank = river >> 2
 
     # Check for flush complete (4th card of same suit)
-    if river_suit in suit_counts and suit_counts[river_suit] >= 3:
+    if (board_mask & SUIT_MASKS[river & 3]).bit_count() >= 3:
         return "flush_complete"
 
     # Check for pair board (adds to existing pair or creates new pair)
-    rank_counts: dict[str, int] = {}
-    for r in board_ranks:
-        rank_counts[r] = rank_counts.get(r, 0) + 1
-
-    if river_rank in rank_counts:
+    if board_mask & RANK_MASKS[river_rank]:
         return "pair_board"
 
-    # Check for straight complete
-    rank_values = {
-        "A": 14,
-        "K": 13,
-        "Q": 12,
-        "J": 11,
-        "T": 10,
-        "9": 9,
-        "8": 8,
-        "7": 7,
-        "6": 6,
-        "5": 5,
-        "4": 4,
-        "3": 3,
-        "2": 2,
-    }
-    river_value = rank_values.get(river_rank, 0)
-    board_values = sorted([rank_values.get(r, 0) for r in board_ranks])
-
-    # Check if river completes a straight
-    all_values = sorted(set(board_values + [river_value]))
-    for i in range(len(all_values) - 4):
-        if all_values[i + 4] - all_values[i] == 4:
-            return "straight_complete"
-
-    # Check for wheel (A-2-3-4-5)
-    if 14 in all_values:
-        wheel_values = [1 if v == 14 else v for v in all_values]
-        wheel_values = sorted(set(wheel_values))
-        for i in range(len(wheel_values) - 4):
-            if wheel_values[i + 4] - wheel_values[i] == 4:
-                return "straight_complete"
+    # Check for straight complete (a 4-card board cannot hold a straight on its
+    # own, so any straight here uses the river; includes the wheel)
+    if straight_high(rank_mask(board_mask | 1 << river)) >= 0:
+        return "straight_complete"
 
     # Check for overcard
-    high_cards = {"A", "K", "Q", "J", "T"}
-    if river_rank in high_cards and river_rank not in board_ranks:
+    if river_rank >= _BROADWAY:
         return "overcard"
 
     # Check for counterfeit (river pairs a low card, counterfeiting low two pairs)
-    low_cards = {"2", "3", "4", "5", "6", "7"}
-    if river_rank in low_cards:
+    if river_rank <= _LOW_MAX:
         # If board already has pairs, this could counterfeit
-        if any(count >= 2 for count in rank_counts.values()):
+        if rank_mask(board_mask).bit_count() < len(board):
             return "counterfeit"
 
     return "brick"
@@ -979,23 +1156,23 @@ def classify_river(
     river: str = Query(..., description="River card (e.g., '3h')"),
 ):
     """Classify a river card based on the 4-card board."""
-    # Parse board
-    board_cards = []
-    i = 0
-    while i < len(board):
-        if i + 1 < len(board):
-            board_cards.append(board[i : i + 2])
-            i += 2
-        else:
-            i += 1
-
+    try:
+        board_cards = parse_card_indexes(board)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid board format (need 4 cards)")
     if len(board_cards) < 4:
         raise HTTPException(status_code=400, detail="Invalid board format (need 4 cards)")
+    try:
+        river_card = card_index(river)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid river card")
+    if river_card in board_cards:
+        raise HTTPException(status_code=400, detail="River card is already on the board")
 
-    river_type = classify_river_card(board_cards, river)
+    river_type = classify_river_card(board_cards, river_card)
 
     return {
-        "board": board_cards,
+        "board": [card_str(c) for c in board_cards],
         "river": river,
         "river_type": river_type,
         "river_type_zh": {
@@ -1023,6 +1200,67 @@ def list_river_card_types():
 # ============ Multi-Street Strategy ============
 
 
+_TURN_TYPE_ZH = {
+    "brick": "磚塊牌",
+    "overcard": "高張牌",
+    "pair_board": "配對牌",
+    "flush_draw": "同花聽牌",
+    "flush_complete": "同花完成",
+    "straight_card": "順子潛力",
+    "straight_complete": "順子完成",
+}
+
+_RIVER_TYPE_ZH = {
+    "brick": "磚塊牌",
+    "overcard": "高張牌",
+    "pair_board": "配對牌",
+    "flush_complete": "同花完成",
+    "straight_complete": "順子完成",
+    "counterfeit": "反殺牌",
+}
+
+# Map flop texture to river texture key
+_RIVER_TEXTURE_MAP = {
+    "dry_ace_high": "dry_ace_high",
+    "dry_king_high": "dry_ace_high",
+    "wet_connected": "wet_board",
+    "monotone": "monotone",
+    "paired_board": "paired_board",
+    "low_connected": "low_connected",
+}
+
+
+def _position_context(position: str, villain: str) -> str:
+    """'ip' or 'oop' key of the turn adjustment data."""
+    is_ip = position in ["BTN", "CO", "SB"] and villain == "BB"
+    return "ip" if is_ip else "oop"
+
+
+def _turn_adjustment(flop_texture: str, turn_type: str, pos_key: str) -> dict:
+    """Adjustments and explanation for one turn card type."""
+    texture_adj = get_turn_adjustments().get("adjustments_by_texture", {}).get(flop_texture, {})
+    turn_adj = texture_adj.get(turn_type, {})
+    return {
+        "adjustments": turn_adj.get(pos_key, {}),
+        "explanation_zh": turn_adj.get("explanation_zh", ""),
+    }
+
+
+def _river_adjustment(flop_texture: str, river_type: str) -> dict:
+    """Adjustments and description for one river card type."""
+    river_data = get_river_adjustments()
+    river_texture = _RIVER_TEXTURE_MAP.get(flop_texture, "dry_ace_high")
+    texture_adj = river_data.get("texture_adjustments", {}).get(river_texture)
+    if not texture_adj:
+        texture_adj = river_data.get("default_adjustments", {})
+
+    river_adj = texture_adj.get(river_type, {})
+    return {
+        "adjustments": river_adj.get("adjustments", {}),
+        "description": river_adj.get("description", ""),
+    }
+
+
 @router.get("/multistreet")
 def get_multistreet_strategy(
     flop: str = Query(..., description="Flop cards (e.g., 'Ah7s2d')"),
@@ -1038,6 +1276,12 @@ def get_multistreet_strategy(
     flop_cards = normalize_board(flop)
     if len(flop_cards) < 3:
         raise HTTPException(status_code=400, detail="Invalid flop format")
+    try:
+        flop_indexes = [card_index(c) for c in flop_cards]
+        turn_index = card_index(turn) if turn else None
+        river_index = card_index(river) if turn and river else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     normalized_hand = normalize_hand(hand)
     pos = position.upper()
@@ -1072,6 +1316,9 @@ def get_multistreet_strategy(
             "texture": flop_scenario.get("texture"),
             "texture_zh": flop_scenario.get("texture_zh"),
             "strategy": hand_strategy,
+            "board": flop_scenario.get("board"),
+            "match": flop_scenario.get("match", "exact"),
+            "distance": flop_scenario.get("distance"),
         }
         flop_texture = flop_scenario.get("texture", "dry_ace_high")
     else:
@@ -1080,103 +1327,223 @@ def get_multistreet_strategy(
 
     # Turn analysis
     if turn:
-        turn_type = classify_turn_card(flop_cards, turn)
-        turn_data = get_turn_adjustments()
-        texture_adj = turn_data.get("adjustments_by_texture", {}).get(flop_texture, {})
-        turn_adj = texture_adj.get(turn_type, {})
-
-        is_ip = pos in ["BTN", "CO", "SB"] and villain.upper() == "BB"
-        pos_key = "ip" if is_ip else "oop"
+        turn_type = classify_turn_card(flop_indexes, turn_index)
+        pos_key = _position_context(pos, villain.upper())
 
         result["streets"]["turn"] = {
             "card": turn,
             "card_type": turn_type,
-            "card_type_zh": {
-                "brick": "磚塊牌",
-                "overcard": "高張牌",
-                "pair_board": "配對牌",
-                "flush_draw": "同花聽牌",
-                "flush_complete": "同花完成",
-                "straight_card": "順子潛力",
-                "straight_complete": "順子完成",
-            }.get(turn_type, turn_type),
+            "card_type_zh": _TURN_TYPE_ZH.get(turn_type, turn_type),
             "position_context": pos_key,
-            "adjustments": turn_adj.get(pos_key, {}),
-            "explanation_zh": turn_adj.get("explanation_zh", ""),
+            **_turn_adjustment(flop_texture, turn_type, pos_key),
         }
 
     # River analysis
     if turn and river:
-        board_4 = flop_cards + [turn]
-        river_type = classify_river_card(board_4, river)
-        river_data = get_river_adjustments()
-
-        # Map flop texture to river texture key
-        river_texture_map = {
-            "dry_ace_high": "dry_ace_high",
-            "dry_king_high": "dry_ace_high",
-            "wet_connected": "wet_board",
-            "monotone": "monotone",
-            "paired_board": "paired_board",
-            "low_connected": "low_connected",
-        }
-        river_texture = river_texture_map.get(flop_texture, "dry_ace_high")
-        texture_adj = river_data.get("texture_adjustments", {}).get(river_texture)
-        if not texture_adj:
-            texture_adj = river_data.get("default_adjustments", {})
-
-        river_adj = texture_adj.get(river_type, {})
+        river_type = classify_river_card(flop_indexes + [turn_index], river_index)
 
         result["streets"]["river"] = {
             "card": river,
             "card_type": river_type,
-            "card_type_zh": {
-                "brick": "磚塊牌",
-                "overcard": "高張牌",
-                "pair_board": "配對牌",
-                "flush_complete": "同花完成",
-                "straight_complete": "順子完成",
-                "counterfeit": "反殺牌",
-            }.get(river_type, river_type),
-            "adjustments": river_adj.get("adjustments", {}),
-            "description": river_adj.get("description", ""),
+            "card_type_zh": _RIVER_TYPE_ZH.get(river_type, river_type),
+            **_river_adjustment(flop_texture, river_type),
         }
 
     return result
 
 
+@router.get("/runouts")
+def get_runout_grid(
+    flop: str = Query(..., description="Flop cards (e.g., 'Ah7s2d')"),
+    turn: str | None = Query(default=None, description="Turn card; omit for the turn grid"),
+    position: str = Query(..., description="Hero position (BTN, CO, BB, etc.)"),
+    villain: str = Query(default="BB", description="Villain position"),
+    pot_type: str = Query(default="srp", description="Pot type: srp, 3bet"),
+):
+    """
+    Card type of every turn (49 cards), or every river after `turn` (48 cards).
+
+    Adjustments are the same ones /multistreet returns for a single card and
+    are listed once per card type.
+    """
+    flop_cards = normalize_board(flop)
+    try:
+        flop_indexes = [card_index(c) for c in flop_cards]
+        turn_index = card_index(turn) if turn else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    board = flop_indexes + ([turn_index] if turn else [])
+    if len(flop_indexes) != 3 or len(set(board)) != len(board):
+        raise HTTPException(status_code=400, detail="Invalid flop format")
+
+    pos = position.upper()
+    scenario = find_matching_scenario(flop_cards, pos, villain.upper(), pot_type.lower())
+    flop_texture = scenario.get("texture", "dry_ace_high") if scenario else "dry_ace_high"
+    pos_key = _position_context(pos, villain.upper())
+
+    if turn_index is None:
+        types = turn_types(flop_indexes)
+        names = _TURN_TYPE_ZH
+
+        def adjustment(card_type):
+            return _turn_adjustment(flop_texture, card_type, pos_key)
+    else:
+        types = river_types(flop_indexes, turn_index)
+        names = _RIVER_TYPE_ZH
+
+        def adjustment(card_type):
+            return _river_adjustment(flop_texture, card_type)
+
+    # Highest rank first, suits in SUITS order, as the runout heatmap lays them out
+    cards = [
+        {"card": card_str(c), "card_type": types[c]}
+        for c in sorted(range(52), key=lambda c: (-(c >> 2), c & 3))
+        if types[c] is not None
+    ]
+    counts: dict[str, int] = {}
+    for c in cards:
+        counts[c["card_type"]] = counts.get(c["card_type"], 0) + 1
+
+    return {
+        "flop": [card_str(c) for c in flop_indexes],
+        "turn": card_str(turn_index) if turn_index is not None else None,
+        "street": "turn" if turn_index is None else "river",
+        "texture": flop_texture,
+        "position_context": pos_key,
+        "cards": cards,
+        "card_types": {
+            t: {"card_type_zh": names.get(t, t), "count": n, **adjustment(t)}
+            for t, n in counts.items()
+        },
+    }
+
+
 # ============ Random Drill (Endless Practice) ============
 
 
+@dataclass
+class DrillPool:
+    """Every (scenario, hand) pair with a strategy, with one sampler per drill filter."""
+
+    store: SolverStore
+    # Per store row: spot, position in get_spot(*spot).scenarios and filter values
+    row_spots: list[tuple]
+    row_offsets: np.ndarray
+    row_filters: dict[str, np.ndarray]
+    # Per pair: store row and hand column
+    rows: np.ndarray
+    columns: np.ndarray
+    samplers: dict[tuple, tuple[AliasSampler, np.ndarray] | None]
+
+    def sampler(
+        self, pot_type: str | None, position: str | None, texture: str | None, weighting: str
+    ) -> tuple[AliasSampler, np.ndarray] | None:
+        """
+        Alias sampler over the pairs that pass the filters, built on first use.
+
+        Returns:
+            (sampler, pair indexes it draws from), or None if nothing matches
+        """
+        key = (pot_type, position, texture, weighting)
+        if key not in self.samplers:
+            selected = np.ones(len(self.row_spots), dtype=bool)
+            for name, value in (
+                ("pot_type", pot_type),
+                ("position", position),
+                ("texture", texture),
+            ):
+                if value:
+                    selected &= self.row_filters[name] == value
+            pairs = np.flatnonzero(selected[self.rows])
+            if len(pairs) == 0:
+                self.samplers[key] = None
+            else:
+                freqs = self.store.frequencies[self.rows[pairs], self.columns[pairs]]
+                freqs = np.where(freqs == ABSENT, np.nan, freqs.astype(np.float64))
+                self.samplers[key] = (AliasSampler(drill_weights(freqs, weighting)), pairs)
+        return self.samplers[key]
+
+
+def get_drill_pool() -> DrillPool:
+    """
+    Drill pairs of every spot, read from the compiled strategy matrices.
+
+    Only the row ranges and frequencies are read, no scenario is parsed; a
+    drawn pair is resolved through get_spot(), which loads just that spot.
+    """
+    if "drill_pool" in _solver_cache:
+        return _solver_cache["drill_pool"]
+
+    store = get_solver_store()
+
+    n_rows = len(store.frequencies)
+    row_spots: list[tuple] = [()] * n_rows
+    row_offsets = np.zeros(n_rows, dtype=np.intp)
+    row_filters = {
+        name: np.full(n_rows, None, dtype=object) for name in ("pot_type", "position", "texture")
+    }
+    has_spot = np.zeros(n_rows, dtype=bool)
+    for spot, entries in get_manifest().items():
+        offset = 0
+        for entry in entries:
+            if entry["file"] not in store.files:
+                continue
+            start, stop = store.files[entry["file"]]["rows"]
+            row_spots[start:stop] = [spot] * (stop - start)
+            row_offsets[start:stop] = np.arange(offset, offset + stop - start)
+            row_filters["position"][start:stop] = spot[0]
+            row_filters["pot_type"][start:stop] = spot[2]
+            row_filters["texture"][start:stop] = entry.get("textures") or [None] * (stop - start)
+            has_spot[start:stop] = True
+            offset += stop - start
+
+    # Hands with only a note have no answer to drill
+    present = (store.frequencies != ABSENT).any(axis=2) & has_spot[:, None]
+    rows, columns = np.nonzero(present)
+    pool = DrillPool(
+        store=store,
+        row_spots=row_spots,
+        row_offsets=row_offsets,
+        row_filters=row_filters,
+        rows=rows,
+        columns=columns,
+        samplers={},
+    )
+    _solver_cache["drill_pool"] = pool
+    return pool
+
+
 @router.get("/random-drill")
 def get_random_drill(
     pot_type: str | None = Query(
         default=None, description="Filter by pot type: srp, 3bet, 4bet, multiway, limp, squeeze"
     ),
+    position: str | None = Query(default=None, description="Filter by hero position"),
+    texture: str | None = Query(default=None, description="Filter by board texture, e.g. Paired"),
+    weighting: str = Query(
+        default="uniform", description="uniform, or mixed to favour mixed-strategy hands"
+    ),
 ):
-    """Get a random drill question from all available scenarios."""
-    scenarios = get_solver_data()
-
-    if not scenarios:
-        raise HTTPException(status_code=404, detail="No scenarios available")
-
-    # Filter by pot type if specified
-    if pot_type:
-        scenarios = [s for s in scenarios if s.get("pot_type") == pot_type]
-
-    if not scenarios:
-        raise HTTPException(status_code=404, detail=f"No scenarios for pot type '{pot_type}'")
+    """
+    Get a random drill question from all available scenarios.
 
-    # Pick random scenario
-    scenario = random.choice(scenarios)
-    strategies = scenario.get("strategies", {})
+    Every (scenario, hand) pair that passes the filters is equally likely
+    with "uniform"; "mixed" draws hands with mixed strategies more often.
+    """
+    if weighting not in WEIGHTINGS:
+        raise HTTPException(status_code=400, detail=f"Unknown weighting '{weighting}'")
 
-    if not strategies:
-        raise HTTPException(status_code=404, detail="No strategies in this scenario")
+    pool = get_drill_pool()
+    drill = pool.sampler(pot_type, position, texture, weighting)
+    if drill is None:
+        raise HTTPException(status_code=404, detail="No scenarios match the filters")
 
-    # Pick random hand
-    hand = random.choice(list(strategies.keys()))
-    hand_data = strategies[hand]
+    sampler, pairs = drill
+    pair = pairs[sampler.sample()]
+    row = pool.rows[pair]
+    scenario = get_spot(*pool.row_spots[row]).scenarios[pool.row_offsets[row]]
+    hand = pool.store.hands[pool.columns[pair]]
+    hand_data = scenario["strategies"][hand]
 
     # Build options based on available actions
     options = set()
@@ -1217,13 +1584,271 @@ def get_random_drill(
 
 
 @router.get("/pot-types")
-def list_pot_types():
+def list_pot_types(request: Request, response: Response):
     """List all available pot types with scenario counts."""
-    scenarios = get_solver_data()
+    aggregates = get_aggregates()
+    if not_modified := _not_modified(request, response, aggregates.version):
+        return not_modified
+
+    return {
+        "pot_types": aggregates.pot_types,
+        "total_scenarios": sum(aggregates.pot_types.values()),
+    }
 
-    pot_type_counts: dict[str, int] = {}
-    for s in scenarios:
-        pt = s.get("pot_type", "unknown")
-        pot_type_counts[pt] = pot_type_counts.get(pt, 0) + 1
 
-    return {"pot_types": pot_type_counts, "total_scenarios": len(scenarios)}
+# ============================================
+# Equity Distributions
+# ============================================
+
+
+class EquityDistributionRequest(BaseModel):
+    hero_range: str  # e.g. "22+, A2s+, KTo+"
+    villain_range: str
+    board: str  # 3-5 cards, e.g. "Ah7s2d"
+    buckets: int = Field(default=10, ge=2, le=100)
+    include_combos: bool = False  # Also return per-combo equity
+
+
+class RangeDistribution(BaseModel):
+    equity: float  # Range equity %
+    combos: int
+    histogram: list[float]  # % of combos per equity bucket, low to high
+    combo_equity: dict[str, float] | None = None  # Combo -> equity %
+
+
+class EquityDistributionResponse(BaseModel):
+    board: str
+    buckets: int
+    runouts: int
+    elapsed_ms: float
+    hero: RangeDistribution
+    villain: RangeDistribution
+
+
+@router.post("/equity-distribution", response_model=EquityDistributionResponse)
+def get_equity_distribution(body: EquityDistributionRequest):
+    """
+    Per-combo equity histograms for two ranges on a flop, turn or river.
+
+    Exact over every runout; results are cached per suit-isomorphic board
+    and range, so e.g. AhKd5c and AsKh5d share one computation.
+    """
+    try:
+        board = parse_card_indexes(body.board)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not 3 <= len(board) <= 5:
+        raise HTTPException(status_code=400, detail="Board must have 3 to 5 cards")
+
+    try:
+        result = equity_distribution(body.hero_range, body.villain_range, board, body.buckets)
+    except (ValueError, IndexError) as e:
+        # parse_range raises ValueError / IndexError on bad notation
+        raise HTTPException(status_code=400, detail=f"Invalid range or board: {e}")
+    except Exception:
+        logger.exception("Unexpected error")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    def side(dist) -> RangeDistribution:
+        return RangeDistribution(
+            equity=round(dist.equity * 100, 2),
+            combos=dist.combos,
+            histogram=[round(share * 100, 2) for share in dist.histogram],
+            combo_equity=(
+                {combo: round(eq * 100, 2) for combo, eq in dist.combo_equity.items()}
+                if body.include_combos
+                else None
+            ),
+        )
+
+    return EquityDistributionResponse(
+        board=format_cards(board),
+        buckets=body.buckets,
+        runouts=result.runouts,
+        elapsed_ms=round(result.elapsed_ms, 1),
+        hero=side(result.hero),
+        villain=side(result.villain),
+    )
+
+
+# ============================================
+# Blockers
+# ============================================
+
+
+class BlockerResponse(BaseModel):
+    hero: str
+    board: str
+    value_combos: float  # Villain value combos with only the board removed
+    value_combos_blocked: float  # ... and hero's cards removed
+    bluff_combos: float
+    bluff_combos_blocked: float
+    value_removed: float  # % of value combos hero blocks
+    bluff_removed: float  # % of bluff combos hero blocks
+    value_share: float  # Value % of villain's betting range, before
+    value_share_blocked: float  # ... after hero's cards
+
+
+@router.get("/blockers", response_model=BlockerResponse)
+def get_blockers(
+    hero: str = Query(..., description="Hero hole cards, e.g. AsQs"),
+    value: str = Query(..., description="Villain value range, e.g. 'AA, KK, AK'"),
+    bluffs: str = Query(..., description="Villain bluff range, e.g. 'QJs, JTs'"),
+    board: str = Query(default="", description="Board cards, e.g. Kh7s2d"),
+):
+    """How hero's hole cards change villain's value and bluff combos."""
+    try:
+        hero_cards = parse_card_indexes(hero)
+        board_cards = parse_card_indexes(board)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if len(hero_cards) != 2:
+        raise HTTPException(status_code=400, detail="Hero needs exactly 2 cards")
+    if len(set(hero_cards + board_cards)) != len(hero_cards) + len(board_cards):
+        raise HTTPException(status_code=400, detail="Duplicate cards")
+
+    try:
+        effect = blocker_effect(hero_cards, range_mask(value), range_mask(bluffs), board_cards)
+    except (ValueError, IndexError) as e:
+        # parse_range raises ValueError / IndexError on bad notation
+        raise HTTPException(status_code=400, detail=f"Invalid range: {e}")
+
+    return BlockerResponse(
+        hero=format_cards(hero_cards),
+        board=format_cards(board_cards),
+        value_combos=effect.value_combos,
+        value_combos_blocked=effect.value_combos_blocked,
+        bluff_combos=effect.bluff_combos,
+        bluff_combos_blocked=effect.bluff_combos_blocked,
+        value_removed=round(effect.value_removed * 100, 2),
+        bluff_removed=round(effect.bluff_removed * 100, 2),
+        value_share=round(effect.value_share * 100, 2),
+        value_share_blocked=round(effect.value_share_blocked * 100, 2),
+    )
+
+
+# ============================================
+# River Subgame Solver
+# ============================================
+
+
+class RiverSolveRequest(BaseModel):
+    board: str  # 5 cards, e.g. "Ks7d2c9h4s"
+    oop_range: str  # e.g. "QQ+, AK, KQ:0.5, AhJh"; ":weight" is 0-1
+    ip_range: str
+    pot: float = Field(gt=0)  # Pot at the start of the river
+    stack: float = Field(ge=0)  # Effective stack behind
+    max_iterations: int = Field(default=1000, ge=1, le=3000)
+    target_exploitability: float = Field(default=0.3, ge=0.05, le=10)  # % of the pot
+    include_combos: bool = False  # Also return per-combo strategies and EVs
+
+
+class RiverDecision(BaseModel):
+    path: str  # Actions leading here, e.g. "check/bet_75"; "" at the root
+    player: str  # "oop" or "ip"
+    actions: list[str]
+    frequencies: dict[str, float]  # Action -> % of the range reaching this node
+    combos: dict[str, dict[str, float]] | None = None  # Combo -> action -> %
+
+
+class RiverRange(BaseModel):
+    combos: int  # Combos left after board removal
+    ev: float  # Expected share of the pot minus river bets; both ranges sum to pot
+    combo_ev: dict[str, float] | None = None
+
+
+class RiverSolveResponse(BaseModel):
+    board: str
+    pot: float
+    stack: float
+    iterations: int
+    exploitability: float  # % of the pot
+    elapsed_ms: float
+    cached: bool
+    oop: RiverRange
+    ip: RiverRange
+    nodes: list[RiverDecision]
+
+
+@router.post("/river/solve", response_model=RiverSolveResponse)
+@limiter.limit("20/minute")
+def solve_river_spot(request: Request, body: RiverSolveRequest):
+    """
+    Solve a river spot the precomputed data does not cover.
+
+    Discounted CFR over concrete combos with a check / 33% / 75% / all-in
+    tree and one raise. Solutions are cached on disk per suit-isomorphic
+    board, ranges and stack-to-pot ratio.
+    """
+    try:
+        board = parse_card_indexes(body.board)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if len(board) != 5:
+        raise HTTPException(status_code=400, detail="Board must have 5 cards")
+
+    try:
+        solution = solve_river(
+            board,
+            range_weights(body.oop_range),
+            range_weights(body.ip_range),
+            body.pot,
+            body.stack,
+            max_iterations=body.max_iterations,
+            target_exploitability=body.target_exploitability,
+        )
+    except (ValueError, IndexError) as e:
+        # parse_range raises ValueError / IndexError on bad notation
+        raise HTTPException(status_code=400, detail=f"Invalid range or board: {e}")
+    except Exception:
+        logger.exception("Unexpected error")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+    names = [[combo_str(*c) for c in combos.tolist()] for combos in solution.combos]
+
+    def decision(node) -> RiverDecision:
+        reach = node.reach.astype(np.float64)
+        total = reach.sum()
+        frequencies = (node.strategy @ reach) / total if total > 0 else node.strategy.mean(axis=1)
+        combos = None
+        if body.include_combos:
+            combos = {
+                names[node.player][k]: {
+                    action: round(float(node.strategy[a, k]) * 100, 1)
+                    for a, action in enumerate(node.actions)
+                }
+                for k in np.flatnonzero(reach > 0)
+            }
+        return RiverDecision(
+            path=node.path,
+            player=PLAYERS[node.player],
+            actions=node.actions,
+            frequencies={
+                action: round(float(f) * 100, 1) for action, f in zip(node.actions, frequencies)
+            },
+            combos=combos,
+        )
+
+    def side(player: int) -> RiverRange:
+        return RiverRange(
+            combos=len(solution.combos[player]),
+            ev=round(solution.value[player], 2),
+            combo_ev=(
+                {name: round(float(ev), 2) for name, ev in zip(names[player], solution.ev[player])}
+                if body.include_combos
+                else None
+            ),
+        )
+
+    return RiverSolveResponse(
+        board=format_cards(board),
+        pot=body.pot,
+        stack=body.stack,
+        iterations=solution.iterations,
+        exploitability=round(solution.exploitability, 3),
+        elapsed_ms=round(solution.elapsed_ms, 1),
+        cached=solution.cached,
+        oop=side(OOP),
+        ip=side(IP),
+        nodes=[decision(node) for node in solution.nodes],
+    )
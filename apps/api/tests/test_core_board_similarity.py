@@ -0,0 +1,78 @@
+"""
+Unit tests for flop features and nearest-board lookup.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.board_similarity import (
+    FEATURE_NAMES,
+    board_features,
+    build_neighbor_table,
+    flop_features,
+)
+from core.canonical import NUM_FLOPS, flop_id
+from core.cards import parse_card_indexes
+
+
+def features(board):
+    return dict(zip(FEATURE_NAMES, board_features(parse_card_indexes(board))))
+
+
+def fid(board):
+    return flop_id(parse_card_indexes(board))
+
+
+class TestFlopFeatures:
+    """Tests for the per-flop feature vectors."""
+
+    def test_shape_and_range(self):
+        matrix = flop_features()
+        assert matrix.shape == (NUM_FLOPS, len(FEATURE_NAMES))
+        assert matrix.min() >= 0 and matrix.max() <= 1
+
+    def test_isomorphic_boards_agree(self):
+        assert np.array_equal(
+            board_features(parse_card_indexes("AhKs5d")),
+            board_features(parse_card_indexes("AcKd5s")),
+        )
+
+    def test_structure(self):
+        assert features("9h8h7h")["suitedness"] == 1
+        assert features("9h8h7h")["connectivity"] == 1
+        assert features("Kc8d2h")["connectivity"] == 0
+        assert features("Ac2d3h")["connectivity"] == 1  # Wheel
+        assert features("2c2d2h")["pairing"] == 1
+        assert features("2c2d2h")["pair_plus"] == 1
+
+    def test_strength_signature(self):
+        """Connected, suited boards hit ranges harder than dry ones."""
+        wet, dry = features("9h8h7h"), features("Kc8d2h")
+        assert wet["straight_plus"] > dry["straight_plus"] == 0
+        assert wet["flush_plus"] > dry["flush_plus"] == 0
+
+
+class TestNeighborTable:
+    """Tests for the nearest solved board lookup."""
+
+    def test_candidates_are_their_own_neighbors(self):
+        candidates = list(range(0, NUM_FLOPS, 50))
+        table = build_neighbor_table(candidates)
+        for position, candidate in enumerate(candidates):
+            assert table.lookup(candidate) == (position, 0.0)
+
+    def test_prefers_same_texture(self):
+        candidates = [fid("Ks9h4d"), fid("Jh9h8h"), fid("7c7d2h")]
+        table = build_neighbor_table(candidates)
+        assert table.lookup(fid("Qs8h3d"))[0] == 0
+        assert table.lookup(fid("Ts9s7s"))[0] == 1
+        assert table.lookup(fid("8c8d3h"))[0] == 2
+
+    def test_no_candidates(self):
+        with pytest.raises(ValueError):
+            build_neighbor_table([])
@@ -0,0 +1,94 @@
+"""
+Unit tests for suit-isomorphic board canonicalization.
+"""
+
+import os
+import random
+import sys
+from itertools import combinations
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.canonical import (
+    NUM_FLOPS,
+    NUM_TURNS,
+    board_from_id,
+    board_id,
+    canonical_board,
+    canonical_form,
+    colex_rank,
+    colex_unrank,
+    flop_id,
+)
+from core.cards import parse_card_indexes
+
+
+def cards(s):
+    return parse_card_indexes(s)
+
+
+class TestColex:
+    """Tests for colex ranking."""
+
+    def test_round_trip(self):
+        for k in (3, 4, 5):
+            for board in random.Random(k).sample(list(combinations(range(52), k)), 200):
+                assert colex_unrank(colex_rank(board), k) == board
+
+    def test_flop_ranks_are_dense(self):
+        ranks = sorted(colex_rank(f) for f in combinations(range(52), 3))
+        assert ranks == list(range(22100))
+
+
+class TestFlopIds:
+    """Tests for the 1,755-flop index."""
+
+    def test_id_range(self):
+        ids = {flop_id(f) for f in combinations(range(52), 3)}
+        assert ids == set(range(NUM_FLOPS))
+
+    def test_suit_relabelling_shares_id(self):
+        assert flop_id(cards("AhKh5d")) == flop_id(cards("AsKs5c"))
+        assert flop_id(cards("AhKh5d")) == flop_id(cards("5hKdAd"))
+
+    def test_different_suit_structure(self):
+        assert flop_id(cards("AhKh5d")) != flop_id(cards("AhKd5h"))
+        assert flop_id(cards("AhKh5h")) != flop_id(cards("AhKh5d"))
+
+    def test_board_from_id(self):
+        for i in range(0, NUM_FLOPS, 97):
+            assert flop_id(board_from_id(i)) == i
+
+
+class TestBoards:
+    """Tests for turn / river boards and hole cards."""
+
+    def test_turn_ids(self):
+        assert board_id(cards("AhKh5d2c")) == board_id(cards("AsKs5h2d"))
+        assert 0 <= board_id(cards("AhKh5d2c")) < NUM_TURNS
+
+    def test_street_order_ignored(self):
+        assert board_id(cards("AhKh5d2c")) == board_id(cards("2cKh5dAh"))
+
+    def test_canonical_board_matches_id(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            board = rng.sample(range(52), 4)
+            assert board_from_id(board_id(board), 4) == canonical_board(board)
+
+    def test_hole_cards_follow_board_suits(self):
+        """Hero's flush draw maps to the same canonical suit as the board."""
+        board, hole, _ = canonical_form(cards("Ah7h2d"), cards("KhQh"))
+        board2, hole2, _ = canonical_form(cards("As7s2c"), cards("KsQs"))
+        assert (board, hole) == (board2, hole2)
+        assert {c & 3 for c in hole} == {board[0] & 3}
+
+    def test_hole_cards_do_not_change_board(self):
+        board = cards("Ah7h2d")
+        assert canonical_form(board, cards("KcQd"))[0] == canonical_board(board)
+
+    def test_invalid_board(self):
+        with pytest.raises(ValueError):
+            canonical_form(cards("AhKh"))
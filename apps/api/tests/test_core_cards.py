@@ -0,0 +1,134 @@
+"""
+Unit tests for the compact card representation.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cards import (
+    Card,
+    CardSet,
+    card_index,
+    card_masks,
+    card_str,
+    card_symbol,
+    hand_notation,
+    indexes_of,
+    mask_of,
+    parse_card_indexes,
+    parse_dead_cards,
+    rank_mask,
+    suit_counts,
+)
+
+
+class TestParsing:
+    """Tests for card parse / format helpers."""
+
+    def test_round_trip(self):
+        for i in range(52):
+            assert card_index(card_str(i)) == i
+
+    def test_parse_formats(self):
+        expected = [card_index("Ah"), card_index("Ks"), card_index("Td")]
+        assert parse_card_indexes("AhKsTd") == expected
+        assert parse_card_indexes("Ah Ks Td") == expected
+        assert parse_card_indexes("[Ah,Ks,10d]") == expected
+
+    def test_invalid_cards(self):
+        with pytest.raises(ValueError):
+            parse_card_indexes("AhK")
+        with pytest.raises(ValueError):
+            parse_card_indexes("Xh")
+        with pytest.raises(ValueError):
+            card_index("Az")
+
+    def test_parse_dead_cards(self):
+        assert parse_dead_cards("") == []
+        assert parse_dead_cards("AhKs") == [card_index("Ah"), card_index("Ks")]
+        with pytest.raises(ValueError):
+            parse_dead_cards("Ahx")
+        with pytest.raises(ValueError, match="Duplicate"):
+            parse_dead_cards("AhKsAh")
+
+    def test_symbol(self):
+        assert card_symbol(card_index("As")) == "A♠"
+
+    def test_hand_notation(self):
+        assert hand_notation(card_index("Kh"), card_index("Ah")) == "AKs"
+        assert hand_notation(card_index("9c"), card_index("Td")) == "T9o"
+        assert hand_notation(card_index("Qd"), card_index("Qc")) == "QQ"
+
+
+class TestMasks:
+    """Tests for mask helpers."""
+
+    def test_mask_round_trip(self):
+        cards = [0, 7, 51, 22]
+        assert indexes_of(mask_of(cards)) == sorted(cards)
+
+    def test_suit_counts(self):
+        mask = mask_of(parse_card_indexes("AsKsQsJh2d"))
+        assert suit_counts(mask) == (3, 1, 1, 0)
+
+    def test_rank_mask(self):
+        mask = mask_of(parse_card_indexes("AsAh5d2c"))
+        assert rank_mask(mask) == (1 << 12) | (1 << 3) | 1
+
+    def test_numpy_masks(self):
+        cards = np.array([[0, 1], [50, 51]])
+        masks = card_masks(cards)
+        assert int(masks[0]) == 0b11
+        assert int(masks[1]) == (1 << 50) | (1 << 51)
+
+
+class TestCardSet:
+    """Tests for the CardSet type."""
+
+    def test_set_algebra(self):
+        a = CardSet.parse("AhKh")
+        b = CardSet.parse("KhQh")
+        assert len(a | b) == 3
+        assert list(a & b) == [card_index("Kh")]
+        assert str(a - b) == "Ah"
+        assert not a.isdisjoint(b)
+        assert card_index("Ah") in a
+
+    def test_deck_complement(self):
+        dead = CardSet.parse("AhKh7c")
+        live = ~dead
+        assert len(live) == 49
+        assert live.isdisjoint(dead)
+
+    def test_suit_and_rank(self):
+        live = ~CardSet.parse("AhKh7h2h")
+        assert len(live.suit(1)) == 9
+        assert len(live.rank(12)) == 3
+
+    def test_from_cards(self):
+        cards = [Card.from_string("As"), Card("K", "d")]
+        assert CardSet.from_cards(cards) == CardSet.parse("AsKd")
+
+
+class TestCard:
+    """Tests for the Card object."""
+
+    def test_attributes(self):
+        card = Card("T", "h")
+        assert card.rank == "T"
+        assert card.suit == "h"
+        assert card.value == 8
+        assert str(card) == "T♥"
+
+    def test_equality_and_hash(self):
+        assert Card("A", "s") == Card.from_index(card_index("As"))
+        assert len({Card("A", "s"), Card("A", "s"), Card("A", "h")}) == 2
+
+    def test_slots(self):
+        with pytest.raises(AttributeError):
+            Card("A", "s").color = "black"
@@ -0,0 +1,117 @@
+"""
+Unit tests for the 1326-combo engine.
+"""
+
+import os
+import sys
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cards import mask_of, parse_card_indexes
+from core.combos import (
+    CLASS_COMBOS,
+    COMBO_CARDS,
+    NUM_COMBOS,
+    blocker_effect,
+    class_counts,
+    class_notation,
+    combo_cards,
+    combo_index,
+    combo_str,
+    count_combos,
+    hands_mask,
+    live_mask,
+    range_mask,
+    weighted_mask,
+)
+
+
+def cards(s):
+    return parse_card_indexes(s)
+
+
+class TestIndexing:
+    """Tests for combo indexing."""
+
+    def test_index_order(self):
+        assert NUM_COMBOS == 1326
+        for i, (a, b) in enumerate(combinations(range(52), 2)):
+            assert combo_index(a, b) == combo_index(b, a) == i
+            assert tuple(COMBO_CARDS[i]) == (a, b)
+
+    def test_same_card_rejected(self):
+        with pytest.raises(ValueError):
+            combo_index(7, 7)
+
+    def test_classes_partition_combos(self):
+        counts = {len(ids) for ids in CLASS_COMBOS.values()}
+        assert counts == {4, 6, 12}
+        all_ids = np.concatenate(list(CLASS_COMBOS.values()))
+        assert sorted(all_ids) == list(range(NUM_COMBOS))
+
+    def test_combo_str(self):
+        assert combo_str(*cards("KhAh")) == "AhKh"
+        assert combo_str(*cards("AcAs")) == "AsAc"
+
+
+class TestMasks:
+    """Tests for range masks and counting."""
+
+    def test_class_counts(self):
+        assert count_combos(hands_mask(["AA"])) == 6
+        assert count_combos(hands_mask(["AKs"])) == 4
+        assert count_combos(hands_mask(["AKo"])) == 12
+
+    def test_unsuited_means_offsuit(self):
+        assert class_notation("ak") == "AKo"
+        assert np.array_equal(range_mask("AK"), range_mask("AKo"))
+
+    def test_invalid_hand(self):
+        with pytest.raises(ValueError):
+            hands_mask(["AX"])
+
+    def test_dead_cards(self):
+        mask = range_mask("AA, AKs, AKo")
+        assert count_combos(mask) == 22
+        # Ah and Kd remove 3 AA, 2 AKs and 5 AKo (AhKd counted once)
+        assert count_combos(mask, cards("AhKd")) == 22 - 3 - 2 - 5
+        assert count_combos(mask, mask_of(cards("AhKd"))) == 12
+
+    def test_live_mask(self):
+        live = live_mask(cards("AhKd7c"))
+        assert live.sum() == 49 * 48 // 2
+
+    def test_weighted(self):
+        weights = weighted_mask({"AA": 1.0, "KQs": 0.5})
+        assert count_combos(weights) == 8
+        assert class_counts(weights, cards("As")) == {"AA": 3.0, "KQs": 2.0}
+
+    def test_combo_cards(self):
+        live = combo_cards(range_mask("QQ"), cards("Qh"))
+        assert len(live) == 3
+        assert all(cards("Qh")[0] not in row for row in live.tolist())
+
+
+class TestBlockers:
+    """Tests for blocker_effect."""
+
+    def test_nut_blocker(self):
+        # AsKs is dead on the board; hero's As removes AsQs
+        effect = blocker_effect(
+            cards("As5d"), range_mask("AKs, AQs"), range_mask("JTo"), cards("Ks9s4s")
+        )
+        assert effect.value_combos == 7
+        assert effect.value_combos_blocked == 6
+        assert effect.bluff_combos == 12
+        assert effect.bluff_combos_blocked == 12
+        assert effect.value_share_blocked < effect.value_share
+
+    def test_no_overlap(self):
+        effect = blocker_effect(cards("2c3d"), range_mask("AA"), range_mask("KK"))
+        assert effect.value_removed == 0
+        assert effect.bluff_removed == 0
+        assert effect.value_share == effect.value_share_blocked == 0.5
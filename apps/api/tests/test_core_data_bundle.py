@@ -0,0 +1,93 @@
+"""
+Unit tests for the checksummed data bundle.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data_bundle import (
+    DATA_ROOT,
+    build_bundle,
+    file_sha256,
+    load_bundle,
+    stale_sources,
+    write_bundle,
+)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    (tmp_path / "solver").mkdir()
+    (tmp_path / "postflop").mkdir()
+    (tmp_path / "solver" / "strategies.bin").write_bytes(b"\x00\x01")
+    (tmp_path / "postflop" / "a.json").write_text('{"scenarios": []}')
+    return tmp_path
+
+
+def make_bundle(data_dir):
+    sources = {"postflop/a.json": file_sha256(data_dir / "postflop" / "a.json")}
+    artifacts = {"solver/strategies.bin": file_sha256(data_dir / "solver" / "strategies.bin")}
+    bundle = build_bundle({"postflop/a.json": {"scenarios": []}}, sources, artifacts)
+    write_bundle(bundle, data_dir / "bundle.json")
+    return data_dir / "bundle.json"
+
+
+def test_round_trip(data_dir):
+    path = make_bundle(data_dir)
+    bundle = load_bundle(path, data_dir)
+    assert bundle.content == {"postflop/a.json": {"scenarios": []}}
+    assert stale_sources(bundle, data_dir) == []
+
+
+def test_edited_content(data_dir):
+    path = make_bundle(data_dir)
+    raw = json.loads(path.read_text())
+    raw["content"]["postflop/a.json"]["scenarios"].append({"id": "x"})
+    path.write_text(json.dumps(raw))
+    with pytest.raises(ValueError, match="checksum"):
+        load_bundle(path, data_dir)
+
+
+def test_wrong_version(data_dir):
+    path = make_bundle(data_dir)
+    raw = json.loads(path.read_text())
+    raw["version"] += 1
+    path.write_text(json.dumps(raw))
+    with pytest.raises(ValueError, match="version"):
+        load_bundle(path, data_dir)
+
+
+def test_truncated(data_dir):
+    path = make_bundle(data_dir)
+    path.write_text(path.read_text()[:20])
+    with pytest.raises(ValueError, match="Unreadable"):
+        load_bundle(path, data_dir)
+
+
+def test_artifact_mismatch(data_dir):
+    path = make_bundle(data_dir)
+    (data_dir / "solver" / "strategies.bin").write_bytes(b"\x00")
+    with pytest.raises(ValueError, match="does not match"):
+        load_bundle(path, data_dir)
+
+
+def test_missing(data_dir):
+    with pytest.raises(FileNotFoundError):
+        load_bundle(data_dir / "bundle.json", data_dir)
+
+
+def test_stale_sources(data_dir):
+    bundle = load_bundle(make_bundle(data_dir), data_dir)
+    (data_dir / "postflop" / "a.json").write_text('{"scenarios": [{}]}')
+    (data_dir / "postflop" / "b.json").write_text("{}")
+    assert stale_sources(bundle, data_dir) == ["postflop/a.json", "postflop/b.json"]
+
+
+def test_shipped_bundle_is_current():
+    bundle = load_bundle()
+    assert stale_sources(bundle, DATA_ROOT) == []
@@ -0,0 +1,100 @@
+"""
+Unit tests for the data file checks.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data_bundle import DATA_ROOT, SOURCE_DIRS
+from core.data_validation import SUM_TOLERANCE, validate_dir, validate_file
+
+
+def scenario(**changes):
+    return {
+        "scenario_id": "btn_AK5",
+        "position": "BTN",
+        "villain": "BB",
+        "pot_type": "srp",
+        "board": ["Ah", "Ks", "5d"],
+        "texture": "ABx",
+        "strategies": {"AA": {"bet_33": 70, "check": 30, "note": "價值"}, "KhKx": {"check": 100}},
+        **changes,
+    }
+
+
+def errors(path, data):
+    return [i for i in validate_file(path, data) if i.fatal]
+
+
+class TestSolverScenarios:
+    """Tests for solver scenario files."""
+
+    def test_valid(self):
+        assert validate_file("solver/a.json", {"scenarios": [scenario()]}) == []
+
+    @pytest.mark.parametrize(
+        "board", [["Ah", "Ks"], ["Ah", "Ah", "5d"], ["Ah", "Ks", "5x"], "AhKs5d"]
+    )
+    def test_bad_board(self, board):
+        assert errors("solver/a.json", [scenario(board=board)])
+
+    def test_unknown_hand_and_action(self):
+        issues = errors("solver/a.json", [scenario(strategies={"AZs": {"raise": 100}})])
+        messages = " ".join(i.message for i in issues)
+        assert "unknown hand 'AZs'" in messages
+        assert "unknown action 'raise'" in messages
+
+    def test_frequencies_off_by_more_than_tolerance(self):
+        strategies = {"AA": {"bet_33": 50, "check": 50 + SUM_TOLERANCE + 1}}
+        issues = errors("solver/a.json", [scenario(strategies=strategies)])
+        assert issues[0].location == "[0].strategies.AA"
+
+    def test_rounding_drift_is_one_warning(self):
+        drifted = {"AA": {"bet_33": 33, "check": 66}, "KK": {"check": 98}}
+        issues = validate_file("solver/a.json", [scenario(strategies=drifted)])
+        assert len(issues) == 1
+        assert not issues[0].fatal
+
+    def test_duplicate_id(self):
+        assert errors("solver/a.json", [scenario(), scenario()])
+
+
+class TestOtherFamilies:
+    """Tests for range, postflop and texture drill files."""
+
+    def test_range_frequencies(self):
+        data = {"meta": {}, "UTG": {"frequencies": {"AA": {"raise": 100}, "72o": {"fold": 90}}}}
+        issues = errors("ranges/6max/rfi_frequencies.json", data)
+        assert [i.location for i in issues] == ["UTG.frequencies.72o"]
+
+    def test_hand_lists(self):
+        data = {"meta": {"note": ["not", "hands"]}, "6max": {"3bb": {"UTG": ["AA", "AKx"]}}}
+        issues = errors("ranges/mtt/push_fold.json", data)
+        assert [i.location for i in issues] == ["6max.3bb.UTG"]
+
+    def test_postflop_board(self):
+        good = {
+            "id": "a",
+            "flop": ["A", "7", "2"],
+            "flop_suits": ["s", "d", "c"],
+            "hero_hand": "AhKh",
+        }
+        bad = {**good, "id": "b", "flop_suits": ["s", "s", "s"], "flop": ["A", "A", "2"]}
+        issues = errors("postflop/flop_cbet.json", {"scenarios": [good, bad]})
+        assert [i.location for i in issues] == ["scenarios[1]"]
+
+    def test_unparseable_file(self, tmp_path):
+        (tmp_path / "postflop").mkdir()
+        (tmp_path / "postflop" / "bad.json").write_text("{")
+        files, issues = validate_dir(tmp_path, ["postflop"])
+        assert files == {}
+        assert issues[0].fatal
+
+
+def test_shipped_data_has_no_errors():
+    _, issues = validate_dir(DATA_ROOT, SOURCE_DIRS)
+    assert [str(i) for i in issues if i.fatal] == []
@@ -0,0 +1,118 @@
+"""
+Unit tests for the preflop equity quiz.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.equity import (
+    CATEGORIES,
+    EquityQuestion,
+    EquityQuiz,
+    classify_matchup,
+    hand_vs_range_equity,
+    matchup_equity,
+)
+
+
+@pytest.fixture(scope="module")
+def quiz():
+    return EquityQuiz()
+
+
+class TestClassifyMatchup:
+    """Tests for automatic category inference."""
+
+    @pytest.mark.parametrize(
+        "hand1, hand2, category",
+        [
+            ("AA", "KK", "overpair_vs_underpair"),
+            ("QQ", "AKs", "pair_vs_overcards"),
+            ("AKo", "22", "pair_vs_overcards"),
+            ("QQ", "AJs", "pair_vs_one_overcard"),
+            ("AA", "KQo", "pair_vs_undercards"),
+            ("JTs", "AA", "suited_connectors_vs_pairs"),
+            ("KK", "AKs", "premium_battles"),
+            ("AKs", "AQs", "domination"),
+            ("AKo", "QJo", "high_vs_low"),
+            ("AKs", "AKo", "special_cases"),
+        ],
+    )
+    def test_categories(self, hand1, hand2, category):
+        assert classify_matchup(hand1, hand2) == category
+        assert classify_matchup(hand2, hand1) == category
+
+
+class TestEquities:
+    """Tests for cached equity lookups."""
+
+    def test_matchup_equity(self):
+        assert matchup_equity("AA", "KK") == (82, 18)
+        equity1, equity2 = matchup_equity("QQ", "AKo")
+        assert equity1 + equity2 == 100
+        assert 55 <= equity1 <= 58
+
+    def test_matchup_equity_is_cached(self):
+        matchup_equity("T9s", "22")
+        hits = matchup_equity.cache_info().hits
+        matchup_equity("T9s", "22")
+        assert matchup_equity.cache_info().hits == hits + 1
+
+    def test_hand_vs_range(self):
+        equity1, equity2 = hand_vs_range_equity("AA", "QQ+, AKs, AKo")
+        assert equity1 + equity2 == 100
+        assert equity1 > 60
+
+
+class TestEquityQuiz:
+    """Tests for question and choice generation."""
+
+    def test_generate_question(self, quiz):
+        for _ in range(200):
+            question = quiz.generate_question()
+            assert isinstance(question, EquityQuestion)
+            assert question.category in CATEGORIES
+            assert question.correct_equity1 + question.correct_equity2 == 100
+            assert question.difficulty in quiz.get_difficulties()
+            assert question.display_hand1
+
+    def test_category_filter(self, quiz):
+        for _ in range(20):
+            question = quiz.generate_question(category="pair_vs_overcards")
+            assert question.category == "pair_vs_overcards"
+            assert len(question.hand1) == 2  # Pair asked first
+            assert classify_matchup(question.hand1, question.hand2) == question.category
+
+    def test_unknown_category_falls_back(self, quiz):
+        question = quiz.generate_question(category="nonexistent")
+        assert question.category in CATEGORIES
+
+    def test_difficulty_filter(self, quiz):
+        for _ in range(20):
+            assert quiz.generate_question(difficulty="easy").difficulty == "easy"
+
+    def test_hand_vs_range_question(self, quiz):
+        question = quiz.generate_question(category="hand_vs_range")
+        assert "," in question.hand2
+        assert question.display_hand2 == question.hand2
+
+    def test_generate_choices(self, quiz):
+        question = quiz.generate_question()
+        choices = quiz.generate_choices(question)
+        assert len(choices) == 4
+        assert sum(c.is_correct for c in choices) == 1
+        assert [c.equity1 for c in choices] == sorted(c.equity1 for c in choices)
+
+    def test_check_answer(self, quiz):
+        question = quiz.generate_question()
+        assert quiz.check_answer(question, question.correct_equity1) == (True, 0)
+        assert not quiz.check_answer(question, question.correct_equity1 + 20)[0]
+
+    def test_categories(self, quiz):
+        keys = [key for key, _ in quiz.get_categories()]
+        assert "domination" in keys and "hand_vs_range" in keys
+        assert quiz.get_category_description("domination")
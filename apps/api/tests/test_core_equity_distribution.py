@@ -0,0 +1,111 @@
+"""
+Unit tests for range vs range equity distributions.
+"""
+
+import os
+import sys
+from itertools import combinations
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cards import mask_of, parse_card_indexes
+from core.combos import combo_cards, combo_str, range_mask
+from core.equity_distribution import equity_distribution, range_classes
+from core.hand_rank import evaluate
+
+
+def cards(s):
+    return parse_card_indexes(s)
+
+
+def brute_force(hero_range, villain_range, board):
+    """Per-combo equity by looping over every villain combo and runout."""
+    dead = mask_of(board)
+
+    def combos(range_str):
+        return [tuple(c) for c in combo_cards(range_mask(range_str), dead).tolist()]
+
+    result = {}
+    for hero in combos(hero_range):
+        points = total = 0
+        for villain in combos(villain_range):
+            if set(hero) & set(villain):
+                continue
+            live = [c for c in range(52) if not dead >> c & 1 and c not in hero + villain]
+            for runout in combinations(live, 5 - len(board)):
+                full = list(board) + list(runout)
+                h, v = evaluate(list(hero) + full), evaluate(list(villain) + full)
+                points += (h > v) + 0.5 * (h == v)
+                total += 1
+        result[combo_str(*hero)] = points / total
+    return result
+
+
+class TestEquityDistribution:
+    """Tests for equity_distribution."""
+
+    @pytest.mark.parametrize(
+        "board, hero, villain",
+        [
+            ("AhKd5c7s2h", "AA, KK, AKs, 76s, QJo", "KK, QQ, AK, 55"),
+            ("AhKd5c7s", "AA, KK, AKs, 76s, QJo", "KK, QQ, AK, 55"),
+            ("Ah7h2c", "AA, 76s", "KK, AKs"),
+        ],
+    )
+    def test_matches_brute_force(self, board, hero, villain):
+        result = equity_distribution(hero, villain, cards(board))
+        for side, expected in (
+            (result.hero, brute_force(hero, villain, cards(board))),
+            (result.villain, brute_force(villain, hero, cards(board))),
+        ):
+            assert side.combo_equity.keys() == expected.keys()
+            for combo, eq in expected.items():
+                assert side.combo_equity[combo] == pytest.approx(eq, abs=1e-4)
+
+    def test_histogram_sums_to_one(self):
+        result = equity_distribution("22+, A2s+, KTo+", "TT+, AQ+", cards("Qs9h4d"), buckets=20)
+        for side in (result.hero, result.villain):
+            assert len(side.histogram) == 20
+            assert sum(side.histogram) == pytest.approx(1.0)
+            assert side.combos == len(side.combo_equity)
+
+    def test_symmetric_ranges_split_evenly(self):
+        result = equity_distribution("JJ+, AK", "JJ+, AK", cards("8c5d2h"))
+        assert result.hero.equity == pytest.approx(0.5)
+        assert result.villain.equity == pytest.approx(0.5)
+
+    def test_equities_are_complementary(self):
+        result = equity_distribution("QQ+, AKs", "99-JJ, KQs", cards("Th6d3c4s"))
+        assert result.hero.equity + result.villain.equity == pytest.approx(1.0)
+        assert result.runouts == 48
+
+    def test_board_cards_removed_from_ranges(self):
+        result = equity_distribution("AA", "KK", cards("AhAd7c"))
+        assert result.hero.combo_equity.keys() == {"AsAc"}
+        assert result.hero.combos == 1
+
+    def test_isomorphic_boards_use_caller_suits(self):
+        a = equity_distribution("AKs, 76s", "QQ", cards("Qh9h5d"))
+        b = equity_distribution("AKs, 76s", "QQ", cards("Qs9s5c"))
+        assert a.hero.equity == b.hero.equity
+        assert a.hero.combo_equity["AhKh"] == b.hero.combo_equity["AsKs"]
+        assert a.hero.combo_equity["7h6h"] == b.hero.combo_equity["7s6s"]
+
+    def test_invalid_board(self):
+        with pytest.raises(ValueError):
+            equity_distribution("AA", "KK", cards("AhKh"))
+        with pytest.raises(ValueError):
+            equity_distribution("AA", "KK", cards("AhAh5d"))
+
+    def test_empty_range_after_board(self):
+        with pytest.raises(ValueError):
+            equity_distribution("AA", "KK", cards("AhAdAs"))
+
+
+class TestRangeClasses:
+    """Tests for range_classes cache keys."""
+
+    def test_order_independent(self):
+        assert range_classes("AKs, QQ+") == range_classes("KK+, QQ, AKs")
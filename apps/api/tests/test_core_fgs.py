@@ -0,0 +1,80 @@
+"""
+Unit tests for future game simulation (FGS) ICM.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.fgs import _acting_order, _bust_prizes, fgs_cache_info, fgs_equities, fgs_equities_batch
+from core.icm import icm_ev
+from core.push_fold import HAND_WEIGHTS, solve_push_fold
+
+STACKS = [3000, 2500, 1500, 1000]
+PAYOUTS = [50, 30, 20]
+
+
+class TestTableModel:
+    """Tests for seating and bust payouts."""
+
+    def test_acting_order(self):
+        assert _acting_order((1, 1, 1, 1), 0) == [3, 0, 1, 2]
+        assert _acting_order((1, 0, 1, 1), 3) == [3, 0, 2]
+        assert _acting_order((0, 1, 1), 2) == [2, 1]
+
+    def test_bust_prizes(self):
+        """Busted players take the lowest open places, shortest stack first."""
+        prizes = _bust_prizes([1, 3], (40, 10, 30, 20), 4, (50, 30, 20))
+        assert prizes.tolist() == [0, 0, 0, 20]
+        tied = _bust_prizes([1, 3], (40, 10, 30, 10), 4, (50, 30, 20))
+        assert tied.tolist() == [0, 10, 0, 10]
+
+
+class TestFGSEquities:
+    """Tests for FGS equities."""
+
+    def test_no_hands_is_icm(self):
+        assert fgs_equities(STACKS, PAYOUTS, 0, 100, 200, hands=0) == pytest.approx(
+            icm_ev(STACKS, PAYOUTS)
+        )
+
+    @pytest.mark.parametrize("hands", [1, 2])
+    def test_prize_pool_conserved(self, hands):
+        equities = fgs_equities(STACKS, PAYOUTS, 0, 100, 200, ante=25, hands=hands)
+        assert sum(equities) == pytest.approx(sum(PAYOUTS))
+        assert all(e >= 0 for e in equities)
+
+    def test_seat_matters(self):
+        """Equal stacks are worth the same under ICM but not once blinds come round."""
+        equities = fgs_equities([1000] * 4, PAYOUTS, 0, 150, 300, hands=1)
+        assert max(equities) - min(equities) > 1
+
+    def test_finished_rows(self):
+        rows = [[1000, 0, 0], [600, 400, 0]]
+        equities = fgs_equities_batch(rows, PAYOUTS, 0, 50, 100, hands=2)
+        assert equities[0].tolist() == pytest.approx([50, 0, 0])
+        assert equities[1].sum() == pytest.approx(80)
+
+    def test_cached(self):
+        fgs_equities(STACKS, PAYOUTS, 1, 100, 200, hands=1)
+        hits = fgs_cache_info()["hits"]
+        fgs_equities(STACKS, PAYOUTS, 1, 100, 200, hands=1)
+        assert fgs_cache_info()["hits"] > hits
+
+    def test_workers_match(self):
+        args = ([1500, 1000, 500], PAYOUTS, 0, 50, 100)
+        assert fgs_equities(*args, hands=2, workers=2) == pytest.approx(
+            fgs_equities(*args, hands=2)
+        )
+
+
+class TestPushFoldFGS:
+    """Tests for FGS payoffs in the push/fold solver."""
+
+    def test_solves(self):
+        solution = solve_push_fold([8, 8, 8], payouts=[50, 50], iterations=100, fgs_hands=1)
+        assert "AA" in solution.push_range("BTN")
+        assert 0 < HAND_WEIGHTS @ solution.call[("BB", "SB")] < 1
@@ -0,0 +1,109 @@
+"""
+Unit tests for the lookup-table hand ranking engine.
+"""
+
+import os
+import random
+import sys
+from itertools import combinations
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cards import card_index, card_str
+from core.hand_rank import (
+    FLUSH,
+    FOUR_OF_A_KIND,
+    FULL_HOUSE,
+    HIGH_CARD,
+    NUM_STRENGTHS,
+    ONE_PAIR,
+    STRAIGHT,
+    STRAIGHT_FLUSH,
+    THREE_OF_A_KIND,
+    TWO_PAIR,
+    evaluate,
+    evaluate_strings,
+    hand_category,
+    hand_ranks,
+    straight_high,
+)
+
+
+def _eval(cards: str) -> int:
+    return evaluate_strings(cards.split())
+
+
+class TestCardIndex:
+    """Tests for card int encoding."""
+
+    def test_round_trip(self):
+        for i in range(52):
+            assert card_index(card_str(i)) == i
+
+    def test_encoding_order(self):
+        assert card_index("2s") == 0
+        assert card_index("Ac") == 51
+        assert card_index("th") == card_index("Th")
+
+
+class TestCategories:
+    """Tests for category detection."""
+
+    def test_each_category(self):
+        cases = [
+            ("Ah Kc 9d 5s 2h", HIGH_CARD),
+            ("Ah Ac 9d 5s 2h", ONE_PAIR),
+            ("Ah Ac 9d 9s 2h", TWO_PAIR),
+            ("Ah Ac Ad 9s 2h", THREE_OF_A_KIND),
+            ("Ah Kc Qd Js Th", STRAIGHT),
+            ("Ah Kh 9h 5h 2h", FLUSH),
+            ("Ah Ac Ad 9s 9h", FULL_HOUSE),
+            ("Ah Ac Ad As 2h", FOUR_OF_A_KIND),
+            ("9h 8h 7h 6h 5h", STRAIGHT_FLUSH),
+        ]
+        for cards, category in cases:
+            assert hand_category(_eval(cards)) == category, cards
+
+    def test_wheel_is_lowest_straight(self):
+        wheel = _eval("Ah 2c 3d 4s 5h")
+        six_high = _eval("2c 3d 4s 5h 6h")
+        assert hand_category(wheel) == STRAIGHT
+        assert hand_ranks(wheel)[0] == 3  # Five-high
+        assert six_high > wheel
+
+    def test_strength_bounds(self):
+        assert _eval("7c 5d 4h 3s 2s") == 1
+        assert _eval("As Ks Qs Js Ts") == NUM_STRENGTHS
+
+
+class TestSevenCards:
+    """Tests for 6 and 7 card evaluation."""
+
+    def test_two_trips_is_full_house(self):
+        strength = _eval("Ah Ac Ad Ks Kh Kd 2c")
+        assert hand_category(strength) == FULL_HOUSE
+        assert hand_ranks(strength)[:2] == (12, 11)
+
+    def test_three_pairs_uses_best_kicker(self):
+        assert _eval("Ah Ac Kd Ks 2h 2d Qc") > _eval("Ah Ac Kd Ks 2h 2d Jc")
+        assert _eval("Ah Ac Kd Ks Qh Qd 2c") == _eval("Ah Ac Kd Ks Qh 3d 2c")
+
+    def test_matches_best_five_card_subset(self):
+        rng = random.Random(7)
+        for _ in range(500):
+            cards = rng.sample(range(52), 7)
+            best = max(evaluate(c) for c in combinations(cards, 5))
+            assert evaluate(cards) == best
+
+    def test_six_cards(self):
+        assert _eval("Ah Kh Qh Jh 2c 2d") < _eval("Ah Kh Qh Jh Th 2d")
+
+
+class TestStraightHigh:
+    """Tests for straight detection from a rank mask."""
+
+    def test_no_straight(self):
+        assert straight_high(0b1010101010101) == -1
+
+    def test_broadway(self):
+        assert straight_high(0b1111100000000) == 12
@@ -5,18 +5,27 @@ Unit tests for ICM (Independent Chip Model) calculations.
 import os
 import sys
 
+import numpy as np
 import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.icm import (
+    MAX_EXACT_PLAYERS,
+    bubble_factors,
     calculate_finish_probability,
     calculate_icm_equity,
     calculate_icm_pressure,
     chip_ev,
+    clear_icm_cache,
+    finish_probabilities,
+    finish_probabilities_batch,
     get_standard_payouts,
+    icm_cache_info,
     icm_ev,
+    icm_pressure_curve,
     icm_vs_chip_ev_diff,
+    sample_icm_equities,
 )
 
 
@@ -59,6 +68,44 @@ class TestFinishProbability:
         assert prob == 0.0
 
 
+class TestFinishProbabilityMatrix:
+    """Tests for the subset-DP finish probability table."""
+
+    def test_matches_hand_computed(self):
+        """P(2nd) sums over who finishes 1st, per Malmuth-Harville."""
+        probs = finish_probabilities([5000, 3000, 2000])
+        assert probs[0][0] == pytest.approx(0.5)
+        assert probs[0][1] == pytest.approx(0.3 * 5 / 7 + 0.2 * 5 / 8)
+        assert probs[2][2] == pytest.approx(1 - probs[2][0] - probs[2][1])
+
+    def test_rows_and_columns_sum_to_one(self):
+        probs = finish_probabilities([9000, 7000, 5000, 4000, 3000, 2000, 1500, 1000, 500])
+        for row in probs:
+            assert sum(row) == pytest.approx(1.0)
+        for place in range(9):
+            assert sum(row[place] for row in probs) == pytest.approx(1.0)
+
+    def test_matches_single_probability(self):
+        stacks = [4000, 3000, 2000, 1000]
+        probs = finish_probabilities(stacks)
+        for player in range(4):
+            for place in range(4):
+                assert calculate_finish_probability(stacks, player, place) == pytest.approx(
+                    probs[player][place]
+                )
+
+    def test_excluded_players(self):
+        """Excluded players are already placed; the rest play for the next places."""
+        probs = finish_probabilities([5000, 3000, 2000], excluded=(0,))
+        assert probs[0] == [0.0, 0.0, 0.0]
+        assert probs[1][0] == pytest.approx(0.6)
+        assert probs[1][2] == 0.0
+
+    def test_more_payouts_than_live_players(self):
+        result = calculate_icm_equity([5000, 0, 5000], [500, 300, 200])
+        assert result.equities == pytest.approx([400, 0, 400])
+
+
 class TestICMEquity:
     """Tests for ICM equity calculations."""
 
@@ -127,6 +174,99 @@ class TestICMEquity:
         assert result.equities[0] == 1000
 
 
+class TestICMCache:
+    """Tests for the canonical-table equity cache."""
+
+    def setup_method(self):
+        clear_icm_cache()
+
+    def test_repeat_is_a_hit(self):
+        calculate_icm_equity([5000, 3000, 2000], [500, 300, 200])
+        calculate_icm_equity([5000, 3000, 2000], [500, 300, 200])
+        info = icm_cache_info()
+        assert (info["hits"], info["misses"], info["size"]) == (1, 1, 1)
+
+    def test_permuted_scaled_and_busted_share_a_key(self):
+        base = calculate_icm_equity([5000, 3000, 2000], [500, 300, 200]).equities
+        permuted = calculate_icm_equity([300, 0, 500, 200], [500, 300, 200, 100]).equities
+        assert icm_cache_info()["hits"] == 1
+        assert permuted == pytest.approx([base[1], 0.0, base[0], base[2]])
+
+    def test_different_payouts_miss(self):
+        calculate_icm_equity([5000, 3000, 2000], [500, 300, 200])
+        calculate_icm_equity([5000, 3000, 2000], [600, 300, 100])
+        assert icm_cache_info()["misses"] == 2
+
+    def test_cached_result_is_not_shared(self):
+        first = calculate_icm_equity([5000, 3000, 2000], [500, 300, 200])
+        first.equities[0] = 0.0
+        second = calculate_icm_equity([5000, 3000, 2000], [500, 300, 200])
+        assert second.equities[0] > 0
+
+    def test_clear_resets_counters(self):
+        calculate_icm_equity([5000, 3000, 2000], [500, 300, 200])
+        clear_icm_cache()
+        assert icm_cache_info() == {"hits": 0, "misses": 0, "size": 0, "max_size": 4096}
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork")
+    def test_forked_child_starts_empty(self):
+        calculate_icm_equity([5000, 3000, 2000], [500, 300, 200])
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, str(icm_cache_info()["size"]).encode())
+            os._exit(0)
+        os.close(write_fd)
+        child_size = os.read(read_fd, 16)
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+        assert child_size == b"0"
+        assert icm_cache_info()["size"] == 1
+
+
+class TestSampledICM:
+    """Tests for Monte Carlo ICM on fields too large for the subset DP."""
+
+    STACKS = [1000 * (i % 7 + 1) for i in range(MAX_EXACT_PLAYERS + 1)]
+    PAYOUTS = [400, 250, 150, 100, 60, 40]
+
+    def test_matches_exact_within_error(self):
+        probs = finish_probabilities(self.STACKS, len(self.PAYOUTS))
+        exact = [sum(p * payout for p, payout in zip(row, self.PAYOUTS)) for row in probs]
+        equities, std_errors, samples = sample_icm_equities(
+            self.STACKS, self.PAYOUTS, samples=50_000, seed=1
+        )
+        assert samples == 50_000
+        for equity, expected, error in zip(equities, exact, std_errors):
+            assert abs(equity - expected) < 5 * error
+
+    def test_large_field_is_sampled(self):
+        stacks = self.STACKS + [0]
+        result = calculate_icm_equity(stacks, self.PAYOUTS, seed=1)
+        assert result.samples > 0
+        assert len(result.std_errors) == len(stacks)
+        assert result.equities[-1] == 0.0
+        assert sum(result.equities) == pytest.approx(sum(self.PAYOUTS))
+
+    def test_small_field_is_exact(self):
+        result = calculate_icm_equity([5000, 3000, 2000], [500, 300, 200])
+        assert result.samples == 0
+        assert result.std_errors is None
+
+    def test_target_std_error_stops_early(self):
+        _, std_errors, samples = sample_icm_equities(
+            self.STACKS, self.PAYOUTS, samples=1_000_000, target_std_error=5.0, seed=1
+        )
+        assert samples < 1_000_000
+        assert max(std_errors) <= 5.0
+
+    def test_seed_is_reproducible(self):
+        first = sample_icm_equities(self.STACKS, self.PAYOUTS, samples=1000, seed=7)
+        second = sample_icm_equities(self.STACKS, self.PAYOUTS, samples=1000, seed=7)
+        assert first == second
+
+
 class TestICMPressure:
     """Tests for ICM pressure calculations."""
 
@@ -152,6 +292,46 @@ class TestICMPressure:
         assert pressure["pressure_level"] in ["low", "medium"]
 
 
+class TestBatchedPressure:
+    """Tests for the batched pressure curve and bubble factors."""
+
+    STACKS = [5000, 4000, 3000, 2000]
+    PAYOUTS = [450, 300, 150, 0]
+
+    def test_batch_rows_match_single(self):
+        rows = [self.STACKS, [6000, 3000, 3000, 2000], [5000, 0, 7000, 2000]]
+        batch = finish_probabilities_batch(rows)
+        for row, probs in zip(rows, batch):
+            assert np.allclose(probs, finish_probabilities(row))
+
+    def test_curve_matches_single_pressure(self):
+        pots = [500, 1000, 2000, 3000]
+        curve = icm_pressure_curve(self.STACKS, self.PAYOUTS, 3, pots)
+        for pot, ratio, level in zip(pots, curve.pressure_ratios, curve.pressure_levels):
+            single = calculate_icm_pressure(self.STACKS, self.PAYOUTS, 3, pot)
+            assert ratio == pytest.approx(single["pressure_ratio"])
+            assert level == single["pressure_level"]
+
+    def test_bubble_factor_definition(self):
+        """Risked over won ICM dollars in an all-in for the effective stack."""
+        factors = bubble_factors(self.STACKS, self.PAYOUTS)
+        i, j = 1, 3
+        now = calculate_icm_equity(self.STACKS, self.PAYOUTS).equities[i]
+        win = calculate_icm_equity([5000, 6000, 3000, 0], self.PAYOUTS).equities[i]
+        lose = calculate_icm_equity([5000, 2000, 3000, 4000], self.PAYOUTS).equities[i]
+        assert factors[i, j] == pytest.approx((now - lose) / (win - now))
+
+    def test_bubble_factors_above_one_on_bubble(self):
+        factors = bubble_factors(self.STACKS, self.PAYOUTS)
+        off_diagonal = factors[~np.eye(4, dtype=bool)]
+        assert (off_diagonal > 1).all()
+
+    def test_busted_player_has_no_factor(self):
+        factors = bubble_factors([5000, 0, 3000], [300, 200])
+        assert np.isnan(factors[1]).all()
+        assert np.isnan(factors[:, 1]).all()
+
+
 class TestStandardPayouts:
     """Tests for standard payout generation."""
 
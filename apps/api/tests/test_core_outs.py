@@ -3,15 +3,20 @@ Unit tests for outs calculation and hand evaluation.
 """
 
 import os
+import random
 import sys
 
+import pytest
+
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.outs import (
+    BATCH_DRAW_TYPES,
     Card,
     DrawType,
     HandStrength,
     calculate_outs,
+    calculate_outs_batch,
     count_ranks,
     count_suits,
     evaluate_hand_strength,
@@ -264,6 +269,59 @@ class TestOutsCalculation:
         assert result.river_probability >= result.turn_probability
 
 
+class TestOutsBatch:
+    """Tests for the vectorized batch outs calculation."""
+
+    def test_matches_single_spot(self):
+        """Every column agrees with calculate_outs on random flops and turns."""
+        rng = random.Random(5)
+        holes, boards = [], []
+        for _ in range(1500):
+            cards = rng.sample(range(52), rng.choice([5, 6]))
+            holes.append(cards[:2])
+            boards.append(cards[2:])
+        batch = calculate_outs_batch(holes, boards)
+        assert len(batch) == 1500
+
+        for i, (hole, board) in enumerate(zip(holes, boards)):
+            result = calculate_outs(
+                [Card.from_index(c) for c in hole], [Card.from_index(c) for c in board]
+            )
+            draw_outs = {draw_type: count for draw_type, count, _ in result.draws}
+            assert batch.hand_strength[i] == result.hand_strength.value
+            assert batch.total_outs[i] == result.total_outs
+            assert batch.turn_probability[i] == result.turn_probability
+            assert batch.river_probability[i] == result.river_probability
+            assert set(batch.out_cards(i)) == set(result.out_cards)
+            for draw_type in BATCH_DRAW_TYPES:
+                assert batch.draw_outs[draw_type][i] == draw_outs.get(draw_type, 0)
+
+    def test_combo_draw_columns(self):
+        hole, board = parse_cards("8h7h"), parse_cards("9h6h2c")
+        batch = calculate_outs_batch([[c.index for c in hole]], [[c.index for c in board]])
+        assert batch.draw_outs[DrawType.FLUSH_DRAW][0] == 9
+        assert batch.draw_outs[DrawType.OESD][0] == 8
+        assert batch.total_outs[0] == 15
+
+    def test_mixed_streets_and_royal(self):
+        holes = [[c.index for c in parse_cards(h)] for h in ("AhKh", "JhJc")]
+        boards = [[c.index for c in parse_cards(b)] for b in ("QhJhTh", "Ks8d4h2c5s")]
+        batch = calculate_outs_batch(holes, boards)
+        assert batch.hand_strength.tolist() == [
+            HandStrength.ROYAL_FLUSH.value,
+            HandStrength.ONE_PAIR.value,
+        ]
+        assert batch.draw_outs[DrawType.SET_DRAW][1] == 2
+
+    def test_invalid_spots(self):
+        with pytest.raises(ValueError):
+            calculate_outs_batch([[0, 1]], [[0, 2, 3]])  # Duplicate card
+        with pytest.raises(ValueError):
+            calculate_outs_batch([[0, 1]], [[2, 3]])  # Board too short
+        with pytest.raises(ValueError):
+            calculate_outs_batch([[0, 1, 2]], [[3, 4, 5]])
+
+
 class TestOutsQuiz:
     """Tests for outs quiz functionality."""
 
@@ -289,3 +347,101 @@ class TestOutsQuiz:
         assert len(choices) == 4
         assert question.result.total_outs in choices
         assert choices == sorted(choices)  # Should be sorted
+
+
+class TestExactEquity:
+    """Tests for exact turn/river enumeration equity."""
+
+    def test_flush_draw_vs_overpair(self):
+        """Nut flush draw vs a set-less overpair matches brute-force enumeration."""
+        from core.outs import calculate_equity
+
+        result = calculate_equity(parse_cards("AsKs"), parse_cards("Qs7s2h"), parse_cards("QhQd"))
+
+        assert result.runouts == 990
+        assert result.villain_combos == 1
+        assert result.win == pytest.approx(25.6, abs=0.05)
+        assert result.win + result.tie + result.lose == pytest.approx(100, abs=0.2)
+
+    def test_true_outs_on_turn(self):
+        """OESD vs overpair: only cards that beat the pair count as true outs."""
+        from core.outs import calculate_equity
+
+        result = calculate_equity(parse_cards("JhTc"), parse_cards("9s8d2h3c"), parse_cards("AhAd"))
+
+        out_ranks = sorted({c.rank for c in result.true_outs})
+        assert out_ranks == ["7", "Q"]
+        assert len(result.true_outs) == 8
+        assert result.equity == pytest.approx(8 / 44 * 100, abs=0.1)
+
+    def test_no_outs_when_ahead(self):
+        """A hand that is already ahead has no true outs."""
+        from core.outs import calculate_equity
+
+        result = calculate_equity(parse_cards("AhAd"), parse_cards("9s8d2h"), parse_cards("JhTc"))
+
+        assert result.true_outs == []
+        assert result.equity > 50
+
+    def test_range_string_and_weights(self):
+        """Range strings and weighted dicts expand to combos with card removal."""
+        from core.outs import calculate_equity
+
+        hole = parse_cards("AsKs")
+        board = parse_cards("Qs7s2h")
+        by_string = calculate_equity(hole, board, "QQ, 77")
+        by_dict = calculate_equity(hole, board, {"QQ": 1.0, "77": 1.0})
+
+        assert by_string.villain_combos == 6  # 3 QQ + 3 77 after board removal
+        assert by_string.equity == by_dict.equity
+
+    def test_river_is_single_showdown(self):
+        """On the river there is nothing left to enumerate."""
+        from core.outs import calculate_equity
+
+        result = calculate_equity(
+            parse_cards("AhKh"), parse_cards("Ac7s2d9c3h"), parse_cards("QsQd")
+        )
+
+        assert result.runouts == 1
+        assert result.win == 100.0
+        assert result.true_outs == []
+
+    @pytest.mark.parametrize(
+        "hole, board, villain",
+        [("KhKs", "Ad7c2h", "TT+"), ("KhKs", "8d7c2h", "88"), ("JhTc", "9s8d2h", "QQ+, 77")],
+    )
+    def test_villain_cards_on_the_runout(self, hole, board, villain):
+        """Villain combos that collide with a runout card are skipped, not scored."""
+        from itertools import combinations
+
+        from core.combos import combo_cards, live_mask, range_mask
+        from core.hand_rank import evaluate
+        from core.outs import calculate_equity
+
+        hero = [c.index for c in parse_cards(hole)]
+        flop = [c.index for c in parse_cards(board)]
+        result = calculate_equity(parse_cards(hole), parse_cards(board), villain)
+
+        # Brute force: every villain combo equally weighted over its runouts
+        dead = hero + flop
+        points = 0.0
+        combos = combo_cards(range_mask(villain) & live_mask(dead))
+        for a, b in combos.tolist():
+            live = [c for c in range(52) if c not in dead + [a, b]]
+            scores = []
+            for turn, river in combinations(live, 2):
+                h = evaluate(hero + flop + [turn, river])
+                v = evaluate([a, b] + flop + [turn, river])
+                scores.append(1.0 if h > v else 0.5 if h == v else 0.0)
+            points += sum(scores) / len(scores)
+        assert result.villain_combos == len(combos)
+        assert result.equity == pytest.approx(points / len(combos) * 100, abs=0.06)
+
+    def test_calculate_outs_attaches_equity(self):
+        """calculate_outs only enumerates when a villain is given."""
+        hole = parse_cards("AsKs")
+        board = parse_cards("Qs7s2h")
+
+        assert calculate_outs(hole, board).equity is None
+        assert calculate_outs(hole, board, "QQ").equity is not None
@@ -0,0 +1,98 @@
+"""
+Unit tests for the precomputed 169x169 preflop equity matrix.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.preflop_equity import (
+    EQUITY_SCALE,
+    N_CLASSES,
+    hand_index,
+    hand_vs_hand,
+    load_matrix,
+    range_indexes,
+    range_vs_range,
+    write_matrix,
+)
+
+
+class TestMatrixFile:
+    """Tests for the binary format and loader."""
+
+    def test_shipped_matrix_shape(self):
+        equity, combos = load_matrix()
+        assert equity.shape == (N_CLASSES, N_CLASSES)
+        assert combos.shape == (N_CLASSES, N_CLASSES)
+
+    def test_matrix_is_antisymmetric(self):
+        equity, combos = load_matrix()
+        total = equity.astype(np.int64) + equity.T.astype(np.int64)
+        assert np.abs(total - EQUITY_SCALE).max() <= 1
+        assert (combos == combos.T).all()
+
+    def test_combo_pair_counts(self):
+        _, combos = load_matrix()
+        assert combos[hand_index("AA"), hand_index("KK")] == 36
+        assert combos[hand_index("AA"), hand_index("AA")] == 6
+        assert combos[hand_index("AKs"), hand_index("AKo")] == 24
+        assert combos[hand_index("72o"), hand_index("AA")] == 72
+
+    def test_round_trip(self, tmp_path):
+        equity = np.full((N_CLASSES, N_CLASSES), 0.25)
+        combos = np.ones((N_CLASSES, N_CLASSES), dtype=np.uint8)
+        path = tmp_path / "matrix.bin"
+        write_matrix(path, equity, combos, samples=10)
+
+        loaded, loaded_combos = load_matrix(path)
+        assert loaded[0, 0] == round(0.25 * EQUITY_SCALE)
+        assert (loaded_combos == 1).all()
+
+    def test_rejects_bad_header(self, tmp_path):
+        path = tmp_path / "bad.bin"
+        path.write_bytes(b"\0" * 64)
+        with pytest.raises(ValueError):
+            load_matrix(path)
+
+
+class TestLookups:
+    """Tests against well-known preflop equities."""
+
+    @pytest.mark.parametrize(
+        "hero,villain,expected",
+        [
+            ("AA", "KK", 0.82),
+            ("AKs", "QQ", 0.46),
+            ("AKo", "22", 0.47),
+            ("72o", "AA", 0.12),
+            ("AKs", "AKo", 0.52),
+        ],
+    )
+    def test_known_matchups(self, hero, villain, expected):
+        assert hand_vs_hand(hero, villain) == pytest.approx(expected, abs=0.01)
+
+    def test_mirror_matchup(self):
+        assert hand_vs_hand("KK", "AA") == pytest.approx(1 - hand_vs_hand("AA", "KK"), abs=1e-4)
+
+    def test_invalid_hand(self):
+        with pytest.raises(ValueError):
+            hand_index("AKx")
+
+    def test_range_weighted_by_combos(self):
+        """AA+KK vs QQ is the combo-weighted mean of both cells."""
+        equity, pairs = range_vs_range(range_indexes("AA, KK"), range_indexes("QQ"))
+        assert pairs == 72
+        expected = (hand_vs_hand("AA", "QQ") + hand_vs_hand("KK", "QQ")) / 2
+        assert equity == pytest.approx(expected)
+
+    def test_class_weights(self):
+        """Zero weight removes a class from the aggregate."""
+        hero = range_indexes("AA, 72o")
+        villain = range_indexes("KK")
+        equity, _ = range_vs_range(hero, villain, hero_weights=np.array([1.0, 0.0]))
+        assert equity == pytest.approx(hand_vs_hand("AA", "KK"))
@@ -0,0 +1,107 @@
+"""
+Unit tests for the push/fold Nash solver.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.hand import ALL_HANDS
+from core.push_fold import (
+    HAND_WEIGHTS,
+    TABLE_POSITIONS,
+    outcome_stacks,
+    solve_push_fold,
+    solve_resteal,
+)
+
+
+@pytest.fixture(scope="module")
+def heads_up():
+    return solve_push_fold([10, 10], iterations=300)
+
+
+class TestOutcomeStacks:
+    """Tests for the final stack of every ending."""
+
+    def test_chips_conserved(self):
+        index, rows = outcome_stacks([10, 6, 12, 8], 0.5, 1.0, 0.1)
+        assert len(rows) == len(index)
+        assert np.allclose(rows.sum(axis=1), 36)
+
+    def test_walk_and_steal(self):
+        index, rows = outcome_stacks([10, 10, 10], 0.5, 1.0, 0.0)
+        assert rows[index[("win", 2)]].tolist() == [10, 9.5, 10.5]
+        assert rows[index[("win", 0)]].tolist() == [11.5, 9.5, 9]
+
+    def test_short_stack_showdown(self):
+        """A short caller only wins what it matches, plus the dead blinds."""
+        index, rows = outcome_stacks([20, 5, 10], 0.5, 1.0, 0.0)
+        assert rows[index[("showdown", 0, 1, 1)]].tolist() == [15, 11, 9]
+        assert rows[index[("showdown", 0, 1, 0)]].tolist() == [26, 0, 9]
+
+
+class TestSolvePushFold:
+    """Tests for the push/fold equilibrium."""
+
+    def test_positions(self, heads_up):
+        assert heads_up.positions == TABLE_POSITIONS[2]
+        assert set(heads_up.push) == {"SB"}
+        assert set(heads_up.call) == {("BB", "SB")}
+
+    def test_premiums_and_trash(self, heads_up):
+        assert "AA" in heads_up.push_range("SB")
+        assert "AA" in heads_up.call_range("BB", "SB")
+        assert "72o" not in heads_up.call_range("BB", "SB")
+
+    def test_converges(self, heads_up):
+        assert heads_up.max_regret < 0.01
+
+    def test_shallower_pushes_wider(self, heads_up):
+        short = solve_push_fold([3, 3], iterations=300)
+        assert len(short.push_range("SB")) > len(heads_up.push_range("SB"))
+
+    def test_later_positions_push_wider(self):
+        solution = solve_push_fold([10] * 4, iterations=150)
+        widths = [HAND_WEIGHTS @ solution.push[p] for p in ["CO", "BTN", "SB"]]
+        assert widths == sorted(widths)
+
+    def test_icm_tightens_calls(self):
+        """On the bubble the big blind calls tighter than in chip EV."""
+        stacks = [10, 10, 10]
+        chips = solve_push_fold(stacks, iterations=200)
+        icm = solve_push_fold(stacks, payouts=[50, 50], iterations=200)
+        assert HAND_WEIGHTS @ icm.call[("BB", "SB")] < HAND_WEIGHTS @ chips.call[("BB", "SB")]
+
+    @pytest.mark.parametrize("stacks", [[10], [10] * 7, [10, 0]])
+    def test_invalid_tables(self, stacks):
+        with pytest.raises(ValueError):
+            solve_push_fold(stacks, iterations=1)
+
+
+class TestSolveResteal:
+    """Tests for the reshove / call-off equilibrium."""
+
+    def test_reshove_range(self):
+        open_range = np.ones(len(ALL_HANDS))
+        solution = solve_resteal(12, open_range, iterations=300)
+        assert "AA" in solution.shove_range()
+        assert "72o" not in solution.shove_range()
+        assert "AA" in solution.call_range()
+        assert solution.max_regret < 0.01
+
+    def test_call_only_opened_hands(self):
+        open_range = np.zeros(len(ALL_HANDS))
+        open_range[ALL_HANDS.index("AKs")] = 1
+        solution = solve_resteal(15, open_range, iterations=50)
+        assert solution.call_range() == ["AKs"]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            solve_resteal(2, np.ones(len(ALL_HANDS)))
+        with pytest.raises(ValueError):
+            solve_resteal(15, np.zeros(len(ALL_HANDS)))
@@ -0,0 +1,68 @@
+"""
+Unit tests for the Monte Carlo range vs range equity engine.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cards import parse_card_indexes
+from core.range_equity import monte_carlo_equity, range_to_combos
+
+
+class TestRangeToCombos:
+    """Tests for range expansion."""
+
+    def test_combo_counts(self):
+        assert len(range_to_combos("AA")) == 6
+        assert len(range_to_combos("AKs")) == 4
+        assert len(range_to_combos("AKo")) == 12
+        assert len(range_to_combos("TT+, AKs")) == 34
+
+    def test_dead_cards_removed(self):
+        dead = 0
+        for c in parse_card_indexes("As"):
+            dead |= 1 << c
+        assert len(range_to_combos("AA, AKs", dead)) == 3 + 3
+
+
+class TestMonteCarloEquity:
+    """Tests for the sampling engine."""
+
+    def test_known_matchup(self):
+        result = monte_carlo_equity("AKs", "QQ", max_samples=100_000, seed=3)
+        assert result.equity == pytest.approx(0.46, abs=0.01)
+        assert result.ci_low < result.equity < result.ci_high
+
+    def test_symmetry(self):
+        result = monte_carlo_equity("KK", "KK", max_samples=20_000, seed=3)
+        assert result.equity == pytest.approx(0.5, abs=0.01)
+        assert result.tie > 0.9
+
+    def test_river_board_is_exact(self):
+        board = parse_card_indexes("Qs7s2h3d4c")
+        result = monte_carlo_equity("QQ", "77", board=board, max_samples=5_000, seed=3)
+        assert result.equity == 1.0
+
+    def test_target_std_error_stops_early(self):
+        result = monte_carlo_equity(
+            "AA", "KK", max_samples=1_000_000, target_std_error=0.01, batch_size=1_000, seed=3
+        )
+        assert result.samples < 1_000_000
+        assert result.std_error <= 0.01
+
+    def test_time_budget_bounds_latency(self):
+        result = monte_carlo_equity("22+", "A2s+", max_samples=10_000_000, time_budget_ms=50)
+        assert result.samples < 10_000_000
+        assert result.elapsed_ms < 500
+
+    def test_incompatible_ranges(self):
+        with pytest.raises(ValueError):
+            monte_carlo_equity("AA", "AA", board=parse_card_indexes("AsAh"))
+
+    def test_invalid_board(self):
+        with pytest.raises(ValueError):
+            monte_carlo_equity("AA", "KK", board=parse_card_indexes("AsAs"))
@@ -0,0 +1,240 @@
+"""
+Unit tests for the river subgame solver.
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.cards import parse_card_indexes
+from core.combos import NUM_COMBOS, combo_index, combo_str
+from core.river_solver import (
+    IP,
+    OOP,
+    _read_cache,
+    _write_cache,
+    build_tree,
+    range_weights,
+    solve_river,
+)
+
+BOARD = parse_card_indexes("Ks7d2c9h4s")
+
+
+def range_frequencies(node) -> np.ndarray:
+    return (node.strategy @ node.reach) / node.reach.sum()
+
+
+class TestRangeWeights:
+    """Tests for weighted range parsing."""
+
+    def test_classes_combos_and_weights(self):
+        weights = range_weights("AA, KK:0.5, AhKh, AsKs:0.25")
+        assert weights.sum() == 6 + 3 + 1 + 0.25
+        ah_kh = combo_index(*parse_card_indexes("AhKh"))
+        assert weights[ah_kh] == 1
+
+    def test_later_parts_override(self):
+        weights = range_weights("AA, AsAh:0")
+        assert weights.sum() == 5
+
+    @pytest.mark.parametrize("range_str", ["AA:2", "AA:-1", "AA:x"])
+    def test_bad_weight(self, range_str):
+        with pytest.raises(ValueError):
+            range_weights(range_str)
+
+
+class TestTree:
+    """Tests for the bet tree."""
+
+    def test_sizes_and_single_raise(self):
+        tree = build_tree(1.5)
+        decisions = {n.path: n.actions for n in tree if n.player >= 0}
+        assert decisions[""] == ["check", "bet_33", "bet_75", "all_in"]
+        assert decisions["check"] == ["check", "bet_33", "bet_75", "all_in"]
+        assert decisions["bet_33"] == ["fold", "call", "all_in"]
+        assert decisions["bet_33/all_in"] == ["fold", "call"]
+        assert decisions["all_in"] == ["fold", "call"]
+
+    def test_short_stack_only_jams(self):
+        decisions = {n.path: n.actions for n in build_tree(0.3) if n.player >= 0}
+        assert decisions[""] == ["check", "all_in"]
+
+    def test_no_stack(self):
+        tree = build_tree(0)
+        assert [n.path for n in tree] == ["", "check", "check/check"]
+
+
+class TestSolveRiver:
+    """Tests for the DCFR solver."""
+
+    def test_polarized_jam(self):
+        # Sets and air vs one bluff catcher, stack 0.3 pot: OOP jams
+        # b / (1 + 2b) bluffs and IP calls 1 / (1 + b)
+        board = parse_card_indexes("AsKs7d4c2h")
+        solution = solve_river(
+            board,
+            range_weights("77, 65s"),
+            range_weights("KQo"),
+            pot=10,
+            stack=3,
+            max_iterations=2000,
+            target_exploitability=0.1,
+            use_cache=False,
+        )
+        root = solution.node("")
+        jams = solution.node("").strategy[1] * root.reach
+        assert jams[:4].sum() == pytest.approx(3 * 0.3 / 1.3, abs=0.05)  # 65s
+        assert jams[4:].sum() == pytest.approx(3, abs=0.01)  # 77
+        call = range_frequencies(solution.node("all_in"))[1]
+        assert call == pytest.approx(1 / 1.3, abs=0.02)
+        assert solution.exploitability < 0.1
+
+    def test_converges(self):
+        solution = solve_river(
+            BOARD,
+            range_weights("QQ+, AK, KQ, 99, 77, 22, QJs, JTs, T8s"),
+            range_weights("AA, KK, 77, 44, AK, KQ, QJs, 65s"),
+            pot=100,
+            stack=150,
+            use_cache=False,
+        )
+        assert solution.exploitability <= 0.3
+        for node in solution.nodes:
+            assert np.allclose(node.strategy.sum(axis=0), 1, atol=1e-4)
+        assert len(solution.combos[OOP]) == len(solution.ev[OOP])
+        # Both ranges share the pot
+        assert sum(solution.value) == pytest.approx(100)
+        assert all(0 < value < 100 for value in solution.value)
+
+    def test_ev_is_share_of_the_pot(self):
+        board = parse_card_indexes("AsKs7d4c2h")
+        solution = solve_river(
+            board, range_weights("77"), range_weights("65s"), 10, 10, use_cache=False
+        )
+        assert solution.value[OOP] == pytest.approx(10, abs=0.05)
+        assert solution.value[IP] == pytest.approx(0, abs=0.05)
+        assert np.allclose(solution.ev[OOP], 10, atol=0.05)
+
+    def test_empty_range(self):
+        with pytest.raises(ValueError):
+            solve_river(BOARD, range_weights("KsKh"), range_weights("AA"), 10, 10, use_cache=False)
+        with pytest.raises(ValueError):
+            solve_river(BOARD, np.zeros(NUM_COMBOS), range_weights("AA"), 10, 10, use_cache=False)
+
+    def test_invalid_board(self):
+        with pytest.raises(ValueError):
+            solve_river(BOARD[:4], range_weights("AA"), range_weights("QQ"), 10, 10)
+
+
+class TestCache:
+    """Tests for the canonical disk cache."""
+
+    def test_isomorphic_spot_hits_cache(self, tmp_path):
+        oop = "QQ+, AK, KQ, 99, 22, QJs, JTs, AhJh:0.5"
+        ip = "AA, KK, 77, AK, KQ, 65s"
+        first = solve_river(
+            BOARD, range_weights(oop), range_weights(ip), 100, 150, cache_dir=tmp_path
+        )
+        assert not first.cached
+        assert len(list(tmp_path.glob("*.npz"))) == 1
+
+        # Swap spades with hearts and diamonds with clubs, and scale the pot
+        swap = str.maketrans("shdc", "hscd")
+        board = parse_card_indexes("Ks7d2c9h4s".translate(swap))
+        second = solve_river(
+            board,
+            range_weights(oop.translate(str.maketrans("h", "s"))),
+            range_weights(ip),
+            10,
+            15,
+            cache_dir=tmp_path,
+        )
+        assert second.cached
+        assert second.value == pytest.approx(tuple(value / 10 for value in first.value))
+
+        def strategies(solution):
+            root = solution.node("")
+            return {
+                combo_str(*c): root.strategy[:, k]
+                for k, c in enumerate(solution.combos[OOP].tolist())
+            }
+
+        before, after = strategies(first), strategies(second)
+        for combo, strategy in before.items():
+            relabelled = combo.translate(swap)
+            relabelled = relabelled if relabelled in after else relabelled[2:] + relabelled[:2]
+            assert np.allclose(after[relabelled], strategy, atol=1e-5)
+
+    def test_unreadable_cache_is_resolved(self, tmp_path):
+        args = (BOARD, range_weights("AA, 22"), range_weights("KQ"), 10, 10)
+        solve_river(*args, cache_dir=tmp_path)
+        path = next(tmp_path.glob("*.npz"))
+        path.write_bytes(b"not a zip")
+        solution = solve_river(*args, cache_dir=tmp_path)
+        assert not solution.cached
+        assert solve_river(*args, cache_dir=tmp_path).cached
+
+    def test_truncated_cache_is_resolved(self, tmp_path):
+        args = (BOARD, range_weights("AA, 22"), range_weights("KQ"), 10, 10)
+        solve_river(*args, cache_dir=tmp_path)
+        path = next(tmp_path.glob("*.npz"))
+        data = path.read_bytes()
+        path.write_bytes(data[: len(data) // 2])
+        assert _read_cache(path) is None
+        assert not solve_river(*args, cache_dir=tmp_path).cached
+
+    def test_concurrent_writes(self, tmp_path):
+        solve_river(BOARD, range_weights("AA, 22"), range_weights("KQ"), 10, 10, cache_dir=tmp_path)
+        path = next(tmp_path.glob("*.npz"))
+        result = _read_cache(path)
+
+        def write(_):
+            for _ in range(20):
+                _write_cache(path, result)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(write, range(4)))
+        assert list(tmp_path.iterdir()) == [path]
+        assert _read_cache(path) is not None
+
+    def test_failed_cache_write_still_solves(self, tmp_path, monkeypatch):
+        def fail(path, result):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("core.river_solver._write_cache", fail)
+        solution = solve_river(
+            BOARD, range_weights("AA, 22"), range_weights("KQ"), 10, 10, cache_dir=tmp_path
+        )
+        assert not solution.cached
+        assert solution.exploitability >= 0
+
+    def test_ip_ranges_keyed(self, tmp_path):
+        solve_river(BOARD, range_weights("AA, 22"), range_weights("KQ"), 10, 10, cache_dir=tmp_path)
+        other = solve_river(
+            BOARD, range_weights("AA, 22"), range_weights("KQ, QJs"), 10, 10, cache_dir=tmp_path
+        )
+        assert not other.cached
+        assert len(other.combos[IP]) > 12
+
+    def test_least_recently_used_evicted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("core.river_solver.CACHE_MAX_FILES", 2)
+        spots = [
+            (BOARD, range_weights(oop), range_weights("KQ"), 10, 10)
+            for oop in ("AA, 22", "AA, 33", "AA, 55")
+        ]
+        solve_river(*spots[0], cache_dir=tmp_path)
+        solve_river(*spots[1], cache_dir=tmp_path)
+        for age, file in enumerate(sorted(tmp_path.glob("*.npz"))):
+            os.utime(file, (1000 + age, 1000 + age))
+        assert solve_river(*spots[0], cache_dir=tmp_path).cached  # Refreshes it
+
+        solve_river(*spots[2], cache_dir=tmp_path)
+        assert len(list(tmp_path.glob("*.npz"))) == 2
+        assert solve_river(*spots[0], cache_dir=tmp_path).cached
+        assert not solve_river(*spots[1], cache_dir=tmp_path).cached
@@ -0,0 +1,54 @@
+"""
+Unit tests for the runout classification tables.
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.canonical import NUM_FLOPS, board_from_id
+from core.cards import parse_card_indexes
+from core.runouts import ON_BOARD, TURN_TYPES, river_types, turn_table, turn_types
+from routers.solver import classify_river_card, classify_turn_card
+
+
+class TestTurnTable:
+    """Tests for the per-flop turn type table."""
+
+    def test_matches_scalar_classifier(self):
+        table = turn_table()
+        for fid in range(NUM_FLOPS):
+            flop = list(board_from_id(fid))
+            for card in range(52):
+                if card in flop:
+                    assert table[fid, card] == ON_BOARD
+                else:
+                    assert TURN_TYPES[table[fid, card]] == classify_turn_card(flop, card)
+
+    def test_real_suits(self):
+        flop = parse_card_indexes("Ah7s2d")
+        types = turn_types(flop)
+        assert types[parse_card_indexes("7c")[0]] == "pair_board"
+        assert types[parse_card_indexes("Kc")[0]] == "overcard"
+        assert sum(t is None for t in types) == 3
+
+
+class TestRiverTable:
+    """Tests for the per-flop river type tables."""
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_matches_scalar_classifier(self, seed):
+        rng = random.Random(seed)
+        for _ in range(500):
+            flop_turn = rng.sample(range(52), 4)
+            flop, turn = flop_turn[:3], flop_turn[3]
+            types = river_types(flop, turn)
+            for card in range(52):
+                if card in flop_turn:
+                    assert types[card] is None
+                else:
+                    assert types[card] == classify_river_card(flop_turn, card)
@@ -0,0 +1,58 @@
+"""
+Unit tests for the alias sampler and drill weights.
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.sampling import MIXED_FLOOR, AliasSampler, drill_weights, strategy_weights
+
+
+class TestAliasSampler:
+    """Tests for Vose's alias method."""
+
+    def test_distribution(self):
+        weights = [1, 0, 3, 6]
+        sampler = AliasSampler(weights)
+        rng = random.Random(0)
+        counts = np.bincount([sampler.sample(rng) for _ in range(100_000)], minlength=4)
+        assert counts[1] == 0
+        assert np.allclose(counts / counts.sum(), np.array(weights) / 10, atol=0.01)
+
+    def test_uniform(self):
+        sampler = AliasSampler(np.ones(5))
+        assert len(sampler) == 5
+        assert (sampler.prob == 1).all()
+
+    @pytest.mark.parametrize("weights", [[], [0, 0], [1, -1], [1, float("nan")]])
+    def test_invalid_weights(self, weights):
+        with pytest.raises(ValueError):
+            AliasSampler(weights)
+
+
+class TestDrillWeights:
+    """Tests for turning strategies into sampling weights."""
+
+    def test_uniform(self):
+        frequencies = np.full((3, 2, 4), 50.0)
+        assert (drill_weights(frequencies) == 1).all()
+
+    def test_mixed(self):
+        frequencies = np.array([[50, 50, np.nan], [100, np.nan, np.nan], [70, 30, 0]])
+        weights = drill_weights(frequencies, "mixed")
+        assert weights == pytest.approx([MIXED_FLOOR + 0.5, MIXED_FLOOR, MIXED_FLOOR + 0.3])
+
+    def test_unknown_weighting(self):
+        with pytest.raises(ValueError):
+            drill_weights(np.ones((1, 1)), "skewed")
+
+    def test_strategy_dicts(self):
+        strategies = [{"bet_33": 50, "check": 50, "note": "混合"}, {"check": 100}]
+        weights = strategy_weights(strategies, "mixed")
+        assert weights == pytest.approx([MIXED_FLOOR + 0.5, MIXED_FLOOR])
@@ -0,0 +1,102 @@
+"""
+Unit tests for the range-level solver aggregates.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.solver_aggregates import aggregate_store, hand_combos
+from core.solver_store import build_store
+
+SCENARIOS = [
+    {
+        "scenario_id": "btn_AK5",
+        "position": "BTN",
+        "villain": "BB",
+        "pot_type": "srp",
+        "board": ["Ah", "Ks", "5d"],
+        "texture": "ABx",
+        "texture_zh": "A 高",
+        "strategies": {
+            # 3 live combos on an ace-high board
+            "AA": {"bet_33": 100},
+            # 6 live combos
+            "QQ": {"bet_33": 50, "check": 50},
+            "72o": {"note": "放棄"},
+        },
+    },
+    {
+        "scenario_id": "btn_QJT",
+        "position": "BTN",
+        "villain": "BB",
+        "pot_type": "srp",
+        "board": ["Qh", "Jh", "Th"],
+        "texture": "monotone",
+        "texture_zh": "單色",
+        "strategies": {"AhKh": {"check": 100}},
+    },
+    {
+        "scenario_id": "co_AK5",
+        "position": "CO",
+        "villain": "BB",
+        "pot_type": "3bet",
+        "board": ["Ah", "Ks", "5d"],
+        "texture": "ABx",
+        "texture_zh": "A 高",
+        "strategies": {"KhKx": {"check": 100}},
+    },
+]
+
+
+@pytest.fixture
+def aggregates():
+    return aggregate_store(build_store({"btn.json": SCENARIOS[:2], "co.json": SCENARIOS[2:]}))
+
+
+class TestHandCombos:
+    """Tests for counting the combos of a strategy key."""
+
+    @pytest.mark.parametrize(
+        ("hand", "count"),
+        [("AA", 6), ("AKs", 4), ("AKo", 12), ("AhJh", 1), ("KhKx", 3), ("??", 0)],
+    )
+    def test_counts(self, hand, count):
+        assert hand_combos(hand).sum() == count
+
+
+class TestAggregates:
+    """Tests for the precomputed listings and frequencies."""
+
+    def test_combo_weighted_scenario(self, aggregates):
+        summary = aggregates.by_scenario["btn_AK5"]
+        assert summary["combos"] == 9
+        # (3 * 100 + 6 * 50) / 9 combos bet
+        assert summary["frequencies"] == {
+            "bet_33": pytest.approx(66.7),
+            "check": pytest.approx(33.3),
+        }
+
+    def test_texture_pools_scenarios(self, aggregates):
+        texture = aggregates.by_texture["ABx"]
+        assert texture["count"] == 2
+        # KhKx: the Ks is on the board, leaving KhKd and KhKc
+        assert texture["combos"] == 11
+        assert texture["frequencies"]["check"] == pytest.approx((300 + 200) / 11, abs=0.05)
+
+    def test_position_pairs(self, aggregates):
+        assert set(aggregates.by_position) == {"BTN_vs_BB", "CO_vs_BB"}
+        assert aggregates.by_position["BTN_vs_BB"]["count"] == 2
+
+    def test_listings(self, aggregates):
+        assert aggregates.scenarios[0]["hand_count"] == 3
+        assert aggregates.spots[("BTN", "BB", "srp")] == [0, 1]
+        assert aggregates.pot_types == {"srp": 2, "3bet": 1}
+
+    def test_version_tracks_data(self, aggregates):
+        changed = [{**SCENARIOS[1], "strategies": {"AhKh": {"bet_33": 100}}}]
+        other = aggregate_store(build_store({"btn.json": SCENARIOS[:1] + changed}))
+        assert other.version != aggregates.version
@@ -0,0 +1,172 @@
+"""
+Unit tests for the compiled solver scenario store.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.solver_store import (
+    DATA_PATH,
+    SpotCache,
+    build_manifest,
+    build_store,
+    load_manifest,
+    load_store,
+    read_json_files,
+    write_store,
+)
+
+SCENARIOS = [
+    {
+        "scenario_id": "test_AK5",
+        "position": "BTN",
+        "villain": "BB",
+        "pot_type": "srp",
+        "board": ["Ah", "Ks", "5d"],
+        "texture": "ABx",
+        "texture_zh": "A 高",
+        "strategies": {
+            "AA": {"bet_33": 70, "check": 30, "note": "價值"},
+            "72o": {"check": 100},
+        },
+    },
+    {
+        "scenario_id": "test_QJT",
+        "position": "BTN",
+        "villain": "BB",
+        "pot_type": "srp",
+        "board": ["Qh", "Jh", "Th"],
+        "texture": "monotone",
+        "texture_zh": "單色",
+        "strategies": {"AKs": {"bet_75": 100, "note": "價值"}},
+    },
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    path = tmp_path / "strategies.bin"
+    write_store(path, {"a.json": SCENARIOS[:1], "b.json": SCENARIOS[1:]})
+    return load_store(path)
+
+
+class TestSolverStore:
+    """Tests for compiling and memory-mapping scenarios."""
+
+    def test_round_trip(self, store):
+        compiled = store.file_scenarios("a.json") + store.file_scenarios("b.json")
+        for original, packed in zip(SCENARIOS, compiled, strict=True):
+            assert {**packed, "strategies": dict(packed["strategies"])} == original
+        assert store.notes == ["價值"]
+
+    def test_unknown_file(self, store):
+        with pytest.raises(KeyError):
+            store.file_scenarios("c.json")
+
+    def test_strategies_mapping(self, store):
+        strategies = store.file_scenarios("b.json")[0]["strategies"]
+        assert len(strategies) == 1
+        assert list(strategies) == ["AKs"]
+        assert strategies.get("AA") is None
+        assert strategies.get("QQ") is None
+        with pytest.raises(KeyError):
+            strategies["AA"]
+
+    def test_invalid_frequency(self, tmp_path):
+        bad = [{**SCENARIOS[0], "strategies": {"AA": {"check": 12.5}}}]
+        with pytest.raises(ValueError):
+            write_store(tmp_path / "bad.bin", {"bad.json": bad})
+
+    def test_in_memory_store(self, store):
+        packed = build_store({"a.json": SCENARIOS[:1], "b.json": SCENARIOS[1:]})
+        assert packed.files == store.files
+        assert (packed.frequencies == store.frequencies).all()
+        assert packed.file_scenarios("a.json") == store.file_scenarios("a.json")
+
+    def test_invalid_header(self, tmp_path):
+        path = tmp_path / "bad.bin"
+        path.write_bytes(b"\0" * 64)
+        with pytest.raises(ValueError):
+            load_store(path)
+
+    def test_shipped_file_matches_json(self):
+        """The compiled file and manifest must be regenerated whenever the JSON changes."""
+        store = load_store(DATA_PATH)
+        files = read_json_files()
+        assert list(store.files) == list(files)
+        for name, scenarios in files.items():
+            for original, packed in zip(scenarios, store.file_scenarios(name), strict=True):
+                assert {**packed, "strategies": dict(packed["strategies"])} == original
+        assert load_manifest() == build_manifest(files)
+
+
+class TestManifest:
+    """Tests for the per-file spot manifest."""
+
+    def test_spots_and_boards(self):
+        manifest = build_manifest({"a.json": SCENARIOS})
+        assert manifest == {
+            "spots": [
+                {
+                    "file": "a.json",
+                    "position": "BTN",
+                    "villain": "BB",
+                    "pot_type": "srp",
+                    "boards": ["AhKs5d", "QhJhTh"],
+                    "textures": ["ABx", "monotone"],
+                }
+            ]
+        }
+
+    def test_mixed_spots(self):
+        mixed = [SCENARIOS[0], {**SCENARIOS[1], "position": "CO"}]
+        with pytest.raises(ValueError):
+            build_manifest({"a.json": mixed})
+
+
+class TestSpotCache:
+    """Tests for the bounded LRU of loaded spots."""
+
+    def test_loads_once(self):
+        calls = []
+        cache = SpotCache(lambda spot: calls.append(spot) or spot.upper(), max_size=2)
+        assert cache.get("a") == "A"
+        assert cache.get("a") == "A"
+        assert calls == ["a"]
+        assert cache.info()["hits"] == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = SpotCache(str.upper, max_size=2)
+        cache.get("a")
+        cache.get("b")
+        cache.get("a")
+        cache.get("c")
+        assert "b" not in cache
+        assert cache.info()["spots"] == ["a", "c"]
+        assert cache.info()["evictions"] == 1
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            SpotCache(str.upper, max_size=0)
+
+    def test_concurrent_gets(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache = SpotCache(str.upper, max_size=2)
+        spots = list("abc") * 5000
+        # Switch threads as often as possible to hit check-then-act races
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(cache.get, spots))
+        finally:
+            sys.setswitchinterval(interval)
+        assert results == [spot.upper() for spot in spots]
+        info = cache.info()
+        assert info["size"] == 2
+        assert info["hits"] + info["misses"] == len(spots)
@@ -0,0 +1,126 @@
+"""
+Tests for equity calculation endpoints.
+"""
+
+import pytest
+
+BASE_URL = "/api/equity"
+
+
+class TestRangeEquity:
+    """Tests for Monte Carlo range vs range equity."""
+
+    def test_pair_vs_pair(self, client):
+        """AA vs KK is roughly 82% preflop."""
+        response = client.post(
+            f"{BASE_URL}/range",
+            json={"hero_range": "AA", "villain_range": "KK", "samples": 50000, "seed": 1},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["equity"] == pytest.approx(82, abs=1.5)
+        assert data["ci_low"] <= data["equity"] <= data["ci_high"]
+        assert data["hero_combos"] == 6
+        assert data["villain_combos"] == 6
+
+    def test_board_removes_combos(self, client):
+        """Board cards are removed from both ranges."""
+        response = client.post(
+            f"{BASE_URL}/range",
+            json={"hero_range": "QQ", "villain_range": "AKs", "board": "Qs7s2h", "seed": 1},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["hero_combos"] == 3
+        assert data["villain_combos"] == 4
+        assert data["equity"] > 85
+
+    def test_sample_cap_respected(self, client):
+        response = client.post(
+            f"{BASE_URL}/range",
+            json={"hero_range": "TT+", "villain_range": "AQs+", "samples": 2000},
+        )
+        assert response.status_code == 200
+        assert response.json()["samples"] <= 2000
+
+    def test_invalid_range(self, client):
+        response = client.post(
+            f"{BASE_URL}/range", json={"hero_range": "ZZ", "villain_range": "KK"}
+        )
+        assert response.status_code == 400
+
+    def test_invalid_board(self, client):
+        response = client.post(
+            f"{BASE_URL}/range",
+            json={"hero_range": "AA", "villain_range": "KK", "board": "Ah7"},
+        )
+        assert response.status_code == 400
+
+    def test_samples_over_cap_rejected(self, client):
+        response = client.post(
+            f"{BASE_URL}/range",
+            json={"hero_range": "AA", "villain_range": "KK", "samples": 10_000_000},
+        )
+        assert response.status_code == 422
+
+
+class TestPreflopEquity:
+    """Tests for the precomputed preflop matrix endpoints."""
+
+    def test_hand_vs_hand(self, client):
+        response = client.get(f"{BASE_URL}/preflop", params={"hero": "AA", "villain": "KK"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["equity"] == pytest.approx(82, abs=1)
+        assert data["combo_pairs"] == 36
+
+    def test_invalid_hand(self, client):
+        response = client.get(f"{BASE_URL}/preflop", params={"hero": "AKx", "villain": "KK"})
+        assert response.status_code == 400
+
+    def test_range_vs_range(self, client):
+        response = client.get(
+            f"{BASE_URL}/preflop/range", params={"hero": "QQ+, AKs", "villain": "22+"}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert 60 < data["equity"] < 80
+        assert data["combo_pairs"] > 0
+
+    def test_empty_range(self, client):
+        response = client.get(f"{BASE_URL}/preflop/range", params={"hero": "", "villain": "22+"})
+        assert response.status_code == 400
+
+
+class TestOutsBatch:
+    """Tests for the batch outs endpoint."""
+
+    def test_columns(self, client):
+        response = client.post(
+            f"{BASE_URL}/outs/batch",
+            json={
+                "spots": [
+                    {"hole": "AsKs", "board": "Qs7s2h"},
+                    {"hole": "JhTc", "board": "9s8d2h"},
+                    {"hole": "JhJc", "board": "Ks8d4h5c"},
+                ]
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["draws"]["flush_draw"] == [9, 0, 0]
+        assert data["draws"]["oesd"] == [0, 8, 0]
+        assert data["draws"]["set_draw"] == [0, 0, 2]
+        assert data["total_outs"] == [15, 14, 2]  # OESD plus two overcards
+        assert data["hand_strength"] == ["high_card", "high_card", "one_pair"]
+        assert len(data["out_cards"][2]) == 4
+        assert data["river_probability"][1] > data["turn_probability"][1]
+
+    def test_invalid_cards(self, client):
+        for spot in ({"hole": "AsKs", "board": "AsQs2h"}, {"hole": "As", "board": "Qs7s2h"}):
+            response = client.post(f"{BASE_URL}/outs/batch", json={"spots": [spot]})
+            assert response.status_code == 400
+
+    def test_empty_batch(self, client):
+        response = client.post(f"{BASE_URL}/outs/batch", json={"spots": []})
+        assert response.status_code == 422
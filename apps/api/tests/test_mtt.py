@@ -2,6 +2,8 @@
 Tests for MTT push/fold endpoints.
 """
 
+import pytest
+
 
 class TestMttRanges:
     """Tests for MTT range queries."""
@@ -25,6 +27,23 @@ class TestMttRanges:
         # AA should always be in push range
         assert "AA" in data["hands"]
 
+    def test_push_fold_total_combos(self, client):
+        """total_combos counts concrete combos, with dead cards removed."""
+        data = client.get("/api/mtt/push_fold/BTN/10bb").json()
+        expected = sum(6 if len(h) == 2 else 4 if h.endswith("s") else 12 for h in data["hands"])
+        assert data["total_combos"] == expected
+
+        blocked = client.get("/api/mtt/push_fold/BTN/10bb", params={"dead": "AhKd"}).json()
+        assert blocked["total_combos"] < expected
+
+    def test_invalid_dead_cards(self, client):
+        response = client.get("/api/mtt/push_fold/BTN/10bb", params={"dead": "Ahx"})
+        assert response.status_code == 400
+
+    def test_duplicate_dead_cards(self, client):
+        response = client.get("/api/mtt/push_fold/BTN/10bb", params={"dead": "AhAh"})
+        assert response.status_code == 400
+
     def test_get_defense_range(self, client):
         """Test getting defense range."""
         response = client.get("/api/mtt/defense/BB_vs_SB_shove/10bb")
@@ -116,3 +135,95 @@ class TestMttDrill:
         assert "explanation" in data
         assert "explanation_zh" in data
         assert "range_pct" in data
+
+
+class TestIcmPressure:
+    """Tests for the ICM pressure curve and bubble factor endpoints."""
+
+    STACKS = [5000, 4000, 3000, 2000]
+    PAYOUTS = [450, 300, 150]
+
+    def test_pressure_curve(self, client):
+        response = client.post(
+            "/api/mtt/icm/pressure-curve",
+            json={
+                "stacks": self.STACKS,
+                "payouts": self.PAYOUTS,
+                "player": 3,
+                "pot_sizes": [500, 1000, 2000],
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["pressure_ratios"]) == 3
+        assert all(r > 1 for r in data["pressure_ratios"])
+        assert data["lose_equities"] == sorted(data["lose_equities"], reverse=True)
+        assert data["win_equities"][0] > data["current_equity"]
+
+    def test_bubble_factors(self, client):
+        response = client.post(
+            "/api/mtt/icm/bubble-factors", json={"stacks": self.STACKS, "payouts": self.PAYOUTS}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        factors = data["bubble_factors"]
+        assert len(factors) == 4
+        assert all(factors[i][i] is None for i in range(4))
+        assert all(f > 1 for row in factors for f in row if f is not None)
+        assert sum(data["equities"]) == pytest.approx(900, abs=0.05)
+
+    def test_invalid_input(self, client):
+        bad = [
+            {"stacks": [5000, -1], "payouts": [100]},
+            {"stacks": [5000, 0], "payouts": [100]},
+        ]
+        for body in bad:
+            response = client.post("/api/mtt/icm/bubble-factors", json=body)
+            assert response.status_code == 400
+        response = client.post(
+            "/api/mtt/icm/pressure-curve",
+            json={"stacks": self.STACKS, "payouts": self.PAYOUTS, "player": 4, "pot_sizes": [500]},
+        )
+        assert response.status_code == 400
+
+    def test_too_many_players(self, client):
+        response = client.post(
+            "/api/mtt/icm/bubble-factors", json={"stacks": [1000] * 13, "payouts": [100]}
+        )
+        assert response.status_code == 422
+
+    def test_fgs(self, client):
+        response = client.post(
+            "/api/mtt/icm/fgs",
+            json={
+                "stacks": self.STACKS,
+                "payouts": self.PAYOUTS,
+                "button": 1,
+                "small_blind": 250,
+                "big_blind": 500,
+                "hands": 1,
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert sum(data["icm_equities"]) == pytest.approx(900, abs=0.05)
+        assert sum(data["fgs_equities"]) == pytest.approx(900, abs=0.05)
+        assert data["differences"] != [0, 0, 0, 0]
+
+    def test_fgs_invalid_input(self, client):
+        body = {"stacks": self.STACKS, "payouts": self.PAYOUTS, "small_blind": 1, "big_blind": 2}
+        assert client.post("/api/mtt/icm/fgs", json={**body, "button": 4}).status_code == 400
+        assert client.post("/api/mtt/icm/fgs", json={**body, "hands": 3}).status_code == 422
+
+    def test_fgs_rate_limited(self, client):
+        from routers.mtt import limiter
+
+        limiter.reset()
+        body = {"stacks": self.STACKS, "payouts": self.PAYOUTS, "small_blind": 1, "big_blind": 2}
+        statuses = [
+            client.post("/api/mtt/icm/fgs", json={**body, "hands": 1}).status_code
+            for _ in range(11)
+        ]
+        assert statuses[:10] == [200] * 10
+        assert statuses[10] == 429
+        limiter.reset()
@@ -30,6 +30,21 @@ class TestRfiRanges:
         assert "hands" in data
         assert data["position"] == position
 
+    def test_total_combos_with_dead_cards(self, client):
+        """Dead cards remove combos from the weighted total."""
+        full = client.get("/api/ranges/rfi/UTG").json()
+        blocked = client.get("/api/ranges/rfi/UTG", params={"dead": "AsAh"}).json()
+        assert 0 < blocked["total_combos"] < full["total_combos"]
+        assert full["total_combos"] <= 6 * full["total_hands"] * 2
+
+    def test_invalid_dead_cards(self, client):
+        response = client.get("/api/ranges/rfi/UTG", params={"dead": "Zz"})
+        assert response.status_code == 400
+
+    def test_duplicate_dead_cards(self, client):
+        response = client.get("/api/ranges/rfi/BTN", params={"dead": "AhAhAh"})
+        assert response.status_code == 400
+
 
 class TestVsRfiRanges:
     """Tests for VS-RFI ranges."""
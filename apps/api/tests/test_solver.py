@@ -2,11 +2,19 @@
 
 import os
 
+import pytest
 from fastapi.testclient import TestClient
 
 BASE_URL = "/api/solver"
 
 
+def all_scenarios() -> list[dict]:
+    """Every solver scenario, loaded one spot at a time."""
+    from routers.solver import get_manifest, get_spot
+
+    return [scenario for spot in get_manifest() for scenario in get_spot(*spot).scenarios]
+
+
 class TestSolverPostflop:
     """Tests for /postflop strategy query."""
 
@@ -130,9 +138,7 @@ class TestSolverCache:
         assert response.status_code == 422
 
     def test_clear_cache_with_wrong_api_key(self, client: TestClient):
-        response = client.delete(
-            f"{BASE_URL}/cache", headers={"X-API-Key": "wrong-key"}
-        )
+        response = client.delete(f"{BASE_URL}/cache", headers={"X-API-Key": "wrong-key"})
         assert response.status_code == 403
 
     def test_clear_cache_with_valid_api_key(self, client: TestClient):
@@ -140,9 +146,7 @@ class TestSolverCache:
         original = os.environ.get("ADMIN_API_KEY")
         os.environ["ADMIN_API_KEY"] = test_key
         try:
-            response = client.delete(
-                f"{BASE_URL}/cache", headers={"X-API-Key": test_key}
-            )
+            response = client.delete(f"{BASE_URL}/cache", headers={"X-API-Key": test_key})
             assert response.status_code == 200
             assert response.json()["message"] == "Solver cache cleared"
         finally:
@@ -152,6 +156,100 @@ class TestSolverCache:
                 os.environ["ADMIN_API_KEY"] = original
 
 
+class TestScenarioIndex:
+    """Tests for the indexed scenario lookup."""
+
+    def test_every_scenario_found(self):
+        from routers.solver import _flop_id, find_matching_scenario
+
+        for scenario in all_scenarios():
+            found = find_matching_scenario(
+                scenario["board"], scenario["position"], scenario["villain"], scenario["pot_type"]
+            )
+            assert found["pot_type"] == scenario["pot_type"]
+            assert _flop_id(tuple(found["board"])) == _flop_id(tuple(scenario["board"]))
+
+    def test_isomorphic_board(self):
+        from routers.solver import find_matching_scenario
+
+        scenario = all_scenarios()[0]
+        swap = str.maketrans("shdc", "hscd")
+        board = [c[0] + c[1].translate(swap) for c in scenario["board"]]
+        found = find_matching_scenario(
+            board, scenario["position"], scenario["villain"], scenario["pot_type"]
+        )
+        assert found["board"] == scenario["board"]
+
+    def test_level1_fallback(self):
+        from routers.solver import find_matching_scenario, get_level1_data
+
+        texture = get_level1_data()["textures"][0]
+        found = find_matching_scenario(texture["representative_board"], "SB", "BB", "3bet")
+        assert found is not None
+        assert found["scenario_id"].startswith("level1_")
+
+    def test_malformed_board(self):
+        from routers.solver import find_matching_scenario
+
+        assert find_matching_scenario(["Xx", "Ah", "2d"], "BTN", "BB") is None
+
+    def test_nearest_board(self):
+        from routers.solver import find_matching_scenario, get_spot
+
+        # No solved flop of the spot has these ranks
+        found = find_matching_scenario(["Qh", "Jh", "Th"], "BTN", "BB", "srp")
+        assert found["match"] == "nearest"
+        assert found["distance"] > 0
+        assert (found["position"], found["villain"], found["pot_type"]) == ("BTN", "BB", "srp")
+        # The index entry itself is not tagged
+        assert all("match" not in s for s in get_spot("BTN", "BB", "srp").scenarios)
+
+    def test_nearest_board_endpoint(self, client: TestClient):
+        response = client.get(
+            f"{BASE_URL}/postflop",
+            params={"board": "QhJhTh", "hand": "AA", "position": "BTN", "villain": "BB"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["found"] is True
+        assert data["match"] == "nearest"
+        assert data["distance"] > 0
+
+
+class TestSpotLoading:
+    """Tests for loading solver spots on demand."""
+
+    def test_loads_only_queried_spot(self):
+        from routers.solver import _solver_cache, _spot_cache, find_matching_scenario
+
+        _solver_cache.clear()
+        _spot_cache.clear()
+        find_matching_scenario(["Ah", "Ks", "5d"], "CO", "BB", "srp")
+        assert _spot_cache.info()["spots"] == [("CO", "BB", "srp")]
+
+    def test_unknown_spot_not_cached(self):
+        from routers.solver import _spot_cache, get_spot
+
+        _spot_cache.clear()
+        assert get_spot("XX", "BB", "srp").scenarios == []
+        assert _spot_cache.info()["size"] == 0
+
+    def test_manifest_matches_spots(self):
+        from routers.solver import get_manifest, get_spot
+
+        for spot, entries in get_manifest().items():
+            boards = ["".join(s["board"]) for s in get_spot(*spot).scenarios]
+            assert boards == [b for e in entries for b in e["boards"]]
+
+    def test_warm_up(self, monkeypatch):
+        from routers.solver import _spot_cache, warm_solver_cache
+
+        _spot_cache.clear()
+        monkeypatch.setenv("SOLVER_WARM_SPOTS", "BTN:BB:srp,XX:BB:srp,bad")
+        assert warm_solver_cache() == [("BTN", "BB", "srp")]
+        assert ("BTN", "BB", "srp") in _spot_cache
+
+
 class TestLevel1Textures:
     """Tests for /level1/textures endpoint."""
 
@@ -199,9 +297,7 @@ class TestLevel1Drill:
             textures = textures_resp.json().get("textures", [])
             if textures:
                 tid = textures[0]["texture_id"]
-                response = client.get(
-                    f"{BASE_URL}/level1/drill", params={"texture_id": tid}
-                )
+                response = client.get(f"{BASE_URL}/level1/drill", params={"texture_id": tid})
                 assert response.status_code == 200
                 assert response.json()["texture_id"] == tid
 
@@ -211,11 +307,17 @@ class TestLevel1Drill:
             assert response.json().get("difficulty") == 1
 
     def test_get_drill_invalid_texture(self, client: TestClient):
-        response = client.get(
-            f"{BASE_URL}/level1/drill", params={"texture_id": "nonexistent"}
-        )
+        response = client.get(f"{BASE_URL}/level1/drill", params={"texture_id": "nonexistent"})
         assert response.status_code == 404
 
+    def test_get_drill_mixed_weighting(self, client: TestClient):
+        response = client.get(f"{BASE_URL}/level1/drill", params={"weighting": "mixed"})
+        assert response.status_code == 200
+
+    def test_get_drill_invalid_weighting(self, client: TestClient):
+        response = client.get(f"{BASE_URL}/level1/drill", params={"weighting": "skewed"})
+        assert response.status_code == 400
+
 
 class TestLevel1Evaluate:
     """Tests for /level1/evaluate endpoint."""
@@ -238,6 +340,21 @@ class TestLevel1Evaluate:
             assert "user_action" in data
             assert "full_strategy" in data
 
+    def test_evaluate_shared_texture_id(self, client: TestClient):
+        """Some texture ids cover several boards; the one holding the hand is used."""
+        from routers.solver import get_level1_data
+
+        textures = get_level1_data()["textures"]
+        ids = [t["texture_id"] for t in textures]
+        shared = next(t for t in textures[::-1] if ids.count(t["texture_id"]) > 1)
+        first = textures[ids.index(shared["texture_id"])]
+        hand = next(h for h in shared["strategies"] if h not in first["strategies"])
+        response = client.post(
+            f"{BASE_URL}/level1/evaluate",
+            params={"texture_id": shared["texture_id"], "hand": hand, "user_action": "check"},
+        )
+        assert response.status_code == 200
+
     def test_evaluate_invalid_texture(self, client: TestClient):
         response = client.post(
             f"{BASE_URL}/level1/evaluate",
@@ -331,6 +448,22 @@ class TestTurnAdjustments:
             params={"flop": "A", "turn": "Kc"},
         )
         assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid flop format"
+
+    def test_classify_turn_invalid_turn(self, client: TestClient):
+        response = client.get(
+            f"{BASE_URL}/turn/classify",
+            params={"flop": "Ah7s2d", "turn": "Kx"},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid turn card"
+
+    def test_classify_turn_already_on_flop(self, client: TestClient):
+        response = client.get(
+            f"{BASE_URL}/turn/classify",
+            params={"flop": "Ah7s2d", "turn": "Ah"},
+        )
+        assert response.status_code == 400
 
     def test_list_turn_card_types(self, client: TestClient):
         response = client.get(f"{BASE_URL}/turn/card-types")
@@ -370,6 +503,21 @@ class TestRiverAdjustments:
         )
         assert response.status_code == 400
 
+    def test_classify_river_invalid_river(self, client: TestClient):
+        response = client.get(
+            f"{BASE_URL}/river/classify",
+            params={"board": "Ah7s2dKc", "river": "Zz"},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid river card"
+
+    def test_classify_river_already_on_board(self, client: TestClient):
+        response = client.get(
+            f"{BASE_URL}/river/classify",
+            params={"board": "Ah7s2dKc", "river": "Kc"},
+        )
+        assert response.status_code == 400
+
     def test_list_river_card_types(self, client: TestClient):
         response = client.get(f"{BASE_URL}/river/card-types")
         assert response.status_code == 200
@@ -458,17 +606,42 @@ class TestRandomDrill:
             assert "correct_strategy" in data
 
     def test_get_random_drill_with_pot_type(self, client: TestClient):
-        response = client.get(
-            f"{BASE_URL}/random-drill", params={"pot_type": "srp"}
-        )
+        response = client.get(f"{BASE_URL}/random-drill", params={"pot_type": "srp"})
         assert response.status_code in (200, 404)
 
     def test_get_random_drill_invalid_pot_type(self, client: TestClient):
-        response = client.get(
-            f"{BASE_URL}/random-drill", params={"pot_type": "nonexistent"}
-        )
+        response = client.get(f"{BASE_URL}/random-drill", params={"pot_type": "nonexistent"})
         assert response.status_code == 404
 
+    def test_filters(self, client: TestClient):
+        params = {"pot_type": "3bet", "position": "BB", "texture": "Paired"}
+        for _ in range(20):
+            response = client.get(f"{BASE_URL}/random-drill", params=params)
+            assert response.status_code == 200
+            data = response.json()
+            assert (data["pot_type"], data["position"], data["texture"]) == ("3bet", "BB", "Paired")
+            assert data["correct_strategy"]
+
+    def test_mixed_weighting(self, client: TestClient):
+        response = client.get(f"{BASE_URL}/random-drill", params={"weighting": "mixed"})
+        assert response.status_code == 200
+
+    def test_invalid_weighting(self, client: TestClient):
+        response = client.get(f"{BASE_URL}/random-drill", params={"weighting": "skewed"})
+        assert response.status_code == 400
+
+    def test_pairs_cover_every_hand(self):
+        """Each (scenario, hand) pair is one draw, so large files are not under-sampled."""
+        from routers.solver import get_drill_pool
+
+        expected = sum(
+            1
+            for scenario in all_scenarios()
+            for strategy in scenario["strategies"].values()
+            if set(strategy) != {"note"}
+        )
+        assert len(get_drill_pool().rows) == expected
+
 
 class TestPotTypes:
     """Tests for /pot-types endpoint."""
@@ -481,6 +654,49 @@ class TestPotTypes:
         assert "total_scenarios" in data
 
 
+class TestAggregates:
+    """Tests for /aggregates and the ETags of the precomputed list endpoints."""
+
+    @pytest.mark.parametrize("group", ["texture", "position", "scenario"])
+    def test_frequencies_sum_to_100(self, client: TestClient, group):
+        response = client.get(f"{BASE_URL}/aggregates", params={"group": group})
+        assert response.status_code == 200
+        for summary in response.json()["aggregates"].values():
+            if summary["combos"]:
+                assert sum(summary["frequencies"].values()) == pytest.approx(100, abs=1)
+
+    def test_invalid_group(self, client: TestClient):
+        response = client.get(f"{BASE_URL}/aggregates", params={"group": "board"})
+        assert response.status_code == 400
+
+    def test_counts_match_scenarios(self, client: TestClient):
+        total = len(all_scenarios())
+        assert client.get(f"{BASE_URL}/pot-types").json()["total_scenarios"] == total
+        textures = client.get(f"{BASE_URL}/textures").json()["textures"]
+        assert sum(t["count"] for t in textures) == total
+
+    @pytest.mark.parametrize(
+        ("path", "params"),
+        [
+            ("/textures", {}),
+            ("/scenarios", {"position": "BTN"}),
+            ("/boards", {"position": "BTN", "villain": "BB"}),
+            ("/pot-types", {}),
+            ("/aggregates", {}),
+        ],
+    )
+    def test_etag_not_modified(self, client: TestClient, path, params):
+        response = client.get(f"{BASE_URL}{path}", params=params)
+        etag = response.headers["etag"]
+        cached = client.get(
+            f"{BASE_URL}{path}", params=params, headers={"If-None-Match": f'W/{etag}, "other"'}
+        )
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        stale = client.get(f"{BASE_URL}{path}", params=params, headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+
+
 class TestNormalizeFunctions:
     """Tests for solver utility functions."""
 
@@ -533,3 +749,208 @@ class TestNormalizeFunctions:
             )
             assert response.status_code == 200
             assert response.json()["river_type"] == expected_type
+
+
+class TestRunoutGrid:
+    """Tests for /runouts endpoint."""
+
+    def test_turn_grid(self, client: TestClient):
+        response = client.get(f"{BASE_URL}/runouts", params={"flop": "Ah7s2d", "position": "BTN"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["street"] == "turn"
+        assert len(data["cards"]) == 49
+        assert data["cards"][0]["card"] == "As"
+        cards = {c["card"]: c["card_type"] for c in data["cards"]}
+        assert cards["7c"] == "pair_board"
+        assert cards["Kc"] == "overcard"
+        assert sum(t["count"] for t in data["card_types"].values()) == 49
+        assert "adjustments" in data["card_types"]["overcard"]
+
+    def test_river_grid(self, client: TestClient):
+        response = client.get(
+            f"{BASE_URL}/runouts",
+            params={"flop": "Ah7s2d", "turn": "Kc", "position": "BTN"},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["street"] == "river"
+        assert len(data["cards"]) == 48
+        cards = {c["card"]: c["card_type"] for c in data["cards"]}
+        assert cards["7d"] == "pair_board"
+        assert cards["Qc"] == "overcard"
+
+    def test_matches_multistreet(self, client: TestClient):
+        params = {"flop": "Ah7s2d", "turn": "Kc", "position": "BTN"}
+        grid = client.get(f"{BASE_URL}/runouts", params=params).json()
+        single = client.get(
+            f"{BASE_URL}/multistreet", params={**params, "river": "3h", "hand": "AKo"}
+        ).json()["streets"]["river"]
+        assert grid["card_types"][single["card_type"]]["adjustments"] == single["adjustments"]
+
+    @pytest.mark.parametrize(
+        "params",
+        [{"flop": "Ah7s"}, {"flop": "Ah7sXx"}, {"flop": "Ah7s2d", "turn": "Ah"}],
+    )
+    def test_invalid_board(self, client: TestClient, params):
+        response = client.get(f"{BASE_URL}/runouts", params={**params, "position": "BTN"})
+        assert response.status_code == 400
+
+
+class TestEquityDistribution:
+    """Tests for /equity-distribution endpoint."""
+
+    def test_flop_distribution(self, client: TestClient):
+        response = client.post(
+            f"{BASE_URL}/equity-distribution",
+            json={
+                "hero_range": "22+, A2s+, KTo+",
+                "villain_range": "TT+, AQ+",
+                "board": "Ah7s2d",
+                "buckets": 5,
+                "include_combos": True,
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["runouts"] == 1176
+        for side in ("hero", "villain"):
+            assert len(data[side]["histogram"]) == 5
+            assert abs(sum(data[side]["histogram"]) - 100) < 0.1
+            assert len(data[side]["combo_equity"]) == data[side]["combos"]
+        assert abs(data["hero"]["equity"] + data["villain"]["equity"] - 100) < 0.1
+
+    def test_combos_omitted_by_default(self, client: TestClient):
+        response = client.post(
+            f"{BASE_URL}/equity-distribution",
+            json={"hero_range": "AA", "villain_range": "KK", "board": "Ah7s2d9c3h"},
+        )
+        assert response.status_code == 200
+        assert response.json()["hero"]["combo_equity"] is None
+
+    def test_invalid_board(self, client: TestClient):
+        response = client.post(
+            f"{BASE_URL}/equity-distribution",
+            json={"hero_range": "AA", "villain_range": "KK", "board": "Ah7s"},
+        )
+        assert response.status_code == 400
+
+    def test_invalid_range(self, client: TestClient):
+        response = client.post(
+            f"{BASE_URL}/equity-distribution",
+            json={"hero_range": "xyz", "villain_range": "KK", "board": "Ah7s2d"},
+        )
+        assert response.status_code == 400
+
+
+class TestBlockers:
+    """Tests for /blockers endpoint."""
+
+    def test_ace_blocks_value(self, client: TestClient):
+        response = client.get(
+            f"{BASE_URL}/blockers",
+            params={
+                "hero": "AsQs",
+                "value": "AA, KK, AKs",
+                "bluffs": "QJs, JTs",
+                "board": "Kh7s2d",
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        # AA 6 + KK 3 + AKs 3 on a K board; As removes 3 AA and 1 AKs
+        assert data["value_combos"] == 12
+        assert data["value_combos_blocked"] == 8
+        # QsJs is blocked by hero's Qs
+        assert data["bluff_combos"] == 8
+        assert data["bluff_combos_blocked"] == 7
+        assert data["value_share_blocked"] < data["value_share"]
+
+    def test_invalid_hero(self, client: TestClient):
+        response = client.get(
+            f"{BASE_URL}/blockers", params={"hero": "As", "value": "AA", "bluffs": "KK"}
+        )
+        assert response.status_code == 400
+
+    def test_duplicate_cards(self, client: TestClient):
+        response = client.get(
+            f"{BASE_URL}/blockers",
+            params={"hero": "AsKs", "value": "AA", "bluffs": "KK", "board": "As7d2c"},
+        )
+        assert response.status_code == 400
+
+
+class TestRiverSolve:
+    """Tests for /river/solve endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        from routers.solver import limiter
+
+        limiter.reset()
+        monkeypatch.setattr("core.river_solver.CACHE_DIR", tmp_path)
+        return tmp_path
+
+    def spot(self, **changes):
+        return {
+            "board": "Ks7d2c9h4s",
+            "oop_range": "QQ+, AK, KQ, 99, 77, 22, QJs, JTs, T8s",
+            "ip_range": "AA, KK, 77, 44, AK, KQ, QJs, 65s",
+            "pot": 100,
+            "stack": 150,
+            **changes,
+        }
+
+    def test_solve_and_cache(self, client: TestClient, cache_dir):
+        response = client.post(f"{BASE_URL}/river/solve", json=self.spot())
+        assert response.status_code == 200
+        data = response.json()
+        assert data["exploitability"] <= 0.3
+        assert not data["cached"]
+        assert data["oop"]["ev"] + data["ip"]["ev"] == pytest.approx(100, abs=0.02)
+        root = data["nodes"][0]
+        assert root["path"] == "" and root["player"] == "oop"
+        assert root["actions"] == ["check", "bet_33", "bet_75", "all_in"]
+        assert sum(root["frequencies"].values()) == pytest.approx(100, abs=0.3)
+        assert root["combos"] is None
+        assert {node["path"] for node in data["nodes"]} >= {"check", "bet_33/all_in"}
+
+        again = client.post(f"{BASE_URL}/river/solve", json=self.spot(include_combos=True))
+        assert again.json()["cached"]
+        assert again.json()["nodes"][0]["frequencies"] == root["frequencies"]
+        assert len(list(cache_dir.glob("*.npz"))) == 1
+
+    def test_include_combos(self, client: TestClient):
+        response = client.post(
+            f"{BASE_URL}/river/solve",
+            json=self.spot(oop_range="AA, 65s", ip_range="KQo", include_combos=True),
+        )
+        data = response.json()
+        assert "AhAd" in data["oop"]["combo_ev"]
+        assert len(data["oop"]["combo_ev"]) == data["oop"]["combos"] == 6 + 4
+        facing = next(node for node in data["nodes"] if node["path"] == "all_in")
+        assert set(facing["combos"]) <= set(data["ip"]["combo_ev"])
+
+    @pytest.mark.parametrize(
+        "changes",
+        [
+            {"board": "Ks7d2c9h"},
+            {"board": "Ks7d2c9hKs"},
+            {"oop_range": "xyz"},
+            {"ip_range": "AA:3"},
+            {"oop_range": "KsKh"},
+        ],
+    )
+    def test_invalid(self, client: TestClient, changes):
+        response = client.post(f"{BASE_URL}/river/solve", json=self.spot(**changes))
+        assert response.status_code == 400
+
+    def test_pot_must_be_positive(self, client: TestClient):
+        response = client.post(f"{BASE_URL}/river/solve", json=self.spot(pot=0))
+        assert response.status_code == 422
+
+    def test_rate_limited(self, client: TestClient):
+        spot = self.spot(oop_range="AA, 65s", ip_range="KQo")
+        codes = [client.post(f"{BASE_URL}/river/solve", json=spot).status_code for _ in range(21)]
+        assert codes[:20] == [200] * 20
+        assert codes[20] == 429
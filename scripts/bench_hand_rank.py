@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Hand Ranking Micro-Benchmark
+
+Reports evaluations per second for core/hand_rank.py on random 5, 6 and
+7 card hands, for both the scalar and the NumPy batch evaluator.
+
+Usage:
+    python scripts/bench_hand_rank.py
+    python scripts/bench_hand_rank.py --hands 500000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "api"))
+
+import numpy as np  # noqa: E402
+
+from core.hand_rank import _build_np_tables, _build_tables, evaluate, evaluate_batch  # noqa: E402
+
+
+def bench(n_hands: int, n_cards: int, seed: int = 42) -> float:
+    """Time `evaluate` over random hands. Returns evaluations per second."""
+    rng = random.Random(seed)
+    deck = list(range(52))
+    hands = [rng.sample(deck, n_cards) for _ in range(n_hands)]
+
+    start = time.perf_counter()
+    for hand in hands:
+        evaluate(hand)
+    elapsed = time.perf_counter() - start
+    return n_hands / elapsed
+
+
+def bench_batch(n_hands: int, n_cards: int, seed: int = 42) -> float:
+    """Time `evaluate_batch` over random hands. Returns evaluations per second."""
+    rng = np.random.default_rng(seed)
+    hands = np.argsort(rng.random((n_hands, 52)), axis=1)[:, :n_cards]
+
+    start = time.perf_counter()
+    evaluate_batch(hands)
+    elapsed = time.perf_counter() - start
+    return n_hands / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the hand ranking engine")
+    parser.add_argument("--hands", type=int, default=200_000, help="Hands per run")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    _build_tables()
+    print(f"Table build: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    start = time.perf_counter()
+    _build_np_tables()
+    print(f"Batch table build: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    for n_cards in (5, 6, 7):
+        rate = bench(args.hands, n_cards)
+        batch_rate = bench_batch(args.hands * 5, n_cards)
+        print(f"{n_cards}-card: {rate:,.0f} evals/sec ({batch_rate:,.0f} batched)")
+
+
+if __name__ == "__main__":
+    main()
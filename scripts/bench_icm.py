@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+ICM Micro-Benchmark
+
+Times core/icm.py's subset-DP equity calculation on random final tables and
+checks it against the original recursive Malmuth-Harville implementation,
+which is kept here as the reference. The recursion grows factorially, so it
+only runs up to --max-reference players.
+
+Usage:
+    python scripts/bench_icm.py
+    python scripts/bench_icm.py --players 12 --max-reference 7
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "api"))
+
+from core.icm import calculate_icm_equity  # noqa: E402
+
+
+def reference_finish_probability(
+    stacks: list[int], player_idx: int, position: int, excluded: tuple[int, ...] = ()
+) -> float:
+    """The original recursion over every ordering of earlier finishers."""
+    if player_idx in excluded:
+        return 0.0
+    remaining_chips = sum(s for i, s in enumerate(stacks) if i not in excluded)
+    if remaining_chips == 0:
+        return 0.0
+    if position == 0:
+        return stacks[player_idx] / remaining_chips
+
+    prob = 0.0
+    for other_idx in range(len(stacks)):
+        if other_idx in excluded or other_idx == player_idx:
+            continue
+        prob += (
+            stacks[other_idx]
+            / remaining_chips
+            * reference_finish_probability(
+                stacks, player_idx, position - 1, excluded + (other_idx,)
+            )
+        )
+    return prob
+
+
+def reference_equities(stacks: list[int], payouts: list[float]) -> list[float]:
+    """Per-player equity, one recursion per player x paid position."""
+    places = min(len(payouts), len(stacks))
+    return [
+        sum(reference_finish_probability(stacks, i, p) * payouts[p] for p in range(places))
+        if stacks[i] > 0
+        else 0.0
+        for i in range(len(stacks))
+    ]
+
+
+def timed(fn, *args) -> tuple[float, object]:
+    """(elapsed ms, result) of one call."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ICM engine")
+    parser.add_argument("--players", type=int, default=10, help="Largest table size")
+    parser.add_argument(
+        "--max-reference",
+        type=int,
+        default=8,
+        help="Largest table for the old recursion",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for n in range(3, args.players + 1):
+        stacks = [rng.randint(1, 100) * 1000 for _ in range(n)]
+        payouts = [1000 * 0.7**p for p in range(n)]  # Every place pays
+
+        dp_ms, result = timed(calculate_icm_equity, stacks, payouts)
+        line = f"{n:2d} players: DP {dp_ms:8.2f} ms"
+        if n <= args.max_reference:
+            ref_ms, expected = timed(reference_equities, stacks, payouts)
+            error = max(abs(a - b) for a, b in zip(result.equities, expected))
+            line += f" | recursion {ref_ms:10.1f} ms | max diff {error:.2e}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Solver Data Load Benchmark
+
+Compares a cold start on the scenario JSON files with one on the compiled,
+memory-mapped file from scripts/compile_solver_data.py, loading every spot
+or only one (as the API does for a worker drilling a single spot). Each load
+runs in a fresh interpreter, as a new uvicorn worker would, and reports:
+
+- load: time to get the scenario list
+- lookup: time for one hand lookup in every scenario
+- memory: growth of the worker's private memory (resident pages not backed by
+  a file), which is what each extra worker costs; the mapped pages of the
+  compiled file are shared through the page cache
+
+Usage:
+    python scripts/bench_solver_store.py
+    python scripts/bench_solver_store.py --repeat 5
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+API_DIR = Path(__file__).parent.parent / "apps" / "api"
+
+CHILD = """
+import json, sys, time
+sys.path.insert(0, {api_dir!r})
+from core.solver_store import load_store, read_json_files
+
+def private_kb():
+    # RssAnon: resident memory not backed by a file (Linux)
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("RssAnon:"):
+                return int(line.split()[1])
+    return 0
+
+before = private_kb()
+start = time.perf_counter()
+if {mode!r} == "json":
+    scenarios = [s for file in read_json_files().values() for s in file]
+else:
+    store = load_store()
+    files = list(store.files)[:1] if {mode!r} == "one spot" else store.files
+    scenarios = [s for name in files for s in store.file_scenarios(name)]
+loaded = time.perf_counter()
+hits = sum(1 for s in scenarios if s["strategies"].get("AKo") is not None)
+done = time.perf_counter()
+print(json.dumps({{
+    "load": loaded - start,
+    "lookup": done - loaded,
+    "memory": private_kb() - before,
+    "scenarios": len(scenarios),
+    "hits": hits,
+}}))
+"""
+
+
+def run(mode: str) -> dict:
+    code = CHILD.format(api_dir=str(API_DIR), mode=mode)
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(output.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark solver data loading")
+    parser.add_argument("--repeat", type=int, default=3, help="Fresh processes per format")
+    args = parser.parse_args()
+
+    print(f"{'format':<10} {'load':>10} {'lookup':>10} {'memory':>10}  scenarios")
+    results = {}
+    for name in ["json", "compiled", "one spot"]:
+        runs = [run(name) for _ in range(args.repeat)]
+        best = {key: min(r[key] for r in runs) for key in ("load", "lookup", "memory")}
+        results[name] = best
+        print(
+            f"{name:<10} {best['load'] * 1000:>8.1f}ms {best['lookup'] * 1000:>8.2f}ms "
+            f"{best['memory'] / 1024:>8.1f}MB  {runs[0]['scenarios']} ({runs[0]['hits']} with AKo)"
+        )
+
+    json_, compiled = results["json"], results["compiled"]
+    print(
+        f"\nCompiled load is {json_['load'] / compiled['load']:.0f}x faster and uses "
+        f"{json_['memory'] / max(compiled['memory'], 1):.0f}x less private memory"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Data Compiler
+
+Validates every data file the API serves, then builds the artifacts it loads
+at startup:
+
+1. Checks each file under data/solver, data/postflop, data/flop-texture and
+   data/ranges (see core/data_validation.py). Any error stops the build;
+   warnings, such as solver strategies whose rounded frequencies sum to 98,
+   are printed.
+2. Packs the solver scenario JSON files into the memory-mapped binary read
+   by routers/solver.py (see core/solver_store.py for the layout), checks
+   that every strategy decodes back to the JSON it came from, and writes
+   manifest.json next to it: the spot and boards of each file, which lets
+   the API load one spot at a time.
+3. Writes data/bundle.json (see core/data_bundle.py): the content hashes of
+   every source and of strategies.bin, and the JSON the routers read.
+
+Run it after editing or regenerating any data file; the test suite fails
+while an artifact is out of date.
+
+Usage:
+    python scripts/compile_solver_data.py
+    python scripts/compile_solver_data.py --check
+    python scripts/compile_solver_data.py --output /tmp/strategies.bin \
+        --manifest /tmp/manifest.json --bundle /tmp/bundle.json
+
+A bundle always names the binary solver/strategies.bin, where the API loads
+it from, so one built with --output must be moved into place with it.
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "api"))
+
+from core.data_bundle import (  # noqa: E402
+    BUNDLE_PATH,
+    DATA_ROOT,
+    GENERATED,
+    SOURCE_DIRS,
+    build_bundle,
+    file_sha256,
+    write_bundle,
+)
+from core.data_validation import validate_dir  # noqa: E402
+from core.solver_store import (  # noqa: E402
+    DATA_PATH,
+    MANIFEST_PATH,
+    build_manifest,
+    load_store,
+    read_json_files,
+    write_store,
+)
+
+
+def dump(data: dict) -> str:
+    """JSON with each board list on one line."""
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    return re.sub(
+        r"\[\s+([^\[\]{}]*?)\s+\]",
+        lambda m: "[" + re.sub(r",\s+", ", ", m.group(1)) + "]",
+        text,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate and compile the API data files"
+    )
+    parser.add_argument("--output", type=Path, default=DATA_PATH)
+    parser.add_argument("--manifest", type=Path, default=MANIFEST_PATH)
+    parser.add_argument("--bundle", type=Path, default=BUNDLE_PATH)
+    parser.add_argument(
+        "--check", action="store_true", help="Only validate, write nothing"
+    )
+    args = parser.parse_args()
+    if (
+        args.output.resolve() != DATA_PATH.resolve()
+        and args.bundle.resolve() == BUNDLE_PATH.resolve()
+    ):
+        # The API's bundle would pin a strategies.bin it never loads
+        parser.error("a custom --output needs a --bundle path as well")
+
+    files, issues = validate_dir(DATA_ROOT, SOURCE_DIRS)
+    for issue in issues:
+        print(issue)
+    errors = sum(issue.fatal for issue in issues)
+    if errors:
+        sys.exit(f"{errors} errors in the data files")
+    print(f"Validated {len(files) - len(GENERATED)} files, {len(issues)} warnings")
+    if args.check:
+        return
+
+    scenario_files = read_json_files()
+    write_store(args.output, scenario_files)
+
+    store = load_store(args.output)
+    for name, scenarios in scenario_files.items():
+        for scenario, compiled in zip(
+            scenarios, store.file_scenarios(name), strict=True
+        ):
+            if {**compiled, "strategies": dict(compiled["strategies"])} != scenario:
+                sys.exit(f"Round trip mismatch in {scenario['scenario_id']}")
+
+    manifest = build_manifest(scenario_files)
+    args.manifest.write_text(dump(manifest) + "\n")
+
+    # Scenario files are served from strategies.bin, everything else as JSON
+    compiled = {f"solver/{name}" for name in scenario_files}
+    content = {path: data for path, data in files.items() if path not in compiled}
+    content["solver/manifest.json"] = manifest
+    sources = {
+        path: file_sha256(DATA_ROOT / path) for path in files if path not in GENERATED
+    }
+    artifacts = {DATA_PATH.relative_to(DATA_ROOT).as_posix(): file_sha256(args.output)}
+    bundle = build_bundle(content, sources, artifacts)
+    write_bundle(bundle, args.bundle)
+
+    size = args.output.stat().st_size
+    total = sum(len(scenarios) for scenarios in scenario_files.values())
+    print(f"Wrote {args.output}: {total} scenarios, {len(store.hands)} hands,")
+    print(
+        f"  {len(store.actions)} actions, {len(store.notes)} notes, {size / 1024:.0f} KB"
+    )
+    print(f"Wrote {args.manifest}: {len(manifest['spots'])} spots")
+    print(f"Wrote {args.bundle}: {len(sources)} sources, {len(content)} bundled files")
+
+
+if __name__ == "__main__":
+    main()
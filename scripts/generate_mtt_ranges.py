@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+MTT Push/Fold Range Generator
+
+Solves the short-stack spots served by routers/mtt.py with core/push_fold.py
+and rewrites the four range files in apps/api/data/ranges/mtt:
+
+- push_fold.json: 6-max open shoves per position
+- defense_vs_shove.json: 6-max calls against a single shove
+- resteal.json: reshoves over an open (opener ranges from the 100bb RFI chart)
+- hu_push_defense.json: heads-up SB shove and BB call
+
+Every stack depth is an independent solve, so depths run in parallel across
+processes. A hand is in a range when its equilibrium frequency is at least
+--threshold. The copy under data/ranges/mtt is kept in sync.
+
+Usage:
+    python scripts/generate_mtt_ranges.py
+    python scripts/generate_mtt_ranges.py --ante 0.125 --payouts 50 30 20
+    python scripts/generate_mtt_ranges.py --payouts 50 30 20 --fgs-hands 1
+    python scripts/generate_mtt_ranges.py --files push_fold hu --workers 4
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "apps" / "api"))
+
+import numpy as np  # noqa: E402
+
+from core.hand import ALL_HANDS  # noqa: E402
+from core.push_fold import DEFAULT_ITERATIONS, solve_push_fold, solve_resteal  # noqa: E402
+
+OUTPUT_DIRS = [ROOT / "apps" / "api" / "data" / "ranges" / "mtt", ROOT / "data" / "ranges" / "mtt"]
+RFI_PATH = ROOT / "data" / "ranges" / "6max" / "rfi_frequencies.json"
+
+PUSH_FOLD_DEPTHS = [3, 4, 5, 8, 10, 12, 15, 20, 25]
+DEFENSE_DEPTHS = [3, 5, 8, 10, 12, 15, 20]
+RESTEAL_DEPTHS = [10, 12, 15, 18, 20]
+HU_DEPTHS = [3, 4, 5, 6, 8, 10, 12, 15, 20]
+
+# Scenario name -> (caller, shover)
+DEFENSE_SCENARIOS = {
+    "BB_vs_SB_shove": ("BB", "SB"),
+    "BB_vs_BTN_shove": ("BB", "BTN"),
+    "SB_vs_BTN_shove": ("SB", "BTN"),
+    "BB_vs_CO_shove": ("BB", "CO"),
+    "BB_vs_HJ_shove": ("BB", "HJ"),
+}
+
+# Scenario name -> (reshover, opener)
+RESTEAL_SCENARIOS = {
+    "SB_resteal_vs_BTN": ("SB", "BTN"),
+    "BB_resteal_vs_BTN": ("BB", "BTN"),
+    "BB_resteal_vs_CO": ("BB", "CO"),
+    "BB_resteal_vs_HJ": ("BB", "HJ"),
+    "SB_resteal_vs_CO": ("SB", "CO"),
+}
+
+FILES = {
+    "push_fold": ("push_fold.json", "MTT Push-Fold 範圍：6max 各位置的開池全下範圍"),
+    "defense": ("defense_vs_shove.json", "MTT Push-Fold 防守範圍：面對 All-in 時的 Call 範圍"),
+    "resteal": ("resteal.json", "MTT Resteal 範圍：對手開池後的 3bet 全下範圍"),
+    "hu": (
+        "hu_push_defense.json",
+        "Heads Up Push/Defense Ranges for MTT Final Table and HU situations",
+    ),
+}
+
+
+def solve_table(depth: int, players: int, options: dict) -> dict:
+    """Push ranges and call ranges for an equal-stack table."""
+    solution = solve_push_fold(
+        [depth] * players,
+        payouts=options["payouts"],
+        ante=options["ante"],
+        iterations=options["iterations"],
+        fgs_hands=options["fgs_hands"],
+    )
+    threshold = options["threshold"]
+    return {
+        "push": {p: solution.push_range(p, threshold) for p in solution.positions[:-1]},
+        "call": {
+            f"{caller}_vs_{shover}": solution.call_range(caller, shover, threshold)
+            for caller, shover in solution.call
+        },
+        "max_regret": solution.max_regret,
+    }
+
+
+def solve_resteals(depth: int, options: dict) -> dict:
+    """Reshove range for every resteal scenario at one depth."""
+    rfi = json.loads(RFI_PATH.read_text())
+    ranges = {}
+    regret = 0.0
+    for name, (reshover, opener) in RESTEAL_SCENARIOS.items():
+        freqs = rfi[opener]["frequencies"]
+        open_range = np.array([freqs.get(h, {}).get("raise", 0) / 100 for h in ALL_HANDS])
+        # The other blind folds and leaves its blind in the pot
+        blind, dead = (0.5, 1.0) if reshover == "SB" else (1.0, 0.5)
+        solution = solve_resteal(
+            depth,
+            open_range,
+            open_size=options["open_size"],
+            blind=blind,
+            dead=dead,
+            ante=options["ante"],
+            iterations=options["iterations"],
+        )
+        ranges[name] = solution.shove_range(options["threshold"])
+        regret = max(regret, solution.max_regret)
+    return {"resteal": ranges, "max_regret": regret}
+
+
+def run_job(job: tuple) -> tuple:
+    kind, depth, options = job
+    if kind == "resteal":
+        return kind, depth, solve_resteals(depth, options)
+    return kind, depth, solve_table(depth, 2 if kind == "hu" else 6, options)
+
+
+def build_files(results: dict, selected: list[str], options: dict) -> dict[str, dict]:
+    """Assemble each selected file's JSON from the per-depth solutions."""
+    assumptions = {
+        "ante": f"{options['ante']}bb" if options["ante"] else "none",
+        "icm": f"icm {options['payouts']}" if options["payouts"] else "chip_ev",
+        "solver": f"fictitious play, {options['iterations']} iterations",
+        "threshold": options["threshold"],
+    }
+    if options["payouts"] and options["fgs_hands"]:
+        assumptions["icm"] += f", fgs {options['fgs_hands']} hands"
+    files = {}
+    if "push_fold" in selected:
+        files["push_fold"] = {
+            "6max": {f"{d}bb": results[("6max", d)]["push"] for d in PUSH_FOLD_DEPTHS}
+        }
+    if "defense" in selected:
+        files["defense"] = {
+            "6max": {
+                name: {
+                    f"{d}bb": results[("6max", d)]["call"][f"{c}_vs_{s}"] for d in DEFENSE_DEPTHS
+                }
+                for name, (c, s) in DEFENSE_SCENARIOS.items()
+            }
+        }
+    if "resteal" in selected:
+        files["resteal"] = {
+            "6max": {
+                name: {f"{d}bb": results[("resteal", d)]["resteal"][name] for d in RESTEAL_DEPTHS}
+                for name in RESTEAL_SCENARIOS
+            }
+        }
+    if "hu" in selected:
+        files["hu"] = {
+            "hu": {
+                "SB_push": {f"{d}bb": results[("hu", d)]["push"]["SB"] for d in HU_DEPTHS},
+                "BB_call_vs_SB_shove": {
+                    f"{d}bb": results[("hu", d)]["call"]["BB_vs_SB"] for d in HU_DEPTHS
+                },
+            }
+        }
+
+    for key, data in files.items():
+        meta = {
+            "version": "2.0",
+            "description": FILES[key][1],
+            "generator": "scripts/generate_mtt_ranges.py",
+            "assumptions": {
+                "format": "Heads Up (SB vs BB)" if key == "hu" else "6max MTT",
+                **assumptions,
+            },
+        }
+        if key == "resteal":
+            meta["assumptions"]["villain_open_size"] = f"{options['open_size']}bb"
+        files[key] = {"meta": meta, **data}
+    return files
+
+
+def dump(data: dict) -> str:
+    """JSON with each hand list on one line."""
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    return re.sub(
+        r"\[\s+([^\[\]{}]*?)\s+\]", lambda m: "[" + re.sub(r",\s+", ", ", m.group(1)) + "]", text
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate the MTT push/fold range files")
+    parser.add_argument("--files", nargs="+", choices=list(FILES), default=list(FILES))
+    parser.add_argument("--ante", type=float, default=0.0, help="Ante per player, in big blinds")
+    parser.add_argument(
+        "--payouts",
+        type=float,
+        nargs="+",
+        default=None,
+        help="Prize structure (ICM); chip EV if omitted",
+    )
+    parser.add_argument("--open-size", type=float, default=2.3, help="Open size for resteal spots")
+    parser.add_argument(
+        "--fgs-hands",
+        type=int,
+        default=0,
+        help="Future hands simulated before ICM (with --payouts)",
+    )
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument(
+        "--threshold", type=float, default=0.5, help="Minimum frequency to list a hand"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: all cores)")
+    parser.add_argument("--output", type=Path, default=None, help="Write to this directory only")
+    args = parser.parse_args()
+
+    options = {
+        "ante": args.ante,
+        "payouts": args.payouts,
+        "open_size": args.open_size,
+        "iterations": args.iterations,
+        "fgs_hands": args.fgs_hands,
+        "threshold": args.threshold,
+    }
+    jobs = set()
+    if {"push_fold", "defense"} & set(args.files):
+        jobs |= {("6max", d) for d in PUSH_FOLD_DEPTHS + DEFENSE_DEPTHS}
+    if "resteal" in args.files:
+        jobs |= {("resteal", d) for d in RESTEAL_DEPTHS}
+    if "hu" in args.files:
+        jobs |= {("hu", d) for d in HU_DEPTHS}
+
+    start = time.perf_counter()
+    results = {}
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for kind, depth, result in pool.map(run_job, [(k, d, options) for k, d in sorted(jobs)]):
+            results[(kind, depth)] = result
+            elapsed = time.perf_counter() - start
+            print(f"  {kind:>7} {depth:>2}bb  regret {result['max_regret']:.4f}  {elapsed:.0f}s")
+
+    if args.output:
+        args.output.mkdir(parents=True, exist_ok=True)
+    dirs = [args.output] if args.output else [d for d in OUTPUT_DIRS if d.exists()]
+    for key, data in build_files(results, args.files, options).items():
+        for directory in dirs:
+            path = directory / FILES[key][0]
+            path.write_text(dump(data) + "\n")
+            print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
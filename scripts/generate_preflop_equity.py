@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Preflop Equity Matrix Generator
+
+Computes all-in equity for every pair of the 169 starting hand classes and
+writes apps/api/data/equity/preflop_169.bin (see core/preflop_equity.py for
+the file layout).
+
+Each matchup is estimated by Monte Carlo with samples spread evenly over its
+card-disjoint combo pairs, so every concrete pairing contributes equally.
+Boards are drawn by index from a table of all 2,598,960 five-card boards whose
+hand-evaluator keys are precomputed, so a sample costs two table lookups.
+Only i < j is simulated; the mirror cell is 1 - equity and the diagonal is
+0.5 by symmetry.
+
+The standard error per cell is at most 0.5 / sqrt(samples) and about
+0.45 / sqrt(samples) in practice: 0.2% at the default 50,000 samples, which
+takes about two minutes on a single core.
+
+Usage:
+    python scripts/generate_preflop_equity.py
+    python scripts/generate_preflop_equity.py --samples 50000 --seed 7
+"""
+
+import argparse
+import sys
+import time
+from itertools import combinations
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "api"))
+
+import numpy as np  # noqa: E402
+
+from core.cards import card_masks  # noqa: E402
+from core.hand import ALL_HANDS, Hand  # noqa: E402
+from core.hand_rank import encode_batch, strength_from_keys  # noqa: E402
+from core.preflop_equity import DATA_PATH, N_CLASSES, write_matrix  # noqa: E402
+
+CHUNK = 500_000
+
+
+def build_combos() -> tuple[list[np.ndarray], np.ndarray]:
+    """Combo ids per class (in ALL_HANDS order) and the (1326, 2) card array."""
+    cards = []
+    class_combos = []
+    for hand in ALL_HANDS:
+        combos = Hand(hand).combos()
+        class_combos.append(np.arange(len(cards), len(cards) + len(combos)))
+        cards.extend(combos)
+    return class_combos, np.array(cards, dtype=np.intp)
+
+
+def generate(samples: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return (equity float[169, 169], compatible combo pairs uint8[169, 169])."""
+    rng = np.random.default_rng(seed)
+    class_combos, combo_cards = build_combos()
+    combo_keys = encode_batch(combo_cards)
+    combo_mask = card_masks(combo_cards)
+
+    print("Encoding all five-card boards...")
+    boards = np.array(list(combinations(range(52), 5)), dtype=np.int8)
+    board_keys = encode_batch(boards)
+    board_mask = card_masks(boards)
+    del boards
+
+    equity = np.full((N_CLASSES, N_CLASSES), 0.5)
+    counts = np.zeros((N_CLASSES, N_CLASSES), dtype=np.uint8)
+    start = time.perf_counter()
+
+    for i in range(N_CLASSES):
+        # Stratified rows for every matchup (i, j > i), plus the diagonal count
+        hero_rows, villain_rows, cell_rows = [], [], []
+        for j in range(i, N_CLASSES):
+            h, v = np.meshgrid(class_combos[i], class_combos[j], indexing="ij")
+            h, v = h.ravel(), v.ravel()
+            ok = (combo_mask[h] & combo_mask[v]) == 0
+            h, v = h[ok], v[ok]
+            counts[i, j] = counts[j, i] = len(h)
+            if j == i:
+                continue
+            repeat = -(-samples // len(h))
+            hero_rows.append(np.tile(h, repeat))
+            villain_rows.append(np.tile(v, repeat))
+            cell_rows.append(np.full(len(h) * repeat, j, dtype=np.intp))
+        if not cell_rows:
+            continue
+
+        hero = np.concatenate(hero_rows)
+        villain = np.concatenate(villain_rows)
+        cells = np.concatenate(cell_rows)
+        points = np.zeros(N_CLASSES)
+        totals = np.bincount(cells, minlength=N_CLASSES)
+
+        for lo in range(0, len(hero), CHUNK):
+            h, v = hero[lo : lo + CHUNK], villain[lo : lo + CHUNK]
+            dead = combo_mask[h] | combo_mask[v]
+            b = rng.integers(len(board_mask), size=len(h))
+            bad = np.flatnonzero(board_mask[b] & dead)
+            while len(bad):
+                b[bad] = rng.integers(len(board_mask), size=len(bad))
+                bad = bad[(board_mask[b[bad]] & dead[bad]) != 0]
+
+            shared = [k[b] for k in board_keys]
+            hero_s = strength_from_keys(*(k[h] + s for k, s in zip(combo_keys, shared)))
+            villain_s = strength_from_keys(*(k[v] + s for k, s in zip(combo_keys, shared)))
+            result = (hero_s > villain_s) + 0.5 * (hero_s == villain_s)
+            points += np.bincount(cells[lo : lo + CHUNK], weights=result, minlength=N_CLASSES)
+
+        done = totals > 0
+        equity[i, done] = points[done] / totals[done]
+        equity[done, i] = 1 - equity[i, done]
+        elapsed = time.perf_counter() - start
+        print(f"  {ALL_HANDS[i]:>4} ({i + 1}/{N_CLASSES}) {elapsed:.0f}s")
+
+    return equity, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the 169x169 preflop equity matrix")
+    parser.add_argument("--samples", type=int, default=50_000, help="Samples per matchup")
+    parser.add_argument("--seed", type=int, default=169)
+    parser.add_argument("--output", type=Path, default=DATA_PATH)
+    args = parser.parse_args()
+
+    equity, counts = generate(args.samples, args.seed)
+    write_matrix(args.output, equity, counts, args.samples)
+    print(f"Wrote {args.output} ({args.output.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()